@@ -46,7 +46,7 @@ int main(int argc, char** argv) {
   std::cout << "Creating enclave\n";
   int log_verbosity = 1;
   char* usernames[1] = {"user1"};
-  safe_xgboost(XGBCreateEnclave(argv[1], usernames, 1, log_verbosity));
+  safe_xgboost(XGBCreateEnclave(argv[1], usernames, 1, log_verbosity, 0, 0, "/tmp", ""));
   
   oe_result_t result;
   int ret = 1;
@@ -97,10 +97,10 @@ int main(int argc, char** argv) {
   char* unames[2] = {"user1", "user1"};
   DMatrixHandle dtrain, dtest;
   std::cout << "Loading train data\n";
-  safe_xgboost(XGDMatrixCreateFromEncryptedFile(fnames1, unames, 2, silent, &dtrain));
+  safe_xgboost(XGDMatrixCreateFromEncryptedFile(fnames1, unames, 2, silent, "", &dtrain));
   //safe_xgboost(XGDMatrixCreateFromFile(fname1.c_str(), "user1", silent, &dtrain));
   std::cout << "Loading test data\n";
-  safe_xgboost(XGDMatrixCreateFromEncryptedFile(fnames2, unames, 1, silent, &dtest));
+  safe_xgboost(XGDMatrixCreateFromEncryptedFile(fnames2, unames, 1, silent, "", &dtest));
   //safe_xgboost(XGDMatrixCreateFromFile(fname2.c_str(), "user1", silent, &dtest));
   std::cout << "Data loaded" << std::endl;
 
@@ -0,0 +1,14 @@
+#!/usr/bin/env bash
+
+set -e
+
+# The intrinsics headers vendored under include/intrinsics target the enclave
+# toolchain; point them at the host compiler's headers instead.
+mkdir -p compat/intrinsics
+echo "#include <immintrin.h>" > compat/intrinsics/immintrin.h
+
+echo "Building"
+g++ -w -O2 -fopenmp -fno-strict-aliasing bin_lookup.cc -Icompat -I../../include/ -o bin_lookup
+g++ -w -O2 -fopenmp -fno-strict-aliasing -mavx2 -DUSE_AVX2 bin_lookup.cc -Icompat -I../../include/ -o bin_lookup_avx2
+
+echo "Done"
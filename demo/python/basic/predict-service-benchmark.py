@@ -0,0 +1,70 @@
+"""
+Measure latency and throughput of predictions on rows sent with the request.
+
+Connects to a running RPC server (see demo/python/remote-control), trains a
+booster on the agaricus data, enables the prediction service and issues
+concurrent ``predict_rows()`` requests of 1 to 1000 rows each. Concurrent
+requests are batched by the server into one enclave call; pass
+``batch_window`` to ``xgb.serve()`` to trade latency for throughput. Usage:
+
+    python3 predict-service-benchmark.py [--remote-addr localhost:50052] [--clients 16] [--requests 50]
+"""
+import argparse
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import securexgboost as xgb
+
+username = "user1"
+DIR = os.path.dirname(os.path.realpath(__file__))
+HOME_DIR = DIR + "/../../../"
+SYM_KEY_FILE = HOME_DIR + "demo/data/key_zeros.txt"
+PRIVATE_KEY_FILE = HOME_DIR + "config/user1.pem"
+CERT_FILE = HOME_DIR + "config/user1.crt"
+
+
+def run_client(bst, rows, num_requests):
+    """Issue `num_requests` requests one after the other, returning the latency of each"""
+    latencies = []
+    for _ in range(num_requests):
+        start = time.time()
+        bst.predict_rows(rows)
+        latencies.append(time.time() - start)
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--remote-addr", default="localhost:50052")
+    parser.add_argument("--clients", type=int, default=16, help="number of concurrent clients")
+    parser.add_argument("--requests", type=int, default=50, help="number of requests per client")
+    args = parser.parse_args()
+
+    xgb.init_client(user_name=username, sym_key_file=SYM_KEY_FILE, priv_key_file=PRIVATE_KEY_FILE,
+                    cert_file=CERT_FILE, remote_addr=args.remote_addr)
+    xgb.attest(verify=False)
+
+    dtrain = xgb.DMatrix({username: HOME_DIR + "demo/data/agaricus.txt.train.enc"})
+    bst = xgb.train({"max_depth": 6, "objective": "binary:logistic"}, dtrain, num_boost_round=20)
+    bst.enable_prediction_service()
+
+    rng = np.random.RandomState(0)
+    num_col = dtrain.num_col()
+
+    print("\n{:>8} {:>14} {:>14} {:>14}".format("rows", "p50 (ms)", "p99 (ms)", "rows/s"))
+    for num_rows in [1, 10, 100, 1000]:
+        rows = np.where(rng.rand(num_rows, num_col) < 0.2, 1.0, np.nan).astype(np.float32)
+        with ThreadPoolExecutor(max_workers=args.clients) as executor:
+            start = time.time()
+            results = list(executor.map(lambda _: run_client(bst, rows, args.requests), range(args.clients)))
+            elapsed = time.time() - start
+        latencies = np.concatenate(results) * 1000
+        print("{:>8} {:>14.2f} {:>14.2f} {:>14.0f}".format(
+            num_rows, np.percentile(latencies, 50), np.percentile(latencies, 99),
+            num_rows * latencies.size / elapsed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Compare enclave launch time with a newly generated and a sealed identity key.
+
+Every launch runs in a fresh process, since an enclave can only be launched
+once per process. The first launch with a key path generates and seals the
+key, later launches unseal it. Usage:
+
+    python3 startup-benchmark.py [--repeat 3]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+import securexgboost as xgb
+
+username = "user1"
+DIR = os.path.dirname(os.path.realpath(__file__))
+HOME_DIR = DIR + "/../../../"
+SYM_KEY_FILE = HOME_DIR + "demo/data/key_zeros.txt"
+PRIVATE_KEY_FILE = HOME_DIR + "config/user1.pem"
+CERT_FILE = HOME_DIR + "config/user1.crt"
+IDENTITY_KEY_FILE = DIR + "/startup-bench.sealed"
+
+
+def run(identity_key_path):
+    """Time launching an enclave and attesting it"""
+    xgb.init_client(user_name=username, sym_key_file=SYM_KEY_FILE, priv_key_file=PRIVATE_KEY_FILE, cert_file=CERT_FILE)
+    start = time.time()
+    xgb.init_server(enclave_image=HOME_DIR + "build/enclave/xgboost_enclave.signed", client_list=[username],
+                    identity_key_path=identity_key_path)
+    launch = time.time() - start
+    xgb.attest(verify=False)
+    print(json.dumps({"launch": launch, "attested": time.time() - start}))
+
+
+def launch(identity_key_path):
+    args = [sys.executable, __file__, "--child"]
+    if identity_key_path:
+        args += ["--identity-key-path", identity_key_path]
+    out = subprocess.check_output(args)
+    return json.loads(out.decode().strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--identity-key-path", default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run(args.identity_key_path)
+        return
+
+    if os.path.exists(IDENTITY_KEY_FILE):
+        os.remove(IDENTITY_KEY_FILE)
+    generated = [launch(None) for _ in range(args.repeat)]
+    first = launch(IDENTITY_KEY_FILE)
+    sealed = [launch(IDENTITY_KEY_FILE) for _ in range(args.repeat)]
+
+    print("\n{:>20} {:>12} {:>14}".format("identity key", "launch (s)", "+ attest (s)"))
+    for name, results in [("generated", generated), ("generated + sealed", [first]), ("unsealed", sealed)]:
+        print("{:>20} {:>12.3f} {:>14.3f}".format(
+            name, min(r["launch"] for r in results), min(r["attested"] for r in results)))
+
+    os.remove(IDENTITY_KEY_FILE)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Compare data ingestion time with and without switchless OCALLs.
+
+Every configuration runs in a fresh process, since an enclave can only be
+launched once per process. Usage:
+
+    python3 switchless-benchmark.py [--rows 200000] [--workers 0 1 2 4] [--repeat 3]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
+import securexgboost as xgb
+
+username = "user1"
+DIR = os.path.dirname(os.path.realpath(__file__))
+HOME_DIR = DIR + "/../../../"
+SYM_KEY_FILE = HOME_DIR + "demo/data/key_zeros.txt"
+PRIVATE_KEY_FILE = HOME_DIR + "config/user1.pem"
+CERT_FILE = HOME_DIR + "config/user1.crt"
+PLAIN_FILE = DIR + "/switchless-bench.txt"
+ENC_FILE = DIR + "/switchless-bench.txt.enc"
+MODEL_FILE = DIR + "/switchless-bench.model"
+
+
+def generate(rows, cols=28):
+    """Write a random libsvm file and encrypt it"""
+    rng = np.random.RandomState(0)
+    with open(PLAIN_FILE, "w") as f:
+        for _ in range(rows):
+            x = rng.rand(cols)
+            label = int(x.sum() > cols / 2)
+            f.write(str(label) + " " + " ".join("{}:{:.6f}".format(j, v) for j, v in enumerate(x)) + "\n")
+    xgb.encrypt_file(PLAIN_FILE, ENC_FILE, SYM_KEY_FILE)
+    os.remove(PLAIN_FILE)
+
+
+def run(workers, repeat):
+    """Time ingestion and model saving in an enclave with the given number of switchless workers"""
+    xgb.init_client(user_name=username, sym_key_file=SYM_KEY_FILE, priv_key_file=PRIVATE_KEY_FILE, cert_file=CERT_FILE)
+    xgb.init_server(enclave_image=HOME_DIR + "build/enclave/xgboost_enclave.signed", client_list=[username],
+                    switchless_workers=workers)
+    xgb.attest(verify=False)
+
+    ingest = []
+    for _ in range(repeat):
+        start = time.time()
+        dtrain = xgb.DMatrix({username: ENC_FILE})
+        ingest.append(time.time() - start)
+
+    booster = xgb.train({"tree_method": "hist", "max_depth": "3", "verbosity": "0"}, dtrain, 1)
+    save = []
+    for _ in range(repeat):
+        start = time.time()
+        booster.save_model(MODEL_FILE)
+        save.append(time.time() - start)
+    print(json.dumps({"workers": workers, "ingest": min(ingest), "save": min(save)}))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[0, 1, 2, 4])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--child", type=int, default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child is not None:
+        run(args.child, args.repeat)
+        return
+
+    print("Generating {} encrypted rows".format(args.rows))
+    generate(args.rows)
+    results = []
+    for workers in args.workers:
+        out = subprocess.check_output([sys.executable, __file__, "--child", str(workers),
+                                       "--repeat", str(args.repeat)])
+        results.append(json.loads(out.decode().strip().splitlines()[-1]))
+
+    baseline = results[0]
+    print("\n{:>8} {:>12} {:>10} {:>12} {:>10}".format("workers", "ingest (s)", "speedup", "save (s)", "speedup"))
+    for r in results:
+        print("{:>8} {:>12.3f} {:>9.2f}x {:>12.4f} {:>9.2f}x".format(
+            r["workers"], r["ingest"], baseline["ingest"] / r["ingest"], r["save"], baseline["save"] / r["save"]))
+
+    for f in [ENC_FILE, MODEL_FILE]:
+        if os.path.exists(f):
+            os.remove(f)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+import securexgboost as xgb
+import os
+import sys
+
+DIR = os.path.dirname(os.path.realpath(__file__))
+HOME_DIR = DIR + "/../../../"
+SYM_KEY_FILE = DIR + "/../../data/key_zeros.txt"
+PRIVATE_KEY_FILE = HOME_DIR + "config/user1.pem"
+CERT_FILE = HOME_DIR + "config/user1.crt"
+CHECKPOINT = DIR + "/demo_model.checkpoint"
+
+# Fault injection: worker CRASH_TASK exits after finishing round CRASH_ROUND
+CRASH_TASK = os.environ.get("CRASH_TASK")
+CRASH_ROUND = int(os.environ.get("CRASH_ROUND", "3"))
+
+username = "user1"
+print("Creating enclave")
+xgb.init_client(user_name=username, sym_key_file=SYM_KEY_FILE, priv_key_file=PRIVATE_KEY_FILE, cert_file=CERT_FILE)
+xgb.init_server(enclave_image=HOME_DIR + "build/enclave/xgboost_enclave.signed", client_list=[username])
+
+# Remote Attestation
+# A restarted worker runs in a fresh enclave, so it must be attested again
+# before the checkpoint key can be provisioned to it
+print("Remote attestation")
+# Note: Simulation mode does not support attestation
+# pass in `verify=False` to attest()
+xgb.attest()
+
+rabit_args = {
+        "DMLC_NUM_WORKER": os.environ.get("DMLC_NUM_WORKER"),
+        "DMLC_NUM_SERVER": os.environ.get("DMLC_NUM_SERVER"),
+        "DMLC_TRACKER_URI": os.environ.get("DMLC_TRACKER_URI"),
+        "DMLC_TRACKER_PORT": os.environ.get("DMLC_TRACKER_PORT"),
+        "DMLC_ROLE": os.environ.get("DMLC_ROLE"),
+        "DMLC_NODE_HOST": os.environ.get("DMLC_NODE_HOST"),
+        "DMLC_TASK_ID": os.environ.get("DMLC_TASK_ID")
+}
+
+rargs = [str.encode(str(k) + "=" + str(v)) for k, v in rabit_args.items()]
+
+xgb.rabit.init(rargs)
+
+print("Creating training matrix from encrypted file")
+dtrain = xgb.DMatrix({username: HOME_DIR + "demo/data/agaricus.txt.train.enc"})
+
+print("Creating test matrix from encrypted file")
+dtest = xgb.DMatrix({username: HOME_DIR + "demo/data/agaricus.txt.test.enc"})
+
+params = {
+        "tree_method": "hist",
+        "n_gpus": "0",
+        "objective": "binary:logistic",
+        "min_child_weight": "1",
+        "gamma": "0.1",
+        "max_depth": "3",
+        "verbosity": "1"
+}
+
+
+def crash_worker(env):
+    """Kill this worker without any cleanup, as a node failure would"""
+    if CRASH_TASK == os.environ.get("DMLC_TASK_ID") and env.iteration + 1 == CRASH_ROUND:
+        print("Worker {} crashing after round {}".format(CRASH_TASK, CRASH_ROUND))
+        sys.stdout.flush()
+        os._exit(1)
+
+
+# Train with a checkpoint after every round. If a previous run left a
+# checkpoint behind, training resumes from it.
+num_rounds = 10
+booster = xgb.train(params, dtrain, num_rounds, evals=[(dtrain, "train"), (dtest, "test")],
+                    callbacks=[crash_worker], checkpoint_path=CHECKPOINT, checkpoint_interval=1)
+booster.save_model(DIR + "/demo_model.model")
+
+# Get encrypted predictions
+print("\n\nModel Predictions: ")
+predictions, num_preds = booster.predict(dtest, decrypt=False)
+
+# Decrypt predictions
+print(booster.decrypt_predictions(predictions, num_preds)[:20])
+
+xgb.rabit.finalize()
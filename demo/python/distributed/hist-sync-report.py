@@ -0,0 +1,68 @@
+"""
+Compare the histogram synchronization formats on a local cluster.
+
+    ./run-local.sh 4 hist-sync-report.py
+
+Each format trains the same model, with histograms allreduced and then
+reduce-scattered by feature shard (``hist_reduce_scatter``). The script
+reports how far the predictions are from the ``double`` allreduce baseline;
+reduce-scatter in double precision should not move them. With ``verbosity=3`` every worker also logs
+how many histogram bytes it sent per tree, and how many the double-precision
+format would have sent.
+"""
+import securexgboost as xgb
+import numpy as np
+import os
+
+DIR = os.path.dirname(os.path.realpath(__file__))
+HOME_DIR = DIR + "/../../../"
+SYM_KEY_FILE = DIR + "/../../data/key_zeros.txt"
+PRIVATE_KEY_FILE = HOME_DIR + "config/user1.pem"
+CERT_FILE = HOME_DIR + "config/user1.crt"
+
+username = "user1"
+xgb.init_client(user_name=username, sym_key_file=SYM_KEY_FILE, priv_key_file=PRIVATE_KEY_FILE, cert_file=CERT_FILE)
+xgb.init_server(enclave_image=HOME_DIR + "build/enclave/xgboost_enclave.signed", client_list=[username])
+xgb.attest(verify=False)
+
+rabit_args = {
+        "DMLC_NUM_WORKER": os.environ.get("DMLC_NUM_WORKER"),
+        "DMLC_NUM_SERVER": os.environ.get("DMLC_NUM_SERVER"),
+        "DMLC_TRACKER_URI": os.environ.get("DMLC_TRACKER_URI"),
+        "DMLC_TRACKER_PORT": os.environ.get("DMLC_TRACKER_PORT"),
+        "DMLC_ROLE": os.environ.get("DMLC_ROLE"),
+        "DMLC_NODE_HOST": os.environ.get("DMLC_NODE_HOST")
+}
+xgb.rabit.init([str.encode(str(k) + "=" + str(v)) for k, v in rabit_args.items()])
+
+dtrain = xgb.DMatrix({username: HOME_DIR + "demo/data/agaricus.txt.train.enc"})
+dtest = xgb.DMatrix({username: HOME_DIR + "demo/data/agaricus.txt.test.enc"})
+
+params = {
+        "tree_method": "hist",
+        "objective": "binary:logistic",
+        "max_depth": "6",
+        "verbosity": "3"
+}
+num_rounds = 10
+
+baseline = None
+for fmt, reduce_scatter in [("double", False), ("float", False), ("sparse", False),
+                            ("double", True), ("float", True)]:
+    name = fmt + (" (reduce-scatter)" if reduce_scatter else "")
+    params["hist_sync_format"] = fmt
+    params["hist_reduce_scatter"] = str(reduce_scatter).lower()
+    try:
+        booster = xgb.train(params, dtrain, num_rounds)
+    except xgb.core.XGBoostError as err:
+        # sparse is refused when the enclave is built in oblivious mode
+        xgb.rabit.tracker_print("{}: {}\n".format(name, err))
+        continue
+    predictions, num_preds = booster.predict(dtest, decrypt=False)
+    preds = np.asarray(booster.decrypt_predictions(predictions, num_preds))
+    if baseline is None:
+        baseline = preds
+    xgb.rabit.tracker_print("{}: max |pred - double| = {:.3g}\n".format(
+        name, np.max(np.abs(preds - baseline))))
+
+xgb.rabit.finalize()
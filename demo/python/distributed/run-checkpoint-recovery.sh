@@ -0,0 +1,20 @@
+#!/bin/bash
+# Fault injection test for sealed training checkpoints on a local cluster.
+# Usage: ./run-checkpoint-recovery.sh [num_workers] [crash_round]
+NUM_WORKERS=${1:-2}
+CRASH_ROUND=${2:-3}
+DIR=$(cd "$(dirname "$0")" && pwd)
+
+cd "$DIR"
+rm -f demo_model.checkpoint.rank*
+
+# First run: worker 1 dies after round $CRASH_ROUND, which brings down the job
+echo "Starting training, worker 1 will crash after round $CRASH_ROUND"
+if CRASH_TASK=1 CRASH_ROUND=$CRASH_ROUND timeout 600 ./run-local.sh $NUM_WORKERS checkpoint-recovery.py; then
+  echo "Expected the first run to fail"
+  exit 1
+fi
+
+# Second run: every worker starts a fresh enclave and resumes from the checkpoint
+echo "Restarting training from the sealed checkpoints"
+./run-local.sh $NUM_WORKERS checkpoint-recovery.py
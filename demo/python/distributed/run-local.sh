@@ -1 +1 @@
-../../../host/dmlc-core/tracker/dmlc-submit --log-level DEBUG --cluster local --num-workers $1 --worker-memory 1g python3 distr-training.py
+../../../host/dmlc-core/tracker/dmlc-submit --log-level DEBUG --cluster local --num-workers $1 --worker-memory 1g python3 ${2:-distr-training.py}
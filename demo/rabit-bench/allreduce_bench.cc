@@ -0,0 +1,94 @@
+/*!
+ * Copyright 2020 by Secure XGBoost Contributors
+ * \file allreduce_bench.cc
+ * \brief Allreduce and reduce-scatter throughput of the TLS rabit transport
+ *  used inside the enclave.
+ *
+ *  Links the enclave rabit sources on the host, in simulation mode, so that
+ *  the built-in test certificates are used and no attestation is needed.
+ */
+#include <chrono>
+#include <cstdio>
+#include <cstdlib>
+#include <string>
+#include <vector>
+
+#include "allreduce_base.h"
+
+namespace {
+
+void Sum(const void* src_, void* dst_, int len, const MPI::Datatype&) {
+  const float* src = static_cast<const float*>(src_);
+  float* dst = static_cast<float*>(dst_);
+  for (int i = 0; i < len; ++i) {
+    dst[i] += src[i];
+  }
+}
+
+}  // namespace
+
+int main(int argc, char* argv[]) {
+  rabit::engine::AllreduceBase engine;
+  engine.Init(argc, argv);
+  const int rank = engine.GetRank();
+  const int world = engine.GetWorldSize();
+  const int repeat = argc > 1 ? std::atoi(argv[1]) : 10;
+
+  for (size_t nbytes = 4 << 10; nbytes <= (64 << 20); nbytes <<= 2) {
+    std::vector<float> buf(nbytes / sizeof(float));
+    for (size_t i = 0; i < buf.size(); ++i) {
+      buf[i] = static_cast<float>(rank);
+    }
+    // warm up
+    engine.Allreduce(buf.data(), sizeof(float), buf.size(), Sum);
+
+    auto start = std::chrono::steady_clock::now();
+    for (int i = 0; i < repeat; ++i) {
+      engine.Allreduce(buf.data(), sizeof(float), buf.size(), Sum);
+    }
+    std::chrono::duration<double> elapsed = std::chrono::steady_clock::now() - start;
+
+    if (rank == 0) {
+      const double sec = elapsed.count() / repeat;
+      char msg[256];
+      std::snprintf(msg, sizeof(msg), "workers=%d size=%8zu KiB allreduce      "
+                    "time=%9.3f ms throughput=%8.1f MiB/s\n",
+                    world, nbytes >> 10, sec * 1e3, nbytes / sec / (1 << 20));
+      engine.TrackerPrint(msg);
+    }
+
+    // uneven shards, the last worker owns whatever is left
+    std::vector<size_t> shard_ptr(world + 1);
+    for (int r = 0; r < world; ++r) {
+      shard_ptr[r] = buf.size() / (world + 1) * r;
+    }
+    shard_ptr[world] = buf.size();
+    const float expected = static_cast<float>(world) * (world - 1) / 2;
+    start = std::chrono::steady_clock::now();
+    for (int i = 0; i < repeat; ++i) {
+      for (size_t j = 0; j < buf.size(); ++j) {
+        buf[j] = static_cast<float>(rank);
+      }
+      engine.ReduceScatter(buf.data(), sizeof(float), buf.size(), shard_ptr.data(), Sum);
+      for (size_t j = shard_ptr[rank]; j < shard_ptr[rank + 1]; ++j) {
+        if (buf[j] != expected) {
+          std::fprintf(stderr, "[%d] reduce-scatter mismatch at %zu: %f != %f\n",
+                       rank, j, buf[j], expected);
+          return 1;
+        }
+      }
+    }
+    elapsed = std::chrono::steady_clock::now() - start;
+
+    if (rank == 0) {
+      const double sec = elapsed.count() / repeat;
+      char msg[256];
+      std::snprintf(msg, sizeof(msg), "workers=%d size=%8zu KiB reduce-scatter "
+                    "time=%9.3f ms throughput=%8.1f MiB/s\n",
+                    world, nbytes >> 10, sec * 1e3, nbytes / sec / (1 << 20));
+      engine.TrackerPrint(msg);
+    }
+  }
+  engine.Shutdown();
+  return 0;
+}
@@ -0,0 +1,13 @@
+#!/usr/bin/env bash
+
+set -e
+
+# Requires the mbedTLS development headers and libraries on the host.
+SRC=../../enclave/rabit/src
+
+echo "Building"
+g++ -w -O2 -std=c++11 -fno-strict-aliasing -D__ENCLAVE_SIMULATION__ \
+  allreduce_bench.cc $SRC/allreduce_base.cc $SRC/allreduce_robust.cc $SRC/engine.cc $SRC/ssl_socket.cc \
+  -I$SRC -I../../include -o allreduce_bench -lmbedtls -lmbedx509 -lmbedcrypto
+
+echo "Done"
@@ -0,0 +1,4 @@
+#!/usr/bin/env bash
+
+# Usage: ./run-local.sh [num_workers=4] [repeat=10]
+../../host/dmlc-core/tracker/dmlc-submit --cluster local --num-workers ${1:-4} ./allreduce_bench ${2:-10}
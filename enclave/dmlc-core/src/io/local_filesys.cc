@@ -22,6 +22,40 @@ extern "C" {
 
 #include <cstring>
 
+#ifdef __ENCLAVE__
+#include <openenclave/enclave.h>
+#include <enclave/host_io.h>
+
+#include <algorithm>
+#include <atomic>
+#include <vector>
+
+#ifdef __ENCLAVE_CONSENSUS__
+#include "xgboost_mc_t.h"
+#else
+#include "xgboost_t.h"
+#endif
+
+namespace {
+std::atomic<uint64_t> host_read_ocalls(0);
+std::atomic<uint64_t> host_read_bytes(0);
+}  // anonymous namespace
+
+void ResetHostReadStats() {
+  host_read_ocalls = 0;
+  host_read_bytes = 0;
+}
+
+HostReadStats GetHostReadStats() {
+  return {host_read_ocalls.load(), host_read_bytes.load()};
+}
+
+void RecordHostRead(size_t nbytes) {
+  ++host_read_ocalls;
+  host_read_bytes += nbytes;
+}
+#endif  // __ENCLAVE__
+
 
 namespace dmlc {
 namespace io {
@@ -69,6 +103,149 @@ class FileStream : public SeekStream {
   bool use_stdio_;
 };
 
+#ifdef __ENCLAVE__
+/*!
+ * \brief Read-only stream over a file on host storage. Every OCALL to the
+ *  host fetches HOST_READ_CHUNK_SIZE bytes, and the host prefetches the next
+ *  chunk while this one is consumed, instead of one OCALL per fread.
+ */
+class HostBufferedStream : public SeekStream {
+ public:
+  explicit HostBufferedStream(void *reader) : reader_(reader) {}
+  virtual ~HostBufferedStream(void) {
+    host_FileReaderClose(reader_);
+    RecordHostRead(0);
+  }
+  virtual size_t Read(void *ptr, size_t size) {
+    char *out = reinterpret_cast<char*>(ptr);
+    size_t nread = 0;
+    while (nread < size) {
+      if (chunk_offset_ == chunk_size_ && !this->NextChunk()) break;
+      size_t n = std::min(size - nread, chunk_size_ - chunk_offset_);
+      std::memcpy(out + nread, chunk_ + chunk_offset_, n);
+      chunk_offset_ += n;
+      nread += n;
+    }
+    return nread;
+  }
+  virtual void Write(const void *ptr, size_t size) {
+    LOG(FATAL) << "HostBufferedStream is read-only";
+  }
+  virtual void Seek(size_t pos) {
+    if (pos >= chunk_begin_ && pos <= chunk_begin_ + chunk_size_) {
+      chunk_offset_ = pos - chunk_begin_;
+      return;
+    }
+    int ret;
+    CHECK_EQ(host_FileReaderSeek(&ret, reader_, pos), OE_OK);
+    CHECK_EQ(ret, 0) << "HostBufferedStream.Seek failed";
+    RecordHostRead(0);
+    chunk_begin_ = pos;
+    chunk_size_ = chunk_offset_ = 0;
+    at_end_ = false;
+  }
+  virtual size_t Tell(void) {
+    return chunk_begin_ + chunk_offset_;
+  }
+  virtual bool AtEnd(void) const {
+    return at_end_ && chunk_offset_ == chunk_size_;
+  }
+
+ private:
+  bool NextChunk() {
+    if (at_end_) return false;
+    uint8_t *buf = NULL;
+    size_t nread;
+    CHECK_EQ(host_FileReaderNext(&nread, reader_, HOST_READ_CHUNK_SIZE, &buf), OE_OK);
+    CHECK_LE(nread, HOST_READ_CHUNK_SIZE);
+    CHECK(nread == 0 || oe_is_outside_enclave(buf, nread))
+      << "HostBufferedStream: chunk is not in host memory";
+    RecordHostRead(nread);
+    chunk_begin_ += chunk_size_;
+    chunk_ = reinterpret_cast<const char*>(buf);
+    chunk_size_ = nread;
+    chunk_offset_ = 0;
+    at_end_ = nread < HOST_READ_CHUNK_SIZE;
+    return nread != 0;
+  }
+
+  void *reader_;
+  /*! \brief current chunk, in host memory */
+  const char *chunk_ {NULL};
+  /*! \brief file offset of the current chunk */
+  size_t chunk_begin_ {0};
+  size_t chunk_size_ {0};
+  size_t chunk_offset_ {0};
+  bool at_end_ {false};
+};
+
+/*!
+ * \brief Write-only stream to a file on host storage. Writes are buffered in
+ *  the enclave and reach the host in blocks of HOST_WRITE_BUFFER_SIZE bytes,
+ *  instead of one OCALL per fwrite.
+ */
+class HostBufferedWriteStream : public SeekStream {
+ public:
+  explicit HostBufferedWriteStream(void *writer) : writer_(writer) {
+    buffer_.reserve(HOST_WRITE_BUFFER_SIZE);
+  }
+  virtual ~HostBufferedWriteStream(void) {
+    // best effort, writers that need the data on disk call Flush() first
+    if (!buffer_.empty()) {
+      size_t nwritten = 0;
+      if (host_FileWriterWrite(&nwritten, writer_,
+                               reinterpret_cast<const uint8_t*>(buffer_.data()),
+                               buffer_.size()) != OE_OK
+          || nwritten != buffer_.size()) {
+        LOG(WARNING) << "HostBufferedWriteStream: lost "
+                     << buffer_.size() - nwritten << " buffered bytes on close";
+      }
+    }
+    host_FileWriterClose(writer_);
+  }
+  virtual size_t Read(void *ptr, size_t size) {
+    LOG(FATAL) << "HostBufferedWriteStream is write-only";
+    return 0;
+  }
+  virtual void Write(const void *ptr, size_t size) {
+    const char *data = reinterpret_cast<const char*>(ptr);
+    if (buffer_.size() + size > HOST_WRITE_BUFFER_SIZE) {
+      this->Flush();
+    }
+    if (size >= HOST_WRITE_BUFFER_SIZE) {
+      this->WriteToHost(data, size);
+    } else {
+      buffer_.insert(buffer_.end(), data, data + size);
+    }
+    written_ += size;
+  }
+  virtual void Seek(size_t pos) {
+    LOG(FATAL) << "HostBufferedWriteStream does not support Seek";
+  }
+  virtual size_t Tell(void) {
+    return written_;
+  }
+  virtual void Flush(void) {
+    if (!buffer_.empty()) {
+      this->WriteToHost(buffer_.data(), buffer_.size());
+      buffer_.clear();
+    }
+  }
+
+ private:
+  void WriteToHost(const char *data, size_t size) {
+    size_t nwritten;
+    CHECK_EQ(host_FileWriterWrite(&nwritten, writer_,
+                                  reinterpret_cast<const uint8_t*>(data), size), OE_OK);
+    CHECK_EQ(nwritten, size) << "HostBufferedWriteStream.Write incomplete";
+  }
+
+  void *writer_;
+  std::vector<char> buffer_;
+  size_t written_ {0};
+};
+#endif  // __ENCLAVE__
+
 FileInfo LocalFileSystem::GetPathInfo(const URI &path) {
   struct stat_struct sb;
   FileInfo ret;
@@ -203,6 +380,29 @@ SeekStream *LocalFileSystem::Open(const URI &path,
     std::string flag = mode;
     if (flag == "w") flag = "wb";
     if (flag == "r") flag = "rb";
+#ifdef __ENCLAVE__
+    if (flag == "rb") {
+      int ret;
+      void *reader = NULL;
+      CHECK_EQ(host_FileReaderOpen(&ret, fname, &reader), OE_OK);
+      RecordHostRead(0);
+      if (ret == 0) {
+        return new HostBufferedStream(reader);
+      }
+      CHECK(allow_null) << " LocalFileSystem::Open \"" << path.str() << "\": cannot open for read";
+      return NULL;
+    }
+    if (flag == "wb") {
+      int ret;
+      void *writer = NULL;
+      CHECK_EQ(host_FileWriterOpen(&ret, fname, &writer), OE_OK);
+      if (ret == 0) {
+        return new HostBufferedWriteStream(writer);
+      }
+      CHECK(allow_null) << " LocalFileSystem::Open \"" << path.str() << "\": cannot open for write";
+      return NULL;
+    }
+#endif  // __ENCLAVE__
 #if DMLC_USE_FOPEN64
     fp = fopen64(fname, flag.c_str());
 #else  // DMLC_USE_FOPEN64
@@ -26,7 +26,7 @@ void free_array(char* arr[], size_t len) {
   }
 }
 
-void enclave_init(char** usernames, size_t* username_lengths, size_t num_clients, int log_verbosity) {
+void enclave_init(char** usernames, size_t* username_lengths, size_t num_clients, int log_verbosity, size_t memory_limit, const char* spill_dir, const char* identity_key_path) {
   std::vector<std::pair<std::string, std::string> > args;
   args.emplace_back("verbosity", std::to_string(log_verbosity));
   xgboost::ConsoleLogger::Configure(args);
@@ -50,6 +50,8 @@ void enclave_init(char** usernames, size_t* username_lengths, size_t num_clients
   copy_arr_to_enclave(usernames_cpy, num_clients, usernames, username_lengths);
 
   EnclaveContext::getInstance().set_usernames(usernames_cpy, num_clients);
+  EnclaveContext::getInstance().set_memory_limit(memory_limit, spill_dir);
+  EnclaveContext::getInstance().init_identity_key(identity_key_path);
 
   free_array(usernames_cpy, num_clients);
 }
@@ -59,7 +61,7 @@ int enclave_XGDMatrixCreateFromFile(const char *fname, char* username, int silen
   return XGDMatrixCreateFromFile(fname, username, silent, out);
 }
 
-int enclave_XGDMatrixCreateFromEncryptedFile(const char *fnames[], size_t fname_lengths[], char* usernames[], size_t username_lengths[], bst_ulong num_files, int silent, DMatrixHandle *out) {
+int enclave_XGDMatrixCreateFromEncryptedFile(const char *fnames[], size_t fname_lengths[], char* usernames[], size_t username_lengths[], bst_ulong num_files, int silent, const char* cache_dir, DMatrixHandle *out) {
   LOG(DEBUG) << "Ecall: XGDMatrixCreateFromEncryptedFile";
   char* fnames_cpy[num_files];
   char* usernames_cpy[num_files];
@@ -67,7 +69,7 @@ int enclave_XGDMatrixCreateFromEncryptedFile(const char *fnames[], size_t fname_
   copy_arr_to_enclave(fnames_cpy, num_files, (char**)fnames, fname_lengths);
   copy_arr_to_enclave(usernames_cpy, num_files, usernames, username_lengths);
 
-  int ret = XGDMatrixCreateFromEncryptedFile((const char**) fnames_cpy, usernames_cpy, num_files, silent, out);
+  int ret = XGDMatrixCreateFromEncryptedFile((const char**) fnames_cpy, usernames_cpy, num_files, silent, cache_dir, out);
 
   free_array(fnames_cpy, num_files);
   free_array(usernames_cpy, num_files);
@@ -42,7 +42,7 @@ void free_array(char* arr[], size_t len) {
   }
 }
 
-void enclave_init(char** usernames, size_t* username_lengths, size_t num_clients, int log_verbosity) {
+void enclave_init(char** usernames, size_t* username_lengths, size_t num_clients, int log_verbosity, size_t memory_limit, const char* spill_dir, const char* identity_key_path) {
   std::vector<std::pair<std::string, std::string> > args;
   args.emplace_back("verbosity", std::to_string(log_verbosity));
   xgboost::ConsoleLogger::Configure(args);
@@ -67,6 +67,8 @@ void enclave_init(char** usernames, size_t* username_lengths, size_t num_clients
   copy_arr_to_enclave(usernames_cpy, num_clients, usernames, username_lengths);
 
   EnclaveContext::getInstance().set_usernames(usernames_cpy, num_clients);
+  EnclaveContext::getInstance().set_memory_limit(memory_limit, spill_dir);
+  EnclaveContext::getInstance().init_identity_key(identity_key_path);
 
   free_array(usernames_cpy, num_clients);
 }
@@ -76,7 +78,7 @@ int enclave_XGDMatrixCreateFromFile(const char *fname, int silent, DMatrixHandle
   return XGDMatrixCreateFromFile(fname, silent, out);
 }
 
-int enclave_XGDMatrixCreateFromEncryptedFile(const char *fnames[], size_t fname_lengths[], char* usernames[], size_t username_lengths[], bst_ulong num_files, int silent, uint8_t* nonce, size_t nonce_size, uint32_t nonce_ctr, DMatrixHandle *out, uint8_t** out_sig, size_t* out_sig_length, char **signers, size_t signer_lengths[], uint8_t* signatures[], size_t sig_lengths[], size_t num_sigs) {
+int enclave_XGDMatrixCreateFromEncryptedFile(const char *fnames[], size_t fname_lengths[], char* usernames[], size_t username_lengths[], bst_ulong num_files, int silent, const char* cache_dir, uint8_t* nonce, size_t nonce_size, uint32_t nonce_ctr, DMatrixHandle *out, uint8_t** out_sig, size_t* out_sig_length, char **signers, size_t signer_lengths[], uint8_t* signatures[], size_t sig_lengths[], size_t num_sigs) {
   LOG(DEBUG) << "Ecall: XGDMatrixCreateFromEncryptedFile";
   int NUM_CLIENTS = EnclaveContext::getInstance().get_num_clients();
   char* fnames_cpy[num_files];
@@ -89,7 +91,7 @@ int enclave_XGDMatrixCreateFromEncryptedFile(const char *fnames[], size_t fname_
   copy_arr_to_enclave(signers_cpy, NUM_CLIENTS, signers, signer_lengths);
   copy_sigs_to_enclave(sigs, signatures, sig_lengths);
 
-  int ret = XGDMatrixCreateFromEncryptedFile((const char**) fnames_cpy, usernames_cpy, num_files, silent, nonce, nonce_size, nonce_ctr, out, out_sig, out_sig_length, signers_cpy, sigs, sig_lengths);
+  int ret = XGDMatrixCreateFromEncryptedFile((const char**) fnames_cpy, usernames_cpy, num_files, silent, cache_dir, nonce, nonce_size, nonce_ctr, out, out_sig, out_sig_length, signers_cpy, sigs, sig_lengths);
 
   free_array(fnames_cpy, num_files);
   free_array(usernames_cpy, num_files);
@@ -155,21 +157,75 @@ int enclave_XGBoosterBoostOneIter(BoosterHandle handle, DMatrixHandle dtrain, bs
   return XGBoosterBoostOneIter(handle, dtrain, grad, hess, len);
 }
 
-int enclave_XGBoosterEvalOneIter(BoosterHandle handle, int iter, DMatrixHandle dmat_handles[], size_t handle_lengths[], const char* evnames[], size_t names_lengths[], bst_ulong len, char** out_str) {
+int enclave_XGBoosterEvalOneIter(BoosterHandle handle,
+                                 int iter,
+                                 DMatrixHandle dmat_handles[],
+                                 size_t handle_lengths[],
+                                 const char* evnames[],
+                                 size_t names_lengths[],
+                                 bst_ulong len,
+                                 int early_stopping_rounds,
+                                 uint8_t* nonce,
+                                 size_t nonce_size,
+                                 uint32_t nonce_ctr,
+                                 xgboost::bst_ulong* out_len,
+                                 char*** out_result,
+                                 uint8_t** out_sig,
+                                 size_t* out_sig_length,
+                                 char **signers,
+                                 size_t signer_lengths[],
+                                 uint8_t* signatures[],
+                                 size_t sig_lengths[],
+                                 size_t num_sigs) {
   LOG(DEBUG) << "Ecall: XGBoosterEvalOneIter";
 
   // Validate buffers and copy to enclave memory
   int NUM_CLIENTS = EnclaveContext::getInstance().get_num_clients();
   char* dmats[len];
   char* eval_names[len];
+  char* signers_cpy[NUM_CLIENTS];
+  uint8_t* sigs[NUM_CLIENTS];
 
   copy_arr_to_enclave(dmats, len, dmat_handles, handle_lengths);
   copy_arr_to_enclave(eval_names, len, (char**)evnames, names_lengths);
+  copy_arr_to_enclave(signers_cpy, NUM_CLIENTS, signers, signer_lengths);
+  copy_sigs_to_enclave(sigs, signatures, sig_lengths);
 
-  int ret = XGBoosterEvalOneIter(handle, iter, dmats, (const char**) eval_names, len, (const char**) out_str);
+  int ret = XGBoosterEvalOneIter(handle, iter, dmats, (const char**) eval_names, len, early_stopping_rounds, nonce, nonce_size, nonce_ctr, out_len, (const char***) out_result, out_sig, out_sig_length, signers_cpy, sigs, sig_lengths);
 
   free_array(dmats, len);
   free_array(eval_names, len);
+  free_array(signers_cpy, NUM_CLIENTS);
+  free_sigs(sigs);
+  return ret;
+}
+
+int enclave_XGBoosterRunPlan(const char* plan,
+                             uint8_t* nonce,
+                             size_t nonce_size,
+                             uint32_t nonce_ctr,
+                             BoosterHandle* out,
+                             xgboost::bst_ulong* out_len,
+                             char*** out_result,
+                             uint8_t** out_sig,
+                             size_t* out_sig_length,
+                             char **signers,
+                             size_t signer_lengths[],
+                             uint8_t* signatures[],
+                             size_t sig_lengths[],
+                             size_t num_sigs) {
+  LOG(DEBUG) << "Ecall: XGBoosterRunPlan";
+  int NUM_CLIENTS = EnclaveContext::getInstance().get_num_clients();
+  char* signers_cpy[NUM_CLIENTS];
+  uint8_t* sigs[NUM_CLIENTS];
+
+  copy_arr_to_enclave(signers_cpy, NUM_CLIENTS, signers, signer_lengths);
+  copy_sigs_to_enclave(sigs, signatures, sig_lengths);
+
+  int ret = XGBoosterRunPlan(plan, nonce, nonce_size, nonce_ctr, out, out_len, (const char***) out_result, out_sig, out_sig_length, signers_cpy, sigs, sig_lengths);
+
+  free_array(signers_cpy, NUM_CLIENTS);
+  free_sigs(sigs);
   return ret;
 }
 
@@ -205,6 +261,38 @@ int enclave_XGBoosterSaveModel(BoosterHandle handle, const char *fname, uint8_t
   return ret;
 }
 
+int enclave_XGBoosterSaveCheckpoint(BoosterHandle handle, const char *fname, uint32_t version, uint8_t *nonce, size_t nonce_size, uint32_t nonce_ctr, uint8_t** out_sig, size_t* out_sig_length, char **signers, size_t signer_lengths[], uint8_t* signatures[], size_t sig_lengths[], size_t num_sigs) {
+  LOG(DEBUG) << "Ecall: XGBoosterSaveCheckpoint";
+  int NUM_CLIENTS = EnclaveContext::getInstance().get_num_clients();
+  char* signers_cpy[NUM_CLIENTS];
+  uint8_t* sigs[NUM_CLIENTS];
+
+  copy_arr_to_enclave(signers_cpy, NUM_CLIENTS, signers, signer_lengths);
+  copy_sigs_to_enclave(sigs, signatures, sig_lengths);
+
+  int ret = XGBoosterSaveCheckpoint(handle, fname, version, nonce, nonce_size, nonce_ctr, out_sig, out_sig_length, signers_cpy, sigs, sig_lengths);
+
+  free_array(signers_cpy, NUM_CLIENTS);
+  free_sigs(sigs);
+  return ret;
+}
+
+int enclave_XGBoosterLoadCheckpoint(BoosterHandle handle, const char *fname, uint8_t *nonce, size_t nonce_size, uint32_t nonce_ctr, uint32_t* out_version, uint8_t** out_sig, size_t* out_sig_length, char **signers, size_t signer_lengths[], uint8_t* signatures[], size_t sig_lengths[], size_t num_sigs) {
+  LOG(DEBUG) << "Ecall: XGBoosterLoadCheckpoint";
+  int NUM_CLIENTS = EnclaveContext::getInstance().get_num_clients();
+  char* signers_cpy[NUM_CLIENTS];
+  uint8_t* sigs[NUM_CLIENTS];
+
+  copy_arr_to_enclave(signers_cpy, NUM_CLIENTS, signers, signer_lengths);
+  copy_sigs_to_enclave(sigs, signatures, sig_lengths);
+
+  int ret = XGBoosterLoadCheckpoint(handle, fname, nonce, nonce_size, nonce_ctr, out_version, out_sig, out_sig_length, signers_cpy, sigs, sig_lengths);
+
+  free_array(signers_cpy, NUM_CLIENTS);
+  free_sigs(sigs);
+  return ret;
+}
+
 int enclave_XGBoosterDumpModel(BoosterHandle handle,
                        const char* fmap,
                        int with_stats,
@@ -325,6 +413,49 @@ int enclave_XGBoosterDumpModelExWithFeatures(BoosterHandle handle,
     return ret;
 }
 
+int enclave_XGBoosterDumpModelFramed(BoosterHandle handle,
+                                     const char* fmap,
+                                     unsigned int fnum,
+                                     const char** fname,
+                                     size_t fname_lengths[],
+                                     const char** ftype,
+                                     size_t ftype_lengths[],
+                                     int with_stats,
+                                     const char *format,
+                                     uint8_t* nonce,
+                                     size_t nonce_size,
+                                     uint32_t nonce_ctr,
+                                     xgboost::bst_ulong* out_len,
+                                     uint8_t** out_dump,
+                                     uint8_t** out_sig,
+                                     size_t* out_sig_length,
+                                     char **signers,
+                                     size_t signer_lengths[],
+                                     uint8_t* signatures[],
+                                     size_t sig_lengths[], size_t num_sigs) {
+    LOG(DEBUG) << "Ecall: XGBoosterDumpModelFramed";
+
+    // Validate buffers and copy to enclave memory
+    int NUM_CLIENTS = EnclaveContext::getInstance().get_num_clients();
+    char* fname_cpy[fnum];
+    char* ftype_cpy[fnum];
+    char* signers_cpy[NUM_CLIENTS];
+    uint8_t* sigs[NUM_CLIENTS];
+
+    copy_arr_to_enclave(fname_cpy, fnum, (char**)fname, fname_lengths);
+    copy_arr_to_enclave(ftype_cpy, fnum, (char**)ftype, ftype_lengths);
+    copy_arr_to_enclave(signers_cpy, NUM_CLIENTS, signers, signer_lengths);
+    copy_sigs_to_enclave(sigs, signatures, sig_lengths);
+
+    int ret = XGBoosterDumpModelFramed(handle, fmap, (int) fnum, (const char**) fname_cpy, (const char**) ftype_cpy, with_stats, format, nonce, nonce_size, nonce_ctr, out_len, out_dump, out_sig, out_sig_length, signers_cpy, sigs, sig_lengths);
+
+    free_array(fname_cpy, fnum);
+    free_array(ftype_cpy, fnum);
+    free_array(signers_cpy, NUM_CLIENTS);
+    free_sigs(sigs);
+    return ret;
+}
+
 int enclave_XGBoosterGetModelRaw(BoosterHandle handle, uint8_t* nonce, size_t nonce_size, uint32_t nonce_ctr, xgboost::bst_ulong *out_len, char **out_dptr, uint8_t** out_sig, size_t* out_sig_length, char **signers, size_t signer_lengths[], uint8_t* signatures[], size_t sig_lengths[], size_t num_sigs) {
   LOG(DEBUG) << "Ecall: XGBoosterGetModelRaw";
   int NUM_CLIENTS = EnclaveContext::getInstance().get_num_clients();
@@ -375,6 +506,37 @@ int enclave_XGBoosterPredict(BoosterHandle handle, DMatrixHandle dmat, int optio
   return ret;
 }
 
+int enclave_XGBoosterEnablePredictionService(BoosterHandle handle, uint8_t* nonce, size_t nonce_size, uint32_t nonce_ctr, uint8_t** out_sig, size_t* out_sig_length, char** signers, size_t signer_lengths[], uint8_t* signatures[], size_t sig_lengths[], size_t num_sigs) {
+  LOG(DEBUG) << "Ecall: XGBoosterEnablePredictionService";
+  int NUM_CLIENTS = EnclaveContext::getInstance().get_num_clients();
+  char* signers_cpy[NUM_CLIENTS];
+  uint8_t* sigs[NUM_CLIENTS];
+
+  copy_arr_to_enclave(signers_cpy, NUM_CLIENTS, signers, signer_lengths);
+  copy_sigs_to_enclave(sigs, signatures, sig_lengths);
+
+  int ret = XGBoosterEnablePredictionService(handle, nonce, nonce_size, nonce_ctr, out_sig, out_sig_length, signers_cpy, sigs, sig_lengths);
+
+  free_array(signers_cpy, NUM_CLIENTS);
+  free_sigs(sigs);
+  return ret;
+}
+
+int enclave_XGBoosterPredictRows(BoosterHandle handle, bst_ulong num_requests, char** usernames, size_t username_lengths[], char** request_ids, size_t request_id_lengths[], bst_ulong* num_rows, bst_ulong num_col, uint8_t* enc_rows, size_t enc_rows_size, int output_margin, unsigned ntree_limit, int* out_status, bst_ulong *out_len, uint8_t **out_result) {
+  LOG(DEBUG) << "Ecall: XGBoosterPredictRows";
+  char* usernames_cpy[num_requests];
+  char* request_ids_cpy[num_requests];
+
+  copy_arr_to_enclave(usernames_cpy, num_requests, usernames, username_lengths);
+  copy_arr_to_enclave(request_ids_cpy, num_requests, request_ids, request_id_lengths);
+
+  int ret = XGBoosterPredictRows(handle, num_requests, usernames_cpy, request_ids_cpy, num_rows, num_col, enc_rows, enc_rows_size, output_margin, ntree_limit, out_status, out_len, out_result);
+
+  free_array(usernames_cpy, num_requests);
+  free_array(request_ids_cpy, num_requests);
+  return ret;
+}
+
 int enclave_XGDMatrixGetFloatInfo(const DMatrixHandle handle, const char* field, bst_ulong *out_len, bst_float **out_dptr) {
   LOG(DEBUG) << "Ecall: XGDMatrixGetFloatInfo";
   return XGDMatrixGetFloatInfo(handle, field, out_len, (const bst_float**) out_dptr);
@@ -437,14 +599,52 @@ int enclave_XGBoosterGetAttrNames(BoosterHandle handle, bst_ulong* out_len, char
   return XGBoosterGetAttrNames(handle, out_len, (const char***) out);
 }
 
-int enclave_XGDMatrixFree(DMatrixHandle handle) {
+int enclave_XGDMatrixFree(DMatrixHandle handle, uint8_t* nonce, size_t nonce_size, uint32_t nonce_ctr, uint8_t** out_sig, size_t* out_sig_length, char** signers, size_t signer_lengths[], uint8_t* signatures[], size_t sig_lengths[], size_t num_sigs) {
   LOG(DEBUG) << "Ecall: XGDMatrixFree";
-  return XGDMatrixFree(handle);
+  int NUM_CLIENTS = EnclaveContext::getInstance().get_num_clients();
+  char* signers_cpy[NUM_CLIENTS];
+  uint8_t* sigs[NUM_CLIENTS];
+
+  copy_arr_to_enclave(signers_cpy, NUM_CLIENTS, signers, signer_lengths);
+  copy_sigs_to_enclave(sigs, signatures, sig_lengths);
+
+  int ret = XGDMatrixFree(handle, nonce, nonce_size, nonce_ctr, out_sig, out_sig_length, signers_cpy, sigs, sig_lengths);
+
+  free_array(signers_cpy, NUM_CLIENTS);
+  free_sigs(sigs);
+  return ret;
 }
 
-int enclave_XGBoosterFree(BoosterHandle handle) {
+int enclave_XGBoosterFree(BoosterHandle handle, uint8_t* nonce, size_t nonce_size, uint32_t nonce_ctr, uint8_t** out_sig, size_t* out_sig_length, char** signers, size_t signer_lengths[], uint8_t* signatures[], size_t sig_lengths[], size_t num_sigs) {
   LOG(DEBUG) << "Ecall: XGBoosterFree";
-  return XGBoosterFree(handle);
+  int NUM_CLIENTS = EnclaveContext::getInstance().get_num_clients();
+  char* signers_cpy[NUM_CLIENTS];
+  uint8_t* sigs[NUM_CLIENTS];
+
+  copy_arr_to_enclave(signers_cpy, NUM_CLIENTS, signers, signer_lengths);
+  copy_sigs_to_enclave(sigs, signatures, sig_lengths);
+
+  int ret = XGBoosterFree(handle, nonce, nonce_size, nonce_ctr, out_sig, out_sig_length, signers_cpy, sigs, sig_lengths);
+
+  free_array(signers_cpy, NUM_CLIENTS);
+  free_sigs(sigs);
+  return ret;
+}
+
+int enclave_XGBGetEnclaveMemoryStats(uint8_t* nonce, size_t nonce_size, uint32_t nonce_ctr, char** out_stats, uint8_t** out_sig, size_t* out_sig_length, char** signers, size_t signer_lengths[], uint8_t* signatures[], size_t sig_lengths[], size_t num_sigs) {
+  LOG(DEBUG) << "Ecall: XGBGetEnclaveMemoryStats";
+  int NUM_CLIENTS = EnclaveContext::getInstance().get_num_clients();
+  char* signers_cpy[NUM_CLIENTS];
+  uint8_t* sigs[NUM_CLIENTS];
+
+  copy_arr_to_enclave(signers_cpy, NUM_CLIENTS, signers, signer_lengths);
+  copy_sigs_to_enclave(sigs, signatures, sig_lengths);
+
+  int ret = XGBGetEnclaveMemoryStats(nonce, nonce_size, nonce_ctr, out_stats, out_sig, out_sig_length, signers_cpy, sigs, sig_lengths);
+
+  free_array(signers_cpy, NUM_CLIENTS);
+  free_sigs(sigs);
+  return ret;
 }
 
 int enclave_get_remote_report_with_pubkey_and_nonce(
@@ -476,6 +676,11 @@ int enclave_get_enclave_symm_key(char* username, uint8_t** out, size_t* out_size
   return get_enclave_symm_key(username, out, out_size);
 }
 
+int enclave_XGBResumeSession(char* username, char* challenge, uint32_t* out_nonce_ctr, uint8_t** out_sig, size_t* out_sig_length) {
+  LOG(DEBUG) << "Ecall: XGBResumeSession";
+  return XGBResumeSession(username, challenge, out_nonce_ctr, out_sig, out_sig_length);
+}
+
 void enclave_RabitInit(int argc, char **argv, size_t arg_lengths[]) {
   LOG(DEBUG) << "Ecall: RabitInit";
 
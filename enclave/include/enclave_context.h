@@ -16,6 +16,7 @@
 #include "mbedtls/ctr_drbg.h"
 #include "mbedtls/error.h"
 #include "mbedtls/pk_internal.h"
+#include "mbedtls/platform_util.h"
 
 // needed for certificate
 #include "mbedtls/platform.h"
@@ -25,10 +26,32 @@
 #include "mbedtls/error.h"
 
 #include <rabit/rabit.h>
+#include <xgboost/data.h>
+#include <xgboost/json.h>
+#include <xgboost/learner.h>
+
+#include <algorithm>
+#include <chrono>
+#include <cstdio>
+#include <cstring>
+#include <limits>
+#include <list>
+#include <memory>
+#include <mutex>
+#include <unordered_set>
+
+#include "../src/data/sealed_dmatrix_cache.h"
 
 
 class EnclaveContext {
   private:
+    // magic number used to identify sealed identity keys
+    static const int kIdentityKeyMagic = 0xffffab04;
+    // label that the identity key is sealed under
+    static constexpr const char* kIdentityKeyLabel = "xgboost-identity-key";
+    // number of counters below the highest accepted one that can still be used
+    static const uint32_t kSeqWindowSize = 64;
+
     mbedtls_ctr_drbg_context m_ctr_drbg_context;
     mbedtls_entropy_context m_entropy_context;
     mbedtls_pk_context m_pk_context;
@@ -36,7 +59,11 @@ class EnclaveContext {
     
     // 12 bytes for the session nonce and four bytes for a counter within the session.
     uint8_t m_nonce[CIPHER_IV_SIZE];
+    // one above the highest counter accepted in the session
     uint32_t m_nonce_ctr;
+    // bit i is set if counter m_nonce_ctr - 1 - i has been accepted
+    uint64_t m_seq_window;
+    std::mutex m_seq_mutex;
     uint8_t m_symm_key[CIPHER_KEY_SIZE];
 
      /* We maintain these maps to avoid having to pass out pointers to application code outside
@@ -46,9 +73,35 @@ class EnclaveContext {
     std::unordered_map<std::string, void*> booster_map;
     std::unordered_map<std::string, void*> dmatrix_map;
     std::unordered_map<std::string, std::vector<std::string>> dmatrix_owner_map;
+    // DMatrices cached by each booster. The learner only holds weak references to
+    // its caches, so these keep them alive after their handles have been freed.
+    std::unordered_map<std::string, std::vector<std::shared_ptr<void>>> booster_refs_map;
+    // boosters that every client agreed to serve row predictions with
+    std::unordered_set<std::string> prediction_service_boosters;
+    // best score and round of each booster evaluated with early stopping
+    std::unordered_map<std::string, std::pair<double, int>> early_stop_map;
     int booster_ctr;
     int dmatrix_ctr;
 
+    /* Memory accounting. Once the DMatrices and prediction caches in the enclave hold more
+     * than memory_limit bytes, DMatrices that no booster refers to are sealed to spill_dir
+     * on the host, least recently used first, and reloaded on their next use.
+     */
+    size_t memory_limit;
+    std::string spill_dir;
+    // handles of resident DMatrices, least recently used first
+    std::list<std::string> dmatrix_lru;
+    std::unordered_map<std::string, std::list<std::string>::iterator> dmatrix_lru_pos;
+    struct EvictedDMatrix {
+      std::string path;
+      // authenticated with the sealed copy, unique to each eviction
+      std::string id;
+      size_t bytes;
+    };
+    std::unordered_map<std::string, EvictedDMatrix> evicted_dmatrix_map;
+    uint64_t num_evictions;
+    uint64_t num_reloads;
+
     // list of usernames configured by the host at enclave launch
     std::vector<std::string> client_names;
     int num_clients;
@@ -60,13 +113,17 @@ class EnclaveContext {
     std::unordered_map<std::string, std::vector<uint8_t>> client_public_keys;
 
     EnclaveContext() {
-      generate_public_key();
+      init_rng();
       generate_nonce();
       m_nonce_ctr = 0;
+      m_seq_window = 0;
       generate_symm_key();
       booster_ctr = 0;
       dmatrix_ctr = 0;
       num_clients = 0;
+      memory_limit = std::numeric_limits<size_t>::max();
+      num_evictions = 0;
+      num_reloads = 0;
     }
 
   public:
@@ -109,25 +166,66 @@ class EnclaveContext {
       return m_nonce;
     }
 
-    // Checks equality of received and expected nonce and nonce counter and increments nonce counter.
-    // FIXME: Redundant check; signature verification is enough
+    /**
+     * Set up the key pair that identifies the enclave to clients. With an empty
+     * |identity_key_path| a new key pair is generated at every launch. Otherwise the
+     * private key sealed at that path is reused if this enclave sealed it, and a newly
+     * generated key is sealed there for the next launch. Generating the key is the
+     * slowest step of launching the enclave.
+     */
+    void init_identity_key(const char* identity_key_path) {
+      auto start = std::chrono::steady_clock::now();
+      const std::string path(identity_key_path);
+      const bool unsealed = !path.empty() && unseal_identity_key(path);
+      if (!unsealed) {
+        generate_public_key();
+        if (!path.empty()) {
+          seal_identity_key(path);
+        }
+      }
+
+      // Write out the public key in PEM format for exchange with other enclaves.
+      int res = mbedtls_pk_write_pubkey_pem(&m_pk_context, m_public_key, sizeof(m_public_key));
+      if (res != 0) {
+        LOG(FATAL) << "mbedtls_pk_write_pubkey_pem failed with " << res;
+      }
+      auto elapsed = std::chrono::duration_cast<std::chrono::milliseconds>(
+          std::chrono::steady_clock::now() - start);
+      LOG(INFO) << (unsealed ? "Unsealed" : "Generated") << " enclave identity key in "
+                << elapsed.count() << " ms";
+    }
+
+    // Checks the received nonce and accepts each counter at most once. Clients may have several
+    // commands in flight, which can arrive out of order, so a counter is accepted if it is above
+    // every counter seen so far, or within kSeqWindowSize of the highest and not seen before.
     bool check_seq_num(uint8_t* recv_nonce, uint32_t recv_nonce_ctr) {
-      bool retval = recv_nonce_ctr == m_nonce_ctr;
-      if (!retval) return retval;
-      for (int i = 0; i < CIPHER_IV_SIZE; i++) {
-        retval = retval && (recv_nonce[i] == m_nonce[i]); 
+      if (memcmp(recv_nonce, m_nonce, CIPHER_IV_SIZE) != 0) {
+        return false;
+      }
+      std::lock_guard<std::mutex> guard(m_seq_mutex);
+      if (recv_nonce_ctr >= m_nonce_ctr) {
+        uint32_t shift = recv_nonce_ctr - m_nonce_ctr + 1;
+        m_seq_window = shift < kSeqWindowSize ? m_seq_window << shift : 0;
+        m_seq_window |= 1;
+        m_nonce_ctr = recv_nonce_ctr + 1;
+        return true;
       }
-      if (retval)
-        m_nonce_ctr += 1;
-      return retval;
+      uint32_t offset = m_nonce_ctr - 1 - recv_nonce_ctr;
+      if (offset >= kSeqWindowSize || (m_seq_window >> offset) & 1) {
+        return false;
+      }
+      m_seq_window |= 1ULL << offset;
+      return true;
     }
 
     // Note: Returned handle needs to be freed
-    BoosterHandle add_booster(void* booster) {
+    BoosterHandle add_booster(void* booster,
+                              std::vector<std::shared_ptr<void>> refs = {}) {
       std::ostringstream oss;
       oss << "Booster_" << ++booster_ctr;
       auto str = oss.str();
       booster_map[str] = booster;
+      booster_refs_map[str] = std::move(refs);
       BoosterHandle handle = strdup(str.c_str());
       LOG(DEBUG) << "Added booster " << handle;
       return handle;
@@ -143,6 +241,9 @@ class EnclaveContext {
       std::vector<std::string> v(usernames, usernames + len);
       dmatrix_owner_map[str] = v;
 
+      dmatrix_lru_pos[str] = dmatrix_lru.insert(dmatrix_lru.end(), str);
+      enforce_memory_limit(str);
+
       DMatrixHandle handle = strdup(str.c_str());
       LOG(DEBUG) << "Added dmatrix " << handle;
       debug_print_dmatrix_map();
@@ -163,7 +264,9 @@ class EnclaveContext {
       }
     }
 
-    void* get_dmatrix(DMatrixHandle handle) {
+    // Evicted matrices are reloaded unless |reload| is false. Loading a matrix may evict
+    // others, so callers must copy the shared pointer of a matrix before getting the next.
+    void* get_dmatrix(DMatrixHandle handle, bool reload = true) {
       LOG(DEBUG) << "Getting dmatrix " << handle;
       std::string str(handle);
       std::unordered_map<std::string, void*>::const_iterator iter = dmatrix_map.find(str);
@@ -171,9 +274,21 @@ class EnclaveContext {
         debug_print_dmatrix_map();
         LOG(FATAL) << "No such dmatrix oject: " << handle;
         return NULL;
-      } else {
-        return iter->second;
       }
+      auto evicted = evicted_dmatrix_map.find(str);
+      if (evicted == evicted_dmatrix_map.end()) {
+        // mark as most recently used
+        dmatrix_lru.splice(dmatrix_lru.end(), dmatrix_lru, dmatrix_lru_pos[str]);
+      } else if (reload) {
+        auto* mat = static_cast<std::shared_ptr<xgboost::DMatrix>*>(iter->second);
+        mat->reset(xgboost::data::UnspillDMatrix(evicted->second.path, evicted->second.id));
+        evicted_dmatrix_map.erase(evicted);
+        dmatrix_lru_pos[str] = dmatrix_lru.insert(dmatrix_lru.end(), str);
+        ++num_reloads;
+        LOG(DEBUG) << "Reloaded evicted dmatrix " << handle;
+        enforce_memory_limit(str);
+      }
+      return iter->second;
     }
 
     std::vector<std::string> get_dmatrix_owners(DMatrixHandle handle) {
@@ -221,12 +336,197 @@ class EnclaveContext {
       LOG(DEBUG) << oss.str();
     }
 
+    // Releases the booster's references to its cache DMatrices; a DMatrix whose
+    // handle was already freed is destroyed here.
     void del_booster(BoosterHandle handle) {
       booster_map.erase(handle);
+      booster_refs_map.erase(handle);
+      prediction_service_boosters.erase(handle);
+      early_stop_map.erase(handle);
+    }
+
+    // Best score and round of a booster so far, or nullptr if it has not been
+    // evaluated with early stopping yet
+    std::pair<double, int>* get_early_stop(BoosterHandle handle) {
+      auto it = early_stop_map.find(handle);
+      return it == early_stop_map.end() ? nullptr : &it->second;
+    }
+
+    void set_early_stop(BoosterHandle handle, double best_score, int best_iteration) {
+      early_stop_map[handle] = std::make_pair(best_score, best_iteration);
+    }
+
+    void enable_prediction_service(BoosterHandle handle) {
+      prediction_service_boosters.insert(handle);
+    }
+
+    // A booster whose configuration changes is no longer served, as configuring
+    // it again may require every worker
+    void disable_prediction_service(BoosterHandle handle) {
+      prediction_service_boosters.erase(handle);
+    }
+
+    bool is_prediction_service_enabled(BoosterHandle handle) {
+      return prediction_service_boosters.count(handle) != 0;
     }
 
     void del_dmatrix(DMatrixHandle handle) {
       dmatrix_map.erase(handle);
+      dmatrix_owner_map.erase(handle);
+      auto evicted = evicted_dmatrix_map.find(handle);
+      if (evicted != evicted_dmatrix_map.end()) {
+        std::remove(evicted->second.path.c_str());
+        evicted_dmatrix_map.erase(evicted);
+      } else {
+        auto pos = dmatrix_lru_pos.find(handle);
+        if (pos != dmatrix_lru_pos.end()) {
+          dmatrix_lru.erase(pos->second);
+          dmatrix_lru_pos.erase(pos);
+        }
+      }
+    }
+
+    // A limit of 0 selects three quarters of the enclave heap
+    void set_memory_limit(size_t limit, const char* dir) {
+      if (limit == 0) {
+        limit = heap_size() / 4 * 3;
+      }
+      memory_limit = limit == 0 ? std::numeric_limits<size_t>::max() : limit;
+      spill_dir = dir;
+      LOG(DEBUG) << "Evicting idle DMatrices to " << spill_dir << " above " << memory_limit
+                 << " bytes";
+    }
+
+    size_t heap_size() const {
+#ifdef ENCLAVE_NUM_HEAP_PAGES
+      return static_cast<size_t>(ENCLAVE_NUM_HEAP_PAGES) * 4096;
+#else
+      return 0;
+#endif
+    }
+
+    size_t dmatrix_bytes(const std::string& name) {
+      auto evicted = evicted_dmatrix_map.find(name);
+      if (evicted != evicted_dmatrix_map.end()) {
+        return 0;
+      }
+      return (*static_cast<std::shared_ptr<xgboost::DMatrix>*>(dmatrix_map[name]))->MemCostBytes();
+    }
+
+    // Bytes held by resident DMatrices and by prediction caches, the memory that
+    // grows with the data. Models are not counted, as measuring them serializes them.
+    size_t accounted_bytes() {
+      size_t total = 0;
+      for (auto const& kv : dmatrix_map) {
+        total += dmatrix_bytes(kv.first);
+      }
+      for (auto const& kv : booster_map) {
+        total += static_cast<xgboost::Learner*>(kv.second)->PredictionCacheMemCostBytes();
+      }
+      return total;
+    }
+
+    // Evict idle DMatrices, other than |in_use|, until the accounted memory is under the limit
+    void enforce_memory_limit(const std::string& in_use) {
+      if (memory_limit == std::numeric_limits<size_t>::max()) {
+        return;
+      }
+      size_t total = accounted_bytes();
+      auto it = dmatrix_lru.begin();
+      while (total > memory_limit && it != dmatrix_lru.end()) {
+        auto pos = it++;
+        const std::string& name = *pos;
+        auto* mat = static_cast<std::shared_ptr<xgboost::DMatrix>*>(dmatrix_map[name]);
+        // matrices cached by a booster are in use
+        if (name == in_use || mat->use_count() > 1) {
+          continue;
+        }
+        unsigned char rand[16];
+        generate_random(rand, sizeof(rand));
+        std::ostringstream path;
+        path << spill_dir << "/";
+        for (unsigned char c : rand) {
+          path << "0123456789abcdef"[c >> 4] << "0123456789abcdef"[c & 0xf];
+        }
+        path << ".evicted";
+        std::ostringstream id;
+        id << name << " " << num_evictions;
+        const size_t bytes = (*mat)->MemCostBytes();
+        if (!xgboost::data::SpillDMatrix(mat->get(), path.str(), id.str())) {
+          // external memory matrices are already on the host
+          continue;
+        }
+        mat->reset();
+        evicted_dmatrix_map[name] = {path.str(), id.str(), bytes};
+        LOG(DEBUG) << "Evicted idle dmatrix " << name << " of " << bytes << " bytes";
+        dmatrix_lru_pos.erase(name);
+        dmatrix_lru.erase(pos);
+        total -= bytes;
+        ++num_evictions;
+      }
+      if (total > memory_limit) {
+        LOG(WARNING) << "Enclave holds " << total << " bytes, above the limit of " << memory_limit
+                     << " bytes, and no idle DMatrix is left to evict";
+      }
+    }
+
+    // Memory held by each DMatrix and booster, as JSON
+    std::string get_memory_stats() {
+      xgboost::Json stats {xgboost::Object()};
+      stats["heap_size"] = xgboost::Integer(static_cast<int64_t>(heap_size()));
+      stats["memory_limit"] = memory_limit == std::numeric_limits<size_t>::max() ?
+          xgboost::Json(xgboost::Null()) :
+          xgboost::Json(xgboost::Integer(static_cast<int64_t>(memory_limit)));
+      stats["accounted_bytes"] = xgboost::Integer(static_cast<int64_t>(accounted_bytes()));
+      stats["num_evictions"] = xgboost::Integer(static_cast<int64_t>(num_evictions));
+      stats["num_reloads"] = xgboost::Integer(static_cast<int64_t>(num_reloads));
+
+      xgboost::Json dmatrices {xgboost::Object()};
+      for (auto const& kv : dmatrix_map) {
+        xgboost::Json entry {xgboost::Object()};
+        auto evicted = evicted_dmatrix_map.find(kv.first);
+        const bool resident = evicted == evicted_dmatrix_map.end();
+        entry["resident"] = xgboost::Boolean(resident);
+        entry["bytes"] = xgboost::Integer(static_cast<int64_t>(
+            resident ? dmatrix_bytes(kv.first) : evicted->second.bytes));
+        dmatrices[kv.first] = entry;
+      }
+      stats["dmatrices"] = dmatrices;
+
+      xgboost::Json boosters {xgboost::Object()};
+      for (auto const& kv : booster_map) {
+        auto* learner = static_cast<xgboost::Learner*>(kv.second);
+        xgboost::Json entry {xgboost::Object()};
+        entry["model_bytes"] = xgboost::Integer(static_cast<int64_t>(learner->ModelMemCostBytes()));
+        entry["prediction_cache_bytes"] =
+            xgboost::Integer(static_cast<int64_t>(learner->PredictionCacheMemCostBytes()));
+        boosters[kv.first] = entry;
+      }
+      stats["boosters"] = boosters;
+
+      std::string out;
+      xgboost::Json::Dump(stats, &out);
+      return out;
+    }
+
+    bool has_client_key(char* username) {
+      return client_keys.count(std::string(username)) != 0;
+    }
+
+    // Lowest counter that is certain not to have been used in the session
+    uint32_t get_nonce_ctr() {
+      std::lock_guard<std::mutex> guard(m_seq_mutex);
+      return m_nonce_ctr;
+    }
+
+    // Like get_client_key(), but returns false for an unknown user
+    bool find_client_key(uint8_t* key, const char* username) {
+      auto iter = client_keys.find(std::string(username));
+      if (iter == client_keys.end()) {
+        return false;
+      }
+      memcpy(key, (uint8_t*) iter->second.data(), CIPHER_KEY_SIZE);
+      return true;
     }
 
     void get_client_key(uint8_t* key, char *username) {
@@ -240,6 +540,29 @@ class EnclaveContext {
       }
     }
 
+    /**
+     * Derive the key that seals training checkpoints. The enclave symmetric key
+     * is regenerated every time the cluster starts, so checkpoints are instead
+     * sealed under a digest of the keys of all clients. A restarted enclave
+     * can unseal them once every client has provisioned its key again.
+     */
+    void get_checkpoint_key(uint8_t* key) {
+      std::vector<std::string> names(client_names);
+      std::sort(names.begin(), names.end());
+      std::string material("xgboost-checkpoint");
+      for (const auto& name : names) {
+        auto iter = client_keys.find(name);
+        if (iter == client_keys.end()) {
+          LOG(FATAL) << "No client key for user: " << name;
+        }
+        material.append(name);
+        material.append(iter->second.begin(), iter->second.end());
+      }
+      if (compute_sha256((const uint8_t*) material.data(), material.size(), key) != 0) {
+        LOG(FATAL) << "Failed to derive the checkpoint key";
+      }
+    }
+
     char* get_client_cert(char *username) {
       LOG(DEBUG) << "Getting username " << username;
       std::string str(username);
@@ -288,14 +611,14 @@ class EnclaveContext {
       return true;
     }
 
-    bool verify_signatures_with_nonce(std::vector<uint8_t> *bytes, char* signers[], uint8_t* signatures[], size_t sig_lengths[]){
+    bool verify_signatures_with_nonce(std::vector<uint8_t> *bytes, uint32_t nonce_ctr, char* signers[], uint8_t* signatures[], size_t sig_lengths[]){
       for (int i = 0; i < CIPHER_IV_SIZE; i ++) {
         bytes->push_back(m_nonce[i]);
       }
-      bytes->push_back(m_nonce_ctr >> 24);
-      bytes->push_back(m_nonce_ctr >> 16);
-      bytes->push_back(m_nonce_ctr >>  8);
-      bytes->push_back(m_nonce_ctr      );
+      bytes->push_back(nonce_ctr >> 24);
+      bytes->push_back(nonce_ctr >> 16);
+      bytes->push_back(nonce_ctr >>  8);
+      bytes->push_back(nonce_ctr      );
       
       return verifyClientSignatures(bytes->data(), bytes->size(), signers, signatures, sig_lengths);
     }
@@ -350,18 +673,33 @@ class EnclaveContext {
       return sign_data(m_pk_context, (uint8_t*)data, strlen(data), signature, sig_len);
     }
 
-    bool sign_bytes_with_nonce(std::vector<uint8_t> *bytes, uint8_t* signature, size_t* sig_len) {
+    // Sign the output of the command with counter |nonce_ctr|
+    bool sign_bytes_with_nonce(std::vector<uint8_t> *bytes, uint32_t nonce_ctr, uint8_t* signature, size_t* sig_len) {
       for (int i = 0; i < CIPHER_IV_SIZE; i ++) {
         bytes->push_back(m_nonce[i]);
       }
-      bytes->push_back(m_nonce_ctr >> 24);
-      bytes->push_back(m_nonce_ctr >> 16);
-      bytes->push_back(m_nonce_ctr >>  8);
-      bytes->push_back(m_nonce_ctr      );
+      bytes->push_back(nonce_ctr >> 24);
+      bytes->push_back(nonce_ctr >> 16);
+      bytes->push_back(nonce_ctr >>  8);
+      bytes->push_back(nonce_ctr      );
 
       return sign_data(m_pk_context, bytes->data(), bytes->size(), signature, sig_len);
     }
 
+    // Same as sign_bytes_with_nonce, for output that was hashed into |ctx| as it was produced
+    bool sign_digest_with_nonce(mbedtls_sha256_context* ctx, uint32_t nonce_ctr, uint8_t* signature, size_t* sig_len) {
+      uint8_t ctr[4] = {
+        static_cast<uint8_t>(nonce_ctr >> 24), static_cast<uint8_t>(nonce_ctr >> 16),
+        static_cast<uint8_t>(nonce_ctr >> 8), static_cast<uint8_t>(nonce_ctr)};
+      uint8_t hash[SHA_DIGEST_SIZE];
+      if (mbedtls_sha256_update_ret(ctx, m_nonce, CIPHER_IV_SIZE) != 0 ||
+          mbedtls_sha256_update_ret(ctx, ctr, sizeof(ctr)) != 0 ||
+          mbedtls_sha256_finish_ret(ctx, hash) != 0) {
+        LOG(FATAL) << "signing failed -- could not hash";
+      }
+      return sign_hash(m_pk_context, hash, signature, sig_len);
+    }
+
     // TODO(rishabh): Fix sequence of the various checks in this function
     bool decrypt_and_save_client_key_with_certificate(char * cert,
             int cert_len,
@@ -484,20 +822,25 @@ class EnclaveContext {
     }
 
     /**
-     * Generate an ephemeral public key pair for the enclave
+     * Initialize the random number generator used with the enclave key pair
      */
-    bool generate_public_key() {
+    void init_rng() {
       mbedtls_ctr_drbg_init(&m_ctr_drbg_context);
       mbedtls_entropy_init(&m_entropy_context);
       mbedtls_pk_init(&m_pk_context);
 
-      int res = -1;
       // Initialize entropy.
-      res = mbedtls_ctr_drbg_seed(&m_ctr_drbg_context, mbedtls_entropy_func, &m_entropy_context, NULL, 0);
+      int res = mbedtls_ctr_drbg_seed(&m_ctr_drbg_context, mbedtls_entropy_func, &m_entropy_context, NULL, 0);
       if (res != 0) {
         LOG(FATAL) << "mbedtls_ctr_drbg_seed failed with " << res;
       }
+    }
 
+    /**
+     * Generate an ephemeral public key pair for the enclave
+     */
+    void generate_public_key() {
+      int res = -1;
       // Initialize RSA context.
       res = mbedtls_pk_setup(&m_pk_context, mbedtls_pk_info_from_type(MBEDTLS_PK_RSA));
       if (res != 0) {
@@ -516,12 +859,143 @@ class EnclaveContext {
       if (res != 0) {
         LOG(FATAL) << "mbedtls_rsa_gen_key failed with " << res;
       }
+    }
 
-      // Write out the public key in PEM format for exchange with other enclaves.
-      res = mbedtls_pk_write_pubkey_pem(&m_pk_context, m_public_key, sizeof(m_public_key));
+    /**
+     * Derive the key that the identity key is sealed under from the enclave sealing key
+     */
+    void derive_identity_seal_key(const uint8_t* seal_key, size_t seal_key_size, uint8_t* key) {
+      std::string material(kIdentityKeyLabel);
+      material.append(reinterpret_cast<const char*>(seal_key), seal_key_size);
+      int res = compute_sha256(reinterpret_cast<const uint8_t*>(material.data()), material.size(), key);
+      mbedtls_platform_zeroize(&material[0], material.size());
       if (res != 0) {
-        LOG(FATAL) << "mbedtls_pk_write_pubkey_pem failed with " << res;
+        LOG(FATAL) << "Failed to derive the identity sealing key";
+      }
+    }
+
+    /**
+     * Seal the private key of the enclave to |path| on the host, with AES-GCM under a key
+     * derived from the sealing key of this enclave, as
+     *
+     *   magic | key info size (uint64_t) | key info | IV | tag | PEM size (uint64_t) | ciphertext
+     *
+     * The key info lets a relaunched enclave with the same identity recover the sealing key.
+     */
+    void seal_identity_key(const std::string& path) {
+      uint8_t* seal_key;
+      size_t seal_key_size;
+      uint8_t* key_info;
+      size_t key_info_size;
+      oe_result_t result = oe_get_seal_key_by_policy(
+          OE_SEAL_POLICY_UNIQUE, &seal_key, &seal_key_size, &key_info, &key_info_size);
+      if (result != OE_OK) {
+        LOG(WARNING) << "oe_get_seal_key_by_policy failed with " << oe_result_str(result)
+                     << ", the identity key is not sealed";
+        return;
+      }
+      uint8_t key[CIPHER_KEY_SIZE];
+      derive_identity_seal_key(seal_key, seal_key_size, key);
+      oe_free_key(seal_key, seal_key_size, NULL, 0);
+
+      unsigned char pem[5 * CIPHER_PK_SIZE];
+      int res = mbedtls_pk_write_key_pem(&m_pk_context, pem, sizeof(pem));
+      if (res != 0) {
+        LOG(FATAL) << "mbedtls_pk_write_key_pem failed with " << res;
+      }
+      const uint64_t size = strlen(reinterpret_cast<const char*>(pem));
+      unsigned char iv[CIPHER_IV_SIZE];
+      unsigned char tag[CIPHER_TAG_SIZE];
+      generate_random(iv, CIPHER_IV_SIZE);
+      mbedtls_gcm_context gcm;
+      cipher_init(&gcm, key);
+      res = mbedtls_gcm_crypt_and_tag(&gcm, MBEDTLS_GCM_ENCRYPT, size, iv, CIPHER_IV_SIZE,
+                                      reinterpret_cast<const unsigned char*>(kIdentityKeyLabel),
+                                      strlen(kIdentityKeyLabel), pem, pem, CIPHER_TAG_SIZE, tag);
+      mbedtls_gcm_free(&gcm);
+      mbedtls_platform_zeroize(key, sizeof(key));
+      if (res != 0) {
+        LOG(FATAL) << "Failed to seal the identity key";
       }
+
+      std::unique_ptr<dmlc::Stream> fo(dmlc::Stream::Create(path.c_str(), "w"));
+      const int magic = kIdentityKeyMagic;
+      const uint64_t info_size = key_info_size;
+      fo->Write(&magic, sizeof(magic));
+      fo->Write(&info_size, sizeof(info_size));
+      fo->Write(key_info, key_info_size);
+      fo->Write(iv, CIPHER_IV_SIZE);
+      fo->Write(tag, CIPHER_TAG_SIZE);
+      fo->Write(&size, sizeof(size));
+      fo->Write(pem, size);
+      oe_free_key(NULL, 0, key_info, key_info_size);
+      fo->Flush();
+    }
+
+    /**
+     * Load a private key written by seal_identity_key. Returns false if there is no key at
+     * |path|, or if it is truncated, forged, or was sealed by a different enclave.
+     */
+    bool unseal_identity_key(const std::string& path) {
+      std::unique_ptr<dmlc::Stream> fi(dmlc::Stream::Create(path.c_str(), "r", true));
+      if (fi == nullptr) {
+        return false;
+      }
+      int magic;
+      uint64_t info_size, size;
+      std::vector<uint8_t> key_info;
+      unsigned char iv[CIPHER_IV_SIZE];
+      unsigned char tag[CIPHER_TAG_SIZE];
+      unsigned char pem[5 * CIPHER_PK_SIZE];
+      if (fi->Read(&magic, sizeof(magic)) != sizeof(magic) || magic != kIdentityKeyMagic ||
+          fi->Read(&info_size, sizeof(info_size)) != sizeof(info_size) || info_size > sizeof(pem)) {
+        LOG(WARNING) << "Ignoring invalid sealed identity key " << path;
+        return false;
+      }
+      key_info.resize(info_size);
+      if (fi->Read(key_info.data(), info_size) != info_size ||
+          fi->Read(iv, CIPHER_IV_SIZE) != CIPHER_IV_SIZE ||
+          fi->Read(tag, CIPHER_TAG_SIZE) != CIPHER_TAG_SIZE ||
+          fi->Read(&size, sizeof(size)) != sizeof(size) || size >= sizeof(pem) ||
+          fi->Read(pem, size) != size) {
+        LOG(WARNING) << "Ignoring truncated sealed identity key " << path;
+        return false;
+      }
+
+      uint8_t* seal_key;
+      size_t seal_key_size;
+      oe_result_t result = oe_get_seal_key(key_info.data(), key_info.size(), &seal_key, &seal_key_size);
+      if (result != OE_OK) {
+        LOG(WARNING) << "Ignoring identity key " << path << " sealed by a different enclave: "
+                     << oe_result_str(result);
+        return false;
+      }
+      uint8_t key[CIPHER_KEY_SIZE];
+      derive_identity_seal_key(seal_key, seal_key_size, key);
+      oe_free_key(seal_key, seal_key_size, NULL, 0);
+
+      mbedtls_gcm_context gcm;
+      cipher_init(&gcm, key);
+      int res = mbedtls_gcm_auth_decrypt(&gcm, size, iv, CIPHER_IV_SIZE,
+                                         reinterpret_cast<const unsigned char*>(kIdentityKeyLabel),
+                                         strlen(kIdentityKeyLabel), tag, CIPHER_TAG_SIZE, pem, pem);
+      mbedtls_gcm_free(&gcm);
+      mbedtls_platform_zeroize(key, sizeof(key));
+      if (res != 0) {
+        LOG(WARNING) << "Ignoring sealed identity key " << path << " that failed authentication";
+        return false;
+      }
+      // the PEM parser expects the terminator to be counted
+      pem[size] = '\0';
+      res = mbedtls_pk_parse_key(&m_pk_context, pem, size + 1, NULL, 0);
+      mbedtls_platform_zeroize(pem, sizeof(pem));
+      if (res != 0 || mbedtls_pk_get_type(&m_pk_context) != MBEDTLS_PK_RSA) {
+        LOG(WARNING) << "Ignoring sealed identity key " << path << " that is not an RSA key";
+        mbedtls_pk_free(&m_pk_context);
+        mbedtls_pk_init(&m_pk_context);
+        return false;
+      }
+      return true;
     }
 
     /**
@@ -536,7 +536,7 @@ AllreduceBase::TryAllreduceTree(void *sendrecvbuf_,
   while (true) {
     // select helper
     bool finished = true;
-    utils::PollHelper watcher;
+    utils::SSLPollHelper watcher;
     for (int i = 0; i < nlink; ++i) {
       if (i == parent_index) {
         if (size_down_in != total_size) {
@@ -575,12 +575,15 @@ AllreduceBase::TryAllreduceTree(void *sendrecvbuf_,
       }
     }
     // read data from childs
+    bool read_progress = false;
     for (int i = 0; i < nlink; ++i) {
       if (i != parent_index && watcher.CheckRead(*links[i].sock)) {
+        const size_t size_read = links[i].size_read;
         ReturnType ret = links[i].ReadToRingBuffer(size_up_out, total_size);
         if (ret != kSuccess) {
           return ReportError(&links[i], ret);
         }
+        read_progress = read_progress || links[i].size_read != size_read;
       }
     }
     // this node have childs, peform reduce
@@ -620,7 +623,9 @@ AllreduceBase::TryAllreduceTree(void *sendrecvbuf_,
     }
     if (parent_index != -1) {
       // pass message up to parent, can pass data that are already been reduced
-      if (size_up_out < size_up_reduce) {
+      if (size_up_out < size_up_reduce &&
+          !DeferWrite(size_up_reduce - size_up_out, size_up_reduce != total_size,
+                      read_progress)) {
         ssize_t len = links[parent_index].sock->
             SSLSend(sendrecvbuf + size_up_out, size_up_reduce - size_up_out);
         if (len != -1) {
@@ -636,7 +641,7 @@ AllreduceBase::TryAllreduceTree(void *sendrecvbuf_,
       if (watcher.CheckRead(*links[parent_index].sock) &&
           total_size > size_down_in) {
         ssize_t len = links[parent_index].sock->
-            SSLRecvAll(sendrecvbuf + size_down_in, total_size - size_down_in);
+            SSLRecv(sendrecvbuf + size_down_in, total_size - size_down_in);
         if (len == 0) {
           links[parent_index].sock->Close();
           return ReportError(&links[parent_index], kRecvZeroLen);
@@ -702,7 +707,7 @@ AllreduceBase::TryBroadcast(void *sendrecvbuf_, size_t total_size, int root) {
   while (true) {
     bool finished = true;
     // select helper
-    utils::PollHelper watcher;
+    utils::SSLPollHelper watcher;
     for (int i = 0; i < nlink; ++i) {
       if (in_link == -2) {
         watcher.WatchRead(*links[i].sock); finished = false;
@@ -799,7 +804,7 @@ AllreduceBase::TryAllgatherRing(void *sendrecvbuf_, size_t total_size,
   while (true) {
     // select helper
     bool finished = true;
-    utils::PollHelper watcher;
+    utils::SSLPollHelper watcher;
     if (read_ptr != stop_read) {
       watcher.WatchRead(*next.sock);
       finished = false;
@@ -812,6 +817,7 @@ AllreduceBase::TryAllgatherRing(void *sendrecvbuf_, size_t total_size,
     }
     if (finished) break;
     watcher.Poll();
+    bool read_progress = false;
     if (read_ptr != stop_read && watcher.CheckRead(*next.sock)) {
       size_t size = stop_read - read_ptr;
       size_t start = read_ptr % total_size;
@@ -821,12 +827,15 @@ AllreduceBase::TryAllgatherRing(void *sendrecvbuf_, size_t total_size,
       ssize_t len = next.sock->SSLRecv(sendrecvbuf + start, size);
       if (len != -1) {
         read_ptr += static_cast<size_t>(len);
+        read_progress = len != 0;
       } else {
         ReturnType ret = Errno2Return();
         if (ret != kSuccess) return ReportError(&next, ret);
       }
     }
-    if (write_ptr < read_ptr && write_ptr != stop_write) {
+    if (write_ptr < read_ptr && write_ptr != stop_write &&
+        !DeferWrite(std::min(read_ptr, stop_write) - write_ptr, read_ptr < stop_write,
+                    read_progress)) {
       size_t size = std::min(read_ptr, stop_write) - write_ptr;
       size_t start = write_ptr % total_size;
       if (start + size > total_size) {
@@ -860,7 +869,8 @@ AllreduceBase::ReturnType
 AllreduceBase::TryReduceScatterRing(void *sendrecvbuf_,
                                     size_t type_nbytes,
                                     size_t count,
-                                    ReduceFunction reducer) {
+                                    ReduceFunction reducer,
+                                    const size_t *shard_ptr) {
   // read from next link and send to prev one
   LinkRecord &prev = *ring_prev, &next = *ring_next;
   // need to reply on special rank structure
@@ -871,16 +881,30 @@ AllreduceBase::TryReduceScatterRing(void *sendrecvbuf_,
   const size_t total_size = type_nbytes * count;
   size_t n = static_cast<size_t>(world_size);
   size_t step = (count + n - 1) / n;
+  // element offset of the shard owned by rank k
+  auto shard_begin = [&](size_t k) {
+    return shard_ptr == NULL ? std::min(k * step, count) : shard_ptr[k];
+  };
+  if (shard_ptr != NULL) {
+    utils::Assert(shard_ptr[0] == 0 && shard_ptr[n] == count,
+                  "ReduceScatter: shards must cover the buffer");
+    step = 1;
+    for (size_t k = 0; k < n; ++k) {
+      utils::Assert(shard_ptr[k] <= shard_ptr[k + 1],
+                    "ReduceScatter: shard offsets must be sorted");
+      step = std::max(step, shard_ptr[k + 1] - shard_ptr[k]);
+    }
+  }
   size_t r = static_cast<size_t>(next.rank);
-  size_t write_ptr = std::min(r * step, count) * type_nbytes;
-  size_t read_ptr = std::min((r + 1) * step, count) * type_nbytes;
+  size_t write_ptr = shard_begin(r) * type_nbytes;
+  size_t read_ptr = shard_begin(r + 1) * type_nbytes;
   size_t reduce_ptr = read_ptr;
   // send recv buffer
   char *sendrecvbuf = reinterpret_cast<char*>(sendrecvbuf_);
   // position to stop reading
   const size_t stop_read = total_size + write_ptr;
   // position to stop writing
-  size_t stop_write = total_size + std::min(rank * step, count) * type_nbytes;
+  size_t stop_write = total_size + shard_begin(rank) * type_nbytes;
   if (stop_write > stop_read) {
     stop_write -= total_size;
     utils::Assert(write_ptr <= stop_write, "write ptr boundary check");
@@ -893,7 +917,7 @@ AllreduceBase::TryReduceScatterRing(void *sendrecvbuf_,
   while (true) {
     // select helper
     bool finished = true;
-    utils::PollHelper watcher;
+    utils::SSLPollHelper watcher;
     if (read_ptr != stop_read) {
       watcher.WatchRead(*next.sock);
       finished = false;
@@ -906,11 +930,13 @@ AllreduceBase::TryReduceScatterRing(void *sendrecvbuf_,
     }
     if (finished) break;
     watcher.Poll();
+    bool read_progress = false;
     if (read_ptr != stop_read && watcher.CheckRead(*next.sock)) {
       ReturnType ret = next.ReadToRingBuffer(reduce_ptr, stop_read);
       if (ret != kSuccess) {
         return ReportError(&next, ret);
       }
+      read_progress = next.size_read != read_ptr;
       // sync the rate
       read_ptr = next.size_read;
       utils::Assert(read_ptr <= stop_read, "[%d] read_ptr boundary check", rank);
@@ -929,7 +955,9 @@ AllreduceBase::TryReduceScatterRing(void *sendrecvbuf_,
         reduce_ptr += nread;
       }
     }
-    if (write_ptr < reduce_ptr && write_ptr != stop_write) {
+    if (write_ptr < reduce_ptr && write_ptr != stop_write &&
+        !DeferWrite(std::min(reduce_ptr, stop_write) - write_ptr, reduce_ptr < stop_write,
+                    read_progress)) {
       size_t size = std::min(reduce_ptr, stop_write) - write_ptr;
       size_t start = write_ptr % total_size;
       if (start + size > total_size) {
@@ -962,7 +990,7 @@ AllreduceBase::TryAllreduceRing(void *sendrecvbuf_,
                                 size_t type_nbytes,
                                 size_t count,
                                 ReduceFunction reducer) {
-  ReturnType ret = TryReduceScatterRing(sendrecvbuf_, type_nbytes, count, reducer);
+  ReturnType ret = TryReduceScatterRing(sendrecvbuf_, type_nbytes, count, reducer, NULL);
   if (ret != kSuccess) return ret;
   size_t n = static_cast<size_t>(world_size);
   size_t step = (count + n - 1) / n;
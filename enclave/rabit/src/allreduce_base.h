@@ -145,6 +145,34 @@ class AllreduceBase : public IEngine {
                                type_nbytes, count, reducer) == kSuccess,
                   "Allreduce failed");
   }
+  /*!
+   * \brief perform in-place reduce-scatter, on sendrecvbuf
+   *        after the call, elements [shard_ptr[rank], shard_ptr[rank + 1])
+   *        hold the reduction result. Each worker sends and receives
+   *        (world_size - 1) / world_size of the buffer, half of what Allreduce
+   *        needs, and only pays for finalizing its own shard.
+   * \param sendrecvbuf_ buffer for both sending and recving data
+   * \param type_nbytes the unit number of bytes the type have
+   * \param count number of elements to be reduced
+   * \param shard_ptr world_size + 1 offsets of the shard of every worker
+   * \param reducer reduce function
+   * \param _file caller file name used to generate unique cache key
+   * \param _line caller line number used to generate unique cache key
+   * \param _caller caller function name used to generate unique cache key
+   */
+  virtual void ReduceScatter(void *sendrecvbuf_,
+                             size_t type_nbytes,
+                             size_t count,
+                             const size_t *shard_ptr,
+                             ReduceFunction reducer,
+                             const char* _file = _FILE,
+                             const int _line = _LINE,
+                             const char* _caller = _CALLER) {
+    if (world_size == 1 || world_size == -1 || count == 0) return;
+    utils::Assert(TryReduceScatterRing(sendrecvbuf_, type_nbytes, count,
+                                       reducer, shard_ptr) == kSuccess,
+                  "ReduceScatter failed");
+  }
   /*!
    * \brief broadcast data from root to all nodes
    * \param sendrecvbuf_ buffer for both sending and recving data
@@ -287,6 +315,18 @@ class AllreduceBase : public IEngine {
       return value != v;
     }
   };
+  /*!
+   * \brief whether a write of nwrite bytes should be held back, so that it
+   *  can be coalesced with data that is still arriving into a full TLS record.
+   *  Writes are only deferred while reads made progress in the same round,
+   *  so no worker blocks in poll while holding back data.
+   * \param nwrite number of bytes ready to be written
+   * \param more_data whether more data will become ready for this write
+   * \param read_progress whether data was read in this round
+   */
+  inline static bool DeferWrite(size_t nwrite, bool more_data, bool read_progress) {
+    return read_progress && more_data && nwrite < utils::SSLTcpSocket::kMaxRecordSize;
+  }
   /*! \brief translate errno to return type */
   inline static ReturnType Errno2Return() {
     int errsv = utils::Socket::GetLastError();
@@ -353,7 +393,7 @@ class AllreduceBase : public IEngine {
       nmax = std::min(nmax, buffer_size - ngap);
       nmax = std::min(nmax, buffer_size - offset);
       if (nmax == 0) return kSuccess;
-      ssize_t len = sock->SSLRecvAll(buffer_head + offset, nmax);
+      ssize_t len = sock->SSLRecv(buffer_head + offset, nmax);
       // length equals 0, remote disconnected
       if (len == 0) {
         sock->Close(); return kRecvZeroLen;
@@ -372,7 +412,7 @@ class AllreduceBase : public IEngine {
     inline ReturnType ReadToArray(void *recvbuf_, size_t max_size) {
       if (max_size == size_read) return kSuccess;
       char *p = static_cast<char*>(recvbuf_);
-      ssize_t len = sock->SSLRecvAll(p + size_read, max_size - size_read);
+      ssize_t len = sock->SSLRecv(p + size_read, max_size - size_read);
       // length equals 0, remote disconnected
       if (len == 0) {
         sock->Close(); return kRecvZeroLen;
@@ -490,19 +530,22 @@ class AllreduceBase : public IEngine {
    *
    *  after the function, node k get k-th segment of the reduction result
    *  the k-th segment is defined by [k * step, min((k + 1) * step,count) )
-   *  where step = ceil(count / world_size)
+   *  where step = ceil(count / world_size), or by
+   *  [shard_ptr[k], shard_ptr[k + 1]) when shard_ptr is given
    *
    * \param sendrecvbuf_ buffer for both sending and recving data
    * \param type_nbytes the unit number of bytes the type have
    * \param count number of elements to be reduced
    * \param reducer reduce function
+   * \param shard_ptr world_size + 1 offsets of the segments, NULL for equal segments
    * \return this function can return kSuccess, kSockError, kGetExcept, see ReturnType for details
    * \sa ReturnType, TryAllreduce
    */
   ReturnType TryReduceScatterRing(void *sendrecvbuf_,
                                   size_t type_nbytes,
                                   size_t count,
-                                  ReduceFunction reducer);
+                                  ReduceFunction reducer,
+                                  const size_t *shard_ptr = NULL);
   /*!
    * \brief perform in-place allreduce, on sendrecvbuf
    *  use a ring based algorithm, reduce-scatter + allgather
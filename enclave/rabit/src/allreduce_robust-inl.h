@@ -71,7 +71,7 @@ AllreduceRobust::MsgPassing(const NodeType &node_value,
       utils::Assert(stage != 2 && stage != 1, "invalie stage id");
     }
     // poll helper
-    utils::PollHelper watcher;
+    utils::SSLPollHelper watcher;
     bool done = (stage == 3);
     for (int i = 0; i < nlink; ++i) {
       watcher.WatchException(*links[i].sock);
@@ -589,7 +589,7 @@ AllreduceRobust::ReturnType AllreduceRobust::TryResetLinks(void) {
         if (len == sizeof(sig)) all_links[i].size_write = 2;
       }
     }
-    utils::PollHelper rsel;
+    utils::SSLPollHelper rsel;
     bool finished = true;
     for (int i = 0; i < nlink; ++i) {
       if (all_links[i].size_write != 2 && !all_links[i].sock->BadSocket()) {
@@ -606,7 +606,7 @@ AllreduceRobust::ReturnType AllreduceRobust::TryResetLinks(void) {
     }
   }
   while (true) {
-    utils::PollHelper rsel;
+    utils::SSLPollHelper rsel;
     bool finished = true;
     for (int i = 0; i < nlink; ++i) {
       if (all_links[i].size_read == 0 && !all_links[i].sock->BadSocket()) {
@@ -891,7 +891,7 @@ AllreduceRobust::TryRecoverData(RecoverType role,
   }
   while (true) {
     bool finished = true;
-    utils::PollHelper watcher;
+    utils::SSLPollHelper watcher;
     for (int i = 0; i < nlink; ++i) {
       if (i == recv_link && links[i].size_read != size) {
         watcher.WatchRead(*links[i].sock);
@@ -1547,7 +1547,7 @@ AllreduceRobust::RingPassing(void *sendrecvbuf_,
   char *buf = reinterpret_cast<char*>(sendrecvbuf_);
   while (true) {
     bool finished = true;
-    utils::PollHelper watcher;
+    utils::SSLPollHelper watcher;
     if (read_ptr != read_end) {
       watcher.WatchRead(*prev.sock);
       finished = false;
@@ -13,8 +13,10 @@
 #include "mbedtls/error.h"
 #include "mbedtls/debug.h"
 
+#include <algorithm>
 #include <memory>
 #include <string>
+#include <vector>
 
 #include "rabit/internal/socket.h"
 #include "../include/dmlc/logging.h"
@@ -72,82 +74,103 @@ class SSLTcpSocket : public TCPSocket {
     mbedtls_ssl_set_bio(&ssl, &net, mbedtls_net_send, mbedtls_net_recv, NULL);
   }
 
-  // SSL Write, note this does not support |flag| argument.
-  ssize_t SSLSend(const void *buf, size_t len) {
-    int ret = -1;
-    while( ( ret = mbedtls_ssl_write( &ssl, (const unsigned char*)buf, len ) ) <= 0 ) {
-      if( ret == MBEDTLS_ERR_NET_CONN_RESET ) {
+  /*!
+   * \brief non-blocking SSL write, note this does not support |flag| argument.
+   *  Sends as many full TLS records as the socket accepts.
+   *  A record cut short by a full socket buffer stays queued in mbedtls and is
+   *  completed by the next call, which must pass at least as many bytes.
+   * \return number of bytes sent, or -1 with errno set to EAGAIN if nothing could be sent
+   */
+  ssize_t SSLSend(const void *buf_, size_t len) {
+    const unsigned char *buf = reinterpret_cast<const unsigned char*>(buf_);
+    const size_t nmax = kMaxRecordSize;
+    size_t ndone = 0;
+    while (ndone < len) {
+      size_t nrecord = pending_write_ != 0 ? pending_write_ : std::min(len - ndone, nmax);
+      utils::Assert(nrecord <= len - ndone, "SSLSend: queued record was truncated");
+      int ret = mbedtls_ssl_write(&ssl, buf + ndone, nrecord);
+      if (ret == MBEDTLS_ERR_SSL_WANT_READ || ret == MBEDTLS_ERR_SSL_WANT_WRITE) {
+        pending_write_ = nrecord;
+        break;
+      }
+      if (ret < 0) {
         print_err(ret);
         return -1;
       }
+      pending_write_ = 0;
+      ndone += ret;
+    }
+    if (ndone == 0) {
+      errno = EAGAIN;
+      return -1;
+    }
+    return static_cast<ssize_t>(ndone);
+  }
 
-      if( ret != MBEDTLS_ERR_SSL_WANT_READ && ret != MBEDTLS_ERR_SSL_WANT_WRITE ) {
+  /*!
+   * \brief non-blocking SSL read, note this does not support |flag| argument.
+   *  Drains every TLS record that has already arrived, up to |len| bytes.
+   * \return number of bytes read, 0 if the peer closed the connection,
+   *  or -1 with errno set to EAGAIN if no data is available
+   */
+  ssize_t SSLRecv(void *buf_, size_t len) {
+    unsigned char *buf = reinterpret_cast<unsigned char*>(buf_);
+    size_t ndone = 0;
+    while (ndone < len) {
+      int ret = mbedtls_ssl_read(&ssl, buf + ndone, len - ndone);
+      if (ret == MBEDTLS_ERR_SSL_WANT_READ || ret == MBEDTLS_ERR_SSL_WANT_WRITE) {
+        break;
+      }
+      if (ret == 0 || ret == MBEDTLS_ERR_SSL_PEER_CLOSE_NOTIFY) {
+        if (ndone == 0) return 0;
+        break;
+      }
+      if (ret < 0) {
         print_err(ret);
         return -1;
       }
+      ndone += ret;
+    }
+    if (ndone == 0) {
+      errno = EAGAIN;
+      return -1;
     }
-    return ret;
+    return static_cast<ssize_t>(ndone);
   }
 
-  // SSL Read, note this does not support |flag| argument.
-  ssize_t SSLRecv(void *buf, size_t len) { 
-    int ret = -1;
-    do {
-      ret = mbedtls_ssl_read(&ssl, (unsigned char*)buf, len);
-
-      if( ret == MBEDTLS_ERR_SSL_WANT_READ || ret == MBEDTLS_ERR_SSL_WANT_WRITE )
-        continue;
-
-      if( ret <= 0 ) {
-        switch( ret ) {
-          case MBEDTLS_ERR_SSL_PEER_CLOSE_NOTIFY:
-            print_err(ret);
-            return -1;
-
-          case MBEDTLS_ERR_NET_CONN_RESET:
-            print_err(ret);
-            return -1;
-
-          default:
-            print_err(ret);
-            return -1;
-        }
-      }
-
-      if( ret > 0 )
-        break;
-    } while( 1 );
-    return ret;
+  /*! \brief whether mbedtls holds decrypted data that poll() cannot see */
+  bool SSLPending() const {
+    return mbedtls_ssl_get_bytes_avail(&ssl) != 0;
   }
 
+  // blocking send, waits on poll() instead of spinning when the socket is full
   size_t SSLSendAll(const void *buf_, size_t len) {
     const char *buf = reinterpret_cast<const char *>(buf_);
     size_t ndone = 0;
     while (ndone < len) {
-      ssize_t ret = SSLSend(buf, static_cast<ssize_t>(len - ndone));
-      if (ret != MBEDTLS_ERR_SSL_WANT_READ && ret != MBEDTLS_ERR_SSL_WANT_WRITE && ret < 0) {
-        if (LastErrorWouldBlock())
-          return ndone;
-        print_err(ret);
+      ssize_t ret = SSLSend(buf + ndone, len - ndone);
+      if (ret == -1) {
+        if (!LastErrorWouldBlock()) return ndone;
+        this->Wait(POLLOUT);
+        continue;
       }
-      buf += ret;
       ndone += ret;
     }
     return ndone;
   }
 
+  // blocking recv, waits on poll() instead of spinning when no data is available
   size_t SSLRecvAll(void *buf_, size_t len) {
     char *buf = reinterpret_cast<char *>(buf_);
     size_t ndone = 0;
     while (ndone < len) {
-      ssize_t ret = SSLRecv(buf, static_cast<sock_size_t>(len - ndone));
-      if (ret != MBEDTLS_ERR_SSL_WANT_READ && ret != MBEDTLS_ERR_SSL_WANT_WRITE && ret < 0) {
-        if (LastErrorWouldBlock())
-          return ndone;
-        print_err(ret);
+      ssize_t ret = SSLRecv(buf + ndone, len - ndone);
+      if (ret == -1) {
+        if (!LastErrorWouldBlock()) return ndone;
+        this->Wait(POLLIN);
+        continue;
       }
       if (ret == 0) return ndone;
-      buf += ret;
       ndone += ret;
     }
     return ndone;
@@ -183,8 +206,23 @@ class SSLTcpSocket : public TCPSocket {
     }
   }
 
+  /*! \brief largest plaintext carried by a single TLS record */
+  static const size_t kMaxRecordSize = MBEDTLS_SSL_MAX_CONTENT_LEN;
+
   mbedtls_ssl_context ssl;
  private:
+  void Wait(short events) {  // NOLINT(*)
+    pollfd pfd;
+    pfd.fd = sockfd;
+    pfd.events = events;
+    pfd.revents = 0;
+    if (poll(&pfd, 1, -1) == -1) {
+      Socket::Error("Poll");
+    }
+  }
+
+  // size of the record queued in mbedtls by an interrupted SSLSend
+  size_t pending_write_ {0};
   mbedtls_net_context net;
   mbedtls_ctr_drbg_context ctr_drbg;
   mbedtls_ssl_config conf;
@@ -196,6 +234,31 @@ class SSLTcpSocket : public TCPSocket {
   mbedtls_pk_context pkey;
 };
 
+/*!
+ * \brief poll helper for TLS links. Data that mbedtls has already read from
+ *  the socket and decrypted is invisible to poll(), so links holding such data
+ *  are reported readable without blocking.
+ */
+struct SSLPollHelper : public PollHelper {
+ public:
+  using PollHelper::WatchRead;
+  inline void WatchRead(const SSLTcpSocket &sock) {
+    PollHelper::WatchRead(sock.sockfd);
+    if (sock.SSLPending()) pending_.push_back(sock.sockfd);
+  }
+  inline void Poll(long timeout = -1) {  // NOLINT(*)
+    PollHelper::Poll(pending_.empty() ? timeout : 0);
+    for (SOCKET fd : pending_) {
+      auto& pfd = fds[fd];
+      pfd.fd = fd;
+      pfd.events |= POLLIN;
+    }
+  }
+
+ private:
+  std::vector<SOCKET> pending_;
+};
+
 }  // namespace utils
 }  // namespace rabit
 
@@ -22,9 +22,11 @@
 #include <xgboost/c_api/c_api_error.h>
 #include "../common/math.h"
 #include "../common/io.h"
+#include "../data/sealed_dmatrix_cache.h"
 
 #include "xgboost_t.h"
 #include <enclave/crypto.h>
+#include <enclave/host_io.h>
 #include "enclave_context.h"
 
 using namespace xgboost; // NOLINT(*);
@@ -253,6 +255,7 @@ int XGDMatrixCreateFromEncryptedFile(const char *fnames[],
                                      char* usernames[],
                                      xgboost::bst_ulong num_files,
                                      int silent,
+                                     const char* cache_dir,
                                      DMatrixHandle *out) {
 	API_BEGIN();
 	bool load_row_split = false;
@@ -271,7 +274,11 @@ int XGDMatrixCreateFromEncryptedFile(const char *fnames[],
 		memcpy(keys[i], key, CIPHER_KEY_SIZE);
 		fnames_vector.push_back(std::string(fnames[i]));
 	}
-	void *mat = new std::shared_ptr<DMatrix>(DMatrix::Load(fnames_vector, silent != 0, load_row_split, true, keys));
+	ResetHostReadStats();
+	void *mat = new std::shared_ptr<DMatrix>(data::LoadCachedDMatrix(fnames_vector, usernames, keys, silent != 0, load_row_split, cache_dir));
+	HostReadStats stats = GetHostReadStats();
+	LOG(INFO) << "XGDMatrixCreateFromEncryptedFile read " << stats.bytes << " bytes from host in "
+		<< stats.ocalls << " OCALLs";
 	char* out_str  = EnclaveContext::getInstance().add_dmatrix(mat, usernames, num_files);
 	*out = oe_host_strndup(out_str, strlen(out_str));
 
@@ -304,7 +311,7 @@ int XGDMatrixCreateFromFile(const char *fname,
 XGB_DLL int XGDMatrixFree(DMatrixHandle handle) {
 	API_BEGIN();
 	CHECK_HANDLE();
-	void* mat = EnclaveContext::getInstance().get_dmatrix(handle);
+	void* mat = EnclaveContext::getInstance().get_dmatrix(handle, false);
 	delete static_cast<std::shared_ptr<DMatrix>*>(mat);
 	EnclaveContext::getInstance().del_dmatrix(handle);
 	API_END();
@@ -404,7 +411,8 @@ XGB_DLL int XGBoosterCreate(const DMatrixHandle dmats[],
     LOG(DEBUG) << "Pushed matrix";
   }
   void* booster = Learner::Create(mats);
-  char* out_str = EnclaveContext::getInstance().add_booster(booster);
+  char* out_str = EnclaveContext::getInstance().add_booster(
+      booster, std::vector<std::shared_ptr<void>>(mats.begin(), mats.end()));
   *out = oe_host_strndup(out_str, strlen(out_str));
 
   free(out_str);
@@ -416,7 +424,7 @@ XGB_DLL int XGBoosterFree(BoosterHandle handle) {
   CHECK_HANDLE();
   void* bst = EnclaveContext::getInstance().get_booster(handle);
   delete static_cast<Booster*>(bst);
-  EnclaveContext::getInstance().del_dmatrix(handle);
+  EnclaveContext::getInstance().del_booster(handle);
   API_END();
 }
 
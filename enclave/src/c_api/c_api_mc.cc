@@ -3,6 +3,7 @@
 
 
 #include <xgboost/data.h>
+#include <xgboost/json.h>
 #include <xgboost/learner.h>
 #include <xgboost/c_api_mc.h>
 #include <xgboost/logging.h>
@@ -15,6 +16,7 @@
 #include <cstdio>
 #include <cstring>
 #include <algorithm>
+#include <limits>
 #include <vector>
 #include <string>
 #include <memory>
@@ -22,9 +24,12 @@
 #include <xgboost/c_api/c_api_error.h>
 #include "../common/math.h"
 #include "../common/io.h"
+#include "../data/adapter.h"
+#include "../data/sealed_dmatrix_cache.h"
 
 #include "xgboost_mc_t.h"
 #include <enclave/crypto.h>
+#include <enclave/host_io.h>
 #include "enclave_context.h"
 
 using namespace xgboost; // NOLINT(*);
@@ -255,17 +260,22 @@ int XGBRegisterLogCallback(void (*callback)(const char*)) {
   API_END();
 }
 
-void check_signed_input(std::ostringstream& ss, char** signers, uint8_t** signatures, size_t* sig_lengths) {
+// Verify the signatures over the command with counter |nonce_ctr|, and claim the counter so the
+// command cannot be replayed
+void check_signed_input(std::ostringstream& ss, uint8_t* nonce, uint32_t nonce_ctr,
+                        char** signers, uint8_t** signatures, size_t* sig_lengths) {
   std::string const& s = ss.str();
   std::vector<uint8_t> bytes(s.begin(), s.end());
-  EnclaveContext::getInstance().verify_signatures_with_nonce(&bytes, signers, signatures, sig_lengths);
+  EnclaveContext::getInstance().verify_signatures_with_nonce(&bytes, nonce_ctr, signers, signatures, sig_lengths);
+  if (!EnclaveContext::getInstance().check_seq_num(nonce, nonce_ctr))
+    LOG(FATAL) << "Incorrect sequence number detected. Exiting.";
 }
 
-void get_signed_output(std::vector<uint8_t> *bytes, uint8_t** out_sig, size_t* out_sig_length) {
+void get_signed_output(std::vector<uint8_t> *bytes, uint32_t nonce_ctr, uint8_t** out_sig, size_t* out_sig_length) {
   // Sign the data and copy to host
   uint8_t* _out_sig = (uint8_t*) malloc(SIG_ALLOC_SIZE * sizeof(uint8_t));
   size_t _out_sig_length = SIG_ALLOC_SIZE;
-  EnclaveContext::getInstance().sign_bytes_with_nonce(bytes, _out_sig,  &_out_sig_length);
+  EnclaveContext::getInstance().sign_bytes_with_nonce(bytes, nonce_ctr, _out_sig,  &_out_sig_length);
   uint8_t* host_buf  = (uint8_t*) oe_host_malloc(_out_sig_length);
   memcpy(host_buf, _out_sig, _out_sig_length);
   *out_sig_length = _out_sig_length;
@@ -273,10 +283,94 @@ void get_signed_output(std::vector<uint8_t> *bytes, uint8_t** out_sig, size_t* o
   free(_out_sig);
 }
 
+// Sign output that was hashed into |ctx| as it was written to the host
+void get_signed_output(mbedtls_sha256_context* ctx, uint32_t nonce_ctr, uint8_t** out_sig, size_t* out_sig_length) {
+  uint8_t* _out_sig = (uint8_t*) malloc(SIG_ALLOC_SIZE * sizeof(uint8_t));
+  size_t _out_sig_length = SIG_ALLOC_SIZE;
+  EnclaveContext::getInstance().sign_digest_with_nonce(ctx, nonce_ctr, _out_sig, &_out_sig_length);
+  uint8_t* host_buf  = (uint8_t*) oe_host_malloc(_out_sig_length);
+  memcpy(host_buf, _out_sig, _out_sig_length);
+  *out_sig_length = _out_sig_length;
+  *out_sig = host_buf;
+  free(_out_sig);
+}
+
+namespace {
+/*! \brief size of the blocks of output encrypted in enclave memory before they are copied to the host */
+constexpr size_t kOutputChunkSize = 1UL << 16UL;
+
+#define CHECK_OUTPUT(ret) CHECK_EQ((ret), 0) << "Failed to encrypt output"
+
+/*!
+ * \brief Encrypt |data| with AES-GCM under |key| into host memory, laid out as
+ *  IV | tag | ciphertext, and sign it. The ciphertext is produced a block at a
+ *  time in enclave memory and hashed before it is copied out, so the output is
+ *  never held twice in the enclave and the host cannot change what is signed.
+ *  As the tag is only known at the end, the signature is over
+ *  IV | ciphertext | tag followed by the nonce.
+ * \return the host buffer
+ */
+uint8_t* EncryptToHost(unsigned char* key, const unsigned char* data, size_t size,
+                       uint32_t nonce_ctr, uint8_t** out_sig, size_t* out_sig_length) {
+  uint8_t* host_buf = (uint8_t*) oe_host_malloc(CIPHER_IV_SIZE + CIPHER_TAG_SIZE + size);
+  CHECK(host_buf != nullptr) << "Failed to allocate " << size << " bytes of host memory for output";
+  uint8_t* host_iv = host_buf;
+  uint8_t* host_tag = host_buf + CIPHER_IV_SIZE;
+  uint8_t* host_output = host_tag + CIPHER_TAG_SIZE;
+
+  unsigned char iv[CIPHER_IV_SIZE];
+  unsigned char tag[CIPHER_TAG_SIZE];
+  generate_random(iv, CIPHER_IV_SIZE);
+  memcpy(host_iv, iv, CIPHER_IV_SIZE);
+
+  mbedtls_sha256_context sha;
+  mbedtls_sha256_init(&sha);
+  CHECK_OUTPUT(mbedtls_sha256_starts_ret(&sha, 0));
+  CHECK_OUTPUT(mbedtls_sha256_update_ret(&sha, iv, CIPHER_IV_SIZE));
+
+  mbedtls_gcm_context gcm;
+  cipher_init(&gcm, key);
+  CHECK_OUTPUT(mbedtls_gcm_starts(&gcm, MBEDTLS_GCM_ENCRYPT, iv, CIPHER_IV_SIZE, NULL, 0));
+  std::vector<unsigned char> chunk(std::min(size, kOutputChunkSize));
+  for (size_t offset = 0; offset < size; offset += chunk.size()) {
+    // every block but the last is a multiple of the AES block size
+    const size_t n = std::min(chunk.size(), size - offset);
+    CHECK_OUTPUT(mbedtls_gcm_update(&gcm, n, data + offset, chunk.data()));
+    CHECK_OUTPUT(mbedtls_sha256_update_ret(&sha, chunk.data(), n));
+    memcpy(host_output + offset, chunk.data(), n);
+  }
+  CHECK_OUTPUT(mbedtls_gcm_finish(&gcm, tag, CIPHER_TAG_SIZE));
+  mbedtls_gcm_free(&gcm);
+  memcpy(host_tag, tag, CIPHER_TAG_SIZE);
+
+  CHECK_OUTPUT(mbedtls_sha256_update_ret(&sha, tag, CIPHER_TAG_SIZE));
+  get_signed_output(&sha, nonce_ctr, out_sig, out_sig_length);
+  mbedtls_sha256_free(&sha);
+  return host_buf;
+}
+}  // anonymous namespace
+
+int XGBResumeSession(char* username, char* challenge, uint32_t* out_nonce_ctr,
+                     uint8_t** out_sig, size_t* out_sig_length) {
+  API_BEGIN();
+  // The session only lives as long as the keys the client provisioned, a
+  // relaunched enclave has to be attested again
+  CHECK(EnclaveContext::getInstance().has_client_key(username))
+      << "No session to resume for user: " << username;
+  std::ostringstream oss;
+  oss << "XGBResumeSession username " << username << " challenge " << challenge;
+  std::string args = oss.str();
+  std::vector<uint8_t> bytes(args.begin(), args.end());
+  *out_nonce_ctr = EnclaveContext::getInstance().get_nonce_ctr();
+  get_signed_output(&bytes, *out_nonce_ctr, out_sig, out_sig_length);
+  API_END();
+}
+
 int XGDMatrixCreateFromEncryptedFile(const char *fnames[],
                                      char* usernames[],
                                      xgboost::bst_ulong num_files,
                                      int silent,
+                                     const char* cache_dir,
                                      uint8_t* nonce,
                                      size_t nonce_size,
                                      uint32_t nonce_ctr,
@@ -300,8 +394,8 @@ int XGDMatrixCreateFromEncryptedFile(const char *fnames[],
     for (xgboost::bst_ulong i = 0; i < num_files; i++) {
         oss << " username " << usernames[i] << " filename " << fnames[i];
     }
-    oss << " silent " << silent;
-    check_signed_input(oss, signers, signatures, sig_lengths);
+    oss << " silent " << silent << " cache_dir " << cache_dir;
+    check_signed_input(oss, nonce, nonce_ctr, signers, signatures, sig_lengths);
 
     char* keys[num_files];
     std::vector<const std::string> fnames_vector;
@@ -312,7 +406,11 @@ int XGDMatrixCreateFromEncryptedFile(const char *fnames[],
         memcpy(keys[i], key, CIPHER_KEY_SIZE);
         fnames_vector.push_back(std::string(fnames[i]));
     }
-    void *mat = new std::shared_ptr<DMatrix>(DMatrix::Load(fnames_vector, silent != 0, load_row_split, true, keys));
+    ResetHostReadStats();
+    void *mat = new std::shared_ptr<DMatrix>(data::LoadCachedDMatrix(fnames_vector, usernames, keys, silent != 0, load_row_split, cache_dir));
+    HostReadStats stats = GetHostReadStats();
+    LOG(INFO) << "XGDMatrixCreateFromEncryptedFile read " << stats.bytes << " bytes from host in "
+              << stats.ocalls << " OCALLs";
     char* out_str  = EnclaveContext::getInstance().add_dmatrix(mat, usernames, num_files);
     *out = oe_host_strndup(out_str, strlen(out_str));
 
@@ -321,13 +419,12 @@ int XGDMatrixCreateFromEncryptedFile(const char *fnames[],
     sss << "handle " << out_str;
     std::string const& s = sss.str();
     std::vector<uint8_t> bytes(s.begin(), s.end());
-    get_signed_output(&bytes, out_sig, out_sig_length);
+    get_signed_output(&bytes, nonce_ctr, out_sig, out_sig_length);
 
     free(out_str);
     for (int i = 0; i < num_files; ++i) {
         free(keys[i]);
     }
-    CHECK_SEQUENCE_NUMBER();
     API_END();
 }
 
@@ -349,13 +446,32 @@ int XGDMatrixCreateFromFile(const char *fname,
     API_END();
 }
 
-// FIXME consensus
-XGB_DLL int XGDMatrixFree(DMatrixHandle handle) {
+XGB_DLL int XGDMatrixFree(DMatrixHandle handle,
+                          uint8_t* nonce,
+                          size_t nonce_size,
+                          uint32_t nonce_ctr,
+                          uint8_t** out_sig,
+                          size_t *out_sig_length,
+                          char **signers,
+                          uint8_t** signatures,
+                          size_t* sig_lengths) {
   API_BEGIN();
   CHECK_HANDLE();
-  void* mat = EnclaveContext::getInstance().get_dmatrix(handle);
+  // signature verification
+  std::ostringstream oss;
+  oss << "XGDMatrixFree handle " << handle;
+  check_signed_input(oss, nonce, nonce_ctr, signers, signatures, sig_lengths);
+
+  // boosters that cache this matrix hold their own references to it, so the
+  // matrix is only destroyed once the last of them is freed
+  void* mat = EnclaveContext::getInstance().get_dmatrix(handle, false);
   delete static_cast<std::shared_ptr<DMatrix>*>(mat);
   EnclaveContext::getInstance().del_dmatrix(handle);
+
+  // sign the output
+  std::vector<uint8_t> bytes;
+  get_signed_output(&bytes, nonce_ctr, out_sig, out_sig_length);
+
   API_END();
 }
 
@@ -434,7 +550,7 @@ XGB_DLL int XGDMatrixNumRow(const DMatrixHandle handle,
   // signature verification
   std::ostringstream oss;
   oss << "XGDMatrixNumRow " << handle;
-  check_signed_input(oss, signers, signatures, sig_lengths);
+  check_signed_input(oss, nonce, nonce_ctr, signers, signatures, sig_lengths);
 
   void* mat = EnclaveContext::getInstance().get_dmatrix(handle);
   *out = static_cast<xgboost::bst_ulong>(
@@ -445,9 +561,8 @@ XGB_DLL int XGDMatrixNumRow(const DMatrixHandle handle,
   sss << *out;
   std::string const& s = sss.str();
   std::vector<uint8_t> bytes(s.begin(), s.end());
-  get_signed_output(&bytes, out_sig, out_sig_length);
+  get_signed_output(&bytes, nonce_ctr, out_sig, out_sig_length);
 
-  CHECK_SEQUENCE_NUMBER();
   API_END();
 }
 
@@ -466,7 +581,7 @@ XGB_DLL int XGDMatrixNumCol(const DMatrixHandle handle,
   // signature verification
   std::ostringstream oss;
   oss << "XGDMatrixNumCol " << handle;
-  check_signed_input(oss, signers, signatures, sig_lengths);
+  check_signed_input(oss, nonce, nonce_ctr, signers, signatures, sig_lengths);
 
   void* mat = EnclaveContext::getInstance().get_dmatrix(handle);
   *out = static_cast<size_t>(
@@ -477,9 +592,8 @@ XGB_DLL int XGDMatrixNumCol(const DMatrixHandle handle,
   sss << *out;
   std::string const& s = sss.str();
   std::vector<uint8_t> bytes(s.begin(), s.end());
-  get_signed_output(&bytes, out_sig, out_sig_length);
+  get_signed_output(&bytes, nonce_ctr, out_sig, out_sig_length);
 
-  CHECK_SEQUENCE_NUMBER();
   API_END();
 }
 
@@ -500,7 +614,7 @@ XGB_DLL int XGBoosterCreate(const DMatrixHandle dmats[],
   // signature verification
   std::ostringstream oss;
   oss << "XGBoosterCreate";
-  check_signed_input(oss, signers, signatures, sig_lengths);
+  check_signed_input(oss, nonce, nonce_ctr, signers, signatures, sig_lengths);
 
   std::vector<std::shared_ptr<DMatrix> > mats;
   for (xgboost::bst_ulong i = 0; i < len; ++i) {
@@ -510,7 +624,8 @@ XGB_DLL int XGBoosterCreate(const DMatrixHandle dmats[],
     LOG(DEBUG) << "Pushed matrix";
   }
   void* booster = Learner::Create(mats);
-  char* out_str = EnclaveContext::getInstance().add_booster(booster);
+  char* out_str = EnclaveContext::getInstance().add_booster(
+      booster, std::vector<std::shared_ptr<void>>(mats.begin(), mats.end()));
   *out = oe_host_strndup(out_str, strlen(out_str));
 
   // sign the output
@@ -518,19 +633,61 @@ XGB_DLL int XGBoosterCreate(const DMatrixHandle dmats[],
   sss << "handle " << out_str;
   std::string const& s = sss.str();
   std::vector<uint8_t> bytes(s.begin(), s.end());
-  get_signed_output(&bytes, out_sig, out_sig_length);
+  get_signed_output(&bytes, nonce_ctr, out_sig, out_sig_length);
 
   free(out_str);
-  CHECK_SEQUENCE_NUMBER();
   API_END();
 }
 
-XGB_DLL int XGBoosterFree(BoosterHandle handle) {
+XGB_DLL int XGBoosterFree(BoosterHandle handle,
+                          uint8_t* nonce,
+                          size_t nonce_size,
+                          uint32_t nonce_ctr,
+                          uint8_t** out_sig,
+                          size_t *out_sig_length,
+                          char **signers,
+                          uint8_t** signatures,
+                          size_t* sig_lengths) {
   API_BEGIN();
   CHECK_HANDLE();
+  // signature verification
+  std::ostringstream oss;
+  oss << "XGBoosterFree handle " << handle;
+  check_signed_input(oss, nonce, nonce_ctr, signers, signatures, sig_lengths);
+
   void* bst = EnclaveContext::getInstance().get_booster(handle);
   delete static_cast<Booster*>(bst);
-  EnclaveContext::getInstance().del_dmatrix(handle);
+  EnclaveContext::getInstance().del_booster(handle);
+
+  // sign the output
+  std::vector<uint8_t> bytes;
+  get_signed_output(&bytes, nonce_ctr, out_sig, out_sig_length);
+
+  API_END();
+}
+
+XGB_DLL int XGBGetEnclaveMemoryStats(uint8_t* nonce,
+                                     size_t nonce_size,
+                                     uint32_t nonce_ctr,
+                                     char** out_stats,
+                                     uint8_t** out_sig,
+                                     size_t *out_sig_length,
+                                     char **signers,
+                                     uint8_t** signatures,
+                                     size_t* sig_lengths) {
+  API_BEGIN();
+  // signature verification
+  std::ostringstream oss;
+  oss << "XGBGetEnclaveMemoryStats";
+  check_signed_input(oss, nonce, nonce_ctr, signers, signatures, sig_lengths);
+
+  std::string stats = EnclaveContext::getInstance().get_memory_stats();
+  *out_stats = oe_host_strndup(stats.c_str(), stats.length());
+
+  // sign the output
+  std::vector<uint8_t> bytes(stats.begin(), stats.end());
+  get_signed_output(&bytes, nonce_ctr, out_sig, out_sig_length);
+
   API_END();
 }
 
@@ -551,16 +708,16 @@ XGB_DLL int XGBoosterSetParam(BoosterHandle handle,
   // signature verification
   std::ostringstream oss;
   oss << "XGBoosterSetParam " << handle << " " << name << "," << value;
-  check_signed_input(oss, signers, signatures, sig_lengths);
+  check_signed_input(oss, nonce, nonce_ctr, signers, signatures, sig_lengths);
 
   void* bst = EnclaveContext::getInstance().get_booster(handle);
   static_cast<Booster*>(bst)->SetParam(name, value);
+  EnclaveContext::getInstance().disable_prediction_service(handle);
 
   // sign the output
   std::vector<uint8_t> bytes;
-  get_signed_output(&bytes, out_sig, out_sig_length);
+  get_signed_output(&bytes, nonce_ctr, out_sig, out_sig_length);
 
-  CHECK_SEQUENCE_NUMBER(); 
   API_END();
 }
 
@@ -582,7 +739,7 @@ XGB_DLL int XGBoosterUpdateOneIter(BoosterHandle handle,
   // signature verification
   std::ostringstream oss;
   oss << "XGBoosterUpdateOneIter booster_handle " << handle << " iteration " << iter << " train_data_handle " << dtrain;
-  check_signed_input(oss, signers, signatures, sig_lengths);
+  check_signed_input(oss, nonce, nonce_ctr, signers, signatures, sig_lengths);
 
   auto* bst = static_cast<Booster*>(EnclaveContext::getInstance().get_booster(handle));
   auto *dtr =
@@ -591,9 +748,8 @@ XGB_DLL int XGBoosterUpdateOneIter(BoosterHandle handle,
 
   // sign the output
   std::vector<uint8_t> bytes;
-  get_signed_output(&bytes, out_sig, out_sig_length);
+  get_signed_output(&bytes, nonce_ctr, out_sig, out_sig_length);
 
-  CHECK_SEQUENCE_NUMBER(); 
   API_END();
 }
 
@@ -618,28 +774,176 @@ XGB_DLL int XGBoosterBoostOneIter(BoosterHandle handle,
   API_END();
 }
 
-// FIXME consensus
+/*!
+ * \brief Encrypt a string with the given key and encode it as
+ *  base64(iv),base64(tag),base64(ciphertext)
+ */
+inline std::string EncryptAndEncode(unsigned char* key, const std::string& str) {
+  unsigned char iv[CIPHER_IV_SIZE];
+  unsigned char tag[CIPHER_TAG_SIZE];
+  std::vector<unsigned char> encrypted(str.length());
+
+  encrypt_symm(
+      key,
+      (const unsigned char*) str.data(),
+      str.length(),
+      NULL,
+      0,
+      encrypted.data(),
+      iv,
+      tag);
+
+  std::string total_encoded = "";
+  total_encoded.append(dmlc::data::base64_encode(iv, CIPHER_IV_SIZE));
+  total_encoded.append(",");
+  total_encoded.append(dmlc::data::base64_encode(tag, CIPHER_TAG_SIZE));
+  total_encoded.append(",");
+  total_encoded.append(dmlc::data::base64_encode(encrypted.data(), str.length()));
+  return total_encoded;
+}
+
+/*!
+ * \brief Evaluate each of |data_sets| separately and assemble, for every client,
+ *  "[iter]\tname-metric:value..." with the metrics of the sets it owns. The
+ *  entry is empty for clients that own none of the sets.
+ * \param last_metric set to the last "name-metric:value" of the last set
+ */
+inline std::vector<std::string> EvalForOwners(Booster* bst, int iter,
+                                              const std::vector<std::shared_ptr<DMatrix>>& data_sets,
+                                              const std::vector<std::string>& data_names,
+                                              const std::vector<std::vector<std::string>>& set_owners,
+                                              const std::vector<std::string>& clients,
+                                              std::string* last_metric) {
+  std::vector<std::string> metrics(clients.size());
+  for (size_t j = 0; j < data_sets.size(); ++j) {
+    // Predictions for the evaluation sets are served from the learner's
+    // prediction cache, so only the trees added since the last call are run
+    std::string eval_str = bst->EvalOneIter(iter, {data_sets[j]}, {data_names[j]});
+    size_t begin = eval_str.find('\t');
+    std::string set_metrics = begin == std::string::npos ? "" : eval_str.substr(begin);
+    for (size_t i = 0; i < clients.size(); ++i) {
+      if (std::find(set_owners[j].begin(), set_owners[j].end(), clients[i]) != set_owners[j].end()) {
+        metrics[i].append(set_metrics);
+      }
+    }
+    *last_metric = set_metrics.substr(set_metrics.rfind('\t') + 1);
+  }
+  for (auto& entry : metrics) {
+    if (!entry.empty()) {
+      entry = "[" + std::to_string(iter) + "]" + entry;
+    }
+  }
+  return metrics;
+}
+
+/*!
+ * \brief Update the best round of the booster with the last metric of this
+ *  round, in the same way as the early_stop callback of the Python package.
+ * \return whether training should stop
+ */
+inline bool UpdateEarlyStop(BoosterHandle handle, int iter, const std::string& metric,
+                            int early_stopping_rounds, int* best_iteration) {
+  size_t colon = metric.rfind(':');
+  CHECK_NE(colon, std::string::npos) << "Early stopping requires an evaluation metric";
+  double score = std::stod(metric.substr(colon + 1));
+  std::string label = metric.substr(0, colon);
+  std::string name = label.substr(label.find('-') + 1);
+  bool maximize = false;
+  for (const char* m : {"auc", "aucpr", "map", "ndcg"}) {
+    maximize = maximize || name == m || name.find(std::string(m) + "@") == 0;
+  }
+
+  std::pair<double, int>* best = EnclaveContext::getInstance().get_early_stop(handle);
+  if (best == nullptr || (maximize && score > best->first) || (!maximize && score < best->first)) {
+    EnclaveContext::getInstance().set_early_stop(handle, score, iter);
+    *best_iteration = iter;
+    return false;
+  }
+  *best_iteration = best->second;
+  return iter - best->second >= early_stopping_rounds;
+}
+
 XGB_DLL int XGBoosterEvalOneIter(BoosterHandle handle,
-    int iter,
-    DMatrixHandle dmats[],
-    const char* evnames[],
-    xgboost::bst_ulong len,
-    const char** out_str) {
+                                 int iter,
+                                 DMatrixHandle dmats[],
+                                 const char* evnames[],
+                                 xgboost::bst_ulong len,
+                                 int early_stopping_rounds,
+                                 uint8_t *nonce,
+                                 size_t nonce_size,
+                                 uint32_t nonce_ctr,
+                                 xgboost::bst_ulong* out_len,
+                                 const char*** out_result,
+                                 uint8_t** out_sig,
+                                 size_t *out_sig_length,
+                                 char **signers,
+                                 uint8_t** signatures,
+                                 size_t* sig_lengths) {
   API_BEGIN();
   CHECK_HANDLE();
+
+  // signature verification
+  std::ostringstream oss;
+  oss << "XGBoosterEvalOneIter booster_handle " << handle << " iteration " << iter
+      << " early_stopping_rounds " << early_stopping_rounds;
+  for (xgboost::bst_ulong i = 0; i < len; ++i) {
+    oss << " data_handle " << dmats[i] << " data_name " << evnames[i];
+  }
+  check_signed_input(oss, nonce, nonce_ctr, signers, signatures, sig_lengths);
+  CHECK_GE(early_stopping_rounds, 0) << "Invalid number of early stopping rounds";
+  CHECK(early_stopping_rounds == 0 || len != 0)
+      << "Early stopping requires at least one evaluation set";
+
   auto* bst = static_cast<Booster*>(EnclaveContext::getInstance().get_booster(handle));
-  std::string& eval_str = bst->GetThreadLocal().ret_str;
   std::vector<std::shared_ptr<DMatrix>> data_sets;
   std::vector<std::string> data_names;
+  std::vector<std::vector<std::string>> set_owners;
 
   for (xgboost::bst_ulong i = 0; i < len; ++i) {
     void* mat = EnclaveContext::getInstance().get_dmatrix(dmats[i]);
     data_sets.push_back(*static_cast<std::shared_ptr<DMatrix>*>(mat));
     data_names.emplace_back(evnames[i]);
+    set_owners.push_back(EnclaveContext::getInstance().get_dmatrix_owners(dmats[i]));
+  }
+
+  // The metrics of each set are only released to the owners of that set, while
+  // the early stopping decision is released to every client, so that all
+  // clients stop at the same round
+  std::vector<std::string> clients = EnclaveContext::getInstance().get_clients();
+  std::string last_metric;
+  std::vector<std::string> metrics = EvalForOwners(bst, iter, data_sets, data_names, set_owners,
+                                                   clients, &last_metric);
+  int best_iteration = -1;
+  bool stop = false;
+  if (early_stopping_rounds > 0) {
+    stop = UpdateEarlyStop(handle, iter, last_metric, early_stopping_rounds, &best_iteration);
+  }
+
+  // One entry per client, in the enclave's client order, followed by the
+  // decision as "<best_iteration> <stop>"
+  char** usr_addr_result = (char**) oe_host_malloc((clients.size() + 1) * sizeof(char*));
+  unsigned char key[CIPHER_KEY_SIZE];
+  std::ostringstream sss;
+  for (size_t i = 0; i < clients.size(); ++i) {
+    std::string encoded;
+    if (!metrics[i].empty()) {
+      EnclaveContext::getInstance().get_client_key((uint8_t*)key, (char*)clients[i].c_str());
+      encoded = EncryptAndEncode(key, metrics[i]);
+    }
+    usr_addr_result[i] = oe_host_strndup(encoded.c_str(), encoded.length());
+    sss << encoded;
   }
+  std::string decision = std::to_string(best_iteration) + " " + std::to_string(stop ? 1 : 0);
+  usr_addr_result[clients.size()] = oe_host_strndup(decision.c_str(), decision.length());
+  sss << decision;
+  *out_result = (const char**) usr_addr_result;
+  *out_len = static_cast<xgboost::bst_ulong>(clients.size() + 1);
+
+  // sign the output
+  std::string const& s = sss.str();
+  std::vector<uint8_t> bytes(s.begin(), s.end());
+  get_signed_output(&bytes, nonce_ctr, out_sig, out_sig_length);
 
-  eval_str = bst->EvalOneIter(iter, data_sets, data_names);
-  *out_str = oe_host_strndup(eval_str.c_str(), eval_str.length());
   API_END();
 }
 
@@ -665,7 +969,7 @@ XGB_DLL int XGBoosterPredict(BoosterHandle handle,
   // FIXME add param training
   std::ostringstream oss;
   oss << "XGBoosterPredict booster_handle " << handle << " data_handle " << dmat << " option_mask " << option_mask << " ntree_limit " << ntree_limit;
-  check_signed_input(oss, signers, signatures, sig_lengths);
+  check_signed_input(oss, nonce, nonce_ctr, signers, signatures, sig_lengths);
 
   auto* bst = static_cast<Booster*>(EnclaveContext::getInstance().get_booster(handle));
   auto& entry = bst->GetThreadLocal().prediction_entry;
@@ -687,35 +991,323 @@ XGB_DLL int XGBoosterPredict(BoosterHandle handle,
   }
   EnclaveContext::getInstance().get_client_key((uint8_t*)key, (char*)owners[0].c_str());
 
-  int preds_len = preds.size()*sizeof(float);
-  size_t buf_len = CIPHER_IV_SIZE + CIPHER_TAG_SIZE + preds_len;
-  unsigned char* buf  = (unsigned char*) malloc(buf_len);
+  // encrypt and sign the output
+  *out_result = EncryptToHost(key, (const unsigned char*)dmlc::BeginPtr(preds),
+                              preds.size() * sizeof(float), nonce_ctr, out_sig, out_sig_length);
+  *len = static_cast<xgboost::bst_ulong>(preds.size());
 
-  unsigned char* iv = buf;
-  unsigned char* tag = buf + CIPHER_IV_SIZE;
-  unsigned char* output = tag + CIPHER_TAG_SIZE;
+  API_END();
+}
 
-  encrypt_symm(
-      key,
-      (const unsigned char*)dmlc::BeginPtr(preds),
-      preds_len,
-      NULL,
-      0,
-      output,
-      iv,
-      tag);
+XGB_DLL int XGBoosterEnablePredictionService(BoosterHandle handle,
+                                             uint8_t *nonce,
+                                             size_t nonce_size,
+                                             uint32_t nonce_ctr,
+                                             uint8_t** out_sig,
+                                             size_t *out_sig_length,
+                                             char** signers,
+                                             uint8_t** signatures,
+                                             size_t* sig_lengths) {
+  API_BEGIN();
+  CHECK_HANDLE();
 
-  unsigned char* host_buf  = (unsigned char*) oe_host_malloc(buf_len);
-  memcpy(host_buf, buf, buf_len);
-  *len = static_cast<xgboost::bst_ulong>(preds.size());
-  *out_result = (uint8_t*)host_buf;
+  // signature verification
+  std::ostringstream oss;
+  oss << "XGBoosterEnablePredictionService handle " << handle;
+  check_signed_input(oss, nonce, nonce_ctr, signers, signatures, sig_lengths);
+
+  // Configure the booster while every worker runs this command, so that
+  // serving rows does not need the other workers
+  auto* bst = static_cast<Booster*>(EnclaveContext::getInstance().get_booster(handle));
+  bst->Configure();
+  EnclaveContext::getInstance().enable_prediction_service(handle);
 
   // sign the output
-  std::vector<uint8_t> bytes(buf, buf + buf_len);
-  get_signed_output(&bytes, out_sig, out_sig_length);
+  std::vector<uint8_t> bytes;
+  get_signed_output(&bytes, nonce_ctr, out_sig, out_sig_length);
 
-  free(buf);
-  CHECK_SEQUENCE_NUMBER();
+  API_END();
+}
+
+namespace {
+/*! \brief most rows in one request to XGBoosterPredictRows */
+constexpr xgboost::bst_ulong kMaxPredictRowsPerRequest = 1UL << 20UL;
+
+/*! \brief a * b for sizes supplied by the host, failing on overflow */
+inline size_t CheckedMul(size_t a, size_t b) {
+  size_t out;
+  CHECK(!__builtin_mul_overflow(a, b, &out)) << "Size overflow";
+  return out;
+}
+
+/*! \brief a + b for sizes supplied by the host, failing on overflow */
+inline size_t CheckedAdd(size_t a, size_t b) {
+  size_t out;
+  CHECK(!__builtin_add_overflow(a, b, &out)) << "Size overflow";
+  return out;
+}
+}  // anonymous namespace
+
+XGB_DLL int XGBoosterPredictRows(BoosterHandle handle,
+                                 xgboost::bst_ulong num_requests,
+                                 char** usernames,
+                                 char** request_ids,
+                                 const xgboost::bst_ulong* num_rows,
+                                 xgboost::bst_ulong num_col,
+                                 const uint8_t* enc_rows,
+                                 size_t enc_rows_size,
+                                 int output_margin,
+                                 unsigned ntree_limit,
+                                 int* out_status,
+                                 xgboost::bst_ulong* out_len,
+                                 uint8_t** out_result) {
+  API_BEGIN();
+  CHECK_HANDLE();
+  CHECK(EnclaveContext::getInstance().is_prediction_service_enabled(handle))
+      << "Prediction service is not enabled for booster " << handle;
+  auto* bst = static_cast<Booster*>(EnclaveContext::getInstance().get_booster(handle));
+  CHECK_EQ(num_col, bst->GetNumFeature()) << "Rows must have one column per feature of the model";
+
+  // The host supplies the shape of every request, so sizes are checked against
+  // the rows actually copied into the enclave before anything is allocated
+  const size_t header_size = CIPHER_IV_SIZE + CIPHER_TAG_SIZE;
+  const size_t row_size = CheckedMul(num_col, sizeof(float));
+  size_t expected_size = 0;
+  for (xgboost::bst_ulong i = 0; i < num_requests; ++i) {
+    CHECK_LE(num_rows[i], kMaxPredictRowsPerRequest) << "Too many rows in request " << request_ids[i];
+    expected_size = CheckedAdd(expected_size, CheckedAdd(header_size, CheckedMul(num_rows[i], row_size)));
+  }
+  CHECK_EQ(enc_rows_size, expected_size) << "Malformed encrypted rows";
+
+  // Decrypt every request into one dense matrix. The shape and prediction
+  // options are authenticated with the rows, so that the host cannot change
+  // them. A request that fails authentication is dropped without failing the
+  // other requests.
+  std::vector<float> rows((enc_rows_size - num_requests * header_size) / sizeof(float));
+  const uint8_t* in = enc_rows;
+  size_t total_rows = 0;
+  for (xgboost::bst_ulong i = 0; i < num_requests; ++i) {
+    std::ostringstream oss;
+    oss << "XGBoosterPredictRows handle " << handle << " request " << request_ids[i]
+        << " num_rows " << num_rows[i] << " num_col " << num_col
+        << " output_margin " << output_margin << " ntree_limit " << ntree_limit;
+    std::string aad = oss.str();
+    const size_t size = num_rows[i] * row_size;
+    const unsigned char* iv = in;
+    const unsigned char* tag = iv + CIPHER_IV_SIZE;
+    unsigned char key[CIPHER_KEY_SIZE];
+    bool authentic = EnclaveContext::getInstance().find_client_key(key, usernames[i]);
+    if (authentic) {
+      mbedtls_gcm_context gcm;
+      cipher_init(&gcm, key);
+      authentic = mbedtls_gcm_auth_decrypt(
+          &gcm, size, iv, CIPHER_IV_SIZE, reinterpret_cast<const unsigned char*>(aad.data()),
+          aad.size(), tag, CIPHER_TAG_SIZE, tag + CIPHER_TAG_SIZE,
+          reinterpret_cast<unsigned char*>(rows.data() + total_rows * num_col)) == 0;
+      mbedtls_gcm_free(&gcm);
+    }
+    if (authentic) {
+      total_rows += num_rows[i];
+      out_status[i] = 0;
+    } else {
+      LOG(INFO) << "Dropping request " << request_ids[i] << " that failed authentication";
+      out_status[i] = -1;
+    }
+    in += header_size + size;
+  }
+
+  // In-place prediction does not build a DMatrix, which would synchronize with
+  // the other workers
+  std::vector<bst_float> empty;
+  HostDeviceVector<bst_float>* predictions = nullptr;
+  if (total_rows != 0) {
+    auto adapter = std::make_shared<data::DenseAdapter>(rows.data(), total_rows, num_col);
+    bst->InplacePredict(adapter, output_margin ? "margin" : "value",
+                        std::numeric_limits<float>::quiet_NaN(), &predictions, 0, ntree_limit);
+  }
+  std::vector<bst_float>& preds = predictions == nullptr ? empty : predictions->HostVector();
+  CHECK(total_rows == 0 || preds.size() % total_rows == 0);
+  const size_t preds_per_row = total_rows == 0 ? 0 : preds.size() / total_rows;
+
+  // Encrypt the predictions of every authenticated request for its requester
+  size_t result_size = 0;
+  for (xgboost::bst_ulong i = 0; i < num_requests; ++i) {
+    if (out_status[i] == 0) {
+      result_size = CheckedAdd(result_size, CheckedAdd(
+          header_size, CheckedMul(CheckedMul(num_rows[i], preds_per_row), sizeof(float))));
+    }
+  }
+  uint8_t* host_buf = (uint8_t*) oe_host_malloc(std::max<size_t>(result_size, 1));
+  CHECK(host_buf != nullptr) << "Failed to allocate host memory for predictions";
+  uint8_t* out = host_buf;
+  size_t offset = 0;
+  for (xgboost::bst_ulong i = 0; i < num_requests; ++i) {
+    if (out_status[i] != 0) {
+      continue;
+    }
+    unsigned char key[CIPHER_KEY_SIZE];
+    EnclaveContext::getInstance().get_client_key((uint8_t*)key, usernames[i]);
+    std::ostringstream oss;
+    oss << "XGBoosterPredictRows handle " << handle << " request " << request_ids[i] << " result";
+    std::string aad = oss.str();
+    const size_t size = num_rows[i] * preds_per_row * sizeof(float);
+    std::vector<unsigned char> output(header_size + size);
+    unsigned char* iv = output.data();
+    unsigned char* tag = iv + CIPHER_IV_SIZE;
+    encrypt_symm(key, reinterpret_cast<const unsigned char*>(preds.data() + offset), size,
+                 (unsigned char*) aad.data(), aad.size(), tag + CIPHER_TAG_SIZE, iv, tag);
+    memcpy(out, output.data(), output.size());
+    out += output.size();
+    offset += num_rows[i] * preds_per_row;
+  }
+  *out_result = host_buf;
+  *out_len = static_cast<xgboost::bst_ulong>(preds.size());
+
+  API_END();
+}
+
+namespace {
+/*! \brief field |name| of a plan */
+Json const& PlanField(Json const& plan, const std::string& name) {
+  auto const& fields = get<Object const>(plan);
+  auto it = fields.find(name);
+  CHECK(it != fields.cend()) << "Plan is missing field " << name;
+  return it->second;
+}
+}  // anonymous namespace
+
+XGB_DLL int XGBoosterRunPlan(const char* plan,
+                             uint8_t *nonce,
+                             size_t nonce_size,
+                             uint32_t nonce_ctr,
+                             BoosterHandle *out,
+                             xgboost::bst_ulong* out_len,
+                             const char*** out_result,
+                             uint8_t** out_sig,
+                             size_t *out_sig_length,
+                             char **signers,
+                             uint8_t** signatures,
+                             size_t* sig_lengths) {
+  API_BEGIN();
+
+  // signature verification, every party signs the whole plan once
+  std::ostringstream oss;
+  oss << "XGBoosterRunPlan plan " << plan;
+  check_signed_input(oss, nonce, nonce_ctr, signers, signatures, sig_lengths);
+
+  // Validate the whole plan before running any of it
+  Json j_plan = Json::Load({plan, strlen(plan)});
+  auto const& params = get<Array const>(PlanField(j_plan, "params"));
+  std::string dtrain = get<String const>(PlanField(j_plan, "dtrain"));
+  int64_t num_boost_round = get<Integer const>(PlanField(j_plan, "num_boost_round"));
+  auto const& evals = get<Array const>(PlanField(j_plan, "evals"));
+  auto const& predict = get<Array const>(PlanField(j_plan, "predict"));
+  CHECK_GE(num_boost_round, 0) << "Invalid number of boosting rounds in plan";
+  for (auto const& param : params) {
+    CHECK_EQ(get<Array const>(param).size(), 2) << "Plan parameters must be name, value pairs";
+  }
+
+  std::vector<std::string> eval_handles;
+  std::vector<std::string> eval_names;
+  std::vector<std::vector<std::string>> eval_owners;
+  for (auto const& eval : evals) {
+    auto const& pair = get<Array const>(eval);
+    CHECK_EQ(pair.size(), 2) << "Plan evaluation sets must be handle, name pairs";
+    eval_handles.push_back(get<String const>(pair[0]));
+    eval_names.push_back(get<String const>(pair[1]));
+    eval_owners.push_back(EnclaveContext::getInstance().get_dmatrix_owners(
+        const_cast<char*>(eval_handles.back().c_str())));
+  }
+  std::vector<std::string> predict_handles;
+  std::vector<std::string> predict_owners;
+  for (auto const& handle : predict) {
+    predict_handles.push_back(get<String const>(handle));
+    std::vector<std::string> owners = EnclaveContext::getInstance().get_dmatrix_owners(
+        const_cast<char*>(predict_handles.back().c_str()));
+    if (owners.size() != 1) {
+      LOG(FATAL) << "Cannot run prediction on data owned by multiple users";
+    }
+    predict_owners.push_back(owners[0]);
+  }
+
+  auto get_mat = [](const std::string& handle) {
+    void* mat = EnclaveContext::getInstance().get_dmatrix(const_cast<char*>(handle.c_str()));
+    return *static_cast<std::shared_ptr<DMatrix>*>(mat);
+  };
+
+  // Same as Booster(params, [dtrain] + evals) followed by train()
+  std::vector<std::shared_ptr<DMatrix>> cache{get_mat(dtrain)};
+  std::vector<std::shared_ptr<DMatrix>> eval_sets;
+  for (const auto& handle : eval_handles) {
+    eval_sets.push_back(get_mat(handle));
+    cache.push_back(eval_sets.back());
+  }
+  auto* bst = Learner::Create(cache);
+  char* out_str = EnclaveContext::getInstance().add_booster(
+      bst, std::vector<std::shared_ptr<void>>(cache.begin(), cache.end()));
+  bst->SetParam("seed", "0");
+  for (auto const& param : params) {
+    auto const& pair = get<Array const>(param);
+    bst->SetParam(get<String const>(pair[0]), get<String const>(pair[1]));
+  }
+
+  // Each client receives the metrics of the evaluation sets it owns, and the
+  // predictions on the matrices it owns, in a single entry encrypted with its
+  // key. Entries are in the enclave's client order.
+  std::vector<std::string> clients = EnclaveContext::getInstance().get_clients();
+  std::vector<std::vector<Json>> eval_logs(clients.size());
+  for (int64_t iter = 0; iter < num_boost_round; ++iter) {
+    bst->UpdateOneIter(static_cast<int>(iter), cache[0]);
+    if (!eval_sets.empty()) {
+      std::string last_metric;
+      std::vector<std::string> metrics = EvalForOwners(bst, static_cast<int>(iter), eval_sets,
+                                                       eval_names, eval_owners, clients,
+                                                       &last_metric);
+      for (size_t i = 0; i < clients.size(); ++i) {
+        if (!metrics[i].empty()) {
+          eval_logs[i].emplace_back(String(metrics[i]));
+        }
+      }
+    }
+  }
+
+  std::vector<Json> results;
+  for (size_t i = 0; i < clients.size(); ++i) {
+    results.emplace_back(Object());
+    results[i]["evals"] = Array(std::move(eval_logs[i]));
+    results[i]["predictions"] = Object();
+  }
+  for (size_t j = 0; j < predict_handles.size(); ++j) {
+    HostDeviceVector<bst_float> preds;
+    bst->Predict(get_mat(predict_handles[j]), false, &preds);
+    std::vector<bst_float> const& h_preds = preds.ConstHostVector();
+    size_t owner = std::find(clients.begin(), clients.end(), predict_owners[j]) - clients.begin();
+    results[owner]["predictions"][std::to_string(j)] = String(dmlc::data::base64_encode(
+        reinterpret_cast<const unsigned char*>(h_preds.data()), h_preds.size() * sizeof(bst_float)));
+  }
+
+  char** usr_addr_result = (char**) oe_host_malloc(clients.size() * sizeof(char*));
+  unsigned char key[CIPHER_KEY_SIZE];
+  std::ostringstream sss;
+  sss << "handle " << out_str;
+  for (size_t i = 0; i < clients.size(); ++i) {
+    std::string result;
+    Json::Dump(results[i], &result);
+    EnclaveContext::getInstance().get_client_key((uint8_t*)key, (char*)clients[i].c_str());
+    std::string encoded = EncryptAndEncode(key, result);
+    usr_addr_result[i] = oe_host_strndup(encoded.c_str(), encoded.length());
+    sss << encoded;
+  }
+  *out = oe_host_strndup(out_str, strlen(out_str));
+  *out_result = (const char**) usr_addr_result;
+  *out_len = static_cast<xgboost::bst_ulong>(clients.size());
+
+  // sign the output
+  std::string const& s = sss.str();
+  std::vector<uint8_t> bytes(s.begin(), s.end());
+  get_signed_output(&bytes, nonce_ctr, out_sig, out_sig_length);
+
+  free(out_str);
   API_END();
 }
 
@@ -727,7 +1319,7 @@ XGB_DLL int XGBoosterLoadModel(BoosterHandle handle, const char* fname, uint8_t*
     // signature verification
     std::ostringstream oss;
     oss << "XGBoosterLoadModel handle " << handle << " filename " << fname;
-    check_signed_input(oss, signers, signatures, sig_lengths);
+    check_signed_input(oss, nonce, nonce_ctr, signers, signatures, sig_lengths);
 
     // TODO(rishabh): Support JSON
     if (common::FileExtension(fname) == "json") {
@@ -766,12 +1358,12 @@ XGB_DLL int XGBoosterLoadModel(BoosterHandle handle, const char* fname, uint8_t*
       static_cast<Booster*>(bst)->LoadModel(&fs);
       free(output);
     }
+    EnclaveContext::getInstance().disable_prediction_service(handle);
 
     // sign the output
     std::vector<uint8_t> bytes;
-    get_signed_output(&bytes, out_sig, out_sig_length);
+    get_signed_output(&bytes, nonce_ctr, out_sig, out_sig_length);
 
-    CHECK_SEQUENCE_NUMBER();
     API_END();
 }
 
@@ -782,7 +1374,7 @@ XGB_DLL int XGBoosterSaveModel(BoosterHandle handle, const char* fname, uint8_t*
     // check signature
     std::ostringstream oss;
     oss << "XGBoosterSaveModel handle " << handle << " filename " << fname;
-    check_signed_input(oss, signers, signatures, sig_lengths);
+    check_signed_input(oss, nonce, nonce_ctr, signers, signatures, sig_lengths);
 
     if (common::FileExtension(fname) == "json") {
       LOG(FATAL) << "Loading from JSON not yet supported";
@@ -817,17 +1409,182 @@ XGB_DLL int XGBoosterSaveModel(BoosterHandle handle, const char* fname, uint8_t*
       fs->Write(&buf_len, sizeof(size_t));
       fs->Write(buf, buf_len);
       free(buf);
+      fs->Flush();
     }
 
     // sign the output
     // TODO(rishabh): Should we include the ciphertext in the signature?
     std::vector<uint8_t> bytes;
-    get_signed_output(&bytes, out_sig, out_sig_length);
+    get_signed_output(&bytes, nonce_ctr, out_sig, out_sig_length);
 
-    CHECK_SEQUENCE_NUMBER();
     API_END();
 }
 
+namespace {
+/*!
+ * \brief Path of a checkpoint slot. Every worker writes its own copy and
+ *  alternates between two slots, so that a crash while a checkpoint is being
+ *  written never destroys the previous one.
+ */
+std::string CheckpointPath(const char* fname, uint64_t version) {
+  std::ostringstream oss;
+  oss << fname << ".rank" << rabit::GetRank() << "." << version % 2;
+  return oss.str();
+}
+
+std::vector<unsigned char> CheckpointAdditionalData(uint64_t version) {
+  const std::string kind("checkpoint");
+  std::vector<unsigned char> aad(kind.begin(), kind.end());
+  const unsigned char* p = reinterpret_cast<const unsigned char*>(&version);
+  aad.insert(aad.end(), p, p + sizeof(version));
+  return aad;
+}
+
+/*!
+ * \brief Read and unseal a checkpoint slot. Missing, truncated or tampered
+ *  slots are skipped instead of failing, the other slot may still be valid.
+ */
+bool ReadCheckpoint(const std::string& path, unsigned char* key,
+                    uint64_t* version, std::string* model) {
+  std::unique_ptr<dmlc::Stream> fi(dmlc::Stream::Create(path.c_str(), "r", true));
+  if (fi == nullptr) return false;
+  uint64_t size;
+  unsigned char iv[CIPHER_IV_SIZE];
+  unsigned char tag[CIPHER_TAG_SIZE];
+  if (fi->Read(version, sizeof(*version)) != sizeof(*version) ||
+      fi->Read(&size, sizeof(size)) != sizeof(size) ||
+      fi->Read(iv, CIPHER_IV_SIZE) != CIPHER_IV_SIZE ||
+      fi->Read(tag, CIPHER_TAG_SIZE) != CIPHER_TAG_SIZE || size == 0) {
+    return false;
+  }
+  std::vector<unsigned char> ciphertext(size);
+  if (fi->Read(ciphertext.data(), size) != size) return false;
+  model->resize(size);
+  std::vector<unsigned char> aad = CheckpointAdditionalData(*version);
+  mbedtls_gcm_context gcm;
+  cipher_init(&gcm, key);
+  int ret = mbedtls_gcm_auth_decrypt(&gcm, size, iv, CIPHER_IV_SIZE, aad.data(), aad.size(),
+                                     tag, CIPHER_TAG_SIZE, ciphertext.data(),
+                                     reinterpret_cast<unsigned char*>(&(*model)[0]));
+  mbedtls_gcm_free(&gcm);
+  if (ret != 0) {
+    LOG(WARNING) << "Ignoring checkpoint " << path << " that failed authentication";
+    return false;
+  }
+  return true;
+}
+}  // anonymous namespace
+
+XGB_DLL int XGBoosterSaveCheckpoint(BoosterHandle handle,
+                                    const char* fname,
+                                    uint32_t version,
+                                    uint8_t *nonce,
+                                    size_t nonce_size,
+                                    uint32_t nonce_ctr,
+                                    uint8_t** out_sig,
+                                    size_t *out_sig_length,
+                                    char **signers,
+                                    uint8_t** signatures,
+                                    size_t* sig_lengths) {
+  API_BEGIN();
+  CHECK_HANDLE();
+
+  // check signature
+  std::ostringstream oss;
+  oss << "XGBoosterSaveCheckpoint handle " << handle << " filename " << fname
+      << " version " << version;
+  check_signed_input(oss, nonce, nonce_ctr, signers, signatures, sig_lengths);
+  CHECK_GT(version, 0U) << "Checkpoint versions start at 1";
+
+  auto* bst = static_cast<Booster*>(EnclaveContext::getInstance().get_booster(handle));
+  bst->Configure();
+  std::string& raw_str = bst->GetThreadLocal().ret_str;
+  raw_str.resize(0);
+  common::MemoryBufferStream fo(&raw_str);
+  bst->SaveModel(&fo);
+
+  unsigned char key[CIPHER_KEY_SIZE];
+  EnclaveContext::getInstance().get_checkpoint_key(key);
+  const uint64_t v = version;
+  const uint64_t size = raw_str.length();
+  std::vector<unsigned char> aad = CheckpointAdditionalData(v);
+  std::vector<unsigned char> ciphertext(size);
+  unsigned char iv[CIPHER_IV_SIZE];
+  unsigned char tag[CIPHER_TAG_SIZE];
+  encrypt_symm(key, reinterpret_cast<const unsigned char*>(raw_str.data()), size,
+               aad.data(), aad.size(), ciphertext.data(), iv, tag);
+
+  std::unique_ptr<dmlc::Stream> fs(dmlc::Stream::Create(CheckpointPath(fname, v).c_str(), "w"));
+  fs->Write(&v, sizeof(v));
+  fs->Write(&size, sizeof(size));
+  fs->Write(iv, CIPHER_IV_SIZE);
+  fs->Write(tag, CIPHER_TAG_SIZE);
+  fs->Write(ciphertext.data(), size);
+  fs->Flush();
+
+  // sign the output
+  std::vector<uint8_t> bytes;
+  get_signed_output(&bytes, nonce_ctr, out_sig, out_sig_length);
+
+  API_END();
+}
+
+XGB_DLL int XGBoosterLoadCheckpoint(BoosterHandle handle,
+                                    const char* fname,
+                                    uint8_t *nonce,
+                                    size_t nonce_size,
+                                    uint32_t nonce_ctr,
+                                    uint32_t* out_version,
+                                    uint8_t** out_sig,
+                                    size_t *out_sig_length,
+                                    char **signers,
+                                    uint8_t** signatures,
+                                    size_t* sig_lengths) {
+  API_BEGIN();
+  CHECK_HANDLE();
+
+  // signature verification
+  std::ostringstream oss;
+  oss << "XGBoosterLoadCheckpoint handle " << handle << " filename " << fname;
+  check_signed_input(oss, nonce, nonce_ctr, signers, signatures, sig_lengths);
+
+  unsigned char key[CIPHER_KEY_SIZE];
+  EnclaveContext::getInstance().get_checkpoint_key(key);
+  uint64_t versions[2];
+  std::string models[2];
+  bool valid[2];
+  uint64_t latest = 0;
+  for (uint64_t slot = 0; slot < 2; ++slot) {
+    valid[slot] = ReadCheckpoint(CheckpointPath(fname, slot), key, &versions[slot], &models[slot])
+        && versions[slot] % 2 == slot;
+    if (valid[slot]) {
+      latest = std::max(latest, versions[slot]);
+    }
+  }
+  // A worker may have failed after some workers wrote a checkpoint and before
+  // others did; resume from the latest version that every worker holds
+  rabit::Allreduce<rabit::op::Min>(&latest, 1);
+  if (latest != 0) {
+    const uint64_t slot = latest % 2;
+    CHECK(valid[slot] && versions[slot] == latest)
+        << "Checkpoint version " << latest << " is missing on rank " << rabit::GetRank();
+    auto* bst = static_cast<Booster*>(EnclaveContext::getInstance().get_booster(handle));
+    common::MemoryFixSizeBuffer fs(&models[slot][0], models[slot].size());
+    bst->LoadModel(&fs);
+    EnclaveContext::getInstance().disable_prediction_service(handle);
+  }
+  *out_version = static_cast<uint32_t>(latest);
+
+  // sign the output
+  std::ostringstream sss;
+  sss << *out_version;
+  std::string const& s = sss.str();
+  std::vector<uint8_t> bytes(s.begin(), s.end());
+  get_signed_output(&bytes, nonce_ctr, out_sig, out_sig_length);
+
+  API_END();
+}
+
 // TODO(rishabh): Add nonce + output signatures
 XGB_DLL int XGBoosterLoadModelFromBuffer(BoosterHandle handle,
                                          const void* buf,
@@ -867,6 +1624,7 @@ XGB_DLL int XGBoosterLoadModelFromBuffer(BoosterHandle handle,
 
     common::MemoryFixSizeBuffer fs((void*)output, len);  // NOLINT(*)
     static_cast<Booster*>(EnclaveContext::getInstance().get_booster(handle))->LoadModel(&fs);
+    EnclaveContext::getInstance().disable_prediction_service(handle);
     free(output);
 
     API_END();
@@ -889,7 +1647,7 @@ XGB_DLL int XGBoosterGetModelRaw(BoosterHandle handle,
     // check signature
     std::ostringstream oss;
     oss << "XGBoosterGetModelRaw handle " << handle;
-    check_signed_input(oss, signers, signatures, sig_lengths);
+    check_signed_input(oss, nonce, nonce_ctr, signers, signatures, sig_lengths);
 
     auto* bst = static_cast<Booster*>(EnclaveContext::getInstance().get_booster(handle));
     bst->Configure();
@@ -898,88 +1656,50 @@ XGB_DLL int XGBoosterGetModelRaw(BoosterHandle handle,
     common::MemoryBufferStream fo(&raw_str);
     bst->Configure();
     bst->SaveModel(&fo);
-    int buf_len = CIPHER_IV_SIZE + CIPHER_TAG_SIZE + raw_str.length();
-    unsigned char* buf  = (unsigned char*) malloc(buf_len);
-
-    unsigned char* iv = buf;
-    unsigned char* tag = buf + CIPHER_IV_SIZE;
-    unsigned char* output = tag + CIPHER_TAG_SIZE;
     unsigned char* key = EnclaveContext::getInstance().get_symm_key();
 
-    encrypt_symm(
-            key,
-            (const unsigned char*)dmlc::BeginPtr(raw_str),
-            raw_str.length(),
-            NULL,
-            0,
-            output,
-            iv,
-            tag);
-
-    unsigned char* host_buf  = (unsigned char*) oe_host_malloc(buf_len);
-    memcpy(host_buf, buf, buf_len);
-    *out_dptr = (const char*)host_buf;
+    // encrypt and sign the output
+    *out_dptr = (const char*)EncryptToHost(key, (const unsigned char*)dmlc::BeginPtr(raw_str),
+                                           raw_str.length(), nonce_ctr, out_sig, out_sig_length);
     *out_len = static_cast<xgboost::bst_ulong>(raw_str.length()) + CIPHER_IV_SIZE + CIPHER_TAG_SIZE;
 
-    // sign the output
-    std::vector<uint8_t> bytes(buf, buf + buf_len);
-    get_signed_output(&bytes, out_sig, out_sig_length);
-
-    free(buf);
-    CHECK_SEQUENCE_NUMBER();
     API_END();
 }
 
+/*!
+ * \brief Dump the model, encrypting each tree straight into host memory. The
+ *  encrypted trees are hashed into |sha| as they are written, so that the dump
+ *  can be signed without concatenating it.
+ */
 inline void XGBoostDumpModelImpl(
     BoosterHandle handle,
     const FeatureMap& fmap,
     int with_stats,
     const char *format,
     xgboost::bst_ulong* len,
-    const char*** out_models) {
+    const char*** out_models,
+    mbedtls_sha256_context* sha) {
   auto* bst = static_cast<Booster*>(EnclaveContext::getInstance().get_booster(handle));
   std::vector<std::string>& str_vecs = bst->GetThreadLocal().ret_vec_str;
   str_vecs = bst->DumpModel(fmap, with_stats != 0, format);
   /* Write *out_models to user memory instead */
   unsigned char** usr_addr_model = (unsigned char**) oe_host_malloc(str_vecs.size() * sizeof(char*));
 
-  int length;
-  unsigned char* encrypted;
-  unsigned char iv[CIPHER_IV_SIZE];
-  unsigned char tag[CIPHER_TAG_SIZE];
-  unsigned char* key;
-
-  key = EnclaveContext::getInstance().get_symm_key();
+  unsigned char* key = EnclaveContext::getInstance().get_symm_key();
   for (size_t i = 0; i < str_vecs.size(); ++i) {
-    length = str_vecs[i].length();
-    encrypted = (unsigned char*) malloc(length * sizeof(char));
-
-    /* Encrypt */
-    encrypt_symm(
-        key,
-        (const unsigned char*) dmlc::BeginPtr(str_vecs[i]),
-        str_vecs[i].length(),
-        NULL,
-        0,
-        encrypted,
-        iv,
-        tag);
-
-    /* Base64 encode */
-    std::string total_encoded = "";
-    total_encoded.append(dmlc::data::base64_encode(iv, CIPHER_IV_SIZE));
-    total_encoded.append(",");
-    total_encoded.append(dmlc::data::base64_encode(tag, CIPHER_TAG_SIZE));
-    total_encoded.append(",");
-    total_encoded.append(dmlc::data::base64_encode(encrypted, length));
+    std::string total_encoded = EncryptAndEncode(key, str_vecs[i]);
     total_encoded.append("\n");
+    // the plaintext tree is no longer needed
+    std::string().swap(str_vecs[i]);
 
+    CHECK_OUTPUT(mbedtls_sha256_update_ret(
+        sha, (const unsigned char*)total_encoded.data(), total_encoded.length()));
     usr_addr_model[i] = (unsigned char*) oe_host_malloc(total_encoded.length() + 1);
     memcpy(usr_addr_model[i], total_encoded.c_str(), total_encoded.length() + 1);
-    free(encrypted);
   }
   *out_models = (const char **) usr_addr_model;
   *len = static_cast<xgboost::bst_ulong>(str_vecs.size());
+  str_vecs.clear();
 }
 
 // TODO(rishabhp): Enable this
@@ -1013,7 +1733,7 @@ XGB_DLL int XGBoosterDumpModelEx(BoosterHandle handle,
     CHECK_HANDLE();
     std::ostringstream oss;
     oss << "XGBoosterDumpModelEx booster_handle " << handle << " fmap " << fmap << " with_stats " << with_stats << " dump_format " << format;
-    check_signed_input(oss, signers, signatures, sig_lengths);
+    check_signed_input(oss, nonce, nonce_ctr, signers, signatures, sig_lengths);
 
     FeatureMap featmap;
     if (strlen(fmap) != 0) {
@@ -1022,18 +1742,15 @@ XGB_DLL int XGBoosterDumpModelEx(BoosterHandle handle,
         dmlc::istream is(fs.get());
         featmap.LoadText(is);
     }
-    XGBoostDumpModelImpl(handle, featmap, with_stats, format, len, out_models);
+    mbedtls_sha256_context sha;
+    mbedtls_sha256_init(&sha);
+    CHECK_OUTPUT(mbedtls_sha256_starts_ret(&sha, 0));
+    XGBoostDumpModelImpl(handle, featmap, with_stats, format, len, out_models, &sha);
 
     // sign the output
-    std::ostringstream sss;
-    for (int i = 0; i < *len; i++) {
-      sss << (*out_models)[i];
-    }
-    std::string const& s = sss.str();
-    std::vector<uint8_t> bytes(s.begin(), s.end());
-    get_signed_output(&bytes, out_sig, out_sig_length);
+    get_signed_output(&sha, nonce_ctr, out_sig, out_sig_length);
+    mbedtls_sha256_free(&sha);
 
-    CHECK_SEQUENCE_NUMBER();
     API_END();
 }
 
@@ -1104,24 +1821,90 @@ XGB_DLL int XGBoosterDumpModelExWithFeatures(BoosterHandle handle,
     for (int i = 0; i <fnum; i++){
         oss << " fname " << fname[i] << " ftype " << ftype[i];
     }
-    check_signed_input(oss, signers, signatures, sig_lengths);
+    check_signed_input(oss, nonce, nonce_ctr, signers, signatures, sig_lengths);
 
     FeatureMap featmap;
     for (int i = 0; i < fnum; ++i) {
         featmap.PushBack(i, fname[i], ftype[i]);
     }
-    XGBoostDumpModelImpl(handle, featmap, with_stats, format, len, out_models);
+    mbedtls_sha256_context sha;
+    mbedtls_sha256_init(&sha);
+    CHECK_OUTPUT(mbedtls_sha256_starts_ret(&sha, 0));
+    XGBoostDumpModelImpl(handle, featmap, with_stats, format, len, out_models, &sha);
 
     // sign the output
-    std::ostringstream sss;
-    for (int i = 0; i < *len; i++) {
-      sss << (*out_models)[i];
+    get_signed_output(&sha, nonce_ctr, out_sig, out_sig_length);
+    mbedtls_sha256_free(&sha);
+
+    API_END();
+}
+
+XGB_DLL int XGBoosterDumpModelFramed(BoosterHandle handle,
+                                     const char* fmap,
+                                     int fnum,
+                                     const char** fname,
+                                     const char** ftype,
+                                     int with_stats,
+                                     const char *format,
+                                     uint8_t* nonce,
+                                     size_t nonce_size,
+                                     uint32_t nonce_ctr,
+                                     xgboost::bst_ulong* out_len,
+                                     uint8_t** out_dump,
+                                     uint8_t** out_sig,
+                                     size_t *out_sig_length,
+                                     char **signers,
+                                     uint8_t** signatures,
+                                     size_t* sig_lengths) {
+    API_BEGIN();
+    CHECK_HANDLE();
+
+    //check signature
+    std::ostringstream oss;
+    oss << "XGBoosterDumpModelFramed booster_handle " << handle << " fmap " << fmap << " with_stats " << with_stats << " dump_format " << format << " flen " << fnum;
+    for (int i = 0; i < fnum; i++) {
+        oss << " fname " << fname[i] << " ftype " << ftype[i];
     }
-    std::string const& s = sss.str();
-    std::vector<uint8_t> bytes(s.begin(), s.end());
-    get_signed_output(&bytes, out_sig, out_sig_length);
+    check_signed_input(oss, nonce, nonce_ctr, signers, signatures, sig_lengths);
+
+    FeatureMap featmap;
+    if (fnum > 0) {
+        for (int i = 0; i < fnum; ++i) {
+            featmap.PushBack(i, fname[i], ftype[i]);
+        }
+    } else if (strlen(fmap) != 0) {
+        std::unique_ptr<dmlc::Stream> fs(
+                dmlc::Stream::Create(fmap, "r"));
+        dmlc::istream is(fs.get());
+        featmap.LoadText(is);
+    }
+
+    auto* bst = static_cast<Booster*>(EnclaveContext::getInstance().get_booster(handle));
+    std::vector<std::string>& str_vecs = bst->GetThreadLocal().ret_vec_str;
+    str_vecs = bst->DumpModel(featmap, with_stats != 0, format);
+
+    // frame the trees as n | offsets[n + 1] | payload
+    std::vector<uint64_t> header(str_vecs.size() + 2);
+    header[0] = str_vecs.size();
+    for (size_t i = 0; i < str_vecs.size(); ++i) {
+      header[i + 2] = header[i + 1] + str_vecs[i].length();
+    }
+    const size_t header_bytes = header.size() * sizeof(uint64_t);
+    std::string& framed = bst->GetThreadLocal().ret_str;
+    framed.resize(header_bytes + header.back());
+    memcpy(&framed[0], header.data(), header_bytes);
+    for (size_t i = 0; i < str_vecs.size(); ++i) {
+      memcpy(&framed[header_bytes + header[i + 1]], str_vecs[i].data(), str_vecs[i].length());
+    }
+    str_vecs.clear();
+
+    // encrypt and sign the output
+    unsigned char* key = EnclaveContext::getInstance().get_symm_key();
+    *out_dump = EncryptToHost(key, (const unsigned char*)framed.data(), framed.length(),
+                              nonce_ctr, out_sig, out_sig_length);
+    *out_len = static_cast<xgboost::bst_ulong>(framed.length()) + CIPHER_IV_SIZE + CIPHER_TAG_SIZE;
+    std::string().swap(framed);
 
-    CHECK_SEQUENCE_NUMBER();
     API_END();
 }
 
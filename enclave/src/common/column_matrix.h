@@ -430,6 +430,17 @@ class ColumnMatrix {
     return bins_type_size_;
   }
 
+  /*! \return estimation of memory cost of the column matrix */
+  size_t MemCostBytes() const {
+    size_t bytes = index_.size() + type_.size() * sizeof(ColumnType) +
+                   (feature_counts_.size() + row_ind_.size() + feature_offsets_.size()) *
+                   sizeof(size_t) + missing_flags_.size() / 8;
+#ifdef __ENCLAVE_OBLIVIOUS__
+    bytes += boundary_.size() * sizeof(ColumnBoundary) + row_wise_index_.size() * sizeof(uint32_t);
+#endif
+    return bytes;
+  }
+
   // This is just an utility function
   const bool NoMissingValues(const size_t n_elements,
                              const size_t n_row, const size_t n_features) {
@@ -11,6 +11,7 @@
 #ifndef XGBOOST_COMMON_COLUMN_MATRIX_H_
 #define XGBOOST_COMMON_COLUMN_MATRIX_H_
 
+#include <algorithm>
 #include <limits>
 #include <vector>
 #include "hist_util.h"
@@ -27,19 +28,33 @@ enum ColumnType {
 };
 
 /*! \brief a column storage, to be used with ApplySplit. Note that each
-    bin id is stored as index[i] + index_base. */
+    bin id is stored as index[i] + index_base. Feature-local bin ids are kept
+    in 1, 2 or 4 bytes, with the maximum value of that type marking a missing
+    value. */
 class Column {
  public:
-  Column(ColumnType type, const uint32_t* index, uint32_t index_base,
-         const size_t* row_ind, size_t len)
+  Column(ColumnType type, const uint8_t* index, BinTypeSize bin_type_size,
+         uint32_t index_base, const size_t* row_ind, size_t len)
       : type_(type),
         index_(index),
+        bin_type_size_(bin_type_size),
         index_base_(index_base),
         row_ind_(row_ind),
         len_(len) {}
   size_t Size() const { return len_; }
-  uint32_t GetGlobalBinIdx(size_t idx) const { return index_base_ + index_[idx]; }
-  uint32_t GetFeatureBinIdx(size_t idx) const { return index_[idx]; }
+  uint32_t GetGlobalBinIdx(size_t idx) const { return index_base_ + GetFeatureBinIdx(idx); }
+  // std::numeric_limits<uint32_t>::max() is returned for a missing value,
+  // whatever the storage type.
+  uint32_t GetFeatureBinIdx(size_t idx) const {
+    switch (bin_type_size_) {
+      case kUint8BinsTypeSize:
+        return Widen(reinterpret_cast<const uint8_t*>(index_)[idx]);
+      case kUint16BinsTypeSize:
+        return Widen(reinterpret_cast<const uint16_t*>(index_)[idx]);
+      default:
+        return reinterpret_cast<const uint32_t*>(index_)[idx];
+    }
+  }
   // column.GetFeatureBinIdx(idx) + column.GetBaseIdx(idx) ==
   // column.GetGlobalBinIdx(idx)
   uint32_t GetBaseIdx() const { return index_base_; }
@@ -50,13 +65,20 @@ class Column {
     return type_ == ColumnType::kDenseColumn ? idx : row_ind_[idx];  // NOLINT
   }
   bool IsMissing(size_t idx) const {
-    return index_[idx] == std::numeric_limits<uint32_t>::max();
+    return GetFeatureBinIdx(idx) == std::numeric_limits<uint32_t>::max();
   }
   const size_t* GetRowData() const { return row_ind_; }
 
  private:
+  template <typename T>
+  static uint32_t Widen(T bin) {
+    return bin == std::numeric_limits<T>::max() ?
+        std::numeric_limits<uint32_t>::max() : static_cast<uint32_t>(bin);
+  }
+
   ColumnType type_;
-  const uint32_t* index_;
+  const uint8_t* index_;
+  BinTypeSize bin_type_size_;
   uint32_t index_base_;
   const size_t* row_ind_;
   const size_t len_;
@@ -82,10 +104,14 @@ class ColumnMatrix {
     type_.resize(nfeature);
     std::fill(feature_counts_.begin(), feature_counts_.end(), 0);
 
-    uint32_t max_val = std::numeric_limits<uint32_t>::max();
+    // the largest value of the bin type is reserved for missing values
+    uint32_t max_feature_bins = 0;
     for (bst_uint fid = 0; fid < nfeature; ++fid) {
-      CHECK_LE(gmat.cut.row_ptr[fid + 1] - gmat.cut.row_ptr[fid], max_val);
+      max_feature_bins = std::max(max_feature_bins,
+                                  gmat.cut.row_ptr[fid + 1] - gmat.cut.row_ptr[fid]);
     }
+    CHECK_LT(max_feature_bins, std::numeric_limits<uint32_t>::max());
+    bins_type_size_ = GetBinTypeSizeFor(max_feature_bins);
 
     gmat.GetFeatureCounts(&feature_counts_[0]);
     // classify features
@@ -117,8 +143,11 @@ class ColumnMatrix {
       boundary_[fid].row_ind_end = accum_row_ind_;
     }
 
-    index_.resize(boundary_[nfeature - 1].index_end);
+    index_.resize(boundary_[nfeature - 1].index_end * bins_type_size_);
     row_ind_.resize(boundary_[nfeature - 1].row_ind_end);
+    // For oblivious.
+    row_wise_index_.resize(nrow * nfeature * bins_type_size_);
+    nfeature_ = nfeature;
 
     // store least bin id for each feature
     index_base_.resize(nfeature);
@@ -126,18 +155,81 @@ class ColumnMatrix {
       index_base_[fid] = gmat.cut.row_ptr[fid];
     }
 
+    switch (bins_type_size_) {
+      case kUint8BinsTypeSize:
+        SetIndex<uint8_t>(gmat);
+        break;
+      case kUint16BinsTypeSize:
+        SetIndex<uint16_t>(gmat);
+        break;
+      default:
+        SetIndex<uint32_t>(gmat);
+    }
+
+    const size_t nbytes = (index_.size() + row_wise_index_.size()) * sizeof(uint8_t);
+    const size_t nbytes_uint32 = (index_.size() + row_wise_index_.size()) /
+                                 bins_type_size_ * sizeof(uint32_t);
+    LOG(INFO) << "ColumnMatrix: bin ids stored in " << nbytes << " bytes ("
+              << nbytes_uint32 << " bytes with uint32_t bin ids), "
+              << static_cast<int>(bins_type_size_) << " byte(s) per bin id";
+  }
+
+  /* Fetch an individual column. */
+  inline Column GetColumn(unsigned fid) const {
+    Column c(type_[fid], &index_[boundary_[fid].index_begin * bins_type_size_],
+             bins_type_size_, index_base_[fid],
+             (type_[fid] == ColumnType::kSparseColumn ?
+              &row_ind_[boundary_[fid].row_ind_begin] : nullptr),
+             boundary_[fid].index_end - boundary_[fid].index_begin);
+    return c;
+  }
+
+  // Global bin id of feature |fid| in row |row_idx|,
+  // std::numeric_limits<uint32_t>::max() if missing.
+  inline uint32_t OGetRowFeatureBinIndex(size_t row_idx, int fid) const {
+    switch (bins_type_size_) {
+      case kUint8BinsTypeSize:
+        return OGetRowFeatureBinIndex<uint8_t>(row_idx, fid);
+      case kUint16BinsTypeSize:
+        return OGetRowFeatureBinIndex<uint16_t>(row_idx, fid);
+      default:
+        return OGetRowFeatureBinIndex<uint32_t>(row_idx, fid);
+    }
+  }
+
+  BinTypeSize GetTypeSize() const {
+    return bins_type_size_;
+  }
+
+  /*! \return estimation of memory cost of the column matrix */
+  size_t MemCostBytes() const {
+    return index_.size() + row_wise_index_.size() + type_.size() * sizeof(ColumnType) +
+           (feature_counts_.size() + row_ind_.size()) * sizeof(size_t) +
+           boundary_.size() * sizeof(ColumnBoundary) + index_base_.size() * sizeof(uint32_t);
+  }
+
+ private:
+  template <typename T>
+  inline void SetIndex(const GHistIndexMatrix& gmat) {
+    const size_t nrow = gmat.row_ptr.size() - 1;
+    const int32_t nfeature = nfeature_;
+    T* index = reinterpret_cast<T*>(index_.data());
+    T* row_wise_index = reinterpret_cast<T*>(row_wise_index_.data());
+    constexpr T kMissing = std::numeric_limits<T>::max();
+
     // pre-fill index_ for dense columns
 
     #pragma omp parallel for
     for (int32_t fid = 0; fid < nfeature; ++fid) {
       if (type_[fid] == kDenseColumn) {
         const size_t ibegin = boundary_[fid].index_begin;
-        uint32_t* begin = &index_[ibegin];
-        uint32_t* end = begin + nrow;
-        std::fill(begin, end, std::numeric_limits<uint32_t>::max());
+        T* begin = &index[ibegin];
+        T* end = begin + nrow;
+        std::fill(begin, end, kMissing);
         // max() indicates missing values
       }
     }
+    std::fill(row_wise_index, row_wise_index + nrow * nfeature, kMissing);
 
     // loop over all rows and fill column entries
     // num_nonzeros[fid] = how many nonzeros have this feature accumulated so far?
@@ -145,12 +237,6 @@ class ColumnMatrix {
     num_nonzeros.resize(nfeature);
     std::fill(num_nonzeros.begin(), num_nonzeros.end(), 0);
 
-    // For oblivious.
-    row_wise_index_.resize(nrow * nfeature);
-    std::fill(row_wise_index_.begin(), row_wise_index_.end(),
-              std::numeric_limits<uint32_t>::max());
-    nfeature_ = nfeature;
-
     for (size_t rid = 0; rid < nrow; ++rid) {
       const size_t ibegin = gmat.row_ptr[rid];
       const size_t iend = gmat.row_ptr[rid + 1];
@@ -162,16 +248,17 @@ class ColumnMatrix {
         while (bin_id >= gmat.cut.row_ptr[fid + 1]) {
           ++fid;
         }
+        const T local_bin = static_cast<T>(bin_id - index_base_[fid]);
 
-        // For oblivious. Note this contains index_base.
-        row_wise_index_[rid * nfeature + fid] = bin_id;
+        // For oblivious. Feature-local, |index_base_| is added on access.
+        row_wise_index[rid * nfeature + fid] = local_bin;
 
         if (type_[fid] == kDenseColumn) {
-          uint32_t* begin = &index_[boundary_[fid].index_begin];
-          begin[rid] = bin_id - index_base_[fid];
+          T* begin = &index[boundary_[fid].index_begin];
+          begin[rid] = local_bin;
         } else {
-          uint32_t* begin = &index_[boundary_[fid].index_begin];
-          begin[num_nonzeros[fid]] = bin_id - index_base_[fid];
+          T* begin = &index[boundary_[fid].index_begin];
+          begin[num_nonzeros[fid]] = local_bin;
           row_ind_[boundary_[fid].row_ind_begin + num_nonzeros[fid]] = rid;
           ++num_nonzeros[fid];
         }
@@ -179,24 +266,19 @@ class ColumnMatrix {
     }
   }
 
-  /* Fetch an individual column. This code should be used with XGBOOST_TYPE_SWITCH
-     to determine type of bin id's */
-  inline Column GetColumn(unsigned fid) const {
-    Column c(type_[fid], &index_[boundary_[fid].index_begin], index_base_[fid],
-             (type_[fid] == ColumnType::kSparseColumn ?
-              &row_ind_[boundary_[fid].row_ind_begin] : nullptr),
-             boundary_[fid].index_end - boundary_[fid].index_begin);
-    return c;
-  }
-
+  template <typename T>
   inline uint32_t OGetRowFeatureBinIndex(size_t row_idx, int fid) const {
-    // NOTE: `oaccess` between [row_idx * nfeature, (row_idx + 1) * nfeature]
-    // return row_wise_index_[row_idx * nfeature_ + fid];
-    return ObliviousArrayAccess(row_wise_index_.data() + row_idx * nfeature_,
-                                fid, nfeature_);
+    // NOTE: `oaccess` between [row_idx * nfeature, (row_idx + 1) * nfeature],
+    // a narrower type touches fewer cache lines.
+    const T* row = reinterpret_cast<const T*>(row_wise_index_.data()) +
+                   row_idx * nfeature_;
+    const uint32_t local_bin = ObliviousArrayAccess(row, fid, nfeature_);
+    const uint32_t base = ObliviousArrayAccess(index_base_.data(), fid, nfeature_);
+    return ObliviousChoose(
+        ObliviousEqual(local_bin, static_cast<uint32_t>(std::numeric_limits<T>::max())),
+        std::numeric_limits<uint32_t>::max(), base + local_bin);
   }
 
- private:
   struct ColumnBoundary {
     // indicate where each column's index and row_ind is stored.
     // index_begin and index_end are logical offsets, so they should be converted to
@@ -209,13 +291,14 @@ class ColumnMatrix {
 
   std::vector<size_t> feature_counts_;
   std::vector<ColumnType> type_;
-  SimpleArray<uint32_t> index_;  // index_: may store smaller integers; needs padding
+  SimpleArray<uint8_t> index_;  // index_: stores 1, 2 or 4 byte bin ids
+  BinTypeSize bins_type_size_ {kUint32BinsTypeSize};
   SimpleArray<size_t> row_ind_;
   std::vector<ColumnBoundary> boundary_;
 
   // For oblivious.
   // Row wise feature index, this helps reduce `oaccess` range to number of features.
-  SimpleArray<uint32_t> row_wise_index_;
+  SimpleArray<uint8_t> row_wise_index_;
   int32_t nfeature_;
 
   // index_base_[fid]: least bin id for feature fid
@@ -316,6 +316,13 @@ struct GHistIndexMatrix {
   size_t max_num_bins;
   // Create a global histogram matrix, given cut
   void Init(DMatrix* p_fmat, int max_num_bins);
+  /*! \return estimation of memory cost of the index and its cuts */
+  size_t MemCostBytes() const {
+    return row_ptr.size() * sizeof(size_t) + hit_count.size() * sizeof(size_t) +
+           index.Size() * index.GetBinTypeSize() + index.OffsetSize() * sizeof(uint32_t) +
+           (cut.cut_values_.Size() + cut.min_vals_.Size()) * sizeof(bst_float) +
+           cut.cut_ptrs_.Size() * sizeof(uint32_t);
+  }
 
   template<typename BinIdxType>
   void SetIndexDataForDense(common::Span<BinIdxType> index_data_span,
@@ -63,6 +63,7 @@ void HistCutMatrix::Init(DMatrix* p_fmat, uint32_t max_num_bins) {
     s.Init(info.num_row_, 1.0 / (max_num_bins * kFactor));
   }
 
+  monitor_.Start("Sketch");
   const auto& weights = info.weights_.HostVector();
 
   // Data groups, used in ranking.
@@ -157,6 +158,8 @@ void HistCutMatrix::Init(DMatrix* p_fmat, uint32_t max_num_bins) {
     }
   }
 
+  monitor_.Stop("Sketch");
+
   Init(&sketchs, max_num_bins);
   monitor_.Stop("Init");
 }
@@ -169,21 +172,38 @@ void HistCutMatrix::Init
   rabit::SerializeReducer<WXQSketch::SummaryContainer> sreducer;
   std::vector<WXQSketch::SummaryContainer> summary_array;
   summary_array.resize(sketchs.size());
-  for (size_t i = 0; i < sketchs.size(); ++i) {
+  const int nthread = omp_get_max_threads();
+  // Features are independent, and in oblivious mode each summary involves
+  // oblivious sorts, so finalize them in parallel.
+  monitor_.Start("GetSummary");
+  #pragma omp parallel for num_threads(nthread) schedule(dynamic)
+  for (omp_ulong i = 0; i < sketchs.size(); ++i) {  // NOLINT(*)
     WXQSketch::SummaryContainer out;
     sketchs[i].GetSummary(&out);
     summary_array[i].Reserve(max_num_bins * kFactor);
     summary_array[i].SetPrune(out, max_num_bins * kFactor);
   }
+  monitor_.Stop("GetSummary");
   CHECK_EQ(summary_array.size(), in_sketchs->size());
+  monitor_.Start("AllreduceSummary");
   size_t nbytes = WXQSketch::SummaryContainer::CalcMemCost(max_num_bins * kFactor);
   sreducer.Allreduce(dmlc::BeginPtr(summary_array), nbytes, summary_array.size());
+  monitor_.Stop("AllreduceSummary");
+
+  monitor_.Start("PruneSummary");
+  std::vector<WXQSketch::SummaryContainer> pruned(summary_array.size());
+  #pragma omp parallel for num_threads(nthread) schedule(dynamic)
+  for (omp_ulong fid = 0; fid < summary_array.size(); ++fid) {  // NOLINT(*)
+    pruned[fid].Reserve(max_num_bins);
+    pruned[fid].SetPrune(summary_array[fid], max_num_bins);
+  }
+  monitor_.Stop("PruneSummary");
+
+  monitor_.Start("BuildCuts");
   this->min_val.resize(sketchs.size());
   row_ptr.push_back(0);
   for (size_t fid = 0; fid < summary_array.size(); ++fid) {
-    WXQSketch::SummaryContainer a;
-    a.Reserve(max_num_bins);
-    a.SetPrune(summary_array[fid], max_num_bins);
+    const WXQSketch::SummaryContainer& a = pruned[fid];
     const bst_float mval = a.data[0].value;
     this->min_val[fid] = mval - (fabs(mval) + 1e-5);
     if (a.size > 1 && a.size <= 16) {
@@ -215,6 +235,7 @@ void HistCutMatrix::Init
     CHECK_GT(cut_size, row_ptr.back());
     row_ptr.push_back(cut_size);
   }
+  monitor_.Stop("BuildCuts");
 }
 
 uint32_t HistCutMatrix::GetBinIdx(const Entry& e) {
@@ -235,17 +256,15 @@ uint32_t HistCutMatrix::RawGetBinIdx(const Entry& e) {
 }
 
 // This reveals range for feature values, thus need to be oblivious.
-// Change std::upper_bound to linear.
+// Change std::upper_bound to a linear count over all cut points of the
+// feature (vectorized when built with AVX2).
 uint32_t HistCutMatrix::OGetBinIdx(const Entry& e) {
   unsigned fid = e.index;
-  auto cbegin = cut.begin() + row_ptr[fid];
-  auto cend = cut.begin() + row_ptr[fid + 1];
-  CHECK(cbegin != cend);
-  uint32_t idx = row_ptr[fid];
-  while (cbegin != cend) {
-    idx += ObliviousChoose(e.fvalue >= *cbegin, 1, 0);
-    cbegin++;
-  }
+  const uint32_t ibegin = row_ptr[fid];
+  const uint32_t iend = row_ptr[fid + 1];
+  CHECK(ibegin != iend);
+  uint32_t idx = ibegin + static_cast<uint32_t>(
+      ObliviousCountLessOrEqual(cut.data() + ibegin, iend - ibegin, e.fvalue));
   CHECK(idx != row_ptr[fid + 1]);
   if (ObliviousDebugCheckEnabled()) {
     CHECK(idx == RawGetBinIdx(e)) << idx << ", expected=" << RawGetBinIdx(e);
@@ -260,6 +279,25 @@ void GHistIndexMatrix::Init(DMatrix* p_fmat, int max_num_bins) {
   hit_count.resize(nbins, 0);
   hit_count_tloc_.resize(nthread * nbins, 0);
 
+  // Dense matrices store feature-local bin ids in the narrowest type that fits
+  // the largest feature, sparse ones keep global uint32_t bin ids.
+  const size_t nfeature = cut.row_ptr.size() - 1;
+  const MetaInfo& info = p_fmat->Info();
+  isDense_ = info.num_nonzero_ == info.num_row_ * info.num_col_ &&
+             info.num_col_ == nfeature;
+  uint32_t max_feature_bins = 0;
+  for (size_t fid = 0; fid < nfeature; ++fid) {
+    max_feature_bins = std::max(max_feature_bins,
+                                cut.row_ptr[fid + 1] - cut.row_ptr[fid]);
+  }
+  if (isDense_ && max_feature_bins > 0) {
+    index.SetBinTypeSize(GetBinTypeSizeFor(max_feature_bins - 1));
+    index.ResizeOffset(nfeature);
+    std::copy(cut.row_ptr.begin(), cut.row_ptr.end() - 1, index.Offset());
+  } else {
+    isDense_ = false;
+    index.SetBinTypeSize(kUint32BinsTypeSize);
+  }
 
   size_t new_size = 1;
   for (const auto &batch : p_fmat->GetBatches<SparsePage>()) {
@@ -315,11 +353,55 @@ void GHistIndexMatrix::Init(DMatrix* p_fmat, int max_num_bins) {
       }
     }
 
-    index.resize(row_ptr[rbegin + batch.Size()]);
-
     CHECK_GT(cut.cut.size(), 0U);
 
-    #pragma omp parallel for num_threads(batch_threads) schedule(static)
+    const size_t n_index = row_ptr[rbegin + batch.Size()];
+    switch (index.GetBinTypeSize()) {
+      case kUint8BinsTypeSize:
+        index.Resize(sizeof(uint8_t) * n_index);
+        SetIndexDataForDense(index.data<uint8_t>(), batch_threads, batch, rbegin, nbins);
+        break;
+      case kUint16BinsTypeSize:
+        index.Resize(sizeof(uint16_t) * n_index);
+        SetIndexDataForDense(index.data<uint16_t>(), batch_threads, batch, rbegin, nbins);
+        break;
+      default:
+        index.Resize(sizeof(uint32_t) * n_index);
+        if (isDense_) {
+          SetIndexDataForDense(index.data<uint32_t>(), batch_threads, batch, rbegin, nbins);
+        } else {
+          SetIndexDataForSparse(index.data<uint32_t>(), batch_threads, batch, rbegin, nbins);
+        }
+    }
+
+    #pragma omp parallel for num_threads(nthread) schedule(static)
+    for (bst_omp_uint idx = 0; idx < bst_omp_uint(nbins); ++idx) {
+      for (size_t tid = 0; tid < nthread; ++tid) {
+        hit_count[idx] += hit_count_tloc_[tid * nbins + idx];
+      }
+    }
+
+    prev_sum = row_ptr[rbegin + batch.Size()];
+    rbegin += batch.Size();
+  }
+
+  LOG(INFO) << "GHistIndexMatrix: " << index.Size() << " bin ids stored in "
+            << index.MemCostBytes() << " bytes ("
+            << index.Size() * sizeof(uint32_t) << " bytes with uint32_t bin ids), "
+            << static_cast<int>(index.GetBinTypeSize()) << " byte(s) per bin id";
+}
+
+template<typename BinIdxType>
+void GHistIndexMatrix::SetIndexDataForDense(BinIdxType* index_data,
+                                            size_t batch_threads,
+                                            const SparsePage& batch,
+                                            size_t rbegin, uint32_t nbins) {
+  const uint32_t* offsets = index.Offset();
+  const size_t nfeature = index.OffsetSize();
+  #pragma omp parallel num_threads(batch_threads)
+  {
+    std::vector<uint32_t> row_bins(nfeature);
+    #pragma omp for schedule(static)
     for (omp_ulong i = 0; i < batch.Size(); ++i) { // NOLINT(*)
       const int tid = omp_get_thread_num();
       size_t ibegin = row_ptr[rbegin + i];
@@ -327,29 +409,48 @@ void GHistIndexMatrix::Init(DMatrix* p_fmat, int max_num_bins) {
       SparsePage::Inst inst = batch[i];
 
       CHECK_EQ(ibegin + inst.size(), iend);
+      CHECK_EQ(inst.size(), nfeature);
       for (bst_uint j = 0; j < inst.size(); ++j) {
         uint32_t idx = cut.GetBinIdx(inst[j]);
-
-        index[ibegin + j] = idx;
+        row_bins[j] = idx;
         ++hit_count_tloc_[tid * nbins + idx];
       }
-      // Sort here is fine due to we only care about what the feature
-      // bins are for this instance as a whole.
-      // This sort helps accelerate |ColumnMatrix::Init|.
+      // Sorting global bin ids orders the row by feature, so the j-th entry
+      // belongs to feature j and only its feature-local bin id is kept.
       // This sort just reveals what the input sequences are, which is not
       // sensitive.
-      std::sort(index.begin() + ibegin, index.begin() + iend);
-    }
-
-    #pragma omp parallel for num_threads(nthread) schedule(static)
-    for (bst_omp_uint idx = 0; idx < bst_omp_uint(nbins); ++idx) {
-      for (size_t tid = 0; tid < nthread; ++tid) {
-        hit_count[idx] += hit_count_tloc_[tid * nbins + idx];
+      std::sort(row_bins.begin(), row_bins.end());
+      for (size_t j = 0; j < nfeature; ++j) {
+        index_data[ibegin + j] = static_cast<BinIdxType>(row_bins[j] - offsets[j]);
       }
     }
+  }
+}
 
-    prev_sum = row_ptr[rbegin + batch.Size()];
-    rbegin += batch.Size();
+void GHistIndexMatrix::SetIndexDataForSparse(uint32_t* index_data,
+                                             size_t batch_threads,
+                                             const SparsePage& batch,
+                                             size_t rbegin, uint32_t nbins) {
+  #pragma omp parallel for num_threads(batch_threads) schedule(static)
+  for (omp_ulong i = 0; i < batch.Size(); ++i) { // NOLINT(*)
+    const int tid = omp_get_thread_num();
+    size_t ibegin = row_ptr[rbegin + i];
+    size_t iend = row_ptr[rbegin + i + 1];
+    SparsePage::Inst inst = batch[i];
+
+    CHECK_EQ(ibegin + inst.size(), iend);
+    for (bst_uint j = 0; j < inst.size(); ++j) {
+      uint32_t idx = cut.GetBinIdx(inst[j]);
+
+      index_data[ibegin + j] = idx;
+      ++hit_count_tloc_[tid * nbins + idx];
+    }
+    // Sort here is fine due to we only care about what the feature
+    // bins are for this instance as a whole.
+    // This sort helps accelerate |ColumnMatrix::Init|.
+    // This sort just reveals what the input sequences are, which is not
+    // sensitive.
+    std::sort(index_data + ibegin, index_data + iend);
   }
 }
 
@@ -359,7 +460,7 @@ static size_t GetConflictCount(const std::vector<bool>& mark,
   size_t ret = 0;
   if (column.GetType() == xgboost::common::kDenseColumn) {
     for (size_t i = 0; i < column.Size(); ++i) {
-      if (column.GetFeatureBinIdx(i) != std::numeric_limits<uint32_t>::max() && mark[i]) {
+      if (!column.IsMissing(i) && mark[i]) {
         ++ret;
         if (ret > max_cnt) {
           return max_cnt + 1;
@@ -384,7 +485,7 @@ MarkUsed(std::vector<bool>* p_mark, const Column& column) {
   std::vector<bool>& mark = *p_mark;
   if (column.GetType() == xgboost::common::kDenseColumn) {
     for (size_t i = 0; i < column.Size(); ++i) {
-      if (column.GetFeatureBinIdx(i) != std::numeric_limits<uint32_t>::max()) {
+      if (!column.IsMissing(i)) {
         mark[i] = true;
       }
     }
@@ -578,6 +679,40 @@ void GHistIndexBlockMatrix::Init(const GHistIndexMatrix& gmat,
   }
 }
 
+template <typename BinIdxType>
+static void BuildHistRows(const size_t* rid, const size_t* row_ptr,
+                          const BinIdxType* index, const uint32_t* offsets,
+                          const float* pgh, size_t istart, size_t iend,
+                          size_t nrows, size_t no_prefetch_size,
+                          size_t prefetch_offset, double* data_local_hist) {
+  for (size_t i = istart; i < iend; ++i) {
+    const size_t icol_start = row_ptr[rid[i]];
+    const size_t icol_end = row_ptr[rid[i]+1];
+
+    if (i < nrows - no_prefetch_size) {
+      PREFETCH_READ_T0(row_ptr + rid[i + prefetch_offset]);
+      PREFETCH_READ_T0(pgh + 2*rid[i + prefetch_offset]);
+    }
+
+    const size_t idx_gh = 2*rid[i];
+    if (offsets != nullptr) {
+      // dense index: entry j of a row holds the local bin of feature j
+      for (size_t j = icol_start; j < icol_end; ++j) {
+        const uint32_t idx_bin =
+            2 * (static_cast<uint32_t>(index[j]) + offsets[j - icol_start]);
+        data_local_hist[idx_bin] += pgh[idx_gh];
+        data_local_hist[idx_bin+1] += pgh[idx_gh+1];
+      }
+    } else {
+      for (size_t j = icol_start; j < icol_end; ++j) {
+        const uint32_t idx_bin = 2 * static_cast<uint32_t>(index[j]);
+        data_local_hist[idx_bin] += pgh[idx_gh];
+        data_local_hist[idx_bin+1] += pgh[idx_gh+1];
+      }
+    }
+  }
+}
+
 void GHistBuilder::BuildHist(const std::vector<GradientPair>& gpair,
                              const RowSetCollection::Elem row_indices,
                              const GHistIndexMatrix& gmat,
@@ -587,7 +722,8 @@ void GHistBuilder::BuildHist(const std::vector<GradientPair>& gpair,
 
   const size_t* rid =  row_indices.begin;
   const size_t nrows = row_indices.Size();
-  const uint32_t* index = gmat.index.data();
+  const uint32_t* offsets = gmat.index.Offset();
+  const BinTypeSize bin_type_size = gmat.index.GetBinTypeSize();
   const size_t* row_ptr =  gmat.row_ptr.data();
   const float* pgh = reinterpret_cast<const float*>(gpair.data());
 
@@ -619,22 +755,21 @@ void GHistBuilder::BuildHist(const std::vector<GradientPair>& gpair,
 
     const size_t istart = iblock*block_size;
     const size_t iend = (((iblock+1)*block_size > nrows) ? nrows : istart + block_size);
-    for (size_t i = istart; i < iend; ++i) {
-      const size_t icol_start = row_ptr[rid[i]];
-      const size_t icol_end = row_ptr[rid[i]+1];
-
-      if (i < nrows - no_prefetch_size) {
-        PREFETCH_READ_T0(row_ptr + rid[i + prefetch_offset]);
-        PREFETCH_READ_T0(pgh + 2*rid[i + prefetch_offset]);
-      }
-
-      for (size_t j = icol_start; j < icol_end; ++j) {
-        const uint32_t idx_bin = 2*index[j];
-        const size_t idx_gh = 2*rid[i];
-
-        data_local_hist[idx_bin] += pgh[idx_gh];
-        data_local_hist[idx_bin+1] += pgh[idx_gh+1];
-      }
+    switch (bin_type_size) {
+      case kUint8BinsTypeSize:
+        BuildHistRows(rid, row_ptr, gmat.index.data<uint8_t>(), offsets, pgh,
+                      istart, iend, nrows, no_prefetch_size, prefetch_offset,
+                      data_local_hist);
+        break;
+      case kUint16BinsTypeSize:
+        BuildHistRows(rid, row_ptr, gmat.index.data<uint16_t>(), offsets, pgh,
+                      istart, iend, nrows, no_prefetch_size, prefetch_offset,
+                      data_local_hist);
+        break;
+      default:
+        BuildHistRows(rid, row_ptr, gmat.index.data<uint32_t>(), offsets, pgh,
+                      istart, iend, nrows, no_prefetch_size, prefetch_offset,
+                      data_local_hist);
     }
   }
 
@@ -133,6 +133,119 @@ void DeviceSketch
  */
 using GHistIndexRow = Span<uint32_t const>;
 
+/*!
+ * \brief width in bytes of a single entry of a compact bin index
+ */
+enum BinTypeSize {
+  kUint8BinsTypeSize  = 1,
+  kUint16BinsTypeSize = 2,
+  kUint32BinsTypeSize = 4
+};
+
+/*!
+ * \brief smallest bin type that can hold |max_value|
+ */
+inline BinTypeSize GetBinTypeSizeFor(size_t max_value) {
+  if (max_value <= std::numeric_limits<uint8_t>::max()) {
+    return kUint8BinsTypeSize;
+  } else if (max_value <= std::numeric_limits<uint16_t>::max()) {
+    return kUint16BinsTypeSize;
+  }
+  return kUint32BinsTypeSize;
+}
+
+/*!
+ * \brief compact storage of bin ids, stored as uint8_t, uint16_t or uint32_t.
+ *  For dense matrices every row holds exactly one bin per feature, so only the
+ *  feature-local bin id is stored and the global bin id is recovered with
+ *  the per-feature offsets (the first bin id of each feature).
+ */
+struct Index {
+  Index() {
+    SetBinTypeSize(binTypeSize_);
+  }
+  Index(const Index& i) = delete;
+  Index& operator=(Index i) = delete;
+  Index(Index&& i) = delete;
+  Index& operator=(Index&& i) = delete;
+  // global bin id of i-th entry
+  uint32_t operator[](size_t i) const {
+    if (offset_ptr_ != nullptr) {
+      return func_(data_ptr_, i) + offset_ptr_[i % p_];
+    } else {
+      return func_(data_ptr_, i);
+    }
+  }
+  void SetBinTypeSize(BinTypeSize binTypeSize) {
+    binTypeSize_ = binTypeSize;
+    switch (binTypeSize) {
+      case kUint8BinsTypeSize:
+        func_ = &GetValueFromUint8;
+        break;
+      case kUint16BinsTypeSize:
+        func_ = &GetValueFromUint16;
+        break;
+      case kUint32BinsTypeSize:
+        func_ = &GetValueFromUint32;
+        break;
+      default:
+        CHECK(binTypeSize == kUint8BinsTypeSize  ||
+              binTypeSize == kUint16BinsTypeSize ||
+              binTypeSize == kUint32BinsTypeSize);
+    }
+  }
+  BinTypeSize GetBinTypeSize() const {
+    return binTypeSize_;
+  }
+  template<typename T>
+  T* data() const {  // NOLINT
+    return static_cast<T*>(data_ptr_);
+  }
+  uint32_t* Offset() const {
+    return offset_ptr_;
+  }
+  size_t OffsetSize() const {
+    return offset_.size();
+  }
+  size_t Size() const {
+    return data_.size() / (binTypeSize_);
+  }
+  // bytes held by the index, including offsets
+  size_t MemCostBytes() const {
+    return data_.size() + offset_.size() * sizeof(uint32_t);
+  }
+  void Resize(const size_t nBytesData) {
+    data_.resize(nBytesData);
+    data_ptr_ = reinterpret_cast<void*>(data_.data());
+  }
+  void ResizeOffset(const size_t nDisps) {
+    offset_.resize(nDisps);
+    offset_ptr_ = offset_.data();
+    p_ = nDisps;
+  }
+
+ private:
+  static uint32_t GetValueFromUint8(void *t, size_t i) {
+    return reinterpret_cast<uint8_t*>(t)[i];
+  }
+  static uint32_t GetValueFromUint16(void* t, size_t i) {
+    return reinterpret_cast<uint16_t*>(t)[i];
+  }
+  static uint32_t GetValueFromUint32(void* t, size_t i) {
+    return reinterpret_cast<uint32_t*>(t)[i];
+  }
+
+  using Func = uint32_t (*)(void*, size_t);
+
+  std::vector<uint8_t> data_;
+  std::vector<uint32_t> offset_;  // size of this field is equal to number of features
+  void* data_ptr_ {nullptr};
+  BinTypeSize binTypeSize_ {kUint8BinsTypeSize};
+  size_t p_ {1};
+  uint32_t* offset_ptr_ {nullptr};
+  Func func_;
+};
+
 /*!
  * \brief preprocessed global index matrix, in CSR format
  *  Transform floating values to integer index in histogram
@@ -143,18 +256,21 @@ struct GHistIndexMatrix {
   /*! \brief row pointer to rows by element position */
   std::vector<size_t> row_ptr;
   /*! \brief The index data */
-  std::vector<uint32_t> index;
+  Index index;
   /*! \brief hit count of each index */
   std::vector<size_t> hit_count;
   /*! \brief The corresponding cuts */
   HistCutMatrix cut;
   // Create a global histogram matrix, given cut
   void Init(DMatrix* p_fmat, int max_num_bins);
-  // get i-th row
-  inline GHistIndexRow operator[](size_t i) const {
-    return {&index[0] + row_ptr[i],
-            static_cast<GHistIndexRow::index_type>(
-                row_ptr[i + 1] - row_ptr[i])};
+  /*! \return estimation of memory cost of the index and its cuts */
+  size_t MemCostBytes() const {
+    return (row_ptr.size() + hit_count.size() + hit_count_tloc_.size()) * sizeof(size_t) +
+           index.MemCostBytes() + cut.row_ptr.size() * sizeof(uint32_t) +
+           (cut.min_val.size() + cut.cut.size()) * sizeof(bst_float);
+  }
+  inline bool IsDense() const {
+    return isDense_;
   }
   inline void GetFeatureCounts(size_t* counts) const {
     auto nfeature = cut.row_ptr.size() - 1;
@@ -168,6 +284,15 @@ struct GHistIndexMatrix {
   }
 
  private:
+  template<typename BinIdxType>
+  void SetIndexDataForDense(BinIdxType* index_data, size_t batch_threads,
+                            const SparsePage& batch, size_t rbegin,
+                            uint32_t nbins);
+  void SetIndexDataForSparse(uint32_t* index_data, size_t batch_threads,
+                             const SparsePage& batch, size_t rbegin,
+                             uint32_t nbins);
+
+  bool isDense_ {false};
   std::vector<size_t> hit_count_tloc_;
 };
 
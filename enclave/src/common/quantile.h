@@ -874,14 +874,22 @@ struct WQSummary {
       a_prev_rmax = next_aprev_rmax;
       b_prev_rmax = next_bprev_rmax;
     }
-    // Bitonic sort to push duplicates to end of list.
+    // Push duplicates to end of list. The remaining entries are still sorted
+    // by value, so an order-preserving compaction is enough; no need to
+    // re-sort.
     std::transform(merged_party_entrys.begin(), merged_party_entrys.end(),
         this->data, [](const EntryWithPartyInfo &party_entry) {
         return party_entry.entry;
         });
     LOG(DEBUG) << __func__ << " BEGIN 3" << std::endl;
-    ObliviousSort(this->data, this->data + this->size);
-    // std::sort(this->data, this->data + this->size);
+    size_t valid_count = ObliviousCompact(this->data, this->data + this->size,
+        [](const Entry &entry) {
+        return ObliviousEqual(entry.value, std::numeric_limits<DType>::max());
+        });
+    for (size_t idx = 0; idx < this->size; ++idx) {
+      ObliviousAssign(ObliviousLess(idx, valid_count), this->data[idx],
+          kDummyEntryWithMaxValue, &this->data[idx]);
+    }
     LOG(DEBUG) << __func__ << " PASSED 3" << std::endl;
     // Need to confirm shrink.
     if (ObliviousDebugCheckEnabled()) {
@@ -6,6 +6,7 @@
 #include <dmlc/registry.h>
 #include <cstring>
 #include <memory>
+#include <mutex>
 
 #include "dmlc/io.h"
 #include "xgboost/data.h"
@@ -24,7 +25,7 @@
 #include "../data/adapter.h"
 #include "../data/iterative_device_dmatrix.h"
 
-#if DMLC_ENABLE_STD_THREAD
+#if DMLC_ENABLE_STD_THREAD || defined(__ENCLAVE__)
 #include "./sparse_page_source.h"
 #include "./sparse_page_dmatrix.h"
 #endif  // DMLC_ENABLE_STD_THREAD
@@ -139,6 +140,20 @@ void MetaInfo::Clear() {
   base_margin_.HostVector().clear();
 }
 
+size_t MetaInfo::MemCostBytes() const {
+  size_t bytes = (labels_.Size() + weights_.Size() + base_margin_.Size() +
+                  labels_lower_bound_.Size() + labels_upper_bound_.Size()) * sizeof(bst_float);
+  bytes += group_ptr_.size() * sizeof(bst_group_t);
+  bytes += feature_types.Size() * sizeof(FeatureType);
+  for (auto const& name : feature_names) {
+    bytes += name.size();
+  }
+  for (auto const& name : feature_type_names) {
+    bytes += name.size();
+  }
+  return bytes;
+}
+
 /*
  * Binary serialization format for MetaInfo:
  *
@@ -567,6 +582,15 @@ XGBAPIThreadLocalEntry& DMatrix::GetThreadLocal() const {
   return (*DMatrixThreadLocal::Get())[this];
 }
 
+size_t DMatrix::MemCostBytes() const {
+  size_t bytes = Info().MemCostBytes();
+  std::lock_guard<std::mutex> guard(derived_mutex_);
+  for (auto const& kv : derived_matrices_) {
+    bytes += kv.second.bytes;
+  }
+  return bytes;
+}
+
 DMatrix::~DMatrix() {
   auto local_map = DMatrixThreadLocal::Get();
   if (local_map->find(this) != local_map->cend()) {
@@ -816,7 +840,8 @@ DMatrix* DMatrix::Load(std::vector<const std::string>& uris,
 
   DMatrix* dmat {nullptr};
   try {
-    dmat = DMatrix::Create(adapters, std::numeric_limits<float>::quiet_NaN(), 1,
+    // nthread = 0 lets the files of different owners be parsed concurrently
+    dmat = DMatrix::Create(adapters, std::numeric_limits<float>::quiet_NaN(), 0,
         cache_file, page_size);
   } catch (dmlc::Error& e) {
     std::vector<std::string> splited = common::Split(fname, '#');
@@ -857,10 +882,9 @@ DMatrix* DMatrix::Load(std::vector<const std::string>& uris,
   for (int i = 0; i < num_uris; ++i) {
     data::FileAdapter* adapter = adapters[i];
     if (is_encrypted) {
-      int *indices = new int[npart];
-      memset(indices, 0, sizeof(indices));
+      std::vector<uint64_t> indices(npart, 0);
       indices[partid] = adapter->TotalRowsInChunk();
-      rabit::Allreduce<rabit::op::Max>(indices, npart);
+      rabit::Allreduce<rabit::op::Max>(indices.data(), npart);
       uint64_t sum = 0;
       uint64_t sum_prev = 0;
       for (int i = 0; i < npart; i++) {
@@ -925,7 +949,7 @@ DMatrix* DMatrix::Create(AdapterT* adapter, float missing, int nthread,
     // Data split mode is fixed to be row right now.
     return new data::SimpleDMatrix(adapter, missing, nthread);
   } else {
-#if DMLC_ENABLE_STD_THREAD
+#if DMLC_ENABLE_STD_THREAD || defined(__ENCLAVE__)
     return new data::SparsePageDMatrix(adapter, missing, nthread, cache_prefix,
                                        page_size);
 #else
@@ -942,8 +966,10 @@ DMatrix* DMatrix::Create(std::vector<AdapterT*> adapters, float missing, int nth
     // Data split mode is fixed to be row right now.
     return new data::SimpleDMatrix(adapters, missing, nthread);
   } else {
-#if DMLC_ENABLE_STD_THREAD
-    return new data::SparsePageDMatrix(adapter, missing, nthread, cache_prefix,
+#if DMLC_ENABLE_STD_THREAD || defined(__ENCLAVE__)
+    CHECK_EQ(adapters.size(), 1U)
+        << "External memory is not supported for data from multiple owners";
+    return new data::SparsePageDMatrix(adapters[0], missing, nthread, cache_prefix,
         page_size);
 #else
     LOG(FATAL) << "External memory is not enabled in mingw";
@@ -1171,5 +1197,6 @@ namespace data {
 
 // List of files that will be force linked in static links.
 DMLC_REGISTRY_LINK_TAG(sparse_page_raw_format);
+DMLC_REGISTRY_LINK_TAG(sparse_page_sealed_format);
 }  // namespace data
 }  // namespace xgboost
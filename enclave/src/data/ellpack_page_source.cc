@@ -3,7 +3,7 @@
  */
 #ifndef XGBOOST_USE_CUDA
 #include <dmlc/base.h>
-#if DMLC_ENABLE_STD_THREAD
+#if DMLC_ENABLE_STD_THREAD || defined(__ENCLAVE__)
 
 #include "ellpack_page_source.h"
 #include <xgboost/data.h>
@@ -0,0 +1,259 @@
+/*!
+ * Copyright 2020 by Secure XGBoost Contributors
+ * \file sealed_dmatrix_cache.cc
+ * \brief Cache of parsed DMatrices sealed to host storage, and eviction of idle
+ *  DMatrices to sealed host storage.
+ */
+#include <dmlc/io.h>
+#include <dmlc/parameter.h>
+#include <rabit/rabit.h>
+
+#include <cstdio>
+#include <cstring>
+#include <memory>
+#include <sstream>
+#include <string>
+#include <vector>
+
+#include "./sealed_dmatrix_cache.h"
+#include "./sealing.h"
+#include "./simple_dmatrix.h"
+#include "../common/io.h"
+
+namespace xgboost {
+namespace data {
+
+namespace {
+/*! \brief size of the reads used to hash the input files */
+constexpr size_t kHashChunkSize = 1UL << 20UL;
+
+#define CHECK_SHA(ret) CHECK_EQ((ret), 0) << "SHA-256 failed while hashing DMatrix inputs"
+
+void HashFile(mbedtls_sha256_context* ctx, const std::string& path) {
+  std::unique_ptr<dmlc::Stream> fi(dmlc::Stream::Create(path.c_str(), "r"));
+  std::vector<unsigned char> buffer(kHashChunkSize);
+  uint64_t total = 0;
+  size_t size;
+  while ((size = fi->Read(buffer.data(), buffer.size())) != 0) {
+    CHECK_SHA(mbedtls_sha256_update_ret(ctx, buffer.data(), size));
+    total += size;
+  }
+  CHECK_SHA(mbedtls_sha256_update_ret(ctx, reinterpret_cast<unsigned char*>(&total),
+                                      sizeof(total)));
+}
+
+/*! \brief size of the file at |path| on host storage */
+size_t FileSize(const std::string& path) {
+  dmlc::io::URI uri(path.c_str());
+  return dmlc::io::FileSystem::GetInstance(uri)->GetPathInfo(uri).size;
+}
+
+void HashString(mbedtls_sha256_context* ctx, const std::string& str) {
+  // include the terminator so that adjacent strings cannot run into each other
+  CHECK_SHA(mbedtls_sha256_update_ret(ctx, reinterpret_cast<const unsigned char*>(str.c_str()),
+                                      str.size() + 1));
+}
+
+/*!
+ * \brief Write |dmat| in the SimpleDMatrix binary format, sealed by |sealer|,
+ *  as  plaintext size (uint64_t) | IV | tag | ciphertext
+ */
+void SealDMatrix(const SimpleDMatrix& dmat, Sealer* sealer,
+                 const unsigned char* aad, size_t aad_size, dmlc::Stream* fo) {
+  std::string buffer;
+  common::MemoryBufferStream ms(&buffer);
+  dmat.SaveBinary(&ms);
+
+  const uint64_t size = buffer.size();
+  unsigned char iv[CIPHER_IV_SIZE];
+  unsigned char tag[CIPHER_TAG_SIZE];
+  // encrypt in place, the matrix is not held twice in enclave memory
+  unsigned char* data = reinterpret_cast<unsigned char*>(&buffer[0]);
+  sealer->Seal(data, size, aad, aad_size, data, iv, tag);
+
+  fo->Write(&size, sizeof(size));
+  fo->Write(iv, CIPHER_IV_SIZE);
+  fo->Write(tag, CIPHER_TAG_SIZE);
+  fo->Write(buffer.data(), size);
+  fo->Flush();
+}
+
+/*!
+ * \brief read a matrix written by SealDMatrix, nullptr if it is truncated or forged
+ * \param available number of bytes left in |fi|, which bounds the size read
+ *  from the unauthenticated header
+ */
+DMatrix* UnsealDMatrix(Sealer* sealer, const unsigned char* aad, size_t aad_size,
+                       dmlc::Stream* fi, size_t available) {
+  constexpr size_t kHeaderSize = sizeof(uint64_t) + CIPHER_IV_SIZE + CIPHER_TAG_SIZE;
+  uint64_t size;
+  unsigned char iv[CIPHER_IV_SIZE];
+  unsigned char tag[CIPHER_TAG_SIZE];
+  if (available < kHeaderSize ||
+      fi->Read(&size, sizeof(size)) != sizeof(size) ||
+      fi->Read(iv, CIPHER_IV_SIZE) != CIPHER_IV_SIZE ||
+      fi->Read(tag, CIPHER_TAG_SIZE) != CIPHER_TAG_SIZE ||
+      size > available - kHeaderSize) {
+    return nullptr;
+  }
+  std::string buffer;
+  buffer.resize(size);
+  if (size != 0 && fi->Read(&buffer[0], size) != size) {
+    return nullptr;
+  }
+  // decrypt in place, the matrix is not held twice in enclave memory
+  unsigned char* data = reinterpret_cast<unsigned char*>(&buffer[0]);
+  if (!sealer->Unseal(data, size, iv, tag, aad, aad_size, data)) {
+    return nullptr;
+  }
+  common::MemoryFixSizeBuffer fs(&buffer[0], buffer.size());
+  return new SimpleDMatrix(&fs);
+}
+}  // anonymous namespace
+
+SealedDMatrixCache::SealedDMatrixCache(const std::string& cache_dir,
+                                       const std::vector<std::string>& uris,
+                                       char* usernames[], char* keys[],
+                                       bool load_row_split) {
+  // same partitioning as DMatrix::Load
+  int partid = 0, npart = 1;
+  if (load_row_split) {
+    partid = rabit::GetRank();
+    npart = rabit::GetWorldSize();
+  } else {
+    npart = dmlc::GetEnv("XGBOOST_TEST_NPART", 1);
+  }
+
+  mbedtls_sha256_context ctx;
+  mbedtls_sha256_init(&ctx);
+  CHECK_SHA(mbedtls_sha256_starts_ret(&ctx, 0));
+  HashString(&ctx, "xgboost-dmatrix-cache");
+  std::ostringstream part;
+  part << partid << "/" << npart;
+  HashString(&ctx, part.str());
+  for (size_t i = 0; i < uris.size(); ++i) {
+    // parser arguments such as the format and label column change the result
+    const size_t arg_pos = uris[i].find('?');
+    HashString(&ctx, usernames[i]);
+    HashString(&ctx, arg_pos == std::string::npos ? "" : uris[i].substr(arg_pos + 1));
+    HashFile(&ctx, uris[i].substr(0, arg_pos));
+  }
+  CHECK_SHA(mbedtls_sha256_finish_ret(&ctx, digest_));
+  mbedtls_sha256_free(&ctx);
+
+  std::string material("xgboost-dmatrix-cache");
+  material.append(reinterpret_cast<char*>(digest_), SHA_DIGEST_SIZE);
+  for (size_t i = 0; i < uris.size(); ++i) {
+    material.append(usernames[i]);
+    material.append(keys[i], CIPHER_KEY_SIZE);
+  }
+  CHECK_EQ(compute_sha256(reinterpret_cast<const uint8_t*>(material.data()), material.size(), key_), 0)
+      << "Failed to derive the DMatrix cache key";
+
+  std::ostringstream path;
+  path << cache_dir << "/";
+  for (unsigned char c : digest_) {
+    path << "0123456789abcdef"[c >> 4] << "0123456789abcdef"[c & 0xf];
+  }
+  path << ".dmatrix";
+  path_ = path.str();
+}
+
+DMatrix* SealedDMatrixCache::Load() {
+  std::unique_ptr<dmlc::Stream> fi(dmlc::Stream::Create(path_.c_str(), "r", true));
+  if (fi == nullptr) return nullptr;
+  int magic;
+  unsigned char digest[SHA_DIGEST_SIZE];
+  if (fi->Read(&magic, sizeof(magic)) != sizeof(magic) || magic != kMagic ||
+      fi->Read(digest, SHA_DIGEST_SIZE) != SHA_DIGEST_SIZE ||
+      memcmp(digest, digest_, SHA_DIGEST_SIZE) != 0) {
+    LOG(WARNING) << "Ignoring invalid DMatrix cache " << path_;
+    return nullptr;
+  }
+  Sealer sealer(key_);
+  DMatrix* dmat = UnsealDMatrix(&sealer, digest_, SHA_DIGEST_SIZE, fi.get(),
+                                FileSize(path_) - sizeof(magic) - SHA_DIGEST_SIZE);
+  if (dmat == nullptr) {
+    LOG(WARNING) << "Ignoring DMatrix cache " << path_ << " that is truncated or failed authentication";
+  }
+  return dmat;
+}
+
+void SealedDMatrixCache::Save(DMatrix* dmat) {
+  auto* simple = dynamic_cast<SimpleDMatrix*>(dmat);
+  if (simple == nullptr) {
+    LOG(INFO) << "Only in-memory DMatrices are written to the DMatrix cache";
+    return;
+  }
+  std::unique_ptr<dmlc::Stream> fo(dmlc::Stream::Create(path_.c_str(), "w"));
+  int magic = kMagic;
+  fo->Write(&magic, sizeof(magic));
+  fo->Write(digest_, SHA_DIGEST_SIZE);
+  Sealer sealer(key_);
+  SealDMatrix(*simple, &sealer, digest_, SHA_DIGEST_SIZE, fo.get());
+}
+
+bool SpillDMatrix(DMatrix* dmat, const std::string& path, const std::string& id) {
+  auto* simple = dynamic_cast<SimpleDMatrix*>(dmat);
+  if (simple == nullptr) {
+    return false;
+  }
+  std::unique_ptr<dmlc::Stream> fo(dmlc::Stream::Create(path.c_str(), "w"));
+  Sealer sealer;
+  SealDMatrix(*simple, &sealer, reinterpret_cast<const unsigned char*>(id.data()), id.size(),
+              fo.get());
+  return true;
+}
+
+DMatrix* UnspillDMatrix(const std::string& path, const std::string& id) {
+  DMatrix* dmat;
+  {
+    std::unique_ptr<dmlc::Stream> fi(dmlc::Stream::Create(path.c_str(), "r"));
+    Sealer sealer;
+    dmat = UnsealDMatrix(&sealer, reinterpret_cast<const unsigned char*>(id.data()),
+                         id.size(), fi.get(), FileSize(path));
+  }
+  CHECK(dmat != nullptr) << "Evicted DMatrix " << path << " is truncated or failed authentication";
+  std::remove(path.c_str());
+  return dmat;
+}
+
+DMatrix* LoadCachedDMatrix(std::vector<const std::string>& uris,
+                           char* usernames[], char* keys[],
+                           bool silent, bool load_row_split,
+                           const std::string& cache_dir) {
+  bool use_cache = !cache_dir.empty();
+  for (const auto& uri : uris) {
+    if (use_cache && uri.find('#') != std::string::npos) {
+      LOG(WARNING) << "DMatrix cache is not used for external memory: " << uri;
+      use_cache = false;
+    }
+  }
+  if (!use_cache) {
+    return DMatrix::Load(uris, silent, load_row_split, true, keys);
+  }
+
+  SealedDMatrixCache cache(cache_dir, std::vector<std::string>(uris.begin(), uris.end()),
+                           usernames, keys, load_row_split);
+  std::unique_ptr<DMatrix> cached(cache.Load());
+  if (load_row_split) {
+    int hit = cached != nullptr;
+    rabit::Allreduce<rabit::op::Min>(&hit, 1);
+    if (!hit) {
+      cached.reset();
+    }
+  }
+  if (cached != nullptr) {
+    if (!silent) {
+      LOG(INFO) << cached->Info().num_row_ << 'x' << cached->Info().num_col_ << " matrix with "
+                << cached->Info().num_nonzero_ << " entries loaded from cache " << cache.Path();
+    }
+    return cached.release();
+  }
+  DMatrix* dmat = DMatrix::Load(uris, silent, load_row_split, true, keys);
+  cache.Save(dmat);
+  return dmat;
+}
+
+}  // namespace data
+}  // namespace xgboost
@@ -0,0 +1,82 @@
+/*!
+ * Copyright 2020 by Secure XGBoost Contributors
+ * \file sealed_dmatrix_cache.h
+ * \brief Cache of parsed DMatrices sealed to host storage, so that repeat
+ *  loads of the same encrypted files skip decryption and parsing, and eviction
+ *  of idle DMatrices to sealed host storage.
+ */
+#ifndef XGBOOST_DATA_SEALED_DMATRIX_CACHE_H_
+#define XGBOOST_DATA_SEALED_DMATRIX_CACHE_H_
+
+#include <xgboost/data.h>
+#include <enclave/crypto.h>
+
+#include <string>
+#include <vector>
+
+namespace xgboost {
+namespace data {
+
+/*!
+ * \brief Sealed binary cache entry for a set of encrypted input files.
+ *
+ *  An entry is identified by a SHA-256 digest over the ciphertext of every
+ *  input file, the names of their owners, the parser arguments and the part
+ *  of the data loaded by this worker. It is sealed with AES-GCM under a key
+ *  derived from that digest and the keys of the owners, so only an enclave
+ *  holding the same owners' keys can read it back, and an entry can never be
+ *  substituted for the entry of different inputs. Each record is laid out as
+ *
+ *    magic (int) | digest | plaintext size (uint64_t) | IV | tag | ciphertext
+ *
+ *  where the plaintext is the SimpleDMatrix binary format.
+ */
+class SealedDMatrixCache {
+ public:
+  SealedDMatrixCache(const std::string& cache_dir,
+                     const std::vector<std::string>& uris,
+                     char* usernames[], char* keys[],
+                     bool load_row_split);
+
+  /*! \brief load the cached matrix, nullptr if there is no valid entry */
+  DMatrix* Load();
+  /*! \brief seal the matrix to the cache, matrices in external memory are skipped */
+  void Save(DMatrix* dmat);
+  /*! \brief path of the entry on host storage */
+  const std::string& Path() const { return path_; }
+
+  /*! \brief magic number used to identify sealed DMatrix cache files */
+  static const int kMagic = 0xffffab03;
+
+ private:
+  std::string path_;
+  unsigned char digest_[SHA_DIGEST_SIZE];
+  unsigned char key_[CIPHER_KEY_SIZE];
+};
+
+/*!
+ * \brief Load encrypted files through a sealed cache in |cache_dir|. An
+ *  empty |cache_dir| disables the cache. In distributed mode the cached
+ *  matrices are only used if every worker holds a valid entry, as loading
+ *  from the files synchronizes the number of columns across workers.
+ */
+DMatrix* LoadCachedDMatrix(std::vector<const std::string>& uris,
+                           char* usernames[], char* keys[],
+                           bool silent, bool load_row_split,
+                           const std::string& cache_dir);
+
+/*!
+ * \brief Seal an in-memory matrix to |path| on host storage so that its memory
+ *  can be released. The matrix is sealed under an ephemeral key of this
+ *  enclave, together with |id|, which must be passed back to UnspillDMatrix so
+ *  that a stale or different matrix cannot be substituted on reload.
+ * \return false if the matrix is not held in memory and cannot be spilled
+ */
+bool SpillDMatrix(DMatrix* dmat, const std::string& path, const std::string& id);
+
+/*! \brief read back a matrix written by SpillDMatrix and delete its file */
+DMatrix* UnspillDMatrix(const std::string& path, const std::string& id);
+
+}  // namespace data
+}  // namespace xgboost
+#endif  // XGBOOST_DATA_SEALED_DMATRIX_CACHE_H_
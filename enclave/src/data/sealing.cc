@@ -0,0 +1,59 @@
+/*!
+ * Copyright 2020 by Secure XGBoost Contributors
+ * \file sealing.cc
+ * \brief AES-GCM sealing of data written by the enclave to untrusted host storage.
+ */
+#include <dmlc/logging.h>
+
+#include <vector>
+
+#include "./sealing.h"
+
+namespace xgboost {
+namespace data {
+
+unsigned char* EphemeralSealingKey() {
+  static std::vector<unsigned char> key = []() {
+    std::vector<unsigned char> k(CIPHER_KEY_SIZE);
+    generate_random(k.data(), CIPHER_KEY_SIZE);
+    return k;
+  }();
+  return key.data();
+}
+
+Sealer::Sealer(unsigned char* key) {
+  int ret = cipher_init(&gcm_, key);
+  CHECK_EQ(ret, 0) << "mbedtls_gcm_setkey failed with " << -ret;
+  mbedtls_entropy_init(&entropy_);
+  mbedtls_ctr_drbg_init(&ctr_drbg_);
+  const char pers[] = "xgboost-sealing";
+  ret = mbedtls_ctr_drbg_seed(&ctr_drbg_, mbedtls_entropy_func, &entropy_,
+                              reinterpret_cast<const unsigned char*>(pers), sizeof(pers) - 1);
+  CHECK_EQ(ret, 0) << "mbedtls_ctr_drbg_seed failed with " << -ret;
+}
+
+Sealer::~Sealer() {
+  mbedtls_gcm_free(&gcm_);
+  mbedtls_ctr_drbg_free(&ctr_drbg_);
+  mbedtls_entropy_free(&entropy_);
+}
+
+void Sealer::Seal(const unsigned char* in, size_t len, const unsigned char* aad, size_t aad_len,
+                  unsigned char* out, unsigned char iv[CIPHER_IV_SIZE],
+                  unsigned char tag[CIPHER_TAG_SIZE]) {
+  int ret = mbedtls_ctr_drbg_random(&ctr_drbg_, iv, CIPHER_IV_SIZE);
+  CHECK_EQ(ret, 0) << "mbedtls_ctr_drbg_random failed with " << -ret;
+  ret = mbedtls_gcm_crypt_and_tag(&gcm_, MBEDTLS_GCM_ENCRYPT, len, iv, CIPHER_IV_SIZE,
+                                  aad, aad_len, in, out, CIPHER_TAG_SIZE, tag);
+  CHECK_EQ(ret, 0) << "mbedtls_gcm_crypt_and_tag failed with " << -ret;
+}
+
+bool Sealer::Unseal(const unsigned char* in, size_t len, const unsigned char iv[CIPHER_IV_SIZE],
+                    const unsigned char tag[CIPHER_TAG_SIZE], const unsigned char* aad,
+                    size_t aad_len, unsigned char* out) {
+  return mbedtls_gcm_auth_decrypt(&gcm_, len, iv, CIPHER_IV_SIZE, aad, aad_len,
+                                  tag, CIPHER_TAG_SIZE, in, out) == 0;
+}
+
+}  // namespace data
+}  // namespace xgboost
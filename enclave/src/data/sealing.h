@@ -0,0 +1,55 @@
+/*!
+ * Copyright 2020 by Secure XGBoost Contributors
+ * \file sealing.h
+ * \brief AES-GCM sealing of data written by the enclave to untrusted host storage.
+ */
+#ifndef XGBOOST_DATA_SEALING_H_
+#define XGBOOST_DATA_SEALING_H_
+
+#include <enclave/crypto.h>
+
+#include <cstddef>
+
+namespace xgboost {
+namespace data {
+
+/*!
+ * \brief Ephemeral key of this enclave, used to seal data that only lives as
+ *  long as the enclave, such as evicted DMatrices and external memory pages.
+ *  The key never leaves the enclave.
+ */
+unsigned char* EphemeralSealingKey();
+
+/*!
+ * \brief Seals and unseals records with AES-GCM under a fixed key, with a
+ *  fresh random IV for every record. Callers store the IV and tag next to the
+ *  ciphertext, and bind each record to its context through the additional data.
+ */
+class Sealer {
+ public:
+  explicit Sealer(unsigned char* key = EphemeralSealingKey());
+  ~Sealer();
+  Sealer(const Sealer&) = delete;
+  Sealer& operator=(const Sealer&) = delete;
+
+  /*! \brief encrypt |len| bytes from |in| to |out|, which may be the same buffer */
+  void Seal(const unsigned char* in, size_t len, const unsigned char* aad, size_t aad_len,
+            unsigned char* out, unsigned char iv[CIPHER_IV_SIZE],
+            unsigned char tag[CIPHER_TAG_SIZE]);
+  /*!
+   * \brief decrypt |len| bytes from |in| to |out|, which may be the same buffer
+   * \return false if the record or its additional data failed authentication
+   */
+  bool Unseal(const unsigned char* in, size_t len, const unsigned char iv[CIPHER_IV_SIZE],
+              const unsigned char tag[CIPHER_TAG_SIZE], const unsigned char* aad,
+              size_t aad_len, unsigned char* out);
+
+ private:
+  mbedtls_gcm_context gcm_;
+  mbedtls_ctr_drbg_context ctr_drbg_;
+  mbedtls_entropy_context entropy_;
+};
+
+}  // namespace data
+}  // namespace xgboost
+#endif  // XGBOOST_DATA_SEALING_H_
@@ -9,6 +9,7 @@
 #include <limits>
 #include <type_traits>
 #include <algorithm>
+#include <cstring>
 
 #include "xgboost/data.h"
 #include "xgboost/c_api.h"
@@ -191,6 +192,52 @@ SimpleDMatrix::SimpleDMatrix(AdapterT* adapter, float missing, int nthread) {
   omp_set_num_threads(nthread_original);
 }
 
+namespace {
+/*! \brief rows and meta information parsed from the files of one data owner */
+struct OwnerShard {
+  SparsePage page;
+  std::vector<bst_float> labels;
+  std::vector<bst_float> weights;
+  std::vector<bst_float> base_margin;
+  std::vector<uint64_t> qids;
+  uint64_t num_col {0};
+  uint64_t num_row {0};
+};
+
+/*!
+ * \brief Parse and decrypt all files of one owner. Every owner has its own
+ *  parser, with its own GCM context and row index checks, so owners can be
+ *  parsed concurrently.
+ */
+void ParseOwner(FileAdapter* adapter, float missing, OwnerShard* out) {
+  adapter->BeforeFirst();
+  while (adapter->Next()) {
+    auto& batch = adapter->Value();
+    out->num_col = std::max(out->page.Push(batch, missing, 1), out->num_col);
+    out->num_row += batch.Size();
+    // Append meta information if available
+    if (batch.Labels() != nullptr) {
+      out->labels.insert(out->labels.end(), batch.Labels(), batch.Labels() + batch.Size());
+    }
+    if (batch.Weights() != nullptr) {
+      out->weights.insert(out->weights.end(), batch.Weights(), batch.Weights() + batch.Size());
+    }
+    if (batch.BaseMargin() != nullptr) {
+      out->base_margin.insert(out->base_margin.end(), batch.BaseMargin(),
+                              batch.BaseMargin() + batch.Size());
+    }
+    if (batch.Qid() != nullptr) {
+      out->qids.insert(out->qids.end(), batch.Qid(), batch.Qid() + batch.Size());
+    }
+  }
+  // Ensure offset_vec.size() - 1 == [number of rows], trailing rows may be empty
+  auto& offset_vec = out->page.offset.HostVector();
+  while (offset_vec.size() - 1 < out->num_row) {
+    offset_vec.emplace_back(offset_vec.back());
+  }
+}
+}  // anonymous namespace
+
 SimpleDMatrix::SimpleDMatrix(std::vector<data::FileAdapter*> adapters, float missing, int nthread) {
   // Set number of threads but keep old value so we can reset it after
   const int nthreadmax = omp_get_max_threads();
@@ -198,90 +245,87 @@ SimpleDMatrix::SimpleDMatrix(std::vector<data::FileAdapter*> adapters, float mis
   int nthread_original = omp_get_max_threads();
   omp_set_num_threads(nthread);
 
-  std::vector<uint64_t> qids;
-  uint64_t default_max = std::numeric_limits<uint64_t>::max();
-  uint64_t last_group_id = default_max;
-  bst_uint group_size = 0;
-  auto& offset_vec = sparse_page_.offset.HostVector();
-  auto& data_vec = sparse_page_.data.HostVector();
+  const size_t num_owners = adapters.size();
+  std::vector<OwnerShard> shards(num_owners);
+  dmlc::OMPException exc;
+  // Owners are parsed and decrypted concurrently, one thread per owner
+#pragma omp parallel for schedule(dynamic)
+  for (omp_ulong i = 0; i < num_owners; ++i) {  // NOLINT(*)
+    exc.Run([&]() { ParseOwner(adapters[i], missing, &shards[i]); });
+  }
+  exc.Rethrow();
+
+  // Rows of owner i start at row_begin[i] and its entries at nnz_begin[i]
+  std::vector<size_t> row_begin(num_owners + 1, 0);
+  std::vector<size_t> nnz_begin(num_owners + 1, 0);
   uint64_t inferred_num_columns = 0;
-  uint64_t total_batch_size = 0;
-  size_t prev_adapter_size;
-  // batch_size is either number of rows or cols, depending on data layout
+  for (size_t i = 0; i < num_owners; ++i) {
+    row_begin[i + 1] = row_begin[i] + shards[i].num_row;
+    nnz_begin[i + 1] = nnz_begin[i] + shards[i].page.data.Size();
+    inferred_num_columns = std::max(inferred_num_columns, shards[i].num_col);
+  }
 
-  for (int i = 0; i < adapters.size(); i++) {
-    prev_adapter_size = total_batch_size;
-    data::FileAdapter* adapter = adapters[i];
-    adapter->BeforeFirst();
-    // Iterate over batches of input data
-    while (adapter->Next()) {
-      auto& batch = adapter->Value();
-      auto batch_max_columns = sparse_page_.Push(batch, missing, nthread, prev_adapter_size);
-      inferred_num_columns = std::max(batch_max_columns, inferred_num_columns);
-      total_batch_size += batch.Size();
-      // Append meta information if available
-      if (batch.Labels() != nullptr) {
-        auto& labels = info_.labels_.HostVector();
-        labels.insert(labels.end(), batch.Labels(),
-            batch.Labels() + batch.Size());
-      }
-      if (batch.Weights() != nullptr) {
-        auto& weights = info_.weights_.HostVector();
-        weights.insert(weights.end(), batch.Weights(),
-            batch.Weights() + batch.Size());
+  auto& offset_vec = sparse_page_.offset.HostVector();
+  auto& data_vec = sparse_page_.data.HostVector();
+  if (num_owners == 1) {
+    // Single owner, the parsed page becomes the primary storage as is
+    offset_vec.swap(shards[0].page.offset.HostVector());
+    data_vec.swap(shards[0].page.data.HostVector());
+  } else {
+    // Place every owner's rows into the final page with a single allocation,
+    // releasing each owner's staging page as soon as it has been placed
+    offset_vec.resize(row_begin[num_owners] + 1);
+    data_vec.resize(nnz_begin[num_owners]);
+    offset_vec[0] = 0;
+#pragma omp parallel for schedule(dynamic)
+    for (omp_ulong i = 0; i < num_owners; ++i) {  // NOLINT(*)
+      auto& shard_offset = shards[i].page.offset.HostVector();
+      auto& shard_data = shards[i].page.data.HostVector();
+      if (!shard_data.empty()) {
+        std::memcpy(dmlc::BeginPtr(data_vec) + nnz_begin[i], dmlc::BeginPtr(shard_data),
+                    sizeof(Entry) * shard_data.size());
       }
-      if (batch.BaseMargin() != nullptr) {
-        auto& base_margin = info_.base_margin_.HostVector();
-        base_margin.insert(base_margin.end(), batch.BaseMargin(),
-            batch.BaseMargin() + batch.Size());
-      }
-      if (batch.Qid() != nullptr) {
-        qids.insert(qids.end(), batch.Qid(), batch.Qid() + batch.Size());
-        // get group
-        for (size_t i = 0; i < batch.Size(); ++i) {
-          const uint64_t cur_group_id = batch.Qid()[i];
-          if (last_group_id == default_max || last_group_id != cur_group_id) {
-            info_.group_ptr_.push_back(group_size);
-          }
-          last_group_id = cur_group_id;
-          ++group_size;
-        }
+      for (size_t r = 0; r < shards[i].num_row; ++r) {
+        offset_vec[row_begin[i] + r + 1] = nnz_begin[i] + shard_offset[r + 1];
       }
+      std::vector<Entry>().swap(shard_data);
+      std::vector<bst_row_t>().swap(shard_offset);
     }
+  }
 
+  std::vector<uint64_t> qids;
+  uint64_t default_max = std::numeric_limits<uint64_t>::max();
+  uint64_t last_group_id = default_max;
+  bst_uint group_size = 0;
+  for (auto& shard : shards) {
+    auto& labels = info_.labels_.HostVector();
+    labels.insert(labels.end(), shard.labels.begin(), shard.labels.end());
+    auto& weights = info_.weights_.HostVector();
+    weights.insert(weights.end(), shard.weights.begin(), shard.weights.end());
+    auto& base_margin = info_.base_margin_.HostVector();
+    base_margin.insert(base_margin.end(), shard.base_margin.begin(), shard.base_margin.end());
+    qids.insert(qids.end(), shard.qids.begin(), shard.qids.end());
+    // get group
+    for (const uint64_t cur_group_id : shard.qids) {
+      if (last_group_id == default_max || last_group_id != cur_group_id) {
+        info_.group_ptr_.push_back(group_size);
+      }
+      last_group_id = cur_group_id;
+      ++group_size;
+    }
     if (last_group_id != default_max) {
       if (group_size > info_.group_ptr_.back()) {
         info_.group_ptr_.push_back(group_size);
       }
     }
+  }
 
-    // Deal with empty rows/columns if necessary
-    if (adapter->NumColumns() == kAdapterUnknownSize) {
-      info_.num_col_ = inferred_num_columns;
-    } else {
-      info_.num_col_ = adapter->NumColumns();
-    }
-
-
-    // Synchronise worker columns
-    rabit::Allreduce<rabit::op::Max>(&info_.num_col_, 1);
+  // Deal with empty rows/columns if necessary
+  info_.num_col_ = inferred_num_columns;
+  // Synchronise worker columns
+  rabit::Allreduce<rabit::op::Max>(&info_.num_col_, 1);
 
-    if (adapter->NumRows() == kAdapterUnknownSize) {
-      info_.num_row_ = total_batch_size;
-      // Ensure offset_vec.size() - 1 == [number of rows]
-      while (offset_vec.size() - 1 < total_batch_size) {
-        offset_vec.emplace_back(offset_vec.back());
-      }
-    } else {
-      if (offset_vec.empty()) {
-        offset_vec.emplace_back(0);
-      }
-      while (offset_vec.size() - 1 < adapter->NumRows()) {
-        offset_vec.emplace_back(offset_vec.back());
-      }
-      info_.num_row_ = adapter->NumRows();
-    }
-  }
+  info_.num_row_ = row_begin[num_owners];
   info_.num_nonzero_ = data_vec.size();
   omp_set_num_threads(nthread_original);
 }
@@ -296,13 +340,28 @@ SimpleDMatrix::SimpleDMatrix(dmlc::Stream* in_stream) {
   in_stream->Read(&sparse_page_.data.HostVector());
 }
 
+size_t SimpleDMatrix::MemCostBytes() const {
+  size_t bytes = DMatrix::MemCostBytes() + sparse_page_.MemCostBytes();
+  if (column_page_) {
+    bytes += column_page_->MemCostBytes();
+  }
+  if (sorted_column_page_) {
+    bytes += sorted_column_page_->MemCostBytes();
+  }
+  return bytes;
+}
+
 void SimpleDMatrix::SaveToLocalFile(const std::string& fname) {
     std::unique_ptr<dmlc::Stream> fo(dmlc::Stream::Create(fname.c_str(), "w"));
+    SaveBinary(fo.get());
+}
+
+void SimpleDMatrix::SaveBinary(dmlc::Stream* fo) const {
     int tmagic = kMagic;
     fo->Write(&tmagic, sizeof(tmagic));
-    info_.SaveBinary(fo.get());
-    fo->Write(sparse_page_.offset.HostVector());
-    fo->Write(sparse_page_.data.HostVector());
+    info_.SaveBinary(fo);
+    fo->Write(sparse_page_.offset.ConstHostVector());
+    fo->Write(sparse_page_.data.ConstHostVector());
 }
 
 template SimpleDMatrix::SimpleDMatrix(DenseAdapter* adapter, float missing,
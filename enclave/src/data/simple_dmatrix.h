@@ -31,12 +31,15 @@ class SimpleDMatrix : public DMatrix {
   ~SimpleDMatrix() override = default;
 
   void SaveToLocalFile(const std::string& fname);
+  /*! \brief write the matrix in the binary format read by SimpleDMatrix(dmlc::Stream*) */
+  void SaveBinary(dmlc::Stream* fo) const;
 
   MetaInfo& Info() override;
 
   const MetaInfo& Info() const override;
 
   bool SingleColBlock() const override { return true; }
+  size_t MemCostBytes() const override;
   DMatrix* Slice(common::Span<int32_t const> ridxs) override;
 
   /*! \brief magic number used to identify SimpleDMatrix binary files */
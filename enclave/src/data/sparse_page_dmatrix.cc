@@ -7,7 +7,7 @@
 #include <dmlc/base.h>
 #include <dmlc/timer.h>
 
-#if DMLC_ENABLE_STD_THREAD
+#if DMLC_ENABLE_STD_THREAD || defined(__ENCLAVE__)
 #include "./sparse_page_dmatrix.h"
 
 #include "./simple_batch_iterator.h"
@@ -0,0 +1,178 @@
+/*!
+ * Copyright 2020 by Secure XGBoost Contributors
+ * \file sparse_page_sealed_format.cc
+ *  Sealed binary format of sparse page, used to spill external memory pages
+ *  from the enclave to untrusted host storage.
+ */
+#include <xgboost/data.h>
+#include <dmlc/registry.h>
+#include <dmlc/memory_io.h>
+
+#include <limits>
+#include <memory>
+#include <string>
+#include <vector>
+
+#include "./sealing.h"
+#include "./sparse_page_writer.h"
+
+namespace xgboost {
+namespace data {
+
+DMLC_REGISTRY_FILE_TAG(sparse_page_sealed_format);
+
+/*!
+ * \brief AES-GCM sealed page. Each record is laid out as
+ *
+ *   page index (uint64_t) | ciphertext size (uint64_t) | IV | tag | ciphertext
+ *
+ *  where the plaintext is the page in raw format. The file ends with a record
+ *  whose page index is kEndRecord and whose size holds the number of pages.
+ *  The cache identifier, shard and page index are authenticated as additional
+ *  data, so the host can neither modify, reorder, replay or drop pages, nor
+ *  swap them between shards or caches.
+ */
+template<typename T>
+class SparsePageSealedFormat : public SparsePageFormat<T> {
+ public:
+  SparsePageSealedFormat(std::string cache_id, size_t shard)
+      : cache_id_(std::move(cache_id)), shard_(shard), raw_(CreatePageFormat<T>("raw")) {}
+
+  bool Read(T* page, dmlc::SeekStream* fi) override {
+    if (!Unseal(fi)) return false;
+    dmlc::MemoryStringStream ms(&plaintext_);
+    CHECK(raw_->Read(page, &ms)) << "Invalid sealed SparsePage file";
+    return true;
+  }
+
+  bool Read(T* page,
+            dmlc::SeekStream* fi,
+            const std::vector<bst_uint>& sorted_index_set) override {
+    if (!Unseal(fi)) return false;
+    dmlc::MemoryStringStream ms(&plaintext_);
+    CHECK(raw_->Read(page, &ms, sorted_index_set)) << "Invalid sealed SparsePage file";
+    return true;
+  }
+
+  void Write(const T& page, dmlc::Stream* fo) override {
+    plaintext_.clear();
+    dmlc::MemoryStringStream ms(&plaintext_);
+    raw_->Write(page, &ms);
+    Seal(write_idx_++, plaintext_.size(), fo);
+  }
+
+  void WriteEnd(dmlc::Stream* fo) override {
+    plaintext_.clear();
+    Seal(kEndRecord, write_idx_, fo);
+  }
+
+ private:
+  static constexpr uint64_t kEndRecord = std::numeric_limits<uint64_t>::max();
+
+  std::vector<unsigned char> AdditionalData(uint64_t page_idx, uint64_t size) const {
+    std::vector<unsigned char> aad(cache_id_.begin(), cache_id_.end());
+    const uint64_t fields[] = {static_cast<uint64_t>(shard_), page_idx, size};
+    const unsigned char* p = reinterpret_cast<const unsigned char*>(fields);
+    aad.insert(aad.end(), p, p + sizeof(fields));
+    return aad;
+  }
+
+  // Seal |plaintext_| as record |page_idx|. The end record has no plaintext
+  // and carries the number of pages in |size|.
+  void Seal(uint64_t page_idx, uint64_t size, dmlc::Stream* fo) {
+    const size_t len = plaintext_.size();
+    std::vector<unsigned char> aad = AdditionalData(page_idx, size);
+    unsigned char iv[CIPHER_IV_SIZE];
+    unsigned char tag[CIPHER_TAG_SIZE];
+    ciphertext_.resize(len);
+    sealer_.Seal(reinterpret_cast<const unsigned char*>(plaintext_.data()), len,
+                 aad.data(), aad.size(), ciphertext_.data(), iv, tag);
+    fo->Write(&page_idx, sizeof(page_idx));
+    fo->Write(&size, sizeof(size));
+    fo->Write(iv, CIPHER_IV_SIZE);
+    fo->Write(tag, CIPHER_TAG_SIZE);
+    if (len != 0) {
+      fo->Write(ciphertext_.data(), len);
+    }
+  }
+
+  // Read the next record into |plaintext_|, checking that pages come back in
+  // the order they were written. Returns false at the authenticated end record.
+  bool Unseal(dmlc::SeekStream* fi) {
+    const size_t record_begin = fi->Tell();
+    if (!has_first_record_) {
+      first_record_ = record_begin;
+      has_first_record_ = true;
+    }
+    // the prefetcher seeks back to the first record on BeforeFirst()
+    if (record_begin == first_record_) {
+      read_idx_ = 0;
+    }
+    uint64_t page_idx, size;
+    CHECK_EQ(fi->Read(&page_idx, sizeof(page_idx)), sizeof(page_idx))
+        << "Sealed SparsePage file was truncated";
+    CHECK_EQ(fi->Read(&size, sizeof(size)), sizeof(size)) << "Invalid sealed SparsePage file";
+    unsigned char iv[CIPHER_IV_SIZE];
+    unsigned char tag[CIPHER_TAG_SIZE];
+    CHECK_EQ(fi->Read(iv, CIPHER_IV_SIZE), CIPHER_IV_SIZE) << "Invalid sealed SparsePage file";
+    CHECK_EQ(fi->Read(tag, CIPHER_TAG_SIZE), CIPHER_TAG_SIZE) << "Invalid sealed SparsePage file";
+    std::vector<unsigned char> aad = AdditionalData(page_idx, size);
+    if (page_idx == kEndRecord) {
+      CHECK_EQ(size, read_idx_) << "Sealed SparsePage file was truncated";
+      unsigned char empty;
+      CHECK(sealer_.Unseal(&empty, 0, iv, tag, aad.data(), aad.size(), &empty))
+          << "Sealed SparsePage file failed authentication";
+      return false;
+    }
+    CHECK_EQ(page_idx, read_idx_) << "Sealed SparsePage file was reordered";
+    // one bulk read of the whole page from host storage
+    ciphertext_.resize(size);
+    if (size != 0) {
+      CHECK_EQ(fi->Read(ciphertext_.data(), size), size) << "Invalid sealed SparsePage file";
+    }
+    plaintext_.resize(size);
+    CHECK(sealer_.Unseal(ciphertext_.data(), size, iv, tag, aad.data(), aad.size(),
+                         reinterpret_cast<unsigned char*>(&plaintext_[0])))
+        << "Sealed SparsePage file failed authentication";
+    ++read_idx_;
+    return true;
+  }
+
+  /*! \brief identifier of the cache, authenticated with every record */
+  std::string cache_id_;
+  /*! \brief index of the shard in the cache, authenticated with every record */
+  size_t shard_;
+  /*! \brief format of the plaintext */
+  std::unique_ptr<SparsePageFormat<T>> raw_;
+  /*! \brief seals records under the ephemeral key of the enclave */
+  Sealer sealer_;
+  uint64_t write_idx_{0};
+  uint64_t read_idx_{0};
+  size_t first_record_{0};
+  bool has_first_record_{false};
+  std::string plaintext_;
+  std::vector<unsigned char> ciphertext_;
+};
+
+std::string NewSealedCacheId() {
+  std::string cache_id(CIPHER_IV_SIZE, '\0');
+  generate_random(reinterpret_cast<unsigned char*>(&cache_id[0]), cache_id.size());
+  return cache_id;
+}
+
+// A sealed format needs the identifier of its cache, so it is created with
+// CreateSealedPageFormat() rather than registered by name.
+template<typename T>
+SparsePageFormat<T>* CreateSealedPageFormat(const std::string& cache_id, size_t shard) {
+  return new SparsePageSealedFormat<T>(cache_id, shard);
+}
+
+template SparsePageFormat<SparsePage>* CreateSealedPageFormat<SparsePage>(
+    const std::string& cache_id, size_t shard);
+template SparsePageFormat<CSCPage>* CreateSealedPageFormat<CSCPage>(
+    const std::string& cache_id, size_t shard);
+template SparsePageFormat<SortedCSCPage>* CreateSealedPageFormat<SortedCSCPage>(
+    const std::string& cache_id, size_t shard);
+
+}  // namespace data
+}  // namespace xgboost
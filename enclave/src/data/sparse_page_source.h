@@ -14,6 +14,7 @@
 #include <limits>
 #include <locale>
 #include <memory>
+#include <mutex>
 #include <string>
 #include <utility>
 #include <vector>
@@ -81,14 +82,25 @@ inline std::pair<std::string, std::string> DecideFormat(const std::string& cache
   if (pos != std::string::npos) {
     std::string fmt = cache_prefix.substr(pos + 5, cache_prefix.length());
     size_t cpos = fmt.rfind('-');
-    if (cpos != std::string::npos) {
-      return std::make_pair(fmt.substr(0, cpos), fmt.substr(cpos + 1, fmt.length()));
-    } else {
-      return std::make_pair(fmt, fmt);
-    }
+    std::pair<std::string, std::string> formats =
+        cpos != std::string::npos ?
+        std::make_pair(fmt.substr(0, cpos), fmt.substr(cpos + 1, fmt.length())) :
+        std::make_pair(fmt, fmt);
+#ifdef __ENCLAVE__
+    CHECK(formats.first == "sealed" && formats.second == "sealed")
+        << "External memory pages must use the `sealed' format inside the enclave, got "
+        << fmt;
+#endif  // __ENCLAVE__
+    return formats;
   } else {
+#ifdef __ENCLAVE__
+    // pages leaving the enclave are always sealed
+    std::string sealed = "sealed";
+    return std::make_pair(sealed, sealed);
+#else
     std::string raw = "raw";
     return std::make_pair(raw, raw);
+#endif  // __ENCLAVE__
   }
 }
 
@@ -96,6 +108,8 @@ struct CacheInfo {
   std::string name_info;
   std::vector<std::string> format_shards;
   std::vector<std::string> name_shards;
+  /*! \brief random identifier of the cache, authenticated with its sealed pages */
+  std::string cache_id;
 };
 
 inline CacheInfo ParseCacheInfo(const std::string& cache_info, const std::string& page_type) {
@@ -108,6 +122,9 @@ inline CacheInfo ParseCacheInfo(const std::string& cache_info, const std::string
     info.name_shards.push_back(prefix + page_type);
     info.format_shards.push_back(DecideFormat(prefix).first);
   }
+#ifdef __ENCLAVE__
+  info.cache_id = NewSealedCacheId();
+#endif  // __ENCLAVE__
   return info;
 }
 
@@ -127,6 +144,58 @@ inline void CheckCacheFileExists(const std::string& file) {
   }
 }
 
+#if DMLC_ENABLE_STD_THREAD
+template <typename PageT>
+using PageIter = dmlc::ThreadedIter<PageT>;
+#else
+/*!
+ * \brief Drop-in replacement of dmlc::ThreadedIter for builds without
+ *  std::thread (e.g. inside the enclave): pages are loaded on demand by the
+ *  calling thread, with recycled pages reused to avoid reallocations.
+ */
+template <typename PageT>
+class PageIter {
+ public:
+  explicit PageIter(size_t max_capacity) {}
+  ~PageIter() {
+    for (PageT* page : free_pages_) {
+      delete page;
+    }
+  }
+  void Init(std::function<bool(PageT**)> next, std::function<void()> beforefirst) {
+    next_ = std::move(next);
+    beforefirst_ = std::move(beforefirst);
+  }
+  bool Next(PageT** out_dptr) {
+    PageT* page = nullptr;
+    if (!free_pages_.empty()) {
+      page = free_pages_.back();
+      free_pages_.pop_back();
+    }
+    if (!next_(&page)) {
+      if (page != nullptr) {
+        free_pages_.push_back(page);
+      }
+      return false;
+    }
+    *out_dptr = page;
+    return true;
+  }
+  void Recycle(PageT** inout_dptr) {
+    free_pages_.push_back(*inout_dptr);
+    *inout_dptr = nullptr;
+  }
+  void BeforeFirst() {
+    beforefirst_();
+  }
+
+ private:
+  std::function<bool(PageT**)> next_;
+  std::function<void()> beforefirst_;
+  std::vector<PageT*> free_pages_;
+};
+#endif  // DMLC_ENABLE_STD_THREAD
+
 /**
  * \brief Given a set of cache files and page type, this object iterates over batches
  * using prefetching for improved performance. Not thread safe.
@@ -158,10 +227,16 @@ class ExternalMemoryPrefetcher : dmlc::DataIter<PageT> {
       std::unique_ptr<dmlc::SeekStream>& fi = files_[i];
       std::string format;
       CHECK(fi->Read(&format)) << "Invalid page format";
+#ifdef __ENCLAVE__
+      // the file is written by the host, so its format is never trusted
+      CHECK_EQ(format, "sealed") << "External memory pages must be sealed inside the enclave";
+      formats_[i].reset(CreateSealedPageFormat<PageT>(info.cache_id, i));
+#else
       formats_[i].reset(CreatePageFormat<PageT>(format));
+#endif  // __ENCLAVE__
       std::unique_ptr<SparsePageFormat<PageT>>& fmt = formats_[i];
       size_t fbegin = fi->Tell();
-      prefetchers_[i].reset(new dmlc::ThreadedIter<PageT>(4));
+      prefetchers_[i].reset(new PageIter<PageT>(4));
       prefetchers_[i]->Init(
           [&fi, &fmt](PageT** dptr) {
             if (*dptr == nullptr) {
@@ -228,7 +303,7 @@ class ExternalMemoryPrefetcher : dmlc::DataIter<PageT> {
   /*! \brief Sparse page format file. */
   std::vector<std::unique_ptr<SparsePageFormat<PageT>>> formats_;
   /*! \brief internal prefetcher. */
-  std::vector<std::unique_ptr<dmlc::ThreadedIter<PageT>>> prefetchers_;
+  std::vector<std::unique_ptr<PageIter<PageT>>> prefetchers_;
 };
 
 class SparsePageSource {
@@ -248,7 +323,8 @@ class SparsePageSource {
 
     {
       SparsePageWriter<SparsePage> writer(cache_info_.name_shards,
-                                          cache_info_.format_shards, 6);
+                                          cache_info_.format_shards, 6,
+                                          cache_info_.cache_id);
       std::shared_ptr<SparsePage> page;
       writer.Alloc(&page);
       page->Clear();
@@ -356,13 +432,18 @@ class SparsePageSource {
       if (page->data.Size() > 0 || info.num_row_ == 0) {
         writer.PushWrite(std::move(page));
       }
+      writer.Finish();
       std::unique_ptr<dmlc::Stream> fo(
           dmlc::Stream::Create(cache_info_.name_info.c_str(), "w"));
       int tmagic = kMagic;
       fo->Write(&tmagic, sizeof(tmagic));
       // Either every row has query ID or none at all
       CHECK(qids.empty() || qids.size() == info.num_row_);
+      // Inside the enclave labels and weights never leave enclave memory,
+      // the info file only carries the magic number.
+#ifndef __ENCLAVE__
       info.SaveBinary(fo.get());
+#endif  // __ENCLAVE__
     }
     LOG(INFO) << "SparsePageSource Finished writing to "
               << cache_info_.name_info;
@@ -403,7 +484,8 @@ class CSCPageSource {
     }
     {
       SparsePageWriter<SparsePage> writer(cache_info_.name_shards,
-                                          cache_info_.format_shards, 6);
+                                          cache_info_.format_shards, 6,
+                                          cache_info_.cache_id);
       std::shared_ptr<SparsePage> page;
       writer.Alloc(&page);
       page->Clear();
@@ -427,6 +509,7 @@ class CSCPageSource {
       if (page->data.Size() != 0) {
         writer.PushWrite(std::move(page));
       }
+      writer.Finish();
       LOG(INFO) << "CSCPageSource: Finished writing to "
                 << cache_info_.name_info;
     }
@@ -464,7 +547,8 @@ class SortedCSCPageSource {
     }
     {
       SparsePageWriter<SparsePage> writer(cache_info_.name_shards,
-                                          cache_info_.format_shards, 6);
+                                          cache_info_.format_shards, 6,
+                                          cache_info_.cache_id);
       std::shared_ptr<SparsePage> page;
       writer.Alloc(&page);
       page->Clear();
@@ -490,6 +574,7 @@ class SortedCSCPageSource {
       if (page->data.Size() != 0) {
         writer.PushWrite(std::move(page));
       }
+      writer.Finish();
       LOG(INFO) << "SortedCSCPageSource: Finished writing to "
                 << cache_info_.name_info;
     }
@@ -58,6 +58,11 @@ class SparsePageFormat {
    * \param fo output stream
    */
   virtual void Write(const T& page, dmlc::Stream* fo) = 0;
+  /*!
+   * \brief called once after the last page was written to fo.
+   * \param fo output stream
+   */
+  virtual void WriteEnd(dmlc::Stream* fo) {}
 };
 
 /*!
@@ -74,6 +79,23 @@ inline SparsePageFormat<T>* CreatePageFormat(const std::string& name) {
   return (e->body)();
 }
 
+#ifdef __ENCLAVE__
+/*!
+ * \brief Generate a random identifier for an external memory cache. It is kept
+ *  in enclave memory and authenticated with every sealed page of the cache.
+ */
+std::string NewSealedCacheId();
+
+/*!
+ * \brief Create the sealed format of one shard of an external memory cache.
+ * \param cache_id identifier of the cache, from NewSealedCacheId().
+ * \param shard index of the shard in the cache.
+ * \return The created format functors.
+ */
+template<typename T>
+SparsePageFormat<T>* CreateSealedPageFormat(const std::string& cache_id, size_t shard);
+#endif  // __ENCLAVE__
+
 #if DMLC_ENABLE_STD_THREAD
 /*!
  * \brief A threaded writer to write sparse batch page to sharded files.
@@ -87,10 +109,12 @@ class SparsePageWriter {
    * \param name_shards name of shard files.
    * \param format_shards format of each shard.
    * \param extra_buffer_capacity Extra buffer capacity before block.
+   * \param cache_id Unused, sealed pages are only written inside the enclave.
    */
   explicit SparsePageWriter(const std::vector<std::string>& name_shards,
                             const std::vector<std::string>& format_shards,
-                            size_t extra_buffer_capacity)
+                            size_t extra_buffer_capacity,
+                            const std::string& cache_id = "")
       : num_free_buffer_(extra_buffer_capacity + name_shards.size()),
         clock_ptr_(0),
         workers_(name_shards.size()),
@@ -120,6 +144,13 @@ class SparsePageWriter {
 
   /*! \brief destructor, will close the files automatically */
   ~SparsePageWriter() {
+    this->Finish();
+  }
+
+  /*! \brief wait for all pushed pages to be written and close the files */
+  void Finish() {
+    if (finished_) return;
+    finished_ = true;
     for (auto& queue : qworkers_) {
       // use nullptr to signal termination.
       std::shared_ptr<T> sig(nullptr);
@@ -168,6 +199,89 @@ class SparsePageWriter {
   dmlc::ConcurrentBlockingQueue<std::shared_ptr<T>> qrecycle_;
   /*! \brief worker threads */
   std::vector<dmlc::ConcurrentBlockingQueue<std::shared_ptr<T>>> qworkers_;
+  /*! \brief whether Finish() was called */
+  bool finished_ {false};
+};
+#elif defined(__ENCLAVE__)
+/*!
+ * \brief A synchronous writer to write sparse batch page to sharded files.
+ *  There is no std::thread inside the enclave, so pages are written by the
+ *  caller as soon as they are pushed.
+ * @tparam T Type of the page.
+ */
+template<typename T>
+class SparsePageWriter {
+ public:
+  /*!
+   * \brief constructor
+   * \param name_shards name of shard files.
+   * \param format_shards format of each shard.
+   * \param extra_buffer_capacity Unused, kept for API compatibility.
+   * \param cache_id identifier of the cache, authenticated with every page.
+   */
+  explicit SparsePageWriter(const std::vector<std::string>& name_shards,
+                            const std::vector<std::string>& format_shards,
+                            size_t extra_buffer_capacity,
+                            const std::string& cache_id)
+      : clock_ptr_(0), name_shards_(name_shards) {
+    CHECK_EQ(name_shards.size(), format_shards.size());
+    for (size_t i = 0; i < name_shards.size(); ++i) {
+      CHECK_EQ(format_shards[i], "sealed")
+          << "External memory pages must use the `sealed' format inside the enclave";
+      files_.emplace_back(dmlc::Stream::Create(name_shards[i].c_str(), "w"));
+      formats_.emplace_back(CreateSealedPageFormat<T>(cache_id, i));
+      files_.back()->Write(format_shards[i]);
+    }
+  }
+
+  /*!
+   * \brief destructor, closes the files. Shards of a writer that was not
+   *  finished have no end marker and are rejected as truncated when read.
+   */
+  ~SparsePageWriter() = default;
+
+  /*! \brief end every shard, write it out to host storage and close it */
+  void Finish() {
+    for (size_t i = 0; i < files_.size(); ++i) {
+      if (files_[i] == nullptr) continue;
+      formats_[i]->WriteEnd(files_[i].get());
+      files_[i]->Flush();
+      files_[i].reset(nullptr);
+      LOG(INFO) << "SparsePageWriter Finished writing to " << name_shards_[i];
+    }
+  }
+
+  /*!
+   * \brief Write the page to the next shard.
+   * \param page The page to be written
+   */
+  void PushWrite(std::shared_ptr<T>&& page) {
+    formats_[clock_ptr_]->Write(*page, files_[clock_ptr_].get());
+    recycled_ = std::move(page);
+    clock_ptr_ = (clock_ptr_ + 1) % files_.size();
+  }
+
+  /*!
+   * \brief Allocate a page to store results, reusing the last written page.
+   * \param out_page Used to store the allocated pages.
+   */
+  void Alloc(std::shared_ptr<T>* out_page) {
+    CHECK(*out_page == nullptr);
+    if (recycled_ != nullptr) {
+      *out_page = std::move(recycled_);
+    } else {
+      out_page->reset(new T());
+    }
+  }
+
+ private:
+  /*! \brief clock_pointer */
+  size_t clock_ptr_;
+  std::vector<std::string> name_shards_;
+  std::vector<std::unique_ptr<dmlc::Stream>> files_;
+  std::vector<std::unique_ptr<SparsePageFormat<T>>> formats_;
+  /*! \brief last written page, reused by Alloc */
+  std::shared_ptr<T> recycled_;
 };
 #endif  // DMLC_ENABLE_STD_THREAD
 
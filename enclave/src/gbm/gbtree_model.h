@@ -93,9 +93,16 @@ struct GBTreeModel : public Model {
 
   std::vector<std::string> DumpModel(const FeatureMap& fmap, bool with_stats,
                                      std::string format) const {
-    std::vector<std::string> dump;
-    for (const auto & tree : trees) {
-      dump.push_back(tree->DumpModel(fmap, with_stats, format));
+    std::vector<std::string> dump(trees.size());
+    if (trees.empty()) {
+      return dump;
+    }
+    // an unknown format fails on the first tree, outside of the parallel region
+    dump[0] = trees[0]->DumpModel(fmap, with_stats, format);
+    const auto ntrees = static_cast<omp_ulong>(trees.size());
+#pragma omp parallel for schedule(dynamic)
+    for (omp_ulong i = 1; i < ntrees; ++i) {
+      dump[i] = trees[i]->DumpModel(fmap, with_stats, format);
     }
     return dump;
   }
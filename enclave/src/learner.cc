@@ -48,6 +48,22 @@
 namespace {
 
 const char* kMaxDeltaStepDefaultValue = "0.7";
+
+/*! \brief output stream that only counts the bytes written to it */
+class CountingStream : public dmlc::Stream {
+ public:
+  size_t Read(void* ptr, size_t size) override {
+    LOG(FATAL) << "CountingStream is write only";
+    return 0;
+  }
+  void Write(const void* ptr, size_t size) override {
+    bytes_ += size;
+  }
+  size_t Bytes() const { return bytes_; }
+
+ private:
+  size_t bytes_ {0};
+};
 }  // anonymous namespace
 
 namespace xgboost {
@@ -1070,6 +1086,27 @@ class LearnerImpl : public LearnerIO {
     return (*LearnerAPIThreadLocalStore::Get())[this];
   }
 
+  size_t ModelMemCostBytes() const override {
+    if (gbm_ == nullptr || obj_ == nullptr) {
+      // not configured yet
+      return 0;
+    }
+    CountingStream fo;
+    this->SaveModel(&fo);
+    return fo.Bytes();
+  }
+
+  size_t PredictionCacheMemCostBytes() const override {
+    size_t bytes = 0;
+    for (auto const& kv : this->GetPredictionCache()->Container()) {
+      bytes += kv.second.predictions.Size() * sizeof(bst_float);
+    }
+    auto const& entry = this->GetThreadLocal();
+    bytes += entry.prediction_entry.predictions.Size() * sizeof(bst_float);
+    bytes += entry.ret_vec_float.size() * sizeof(bst_float);
+    return bytes;
+  }
+
   void InplacePredict(dmlc::any const &x, std::string const &type,
                       float missing, HostDeviceVector<bst_float> **out_preds,
                       uint32_t layer_begin = 0, uint32_t layer_end = 0) override {
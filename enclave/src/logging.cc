@@ -13,13 +13,27 @@
 #include "xgboost/parameter.h"
 #include "xgboost/logging.h"
 
+#ifdef __ENCLAVE__
+#ifdef __ENCLAVE_CONSENSUS__
+#include "xgboost_mc_t.h"
+#else
+#include "xgboost_t.h"
+#endif
+#endif  // __ENCLAVE__
+
 #if !defined(XGBOOST_STRICT_R_MODE) || XGBOOST_STRICT_R_MODE == 0
 // Override logging mechanism for non-R interfaces
 void dmlc::CustomLogMessage::Log(const std::string& msg) {
+#ifdef __ENCLAVE__
+  // Print on the host directly, over a switchless OCALL when enabled,
+  // rather than through the enclave's stdio
+  host_XGBLog(msg.c_str());
+#else
   const xgboost::LogCallbackRegistry* registry
     = xgboost::LogCallbackRegistryStore::Get();
   auto callback = registry->Get();
   callback(msg.c_str());
+#endif  // __ENCLAVE__
 }
 
 namespace xgboost {
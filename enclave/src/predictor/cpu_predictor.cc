@@ -5,6 +5,7 @@
 #include <dmlc/omp.h>
 #include <dmlc/any.h>
 
+#include <algorithm>
 #include <cstddef>
 #include <limits>
 #include <mutex>
@@ -62,6 +63,235 @@ bst_float PredValue(const SparsePage::Inst &inst,
   return psum;
 }
 
+#ifdef __ENCLAVE_OBLIVIOUS__
+/*! \brief number of rows evaluated together by the oblivious block predictor */
+constexpr size_t kBlockRows = 8;
+
+/*!
+ * \brief flat struct-of-arrays copy of a tree, used by the oblivious block
+ *  predictor to stream over all nodes without chasing the node structs.
+ */
+struct ObliviousTreeLayout {
+  std::vector<uint32_t> split_index;
+  std::vector<bst_float> split_cond;
+  std::vector<int32_t> left;
+  std::vector<int32_t> right;
+  std::vector<int32_t> default_child;
+  /*! \brief leaf value of leaf nodes, 0 for split nodes */
+  std::vector<bst_float> leaf_value;
+  std::vector<uint8_t> is_leaf;
+
+  void Init(const RegTree& tree) {
+    const size_t n = tree.GetNodes().size();
+    split_index.resize(n);
+    split_cond.resize(n);
+    left.resize(n);
+    right.resize(n);
+    default_child.resize(n);
+    leaf_value.resize(n);
+    is_leaf.resize(n);
+    for (size_t nid = 0; nid < n; ++nid) {
+      const RegTree::Node& node = tree[nid];
+      // Deleted nodes can never be on a prediction path, treat them as leaves.
+      bool leaf = node.IsLeaf() || node.IsDeleted();
+      is_leaf[nid] = leaf;
+      leaf_value[nid] = node.IsLeaf() ? node.LeafValue() : 0.0f;
+      split_index[nid] = leaf ? 0 : node.SplitIndex();
+      split_cond[nid] = leaf ? 0.0f : node.SplitCond();
+      left[nid] = leaf ? RegTree::kInvalidNodeId : node.LeftChild();
+      right[nid] = leaf ? RegTree::kInvalidNodeId : node.RightChild();
+      default_child[nid] = leaf ? RegTree::kInvalidNodeId : node.DefaultChild();
+    }
+  }
+
+  size_t Size() const { return split_index.size(); }
+};
+
+/*!
+ * \brief dense feature vectors of a block of rows, stored feature-major so
+ *  that one oblivious access fetches a feature for every row of the block.
+ */
+class FVecBlock {
+ public:
+  struct Entries {
+    RegTree::FVec::Entry lanes[kBlockRows];
+  };
+
+  void Init(size_t size) {
+    Entries e;
+    for (auto& lane : e.lanes) {
+      lane.flag = -1;
+    }
+    data_.resize(size);
+    std::fill(data_.begin(), data_.end(), e);
+  }
+
+  void Fill(size_t lane, const SparsePage::Inst& inst) {
+    for (auto const& entry : inst) {
+      if (entry.index >= data_.size()) {
+        continue;
+      }
+      data_[entry.index].lanes[lane].fvalue = entry.fvalue;
+    }
+  }
+
+  void Drop(size_t lane, const SparsePage::Inst& inst) {
+    for (auto const& entry : inst) {
+      if (entry.index >= data_.size()) {
+        continue;
+      }
+      data_[entry.index].lanes[lane].flag = -1;
+    }
+  }
+
+  size_t Size() const { return data_.size(); }
+
+  Entries OGetEntries(size_t i) const {
+    return ObliviousArrayAccess(data_.data(), i, data_.size());
+  }
+
+ private:
+  std::vector<Entries> data_;
+};
+
+/*!
+ * \brief obliviously add the leaf value reached by every row of the block to
+ *  psum. Like RegTree::OGetLeafValue, every node of the tree is visited.
+ */
+inline void OPredBlock(const ObliviousTreeLayout& tree, const FVecBlock& block,
+                       bst_float* psum) {
+  const auto nnodes = static_cast<int32_t>(tree.Size());
+#ifdef USE_AVX2
+  __m256i next_id = _mm256_setzero_si256();
+  __m256 sum = _mm256_loadu_ps(psum);
+  const __m256i missing_flag = _mm256_set1_epi32(-1);
+  for (int32_t nid = 0; nid < nnodes; ++nid) {
+    // We are accessing the node in prediction path.
+    __m256i is_in_path = _mm256_cmpeq_epi32(next_id, _mm256_set1_epi32(nid));
+    __m256 leaf_value = _mm256_and_ps(_mm256_castsi256_ps(is_in_path),
+                                      _mm256_set1_ps(tree.leaf_value[nid]));
+    sum = _mm256_add_ps(sum, leaf_value);
+    // This is deterministic in oblivious model.
+    if (tree.is_leaf[nid]) {
+      continue;
+    }
+    // oaccess to protect the feature to split on.
+    FVecBlock::Entries entries = block.OGetEntries(tree.split_index[nid]);
+    __m256 fvalue = _mm256_loadu_ps(reinterpret_cast<const float*>(entries.lanes));
+    __m256i flag = _mm256_loadu_si256(reinterpret_cast<const __m256i*>(entries.lanes));
+    __m256 go_left = _mm256_cmp_ps(fvalue, _mm256_set1_ps(tree.split_cond[nid]),
+                                   _CMP_LT_OQ);
+    __m256i next = _mm256_castps_si256(_mm256_blendv_ps(
+        _mm256_castsi256_ps(_mm256_set1_epi32(tree.right[nid])),
+        _mm256_castsi256_ps(_mm256_set1_epi32(tree.left[nid])), go_left));
+    __m256i is_missing = _mm256_cmpeq_epi32(flag, missing_flag);
+    next = _mm256_blendv_epi8(next, _mm256_set1_epi32(tree.default_child[nid]),
+                              is_missing);
+    next_id = _mm256_blendv_epi8(next_id, next, is_in_path);
+  }
+  _mm256_storeu_ps(psum, sum);
+#else
+  int32_t next_id[kBlockRows] = {0};
+  for (int32_t nid = 0; nid < nnodes; ++nid) {
+    for (size_t k = 0; k < kBlockRows; ++k) {
+      // We are accessing the node in prediction path.
+      bool is_in_path = ObliviousEqual(next_id[k], nid);
+      psum[k] += ObliviousChoose(is_in_path, tree.leaf_value[nid], 0.0f);
+    }
+    // This is deterministic in oblivious model.
+    if (tree.is_leaf[nid]) {
+      continue;
+    }
+    // oaccess to protect the feature to split on.
+    FVecBlock::Entries entries = block.OGetEntries(tree.split_index[nid]);
+    for (size_t k = 0; k < kBlockRows; ++k) {
+      bool is_in_path = ObliviousEqual(next_id[k], nid);
+      const auto& entry = entries.lanes[k];
+      int32_t next = ObliviousChoose(ObliviousLess(entry.fvalue, tree.split_cond[nid]),
+                                     tree.left[nid], tree.right[nid]);
+      next = ObliviousChoose(RegTree::FVec::IsEntryMissing(entry),
+                             tree.default_child[nid], next);
+      next_id[k] = ObliviousChoose(is_in_path, next, next_id[k]);
+    }
+  }
+#endif  // USE_AVX2
+}
+
+/*!
+ * \brief oblivious prediction over blocks of kBlockRows rows, parallelized over
+ *  blocks. Gives the same output as PredValue with obliviousness enabled.
+ */
+template <typename DataView>
+void OPredictBatchKernel(DataView batch, std::vector<bst_float> *out_preds,
+                         gbm::GBTreeModel const &model, int32_t tree_begin,
+                         int32_t tree_end) {
+  static_assert(DataView::kUnroll >= kBlockRows,
+                "a block must fit in the unrolled rows of the data view");
+  int32_t const num_group = model.learner_model_param->num_output_group;
+  const size_t num_feature = model.learner_model_param->num_feature;
+  std::vector<bst_float> &preds = *out_preds;
+
+  std::vector<ObliviousTreeLayout> layouts(std::max(tree_end - tree_begin, 0));
+#pragma omp parallel for schedule(static)
+  for (int32_t i = tree_begin; i < tree_end; ++i) {
+    layouts[i - tree_begin].Init(*model.trees[i]);
+  }
+
+  const size_t nsize = batch.Size();
+  const auto nblocks = static_cast<bst_omp_uint>((nsize + kBlockRows - 1) / kBlockRows);
+  std::vector<FVecBlock> thread_blocks(omp_get_max_threads());
+  std::vector<RegTree::FVec> thread_feats(omp_get_max_threads());
+
+#pragma omp parallel for schedule(static)
+  for (bst_omp_uint iblock = 0; iblock < nblocks; ++iblock) {
+    const int tid = omp_get_thread_num();
+    FVecBlock &block = thread_blocks[tid];
+    if (block.Size() != num_feature) {
+      block.Init(num_feature);
+    }
+    const size_t ibegin = iblock * kBlockRows;
+    const size_t nrows = std::min(kBlockRows, nsize - ibegin);
+    SparsePage::Inst inst[kBlockRows];
+    for (size_t k = 0; k < nrows; ++k) {
+      inst[k] = batch[ibegin + k];
+      block.Fill(k, inst[k]);
+    }
+    for (int gid = 0; gid < num_group; ++gid) {
+      bst_float psum[kBlockRows] = {0.0f};
+      for (int32_t i = tree_begin; i < tree_end; ++i) {
+        if (model.tree_info[i] == gid) {
+          OPredBlock(layouts[i - tree_begin], block, psum);
+        }
+      }
+      if (common::ObliviousDebugCheckEnabled()) {
+        RegTree::FVec &feats = thread_feats[tid];
+        if (feats.Size() != num_feature) {
+          feats.Init(num_feature);
+        }
+        for (size_t k = 0; k < nrows; ++k) {
+          feats.Fill(inst[k]);
+          bst_float expected = 0.0f;
+          for (int32_t i = tree_begin; i < tree_end; ++i) {
+            if (model.tree_info[i] == gid) {
+              expected += (*model.trees[i])[model.trees[i]->GetLeafIndex(feats)].LeafValue();
+            }
+          }
+          CHECK_EQ(psum[k], expected) << psum[k] << ", " << expected;
+          feats.Drop(inst[k]);
+        }
+      }
+      for (size_t k = 0; k < nrows; ++k) {
+        const size_t offset = (batch.base_rowid + ibegin + k) * num_group + gid;
+        preds[offset] += psum[k];
+      }
+    }
+    for (size_t k = 0; k < nrows; ++k) {
+      block.Drop(k, inst[k]);
+    }
+  }
+}
+#endif  // __ENCLAVE_OBLIVIOUS__
+
 template <size_t kUnrollLen = 8>
 struct SparsePageView {
   SparsePage const* page;
@@ -132,6 +362,12 @@ void PredictBatchKernel(DataView batch, std::vector<bst_float> *out_preds,
   std::vector<bst_float> &preds = *out_preds;
   CHECK_EQ(model.param.size_leaf_vector, 0)
       << "size_leaf_vector is enforced to 0 so far";
+#ifdef __ENCLAVE_OBLIVIOUS__
+  if (common::ObliviousEnabled()) {
+    OPredictBatchKernel(batch, out_preds, model, tree_begin, tree_end);
+    return;
+  }
+#endif  // __ENCLAVE_OBLIVIOUS__
   // parallel over local batch
   const auto nsize = static_cast<bst_omp_uint>(batch.Size());
   auto constexpr kUnroll = DataView::kUnroll;
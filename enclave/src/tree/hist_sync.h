@@ -0,0 +1,180 @@
+/*!
+ * Copyright 2020 by Secure XGBoost Contributors
+ * \file hist_sync.h
+ * \brief wire formats used to synchronize gradient histograms across workers
+ */
+#ifndef XGBOOST_TREE_HIST_SYNC_H_
+#define XGBOOST_TREE_HIST_SYNC_H_
+
+#include <rabit/rabit.h>
+#include <xgboost/base.h>
+#include <xgboost/logging.h>
+
+#include <algorithm>
+#include <cstdint>
+#include <vector>
+
+namespace xgboost {
+namespace tree {
+
+/*! \brief format of the histograms exchanged by rabit during distributed training */
+enum HistSyncFormat {
+  /*! \brief histograms are sent in the precision they are accumulated in */
+  kHistSyncDouble = 0,
+  /*! \brief histograms are narrowed to float32 on the wire */
+  kHistSyncFloat = 1,
+  /*!
+   * \brief only non-empty bins are sent, as (bin, grad, hess) triples.
+   *  The message length reveals how many bins are occupied, so this format
+   *  is refused when obliviousness is enabled.
+   */
+  kHistSyncSparse = 2
+};
+
+/*!
+ * \brief Allreduce for gradient histograms that supports the formats in
+ *  HistSyncFormat. Sums are always accumulated back into the native
+ *  precision of GradientT. Bytes contributed to the wire are counted so that
+ *  the saving over the native format can be reported.
+ */
+template <typename GradientT>
+class HistReducer {
+ public:
+  void SetFormat(int format) {
+    CHECK(format == kHistSyncDouble || format == kHistSyncFloat || format == kHistSyncSparse)
+        << "Unknown histogram synchronization format: " << format;
+    format_ = format;
+  }
+  int Format() const { return format_; }
+
+  /*! \brief allreduce in the native format, used for node statistics */
+  void Allreduce(GradientT* data, size_t count) {
+    native_.Allreduce(data, count);
+  }
+
+  /*! \brief allreduce a block of histogram bins in the configured format */
+  void AllreduceHist(GradientT* data, size_t count) {
+    baseline_bytes_ += count * sizeof(GradientT);
+    switch (format_) {
+      case kHistSyncFloat:
+        AllreduceFloat(data, count);
+        break;
+      case kHistSyncSparse:
+        AllreduceSparse(data, count);
+        break;
+      default:
+        native_.Allreduce(data, count);
+        wire_bytes_ += count * sizeof(GradientT);
+        break;
+    }
+  }
+
+  /*!
+   * \brief reduce-scatter a block of histogram bins in the configured format.
+   *  Only the bins in [shard_ptr[rank], shard_ptr[rank + 1]) hold the global
+   *  sum afterwards, the rest of the block is left unspecified.
+   */
+  void ReduceScatterHist(GradientT* data, size_t count, const size_t* shard_ptr) {
+    const int rank = rabit::GetRank();
+    baseline_bytes_ += count * sizeof(GradientT);
+    // a ring reduce-scatter moves half of the data of a ring allreduce
+    switch (format_) {
+      case kHistSyncFloat: {
+        float_buffer_.resize(count);
+        for (size_t i = 0; i < count; ++i) {
+          float_buffer_[i] = GradientPair(data[i].GetGrad(), data[i].GetHess());
+        }
+        float_.ReduceScatter(float_buffer_.data(), count, shard_ptr);
+        for (size_t i = shard_ptr[rank]; i < shard_ptr[rank + 1]; ++i) {
+          data[i] = GradientT(float_buffer_[i].GetGrad(), float_buffer_[i].GetHess());
+        }
+        wire_bytes_ += count * sizeof(GradientPair) / 2;
+        break;
+      }
+      case kHistSyncSparse:
+        LOG(FATAL) << "Sparse histogram synchronization does not support reduce-scatter";
+        break;
+      default:
+        native_.ReduceScatter(data, count, shard_ptr);
+        wire_bytes_ += count * sizeof(GradientT) / 2;
+        break;
+    }
+  }
+
+  /*! \brief bytes this worker contributed since the last reset */
+  size_t WireBytes() const { return wire_bytes_; }
+  /*! \brief bytes the native format would have contributed since the last reset */
+  size_t BaselineBytes() const { return baseline_bytes_; }
+  void ResetCounters() {
+    wire_bytes_ = 0;
+    baseline_bytes_ = 0;
+  }
+
+ private:
+  struct SparseBin {
+    uint32_t bin;
+    float grad;
+    float hess;
+  };
+
+  void AllreduceFloat(GradientT* data, size_t count) {
+    float_buffer_.resize(count);
+    for (size_t i = 0; i < count; ++i) {
+      float_buffer_[i] = GradientPair(data[i].GetGrad(), data[i].GetHess());
+    }
+    float_.Allreduce(float_buffer_.data(), count);
+    for (size_t i = 0; i < count; ++i) {
+      data[i] = GradientT(float_buffer_[i].GetGrad(), float_buffer_[i].GetHess());
+    }
+    wire_bytes_ += count * sizeof(GradientPair);
+  }
+
+  void AllreduceSparse(GradientT* data, size_t count) {
+    CHECK_LE(count, static_cast<size_t>(UINT32_MAX));
+    const int rank = rabit::GetRank();
+    const int world = rabit::GetWorldSize();
+    sparse_buffer_.clear();
+    for (size_t i = 0; i < count; ++i) {
+      if (data[i].GetGrad() != 0 || data[i].GetHess() != 0) {
+        sparse_buffer_.push_back({static_cast<uint32_t>(i),
+                                  static_cast<float>(data[i].GetGrad()),
+                                  static_cast<float>(data[i].GetHess())});
+      }
+    }
+    // exchange the number of non-empty bins held by every worker
+    sizes_.assign(world, 0);
+    sizes_[rank] = sparse_buffer_.size();
+    rabit::Allreduce<rabit::op::Sum>(sizes_.data(), sizes_.size());
+    uint64_t begin = 0, total = 0;
+    for (int r = 0; r < world; ++r) {
+      if (r == rank) begin = total;
+      total += sizes_[r];
+    }
+    const uint64_t size_prev = sizes_[(rank + world - 1) % world];
+
+    std::vector<SparseBin> gathered(total);
+    std::copy(sparse_buffer_.begin(), sparse_buffer_.end(), gathered.begin() + begin);
+    rabit::Allgather(gathered.data(), total, begin, sparse_buffer_.size(), size_prev);
+
+    std::fill(data, data + count, GradientT());
+    for (auto const& e : gathered) {
+      CHECK_LT(e.bin, count);
+      data[e.bin] = GradientT(data[e.bin].GetGrad() + e.grad, data[e.bin].GetHess() + e.hess);
+    }
+    wire_bytes_ += sparse_buffer_.size() * sizeof(SparseBin) + world * sizeof(uint64_t);
+  }
+
+  int format_ {kHistSyncDouble};
+  rabit::Reducer<GradientT, GradientT::Reduce> native_;
+  rabit::Reducer<GradientPair, GradientPair::Reduce> float_;
+  std::vector<GradientPair> float_buffer_;
+  std::vector<SparseBin> sparse_buffer_;
+  std::vector<uint64_t> sizes_;
+  size_t wire_bytes_ {0};
+  size_t baseline_bytes_ {0};
+};
+
+}  // namespace tree
+}  // namespace xgboost
+
+#endif  // XGBOOST_TREE_HIST_SYNC_H_
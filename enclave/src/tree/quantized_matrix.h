@@ -0,0 +1,60 @@
+/*!
+ * Copyright 2020 by Secure XGBoost Contributors
+ * \file quantized_matrix.h
+ * \brief quantized data matrix of the hist updater, shared between boosters
+ */
+#ifndef XGBOOST_TREE_QUANTIZED_MATRIX_H_
+#define XGBOOST_TREE_QUANTIZED_MATRIX_H_
+
+#include <dmlc/timer.h>
+#include <xgboost/data.h>
+#include <xgboost/logging.h>
+
+#include <memory>
+#include <sstream>
+#include <string>
+
+#include "../common/hist_util.h"
+#include "../common/column_matrix.h"
+
+namespace xgboost {
+namespace tree {
+
+/*! \brief quantized data matrix and its column accessor */
+struct QuantizedMatrix {
+  common::GHistIndexMatrix gmat;
+  common::ColumnMatrix column_matrix;
+};
+
+/*!
+ * \brief Get the quantized matrix of |dmat|, building it on first use. The
+ *  matrix only depends on the data, the number of bins, the sparsity threshold
+ *  of the column accessor and on whether the sketch is oblivious, so boosters
+ *  trained on the same DMatrix with the same values share a single copy.
+ */
+inline std::shared_ptr<QuantizedMatrix const> GetQuantizedMatrix(DMatrix* dmat,
+                                                                 int max_bin,
+                                                                 double sparse_threshold) {
+#ifdef __ENCLAVE_OBLIVIOUS__
+  const bool oblivious = common::ObliviousEnabled();
+#else
+  const bool oblivious = false;
+#endif
+  std::ostringstream key;
+  key << "quantized max_bin=" << max_bin << " sparse_threshold=" << sparse_threshold
+      << " oblivious=" << oblivious;
+  auto matrix = dmat->GetDerivedMatrix(key.str(), [&]() {
+    double tstart = dmlc::GetTime();
+    std::shared_ptr<QuantizedMatrix> quantized(new QuantizedMatrix());
+    quantized->gmat.Init(dmat, max_bin);
+    quantized->column_matrix.Init(quantized->gmat, sparse_threshold);
+    LOG(INFO) << "Generating gmat: " << dmlc::GetTime() - tstart << " sec";
+    return DerivedMatrix{quantized,
+                         quantized->gmat.MemCostBytes() + quantized->column_matrix.MemCostBytes()};
+  });
+  return std::static_pointer_cast<QuantizedMatrix const>(matrix);
+}
+
+}  // namespace tree
+}  // namespace xgboost
+#endif  // XGBOOST_TREE_QUANTIZED_MATRIX_H_
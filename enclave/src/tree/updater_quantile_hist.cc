@@ -47,6 +47,10 @@ void QuantileHistMaker::Configure(const Args& args) {
   pruner_->Configure(args);
   param_.UpdateAllowUnknown(args);
   hist_maker_param_.UpdateAllowUnknown(args);
+  if (hist_maker_param_.hist_reduce_scatter) {
+    LOG(WARNING) << "hist_reduce_scatter is only supported by the oblivious build, "
+                 << "histograms are synchronized with allreduce";
+  }
   // initialize the split evaluator
   if (!spliteval_) {
     spliteval_.reset(SplitEvaluator::Create(param_.split_evaluator));
@@ -60,6 +64,7 @@ void QuantileHistMaker::SetBuilder(std::unique_ptr<Builder<GradientSumT>>* build
                                    DMatrix *dmat) {
   builder->reset(new Builder<GradientSumT>(
                 param_,
+                hist_maker_param_,
                 std::move(pruner_),
                 std::unique_ptr<SplitEvaluator>(spliteval_->GetHostClone()),
                 int_constraint_, dmat));
@@ -78,7 +83,7 @@ void QuantileHistMaker::CallBuilderUpdate(const std::unique_ptr<Builder<Gradient
                                           DMatrix *dmat,
                                           const std::vector<RegTree *> &trees) {
   for (auto tree : trees) {
-    builder->Update(gmat_, gmatb_, column_matrix_, gpair, dmat, tree);
+    builder->Update(quantized_->gmat, gmatb_, quantized_->column_matrix, gpair, dmat, tree);
   }
 }
 void QuantileHistMaker::Update(HostDeviceVector<GradientPair> *gpair,
@@ -86,14 +91,11 @@ void QuantileHistMaker::Update(HostDeviceVector<GradientPair> *gpair,
                                const std::vector<RegTree *> &trees) {
   if (dmat != p_last_dmat_ || is_gmat_initialized_ == false) {
     updater_monitor_.Start("GmatInitialization");
-    gmat_.Init(dmat, static_cast<uint32_t>(param_.max_bin));
-    column_matrix_.Init(gmat_, param_.sparse_threshold);
+    quantized_ = GetQuantizedMatrix(dmat, param_.max_bin, param_.sparse_threshold);
     if (param_.enable_feature_grouping > 0) {
-      gmatb_.Init(gmat_, column_matrix_, param_);
+      gmatb_.Init(quantized_->gmat, quantized_->column_matrix, param_);
     }
     updater_monitor_.Stop("GmatInitialization");
-    // A proper solution is puting cut matrix in DMatrix, see:
-    // https://github.com/dmlc/xgboost/issues/5143
     is_gmat_initialized_ = true;
   }
   // rescale learning rate according to size of trees
@@ -191,8 +193,8 @@ void DistributedHistSynchronizer<GradientSumT>::SyncHistograms(BuilderT* builder
     }
   });
   builder->builder_monitor_.Start("SyncHistogramsAllreduce");
-  builder->histred_.Allreduce(builder->hist_[starting_index].data(),
-                                    builder->hist_builder_.GetNumBins() * sync_count);
+  builder->histred_.AllreduceHist(builder->hist_[starting_index].data(),
+                                  builder->hist_builder_.GetNumBins() * sync_count);
   builder->builder_monitor_.Stop("SyncHistogramsAllreduce");
 
   ParallelSubtractionHist(builder, space, builder->nodes_for_explicit_hist_build_, p_tree);
@@ -600,6 +602,8 @@ void QuantileHistMaker::Builder<GradientSumT>::Update(const GHistIndexMatrix& gm
 
   spliteval_->Reset();
   interaction_constraints_.Reset();
+  histred_.SetFormat(hist_maker_param_.hist_sync_format);
+  histred_.ResetCounters();
 
   this->InitData(gmat, gpair_h, *p_fmat, *p_tree);
   if (param_.grow_policy == TrainParam::kLossGuide) {
@@ -615,6 +619,10 @@ void QuantileHistMaker::Builder<GradientSumT>::Update(const GHistIndexMatrix& gm
   }
   pruner_->Update(gpair, p_fmat, std::vector<RegTree*>{p_tree});
 
+  if (rabit::IsDistributed()) {
+    LOG(DEBUG) << "Histogram synchronization sent " << histred_.WireBytes()
+               << " bytes, " << histred_.BaselineBytes() << " bytes in native precision";
+  }
   builder_monitor_.Stop("Update");
 }
 template<typename GradientSumT>
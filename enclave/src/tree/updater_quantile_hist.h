@@ -26,7 +26,9 @@
 #include "xgboost/data.h"
 #include "xgboost/json.h"
 #include "constraints.h"
+#include "./hist_sync.h"
 #include "./param.h"
+#include "./quantized_matrix.h"
 #include "./split_evaluator.h"
 #include "../common/random.h"
 #include "../common/timer.h"
@@ -104,10 +106,22 @@ class DistributedHistRowsAdder;
 struct CPUHistMakerTrainParam
     : public XGBoostParameter<CPUHistMakerTrainParam> {
   bool single_precision_histogram;
+  int hist_sync_format;
+  bool hist_reduce_scatter;
   // declare parameters
   DMLC_DECLARE_PARAMETER(CPUHistMakerTrainParam) {
     DMLC_DECLARE_FIELD(single_precision_histogram).set_default(false).describe(
         "Use single precision to build histograms.");
+    DMLC_DECLARE_FIELD(hist_sync_format)
+        .set_default(kHistSyncDouble)
+        .add_enum("double", kHistSyncDouble)
+        .add_enum("float", kHistSyncFloat)
+        .add_enum("sparse", kHistSyncSparse)
+        .describe("Wire format of the histograms synchronized in distributed training.");
+    DMLC_DECLARE_FIELD(hist_reduce_scatter)
+        .set_default(false)
+        .describe("Reduce-scatter histograms by feature shard in distributed training. "
+                  "Only supported by the oblivious build, ignored here.");
   }
 };
 
@@ -174,12 +188,10 @@ class QuantileHistMaker: public TreeUpdater {
   CPUHistMakerTrainParam hist_maker_param_;
   // training parameter
   TrainParam param_;
-  // quantized data matrix
-  GHistIndexMatrix gmat_;
+  // quantized data matrix and column accessor, shared with other boosters
+  std::shared_ptr<QuantizedMatrix const> quantized_;
   // (optional) data matrix with feature grouping
   GHistIndexBlockMatrix gmatb_;
-  // column accessor
-  ColumnMatrix column_matrix_;
   DMatrix const* p_last_dmat_ {nullptr};
   bool is_gmat_initialized_ {false};
 
@@ -206,11 +218,12 @@ class QuantileHistMaker: public TreeUpdater {
     using GradientPairT = xgboost::detail::GradientPairInternal<GradientSumT>;
     // constructor
     explicit Builder(const TrainParam& param,
+                     const CPUHistMakerTrainParam& hist_maker_param,
                      std::unique_ptr<TreeUpdater> pruner,
                      std::unique_ptr<SplitEvaluator> spliteval,
                      FeatureInteractionConstraintHost int_constraints_,
                      DMatrix const* fmat)
-      : param_(param), pruner_(std::move(pruner)),
+      : param_(param), hist_maker_param_(hist_maker_param), pruner_(std::move(pruner)),
         spliteval_(std::move(spliteval)),
         interaction_constraints_{std::move(int_constraints_)},
         p_last_tree_(nullptr), p_last_fmat_(fmat) {
@@ -397,6 +410,7 @@ class QuantileHistMaker: public TreeUpdater {
     }
     //  --data fields--
     const TrainParam& param_;
+    const CPUHistMakerTrainParam& hist_maker_param_;
     // number of omp thread used during training
     int nthread_;
     common::ColumnSampler column_sampler_;
@@ -446,7 +460,7 @@ class QuantileHistMaker: public TreeUpdater {
 
     common::Monitor builder_monitor_;
     common::ParallelGHistBuilder<GradientSumT> hist_buffer_;
-    rabit::Reducer<GradientPairT, GradientPairT::Reduce> histred_;
+    HistReducer<GradientPairT> histred_;
     std::unique_ptr<HistSynchronizer<GradientSumT>> hist_synchronizer_;
     std::unique_ptr<HistRowsAdder<GradientSumT>> hist_rows_adder_;
   };
@@ -53,6 +53,8 @@ std::pair<size_t, size_t> GetLevelNodeRange(size_t nid) {
 
 DMLC_REGISTRY_FILE_TAG(updater_quantile_hist);
 
+DMLC_REGISTER_PARAMETER(CPUHistMakerTrainParam);
+
 void QuantileHistMaker::Configure(const Args& args) {
   // initialize pruner
   if (!pruner_) {
@@ -60,6 +62,17 @@ void QuantileHistMaker::Configure(const Args& args) {
   }
   pruner_->Configure(args);
   param_.InitAllowUnknown(args);
+  hist_maker_param_.UpdateAllowUnknown(args);
+  // the size of a sparse histogram depends on how many bins are occupied
+  CHECK(!common::ObliviousEnabled() || hist_maker_param_.hist_sync_format != kHistSyncSparse)
+      << "hist_sync_format='sparse' leaks histogram occupancy and cannot be used "
+      << "when obliviousness is enabled";
+  CHECK(!hist_maker_param_.hist_reduce_scatter ||
+        hist_maker_param_.hist_sync_format != kHistSyncSparse)
+      << "hist_reduce_scatter cannot be combined with hist_sync_format='sparse'";
+  CHECK(!hist_maker_param_.hist_reduce_scatter ||
+        param_.grow_policy == TrainParam::kDepthWise)
+      << "hist_reduce_scatter requires grow_policy='depthwise'";
   is_gmat_initialized_ = false;
 
   // initialise the split evaluator
@@ -74,14 +87,11 @@ void QuantileHistMaker::Update(HostDeviceVector<GradientPair> *gpair,
                                DMatrix *dmat,
                                const std::vector<RegTree *> &trees) {
   if (is_gmat_initialized_ == false) {
-    double tstart = dmlc::GetTime();
-    gmat_.Init(dmat, static_cast<uint32_t>(param_.max_bin));
-    column_matrix_.Init(gmat_, param_.sparse_threshold);
+    quantized_ = GetQuantizedMatrix(dmat, param_.max_bin, param_.sparse_threshold);
     if (param_.enable_feature_grouping > 0) {
-      gmatb_.Init(gmat_, column_matrix_, param_);
+      gmatb_.Init(quantized_->gmat, quantized_->column_matrix, param_);
     }
     is_gmat_initialized_ = true;
-    LOG(INFO) << "Generating gmat: " << dmlc::GetTime() - tstart << " sec";
   }
   // rescale learning rate according to size of trees
   float lr = param_.learning_rate;
@@ -91,12 +101,13 @@ void QuantileHistMaker::Update(HostDeviceVector<GradientPair> *gpair,
   if (!builder_) {
     builder_.reset(new Builder(
         param_,
+        hist_maker_param_,
         std::move(pruner_),
         std::unique_ptr<SplitEvaluator>(spliteval_->GetHostClone()),
         int_constraint_));
   }
   for (auto tree : trees) {
-    builder_->Update(gmat_, gmatb_, column_matrix_, gpair, dmat, tree);
+    builder_->Update(quantized_->gmat, gmatb_, quantized_->column_matrix, gpair, dmat, tree);
   }
   param_.learning_rate = lr;
 }
@@ -116,8 +127,14 @@ void QuantileHistMaker::Builder::SyncHistograms(
     int sync_count,
     RegTree *p_tree) {
   builder_monitor_.Start("SyncHistograms");
-  this->histred_.Allreduce(hist_[starting_index].data(), hist_builder_.GetNumBins() * sync_count);
-  // use Subtraction Trick
+  if (shard_features_) {
+    ReduceScatterHistograms(starting_index, sync_count);
+  } else {
+    this->histred_.AllreduceHist(hist_[starting_index].data(),
+                                 hist_builder_.GetNumBins() * sync_count);
+  }
+  // use Subtraction Trick, only the bins of the own shard are meaningful when
+  // histograms are reduce-scattered
   for (auto const& node_pair : nodes_for_subtraction_trick_) {
     hist_.AddHistRow(node_pair.first);
     SubtractionTrick(hist_[node_pair.first], hist_[node_pair.second],
@@ -126,6 +143,75 @@ void QuantileHistMaker::Builder::SyncHistograms(
   builder_monitor_.Stop("SyncHistograms");
 }
 
+void QuantileHistMaker::Builder::InitFeatureShards(const GHistIndexMatrix& gmat) {
+  const std::vector<uint32_t>& row_ptr = gmat.cut.row_ptr;
+  const auto nfeature = static_cast<bst_uint>(row_ptr.size() - 1);
+  const size_t nbins = row_ptr.back();
+  const auto world = static_cast<size_t>(rabit::GetWorldSize());
+  shard_feature_ptr_.assign(world + 1, nfeature);
+  shard_bin_ptr_.assign(world + 1, nbins);
+  shard_feature_ptr_[0] = 0;
+  shard_bin_ptr_[0] = 0;
+  // the cuts are identical on every worker, so are the shards
+  bst_uint fid = 0;
+  for (size_t r = 1; r < world; ++r) {
+    const size_t target = nbins * r / world;
+    while (fid < nfeature && row_ptr[fid] < target) {
+      ++fid;
+    }
+    shard_feature_ptr_[r] = fid;
+    shard_bin_ptr_[r] = row_ptr[fid];
+  }
+}
+
+void QuantileHistMaker::Builder::ReduceScatterHistograms(int starting_index, int sync_count) {
+  const size_t nbins = hist_builder_.GetNumBins();
+  const auto world = static_cast<size_t>(rabit::GetWorldSize());
+  const auto rank = static_cast<size_t>(rabit::GetRank());
+  const auto nodes = static_cast<size_t>(sync_count);
+  GradStats* level_hist = hist_[starting_index].data();
+  // lay the histograms of the level out shard by shard, so that the shard of
+  // every worker is contiguous across all nodes being synchronized
+  shard_buffer_.resize(nbins * nodes);
+  shard_ptr_.resize(world + 1);
+  for (size_t r = 0; r < world; ++r) {
+    const size_t begin = shard_bin_ptr_[r];
+    const size_t width = shard_bin_ptr_[r + 1] - begin;
+    shard_ptr_[r] = begin * nodes;
+    for (size_t i = 0; i < nodes; ++i) {
+      std::copy(level_hist + i * nbins + begin, level_hist + i * nbins + begin + width,
+                shard_buffer_.begin() + shard_ptr_[r] + i * width);
+    }
+  }
+  shard_ptr_[world] = nbins * nodes;
+  histred_.ReduceScatterHist(shard_buffer_.data(), shard_buffer_.size(), shard_ptr_.data());
+  const size_t begin = shard_bin_ptr_[rank];
+  const size_t width = shard_bin_ptr_[rank + 1] - begin;
+  for (size_t i = 0; i < nodes; ++i) {
+    auto src = shard_buffer_.begin() + shard_ptr_[rank] + i * width;
+    std::copy(src, src + width, level_hist + i * nbins + begin);
+  }
+}
+
+void QuantileHistMaker::Builder::AllgatherBestSplits() {
+  const size_t world = static_cast<size_t>(rabit::GetWorldSize());
+  const size_t rank = static_cast<size_t>(rabit::GetRank());
+  const size_t nodes = qexpand_depth_wise_.size();
+  split_buffer_.resize(world * nodes);
+  for (size_t i = 0; i < nodes; ++i) {
+    split_buffer_[rank * nodes + i] = snode_[qexpand_depth_wise_[i].nid].best;
+  }
+  rabit::Allgather(split_buffer_.data(), split_buffer_.size(), rank * nodes, nodes, nodes);
+  // reduce in rank order, so that every worker picks the same split on ties
+  for (size_t i = 0; i < nodes; ++i) {
+    SplitEntry best;
+    for (size_t r = 0; r < world; ++r) {
+      best.Update(split_buffer_[r * nodes + i]);
+    }
+    snode_[qexpand_depth_wise_[i].nid].best = best;
+  }
+}
+
 void QuantileHistMaker::Builder::BuildLocalHistograms(
     int *starting_index,
     int *sync_count,
@@ -209,9 +295,15 @@ void QuantileHistMaker::Builder::EvaluateSplits(
     int depth,
     unsigned *timestamp,
     std::vector<ExpandEntry> *temp_qexpand_depth) {
+  for (auto const& entry : qexpand_depth_wise_) {
+    this->EvaluateSplit(entry.nid, gmat, hist_, *p_fmat, *p_tree);
+  }
+  if (shard_features_) {
+    // every worker only evaluated the features of its own shard
+    AllgatherBestSplits();
+  }
   for (auto const& entry : qexpand_depth_wise_) {
     int nid = entry.nid;
-    this->EvaluateSplit(nid, gmat, hist_, *p_fmat, *p_tree);
     // For oblivious: we keep expanding nodes since we wanna protect tree
     // structures.
     const bool kMaxDepthReached =
@@ -409,8 +501,14 @@ void QuantileHistMaker::Builder::Update(const GHistIndexMatrix& gmat,
 
   spliteval_->Reset();
   interaction_constraints_.Reset();
+  histred_.SetFormat(hist_maker_param_.hist_sync_format);
+  histred_.ResetCounters();
 
   this->InitData(gmat, gpair_h, *p_fmat, *p_tree);
+  shard_features_ = hist_maker_param_.hist_reduce_scatter && rabit::IsDistributed();
+  if (shard_features_) {
+    InitFeatureShards(gmat);
+  }
 
   // Init oblivious helper.
   row_node_map_.Init(gmat.row_ptr.size() - 1, param_.max_depth);
@@ -433,6 +531,10 @@ void QuantileHistMaker::Builder::Update(const GHistIndexMatrix& gmat,
 
   pruner_->Update(gpair, p_fmat, std::vector<RegTree*>{p_tree});
 
+  if (rabit::IsDistributed()) {
+    LOG(DEBUG) << "Histogram synchronization sent " << histred_.WireBytes()
+               << " bytes, " << histred_.BaselineBytes() << " bytes in native precision";
+  }
   builder_monitor_.Stop("Update");
 }
 
@@ -659,12 +761,21 @@ void QuantileHistMaker::Builder::EvaluateSplit(const int nid,
     best_split_tloc_[tid] = snode_[nid].best;
   }
   GHistRow node_hist = hist[nid];
+  bst_uint fbegin = 0, fend = std::numeric_limits<bst_uint>::max();
+  if (shard_features_) {
+    fbegin = shard_feature_ptr_[rabit::GetRank()];
+    fend = shard_feature_ptr_[rabit::GetRank() + 1];
+  }
 
 #pragma omp parallel for schedule(dynamic) num_threads(nthread)
   for (bst_omp_uint i = 0; i < nfeature; ++i) {  // NOLINT(*)
     const auto feature_id = static_cast<bst_uint>(feature_set[i]);
     const auto tid = static_cast<unsigned>(omp_get_thread_num());
     const auto node_id = static_cast<bst_uint>(nid);
+    // Histograms of features outside the shard of this worker are not synchronized
+    if (feature_id < fbegin || feature_id >= fend) {
+      continue;
+    }
     // Narrow search space by dropping features that are not feasible under the
     // given set of constraints (e.g. feature interaction constraints)
     if (interaction_constraints_.Query(node_id, feature_id)) {
@@ -886,7 +997,9 @@ void QuantileHistMaker::Builder::InitNewNode(int nid,
     auto& stats = snode_[nid].stats;
     GHistRow hist = hist_[nid];
     if (tree[nid].IsRoot()) {
-      if (data_layout_ == kDenseDataZeroBased || data_layout_ == kDenseDataOneBased) {
+      // with sharded histograms, the feature with least bins may not be synchronized here
+      if (!shard_features_ &&
+          (data_layout_ == kDenseDataZeroBased || data_layout_ == kDenseDataOneBased)) {
         const std::vector<uint32_t>& row_ptr = gmat.cut.row_ptr;
         const uint32_t ibegin = row_ptr[fid_least_bins_];
         const uint32_t iend = row_ptr[fid_least_bins_ + 1];
@@ -1029,7 +1142,7 @@ void QuantileHistMaker::Builder::BuildLocalHistogramsLevelWise(
     hist.Init(hist_.nbins(), num_left_nodes);
   }
 
-  const uint32_t* index = gmat.index.data();
+  const common::Index& index = gmat.index;
   const size_t* row_ptr =  gmat.row_ptr.data();
   const auto nrows = gmat.row_ptr.size() - 1;
 
@@ -23,7 +23,9 @@
 #include <utility>
 
 #include "constraints.h"
+#include "./hist_sync.h"
 #include "./param.h"
+#include "./quantized_matrix.h"
 #include "./split_evaluator.h"
 #include "../common/random.h"
 #include "../common/timer.h"
@@ -80,6 +82,28 @@ using xgboost::common::GHistBuilder;
 using xgboost::common::ColumnMatrix;
 using xgboost::common::Column;
 
+// training parameters specific to this algorithm
+struct CPUHistMakerTrainParam
+    : public XGBoostParameter<CPUHistMakerTrainParam> {
+  int hist_sync_format;
+  bool hist_reduce_scatter;
+  // declare parameters
+  DMLC_DECLARE_PARAMETER(CPUHistMakerTrainParam) {
+    DMLC_DECLARE_FIELD(hist_sync_format)
+        .set_default(kHistSyncDouble)
+        .add_enum("double", kHistSyncDouble)
+        .add_enum("float", kHistSyncFloat)
+        .add_enum("sparse", kHistSyncSparse)
+        .describe("Wire format of the histograms synchronized in distributed training. "
+                  "'sparse' is not available when obliviousness is enabled.");
+    DMLC_DECLARE_FIELD(hist_reduce_scatter)
+        .set_default(false)
+        .describe("In distributed training, reduce-scatter histograms so that every "
+                  "worker only finalizes and evaluates the bins of its own shard of "
+                  "features, then allgather the best splits.");
+  }
+};
+
 /*! \brief construct a tree using quantized feature values */
 class QuantileHistMaker: public TreeUpdater {
  public:
@@ -109,14 +133,13 @@ class QuantileHistMaker: public TreeUpdater {
   }
 
  protected:
+  CPUHistMakerTrainParam hist_maker_param_;
   // training parameter
   TrainParam param_;
-  // quantized data matrix
-  GHistIndexMatrix gmat_;
+  // quantized data matrix and column accessor, shared with other boosters
+  std::shared_ptr<QuantizedMatrix const> quantized_;
   // (optional) data matrix with feature grouping
   GHistIndexBlockMatrix gmatb_;
-  // column accessor
-  ColumnMatrix column_matrix_;
   bool is_gmat_initialized_;
 
   // data structure
@@ -139,10 +162,11 @@ class QuantileHistMaker: public TreeUpdater {
    public:
     // constructor
     explicit Builder(const TrainParam& param,
+                     const CPUHistMakerTrainParam& hist_maker_param,
                      std::unique_ptr<TreeUpdater> pruner,
                      std::unique_ptr<SplitEvaluator> spliteval,
                      FeatureInteractionConstraintHost int_constraints_)
-      : param_(param), pruner_(std::move(pruner)),
+      : param_(param), hist_maker_param_(hist_maker_param), pruner_(std::move(pruner)),
         spliteval_(std::move(spliteval)), p_last_tree_(nullptr),
         interaction_constraints_{std::move(int_constraints_)},
         p_last_fmat_(nullptr) {
@@ -169,7 +193,7 @@ class QuantileHistMaker: public TreeUpdater {
         hist_builder_.BuildHist(gpair, row_indices, gmat, hist);
       }
       if (sync_hist) {
-        this->histred_.Allreduce(hist.data(), hist_builder_.GetNumBins());
+        this->histred_.AllreduceHist(hist.data(), hist_builder_.GetNumBins());
       }
       builder_monitor_.Stop("BuildHist");
     }
@@ -272,6 +296,15 @@ class QuantileHistMaker: public TreeUpdater {
                         int sync_count,
                         RegTree *p_tree);
 
+    // split the features into one contiguous shard per worker, balanced by bins
+    void InitFeatureShards(const GHistIndexMatrix& gmat);
+
+    // reduce-scatter the histograms of a level, each worker owning a feature shard
+    void ReduceScatterHistograms(int starting_index, int sync_count);
+
+    // agree on the best split of every node of the level across feature shards
+    void AllgatherBestSplits();
+
     void BuildNodeStats(const GHistIndexMatrix &gmat,
                         DMatrix *p_fmat,
                         RegTree *p_tree,
@@ -303,6 +336,7 @@ class QuantileHistMaker: public TreeUpdater {
 
     //  --data fields--
     const TrainParam& param_;
+    const CPUHistMakerTrainParam& hist_maker_param_;
     // number of omp thread used during training
     int nthread_;
     common::ColumnSampler column_sampler_;
@@ -346,7 +380,17 @@ class QuantileHistMaker: public TreeUpdater {
     DataLayout data_layout_;
 
     common::Monitor builder_monitor_;
-    rabit::Reducer<GradStats, GradStats::Reduce> histred_;
+    HistReducer<GradStats> histred_;
+    /*! \brief whether histograms are reduce-scattered by feature shard */
+    bool shard_features_ {false};
+    /*! \brief first feature of the shard of every worker, world_size + 1 entries */
+    std::vector<bst_uint> shard_feature_ptr_;
+    /*! \brief first histogram bin of the shard of every worker */
+    std::vector<size_t> shard_bin_ptr_;
+    /*! \brief histograms of a level, laid out shard by shard */
+    std::vector<GradStats> shard_buffer_;
+    std::vector<size_t> shard_ptr_;
+    std::vector<SplitEntry> split_buffer_;
   };
 
   std::unique_ptr<Builder> builder_;
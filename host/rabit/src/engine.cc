@@ -138,5 +138,16 @@ void ReduceHandle::Allreduce(void *sendrecvbuf,
                          redfunc_, prepare_fun, prepare_arg,
                          _file, _line, _caller);
 }
+
+void ReduceHandle::ReduceScatter(void *sendrecvbuf,
+                                 size_t type_nbytes, size_t count,
+                                 const size_t *shard_ptr,
+                                 const char* _file,
+                                 const int _line,
+                                 const char* _caller) {
+  utils::Assert(redfunc_ != NULL, "must intialize handle to call ReduceScatter");
+  GetEngine()->ReduceScatter(sendrecvbuf, type_nbytes, count, shard_ptr,
+                             redfunc_, _file, _line, _caller);
+}
 }  // namespace engine
 }  // namespace rabit
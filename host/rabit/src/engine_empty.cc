@@ -144,5 +144,13 @@ void ReduceHandle::Allreduce(void *sendrecvbuf,
                              const char* _caller) {
   if (prepare_fun != NULL) prepare_fun(prepare_arg);
 }
+
+void ReduceHandle::ReduceScatter(void *sendrecvbuf,
+                                 size_t type_nbytes, size_t count,
+                                 const size_t *shard_ptr,
+                                 const char* _file,
+                                 const int _line,
+                                 const char* _caller) {
+}
 }  // namespace engine
 }  // namespace rabit
@@ -247,5 +247,15 @@ void ReduceHandle::Allreduce(void *sendrecvbuf,
   if (prepare_fun != NULL) prepare_fun(prepare_arg);
   MPI::COMM_WORLD.Allreduce(MPI_IN_PLACE, sendrecvbuf, count, *dtype, *op);
 }
+// MPI has no reduce-scatter with custom shard offsets here, fall back to Allreduce
+void ReduceHandle::ReduceScatter(void *sendrecvbuf,
+                                 size_t type_nbytes, size_t count,
+                                 const size_t *shard_ptr,
+                                 const char* _file,
+                                 const int _line,
+                                 const char* _caller) {
+  this->Allreduce(sendrecvbuf, type_nbytes, count, NULL, NULL,
+                  _file, _line, _caller);
+}
 }  // namespace engine
 }  // namespace rabit
@@ -40,6 +40,7 @@
 #include <dmlc/base64.h>
 
 #define safe_ecall(call) {                                      \
+std::lock_guard<std::mutex> ecall_guard(Enclave::getInstance().ecall_mutex); \
 if (!Enclave::getInstance().getEnclave()) {                     \
   fprintf(                                                      \
       stderr,                                                   \
@@ -96,6 +97,7 @@ int XGDMatrixCreateFromEncryptedFile(const char *fnames[],
                                      char* usernames[],
                                      xgboost::bst_ulong num_files,
                                      int silent,
+                                     const char* cache_dir,
                                      DMatrixHandle *out) {
     size_t fname_lengths[num_files];
     size_t username_lengths[num_files];
@@ -103,7 +105,7 @@ int XGDMatrixCreateFromEncryptedFile(const char *fnames[],
     get_str_lengths((char**)fnames, num_files, fname_lengths);
     get_str_lengths(usernames, num_files, username_lengths);
 
-    safe_ecall(enclave_XGDMatrixCreateFromEncryptedFile(Enclave::getInstance().getEnclave(), &Enclave::getInstance().enclave_ret, (const char**) fnames, fname_lengths, usernames, username_lengths, num_files, silent, out));
+    safe_ecall(enclave_XGDMatrixCreateFromEncryptedFile(Enclave::getInstance().getEnclave(), &Enclave::getInstance().enclave_ret, (const char**) fnames, fname_lengths, usernames, username_lengths, num_files, silent, cache_dir, out));
 }
 
 /*
@@ -396,7 +398,7 @@ XGB_DLL int XGDMatrixNumCol(const DMatrixHandle handle,
 
 // xgboost implementation
 //
-XGB_DLL int XGBCreateEnclave(const char *enclave_image, char** usernames, size_t num_clients, int log_verbosity) {
+XGB_DLL int XGBCreateEnclave(const char *enclave_image, char** usernames, size_t num_clients, int log_verbosity, int switchless_workers, size_t memory_limit, const char* spill_dir, const char* identity_key_path) {
   if (!Enclave::getInstance().getEnclave()) {
     size_t username_lengths[num_clients];
     get_str_lengths(usernames, num_clients, username_lengths);
@@ -411,10 +413,19 @@ XGB_DLL int XGBCreateEnclave(const char *enclave_image, char** usernames, size_t
     flags |= OE_ENCLAVE_FLAG_SIMULATE;
 #endif
 
+    // Host threads that poll for switchless OCALLs, so that file I/O and
+    // logging do not exit the enclave
+    oe_enclave_setting_context_switchless_t switchless_setting = {
+        static_cast<size_t>(std::max(switchless_workers, 0)), 0};
+    oe_enclave_setting_t settings[1];
+    settings[0].setting_type = OE_ENCLAVE_SETTING_CONTEXT_SWITCHLESS;
+    settings[0].u.context_switchless_setting = &switchless_setting;
+    const uint32_t num_settings = switchless_workers > 0 ? 1 : 0;
+
     oe_enclave_t** enclave = Enclave::getInstance().getEnclaveRef();
     // Create the enclave
     result = oe_create_xgboost_enclave(
-        enclave_image, OE_ENCLAVE_TYPE_AUTO, flags, NULL, 0, enclave);
+        enclave_image, OE_ENCLAVE_TYPE_AUTO, flags, settings, num_settings, enclave);
     if (result != OE_OK) {
       fprintf(
           stderr,
@@ -425,7 +436,7 @@ XGB_DLL int XGBCreateEnclave(const char *enclave_image, char** usernames, size_t
       return Enclave::getInstance().enclave_ret;
     }
     Enclave::getInstance().set_num_clients(num_clients);
-    safe_ecall(enclave_init(Enclave::getInstance().getEnclave(), usernames, username_lengths, num_clients, log_verbosity));
+    safe_ecall(enclave_init(Enclave::getInstance().getEnclave(), usernames, username_lengths, num_clients, log_verbosity, memory_limit, spill_dir, identity_key_path));
   }
   return 0;
 }
@@ -40,6 +40,7 @@
 #include <dmlc/base64.h>
 
 #define safe_ecall(call) {                                      \
+std::lock_guard<std::mutex> ecall_guard(Enclave::getInstance().ecall_mutex); \
 if (!Enclave::getInstance().getEnclave()) {                     \
   fprintf(                                                      \
       stderr,                                                   \
@@ -96,6 +97,7 @@ int XGDMatrixCreateFromEncryptedFile(const char *fnames[],
                                      char* usernames[],
                                      xgboost::bst_ulong num_files,
                                      int silent,
+                                     const char* cache_dir,
                                      uint8_t *nonce,
                                      size_t nonce_size,
                                      uint32_t nonce_ctr,
@@ -114,11 +116,23 @@ int XGDMatrixCreateFromEncryptedFile(const char *fnames[],
     get_str_lengths(usernames, num_files, username_lengths);
     get_str_lengths(signers, NUM_CLIENTS, signer_lengths);
 
-    safe_ecall(enclave_XGDMatrixCreateFromEncryptedFile(Enclave::getInstance().getEnclave(), &Enclave::getInstance().enclave_ret, (const char**) fnames, fname_lengths, usernames, username_lengths, num_files, silent, nonce, nonce_size, nonce_ctr, out, out_sig, out_sig_length, signers, signer_lengths, signatures, sig_lengths, NUM_CLIENTS));
+    safe_ecall(enclave_XGDMatrixCreateFromEncryptedFile(Enclave::getInstance().getEnclave(), &Enclave::getInstance().enclave_ret, (const char**) fnames, fname_lengths, usernames, username_lengths, num_files, silent, cache_dir, nonce, nonce_size, nonce_ctr, out, out_sig, out_sig_length, signers, signer_lengths, signatures, sig_lengths, NUM_CLIENTS));
 }
 
-XGB_DLL int XGDMatrixFree(DMatrixHandle handle) {
-    safe_ecall(enclave_XGDMatrixFree(Enclave::getInstance().getEnclave(), &Enclave::getInstance().enclave_ret, handle));
+XGB_DLL int XGDMatrixFree(DMatrixHandle handle,
+                          uint8_t *nonce,
+                          size_t nonce_size,
+                          uint32_t nonce_ctr,
+                          uint8_t** out_sig,
+                          size_t *out_sig_length,
+                          char **signers,
+                          uint8_t* signatures[],
+                          size_t* sig_lengths) {
+    int NUM_CLIENTS = Enclave::getInstance().get_num_clients();
+    size_t signer_lengths[NUM_CLIENTS];
+    get_str_lengths(signers, NUM_CLIENTS, signer_lengths);
+
+    safe_ecall(enclave_XGDMatrixFree(Enclave::getInstance().getEnclave(), &Enclave::getInstance().enclave_ret, handle, nonce, nonce_size, nonce_ctr, out_sig, out_sig_length, signers, signer_lengths, signatures, sig_lengths, NUM_CLIENTS));
 }
 
 XGB_DLL int XGDMatrixSetFloatInfo(DMatrixHandle handle,
@@ -186,7 +200,7 @@ XGB_DLL int XGDMatrixNumCol(const DMatrixHandle handle,
 
 // xgboost implementation
 
-XGB_DLL int XGBCreateEnclave(const char *enclave_image, char** usernames, size_t num_clients, int log_verbosity) {
+XGB_DLL int XGBCreateEnclave(const char *enclave_image, char** usernames, size_t num_clients, int log_verbosity, int switchless_workers, size_t memory_limit, const char* spill_dir, const char* identity_key_path) {
   if (!Enclave::getInstance().getEnclave()) {
     size_t username_lengths[num_clients];
     get_str_lengths(usernames, num_clients, username_lengths);
@@ -201,10 +215,19 @@ XGB_DLL int XGBCreateEnclave(const char *enclave_image, char** usernames, size_t
     flags |= OE_ENCLAVE_FLAG_SIMULATE;
 #endif
 
+    // Host threads that poll for switchless OCALLs, so that file I/O and
+    // logging do not exit the enclave
+    oe_enclave_setting_context_switchless_t switchless_setting = {
+        static_cast<size_t>(std::max(switchless_workers, 0)), 0};
+    oe_enclave_setting_t settings[1];
+    settings[0].setting_type = OE_ENCLAVE_SETTING_CONTEXT_SWITCHLESS;
+    settings[0].u.context_switchless_setting = &switchless_setting;
+    const uint32_t num_settings = switchless_workers > 0 ? 1 : 0;
+
     oe_enclave_t** enclave = Enclave::getInstance().getEnclaveRef();
     // Create the enclave
     result = oe_create_xgboost_mc_enclave(
-        enclave_image, OE_ENCLAVE_TYPE_AUTO, flags, NULL, 0, enclave);
+        enclave_image, OE_ENCLAVE_TYPE_AUTO, flags, settings, num_settings, enclave);
     if (result != OE_OK) {
       fprintf(
           stderr,
@@ -215,7 +238,7 @@ XGB_DLL int XGBCreateEnclave(const char *enclave_image, char** usernames, size_t
       return Enclave::getInstance().enclave_ret;
     }
     Enclave::getInstance().set_num_clients(num_clients);
-    safe_ecall(enclave_init(Enclave::getInstance().getEnclave(), usernames, username_lengths, num_clients, log_verbosity));
+    safe_ecall(enclave_init(Enclave::getInstance().getEnclave(), usernames, username_lengths, num_clients, log_verbosity, memory_limit, spill_dir, identity_key_path));
   }
   return 0;
 }
@@ -241,8 +264,36 @@ XGB_DLL int XGBoosterCreate(const DMatrixHandle dmats[],
   safe_ecall(enclave_XGBoosterCreate(Enclave::getInstance().getEnclave(), &Enclave::getInstance().enclave_ret, const_cast<char**>(dmats), handle_lengths, len, nonce, nonce_size, nonce_ctr, out, out_sig, out_sig_length, signers, signer_lengths, signatures, sig_lengths, NUM_CLIENTS));
 }
 
-XGB_DLL int XGBoosterFree(BoosterHandle handle) {
-    safe_ecall(enclave_XGBoosterFree(Enclave::getInstance().getEnclave(), &Enclave::getInstance().enclave_ret, handle));
+XGB_DLL int XGBoosterFree(BoosterHandle handle,
+                          uint8_t *nonce,
+                          size_t nonce_size,
+                          uint32_t nonce_ctr,
+                          uint8_t** out_sig,
+                          size_t *out_sig_length,
+                          char **signers,
+                          uint8_t* signatures[],
+                          size_t* sig_lengths) {
+    int NUM_CLIENTS = Enclave::getInstance().get_num_clients();
+    size_t signer_lengths[NUM_CLIENTS];
+    get_str_lengths(signers, NUM_CLIENTS, signer_lengths);
+
+    safe_ecall(enclave_XGBoosterFree(Enclave::getInstance().getEnclave(), &Enclave::getInstance().enclave_ret, handle, nonce, nonce_size, nonce_ctr, out_sig, out_sig_length, signers, signer_lengths, signatures, sig_lengths, NUM_CLIENTS));
+}
+
+XGB_DLL int XGBGetEnclaveMemoryStats(uint8_t *nonce,
+                                     size_t nonce_size,
+                                     uint32_t nonce_ctr,
+                                     char **out_stats,
+                                     uint8_t** out_sig,
+                                     size_t *out_sig_length,
+                                     char **signers,
+                                     uint8_t* signatures[],
+                                     size_t* sig_lengths) {
+    int NUM_CLIENTS = Enclave::getInstance().get_num_clients();
+    size_t signer_lengths[NUM_CLIENTS];
+    get_str_lengths(signers, NUM_CLIENTS, signer_lengths);
+
+    safe_ecall(enclave_XGBGetEnclaveMemoryStats(Enclave::getInstance().getEnclave(), &Enclave::getInstance().enclave_ret, nonce, nonce_size, nonce_ctr, out_stats, out_sig, out_sig_length, signers, signer_lengths, signatures, sig_lengths, NUM_CLIENTS));
 }
 
 XGB_DLL int XGBoosterSetParam(BoosterHandle handle,
@@ -294,14 +345,47 @@ XGB_DLL int XGBoosterEvalOneIter(BoosterHandle handle,
                                  DMatrixHandle dmats[],
                                  const char* evnames[],
                                  xgboost::bst_ulong len,
-                                 const char** out_str) {
+                                 int early_stopping_rounds,
+                                 uint8_t* nonce,
+                                 size_t nonce_size,
+                                 uint32_t nonce_ctr,
+                                 xgboost::bst_ulong* out_len,
+                                 const char*** out_result,
+                                 uint8_t** out_sig,
+                                 size_t *out_sig_length,
+                                 char **signers,
+                                 uint8_t* signatures[],
+                                 size_t* sig_lengths) {
   size_t handle_lengths[len];
   size_t name_lengths[len];
 
   get_str_lengths(dmats, len, handle_lengths);
   get_str_lengths((char**)evnames, len, name_lengths);
 
-  safe_ecall(enclave_XGBoosterEvalOneIter(Enclave::getInstance().getEnclave(), &Enclave::getInstance().enclave_ret, handle, iter, dmats, handle_lengths, evnames, name_lengths, len, (char**) out_str));
+  int NUM_CLIENTS = Enclave::getInstance().get_num_clients();
+  size_t signer_lengths[NUM_CLIENTS];
+  get_str_lengths(signers, NUM_CLIENTS, signer_lengths);
+
+  safe_ecall(enclave_XGBoosterEvalOneIter(Enclave::getInstance().getEnclave(), &Enclave::getInstance().enclave_ret, handle, iter, dmats, handle_lengths, evnames, name_lengths, len, early_stopping_rounds, nonce, nonce_size, nonce_ctr, out_len, (char***) out_result, out_sig, out_sig_length, signers, signer_lengths, signatures, sig_lengths, NUM_CLIENTS));
+}
+
+XGB_DLL int XGBoosterRunPlan(const char* plan,
+                             uint8_t* nonce,
+                             size_t nonce_size,
+                             uint32_t nonce_ctr,
+                             BoosterHandle* out,
+                             xgboost::bst_ulong* out_len,
+                             const char*** out_result,
+                             uint8_t** out_sig,
+                             size_t *out_sig_length,
+                             char **signers,
+                             uint8_t* signatures[],
+                             size_t* sig_lengths) {
+  int NUM_CLIENTS = Enclave::getInstance().get_num_clients();
+  size_t signer_lengths[NUM_CLIENTS];
+  get_str_lengths(signers, NUM_CLIENTS, signer_lengths);
+
+  safe_ecall(enclave_XGBoosterRunPlan(Enclave::getInstance().getEnclave(), &Enclave::getInstance().enclave_ret, plan, nonce, nonce_size, nonce_ctr, out, out_len, (char***) out_result, out_sig, out_sig_length, signers, signer_lengths, signatures, sig_lengths, NUM_CLIENTS));
 }
 
 XGB_DLL int XGBoosterPredict(BoosterHandle handle,
@@ -326,6 +410,43 @@ XGB_DLL int XGBoosterPredict(BoosterHandle handle,
     safe_ecall(enclave_XGBoosterPredict(Enclave::getInstance().getEnclave(), &Enclave::getInstance().enclave_ret, handle, dmat, option_mask, ntree_limit, training, nonce, nonce_size, nonce_ctr, len, out_result, out_sig, out_sig_length, signers, signer_lengths, signatures, sig_lengths, NUM_CLIENTS));
 }
 
+XGB_DLL int XGBoosterEnablePredictionService(BoosterHandle handle,
+                                             uint8_t *nonce,
+                                             size_t nonce_size,
+                                             uint32_t nonce_ctr,
+                                             uint8_t** out_sig,
+                                             size_t *out_sig_length,
+                                             char **signers,
+                                             uint8_t* signatures[],
+                                             size_t* sig_lengths) {
+  int NUM_CLIENTS = Enclave::getInstance().get_num_clients();
+  size_t signer_lengths[NUM_CLIENTS];
+  get_str_lengths(signers, NUM_CLIENTS, signer_lengths);
+
+  safe_ecall(enclave_XGBoosterEnablePredictionService(Enclave::getInstance().getEnclave(), &Enclave::getInstance().enclave_ret, handle, nonce, nonce_size, nonce_ctr, out_sig, out_sig_length, signers, signer_lengths, signatures, sig_lengths, NUM_CLIENTS));
+}
+
+XGB_DLL int XGBoosterPredictRows(BoosterHandle handle,
+                                 xgboost::bst_ulong num_requests,
+                                 char **usernames,
+                                 char **request_ids,
+                                 const xgboost::bst_ulong *num_rows,
+                                 xgboost::bst_ulong num_col,
+                                 const uint8_t *enc_rows,
+                                 size_t enc_rows_size,
+                                 int output_margin,
+                                 unsigned ntree_limit,
+                                 int *out_status,
+                                 xgboost::bst_ulong *out_len,
+                                 uint8_t **out_result) {
+  size_t username_lengths[num_requests];
+  size_t request_id_lengths[num_requests];
+  get_str_lengths(usernames, num_requests, username_lengths);
+  get_str_lengths(request_ids, num_requests, request_id_lengths);
+
+  safe_ecall(enclave_XGBoosterPredictRows(Enclave::getInstance().getEnclave(), &Enclave::getInstance().enclave_ret, handle, num_requests, usernames, username_lengths, request_ids, request_id_lengths, (xgboost::bst_ulong*) num_rows, num_col, (uint8_t*) enc_rows, enc_rows_size, output_margin, ntree_limit, out_status, out_len, out_result));
+}
+
 XGB_DLL int XGBoosterLoadModel(BoosterHandle handle, const char* fname, uint8_t* nonce, size_t nonce_size, uint32_t nonce_ctr, uint8_t** out_sig, size_t* out_sig_length, char** signers, uint8_t* signatures[], size_t* sig_lengths) {
   int NUM_CLIENTS = Enclave::getInstance().get_num_clients();
   size_t signer_lengths[NUM_CLIENTS];
@@ -342,6 +463,22 @@ XGB_DLL int XGBoosterSaveModel(BoosterHandle handle, const char* fname, uint8_t*
   safe_ecall(enclave_XGBoosterSaveModel(Enclave::getInstance().getEnclave(), &Enclave::getInstance().enclave_ret, handle, fname, nonce, nonce_size, nonce_ctr, out_sig, out_sig_length, signers, signer_lengths, signatures, sig_lengths, NUM_CLIENTS));
 }
 
+XGB_DLL int XGBoosterSaveCheckpoint(BoosterHandle handle, const char* fname, uint32_t version, uint8_t* nonce, size_t nonce_size, uint32_t nonce_ctr, uint8_t** out_sig, size_t* out_sig_length, char** signers, uint8_t* signatures[], size_t* sig_lengths) {
+  int NUM_CLIENTS = Enclave::getInstance().get_num_clients();
+  size_t signer_lengths[NUM_CLIENTS];
+  get_str_lengths(signers, NUM_CLIENTS, signer_lengths);
+
+  safe_ecall(enclave_XGBoosterSaveCheckpoint(Enclave::getInstance().getEnclave(), &Enclave::getInstance().enclave_ret, handle, fname, version, nonce, nonce_size, nonce_ctr, out_sig, out_sig_length, signers, signer_lengths, signatures, sig_lengths, NUM_CLIENTS));
+}
+
+XGB_DLL int XGBoosterLoadCheckpoint(BoosterHandle handle, const char* fname, uint8_t* nonce, size_t nonce_size, uint32_t nonce_ctr, uint32_t* out_version, uint8_t** out_sig, size_t* out_sig_length, char** signers, uint8_t* signatures[], size_t* sig_lengths) {
+  int NUM_CLIENTS = Enclave::getInstance().get_num_clients();
+  size_t signer_lengths[NUM_CLIENTS];
+  get_str_lengths(signers, NUM_CLIENTS, signer_lengths);
+
+  safe_ecall(enclave_XGBoosterLoadCheckpoint(Enclave::getInstance().getEnclave(), &Enclave::getInstance().enclave_ret, handle, fname, nonce, nonce_size, nonce_ctr, out_version, out_sig, out_sig_length, signers, signer_lengths, signatures, sig_lengths, NUM_CLIENTS));
+}
+
 XGB_DLL int XGBoosterLoadModelFromBuffer(BoosterHandle handle,
                                          const void* buf,
                                          xgboost::bst_ulong len,
@@ -462,6 +599,35 @@ XGB_DLL int XGBoosterDumpModelExWithFeatures(BoosterHandle handle,
     safe_ecall(enclave_XGBoosterDumpModelExWithFeatures(Enclave::getInstance().getEnclave(), &Enclave::getInstance().enclave_ret, handle, (unsigned int) fnum, fname, fname_lengths, ftype, ftype_lengths, with_stats, format, nonce, nonce_size, nonce_ctr, len, (char***) out_models, out_sig, out_sig_length, signers, signer_lengths, signatures, sig_lengths, NUM_CLIENTS));
 }
 
+XGB_DLL int XGBoosterDumpModelFramed(BoosterHandle handle,
+                                     const char* fmap,
+                                     int fnum,
+                                     const char** fname,
+                                     const char** ftype,
+                                     int with_stats,
+                                     const char *format,
+                                     uint8_t *nonce,
+                                     size_t nonce_size,
+                                     uint32_t nonce_ctr,
+                                     xgboost::bst_ulong* out_len,
+                                     uint8_t** out_dump,
+                                     uint8_t** out_sig,
+                                     size_t *out_sig_length,
+                                     char **signers,
+                                     uint8_t* signatures[],
+                                     size_t* sig_lengths) {
+    size_t fname_lengths[fnum];
+    size_t ftype_lengths[fnum];
+    int NUM_CLIENTS = Enclave::getInstance().get_num_clients();
+    size_t signer_lengths[NUM_CLIENTS];
+
+    get_str_lengths((char**)fname, fnum, fname_lengths);
+    get_str_lengths((char**)ftype, fnum, ftype_lengths);
+    get_str_lengths(signers, NUM_CLIENTS, signer_lengths);
+
+    safe_ecall(enclave_XGBoosterDumpModelFramed(Enclave::getInstance().getEnclave(), &Enclave::getInstance().enclave_ret, handle, fmap, (unsigned int) fnum, fname, fname_lengths, ftype, ftype_lengths, with_stats, format, nonce, nonce_size, nonce_ctr, out_len, out_dump, out_sig, out_sig_length, signers, signer_lengths, signatures, sig_lengths, NUM_CLIENTS));
+}
+
 
 XGB_DLL int XGBoosterGetAttr(BoosterHandle handle,
                      const char* key,
@@ -761,6 +927,10 @@ XGB_DLL int get_enclave_symm_key(char *username, uint8_t** out, size_t* out_size
   safe_ecall(enclave_get_enclave_symm_key(Enclave::getInstance().getEnclave(), &Enclave::getInstance().enclave_ret, username, out, out_size));
 }
 
+XGB_DLL int XGBResumeSession(char *username, char* challenge, uint32_t* out_nonce_ctr, uint8_t** out_sig, size_t* out_sig_length) {
+  safe_ecall(enclave_XGBResumeSession(Enclave::getInstance().getEnclave(), &Enclave::getInstance().enclave_ret, username, challenge, out_nonce_ctr, out_sig, out_sig_length));
+}
+
 XGB_DLL int verify_signature(uint8_t* pem_key, size_t key_size, uint8_t* data, size_t data_len, uint8_t* signature, size_t sig_len) {
   API_BEGIN();
   int res = -1;
@@ -872,6 +1042,33 @@ XGB_DLL int decrypt_predictions(char* key, uint8_t* encrypted_preds, size_t num_
     API_END();
 }
 
+XGB_DLL int decrypt_framed_dump(char* key, uint8_t* encrypted_dump, size_t len, uint8_t** out_dump) {
+    API_BEGIN();
+    unsigned char* iv = (unsigned char*)encrypted_dump;
+    unsigned char* tag = iv + CIPHER_IV_SIZE;
+    unsigned char* data = tag + CIPHER_TAG_SIZE;
+    unsigned char* output = (unsigned char*) malloc(len);
+
+    decrypt_symm(
+            (uint8_t*) key,
+            data,
+            len,
+            iv,
+            tag,
+            NULL,
+            0,
+            output);
+    *out_dump = output;
+    API_END();
+}
+
+XGB_DLL int free_buffer(void* buf) {
+  API_BEGIN();
+  // oe_host_malloc() in the enclave allocates with the host malloc()
+  free(buf);
+  API_END();
+}
+
 XGB_DLL int decrypt_enclave_key(char* key, uint8_t* encrypted_key, size_t len, uint8_t** out_key) {
   API_BEGIN();
   unsigned char* iv = (unsigned char*)encrypted_key;
@@ -892,6 +1089,53 @@ XGB_DLL int decrypt_enclave_key(char* key, uint8_t* encrypted_key, size_t len, u
   API_END();
 }
 
+XGB_DLL int encrypt_data_with_keybuf(char* key, uint8_t* data, size_t len, uint8_t** out_data) {
+  return encrypt_data_with_keybuf_and_aad(key, data, len, NULL, 0, out_data);
+}
+
+XGB_DLL int decrypt_data_with_keybuf(char* key, uint8_t* encrypted_data, size_t len, uint8_t** out_data) {
+  return decrypt_data_with_keybuf_and_aad(key, encrypted_data, len, NULL, 0, out_data);
+}
+
+XGB_DLL int encrypt_data_with_keybuf_and_aad(char* key, uint8_t* data, size_t len, uint8_t* aad, size_t aad_len, uint8_t** out_data) {
+  API_BEGIN();
+  unsigned char* output = (unsigned char*) malloc(CIPHER_IV_SIZE + CIPHER_TAG_SIZE + len);
+  unsigned char* iv = output;
+  unsigned char* tag = iv + CIPHER_IV_SIZE;
+
+  encrypt_symm(
+      (uint8_t*) key,
+      data,
+      len,
+      aad,
+      aad_len,
+      tag + CIPHER_TAG_SIZE,
+      iv,
+      tag);
+  *out_data = output;
+  API_END();
+}
+
+XGB_DLL int decrypt_data_with_keybuf_and_aad(char* key, uint8_t* encrypted_data, size_t len, uint8_t* aad, size_t aad_len, uint8_t** out_data) {
+  API_BEGIN();
+  unsigned char* iv = (unsigned char*)encrypted_data;
+  unsigned char* tag = iv + CIPHER_IV_SIZE;
+  unsigned char* data = tag + CIPHER_TAG_SIZE;
+  unsigned char* output = (unsigned char*) malloc(len);
+
+  decrypt_symm(
+      (uint8_t*) key,
+      data,
+      len,
+      iv,
+      tag,
+      aad,
+      aad_len,
+      output);
+  *out_data = output;
+  API_END();
+}
+
 XGB_DLL int decrypt_dump(char* key, char** models, xgboost::bst_ulong length) {
   API_BEGIN();
   mbedtls_gcm_context gcm;
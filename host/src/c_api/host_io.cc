@@ -0,0 +1,128 @@
+/*!
+ * Copyright 2020 by Secure XGBoost Contributors
+ * \file host_io.cc
+ * \brief Host side of the OCALLs the enclave uses for file I/O and logging.
+ *  Files are read in large chunks, and the chunk after the one handed to the
+ *  enclave is fetched by a host thread while the enclave decrypts and parses
+ *  the current one. Writes are buffered in the enclave and arrive in large
+ *  blocks. All of these OCALLs are switchless when the enclave is created
+ *  with switchless workers.
+ */
+#include <dmlc/logging.h>
+
+#include <cstdio>
+#include <future>
+#include <iostream>
+#include <vector>
+
+#ifdef __ENCLAVE_CONSENSUS__
+#include "xgboost_mc_u.h"
+#else
+#include "xgboost_u.h"
+#endif
+
+namespace {
+class HostFileReader {
+ public:
+  explicit HostFileReader(std::FILE* fp) : fp_(fp) {}
+
+  ~HostFileReader() {
+    Cancel();
+    std::fclose(fp_);
+  }
+
+  /*!
+   * \brief Return the next chunk of up to size bytes. The chunk stays valid
+   *  until the next call, and the following chunk is prefetched meanwhile.
+   */
+  size_t Next(size_t size, uint8_t** out) {
+    size_t nread;
+    if (pending_.valid() && pending_size_ == size) {
+      nread = pending_.get();
+      front_ = 1 - front_;
+    } else {
+      Cancel();
+      nread = ReadInto(front_, size);
+    }
+    pos_ += nread;
+    *out = buffers_[front_].data();
+    if (nread == size) {
+      const int back = 1 - front_;
+      pending_size_ = size;
+      pending_ = std::async(std::launch::async, [this, back, size]() {
+        return this->ReadInto(back, size);
+      });
+    }
+    return nread;
+  }
+
+  int Seek(size_t pos) {
+    Cancel();
+    pos_ = pos;
+    return std::fseek(fp_, static_cast<long>(pos), SEEK_SET);  // NOLINT(*)
+  }
+
+ private:
+  size_t ReadInto(int buffer, size_t size) {
+    buffers_[buffer].resize(size);
+    return std::fread(buffers_[buffer].data(), 1, size, fp_);
+  }
+
+  // Drop the prefetched chunk and rewind to the last position handed out
+  void Cancel() {
+    if (pending_.valid()) {
+      pending_.get();
+      CHECK(!std::fseek(fp_, static_cast<long>(pos_), SEEK_SET));  // NOLINT(*)
+    }
+  }
+
+  std::FILE* fp_;
+  /*! \brief file offset just past the last chunk handed to the enclave */
+  size_t pos_ {0};
+  std::vector<uint8_t> buffers_[2];
+  /*! \brief buffer holding the chunk handed to the enclave */
+  int front_ {0};
+  std::future<size_t> pending_;
+  size_t pending_size_ {0};
+};
+}  // anonymous namespace
+
+int host_FileReaderOpen(const char* fname, void** reader) {
+  std::FILE* fp = std::fopen(fname, "rb");
+  if (fp == nullptr) {
+    *reader = nullptr;
+    return -1;
+  }
+  *reader = new HostFileReader(fp);
+  return 0;
+}
+
+size_t host_FileReaderNext(void* reader, size_t size, uint8_t** buf) {
+  return static_cast<HostFileReader*>(reader)->Next(size, buf);
+}
+
+int host_FileReaderSeek(void* reader, size_t pos) {
+  return static_cast<HostFileReader*>(reader)->Seek(pos);
+}
+
+void host_FileReaderClose(void* reader) {
+  delete static_cast<HostFileReader*>(reader);
+}
+
+int host_FileWriterOpen(const char* fname, void** writer) {
+  std::FILE* fp = std::fopen(fname, "wb");
+  *writer = fp;
+  return fp == nullptr ? -1 : 0;
+}
+
+size_t host_FileWriterWrite(void* writer, const uint8_t* buf, size_t size) {
+  return std::fwrite(buf, 1, size, static_cast<std::FILE*>(writer));
+}
+
+void host_FileWriterClose(void* writer) {
+  std::fclose(static_cast<std::FILE*>(writer));
+}
+
+void host_XGBLog(const char* msg) {
+  std::cerr << msg << std::endl;
+}
@@ -42,6 +42,11 @@ class Stream {  // NOLINT(*)
    * \param size block size
    */
   virtual void Write(const void *ptr, size_t size) = 0;
+  /*!
+   * \brief writes out any data buffered by the stream, reporting an error
+   *  if it cannot be written. Streams that do not buffer do nothing.
+   */
+  virtual void Flush(void) {}
   /*! \brief virtual destructor */
   virtual ~Stream(void) {}
   /*!
@@ -250,14 +250,14 @@ static int verifySignature(mbedtls_pk_context pk, uint8_t* data, size_t data_len
   return ret;
 }
 
-static int sign_data(mbedtls_pk_context pk, uint8_t* data, size_t data_size, uint8_t* signature, size_t* sig_len) {
+// Sign a SHA-256 digest, for data that is hashed as it is produced
+static int sign_hash(mbedtls_pk_context pk, const uint8_t hash[SHA_DIGEST_SIZE], uint8_t* signature, size_t* sig_len) {
   mbedtls_entropy_context m_entropy_context;
   mbedtls_ctr_drbg_context m_ctr_drbg_context;
 
   mbedtls_entropy_init( &m_entropy_context );
   mbedtls_ctr_drbg_init( &m_ctr_drbg_context );
 
-  unsigned char hash[32];
   int ret = 1;
 
   ret = mbedtls_ctr_drbg_seed(&m_ctr_drbg_context, mbedtls_entropy_func, &m_entropy_context, NULL, 0);
@@ -268,13 +268,19 @@ static int sign_data(mbedtls_pk_context pk, uint8_t* data, size_t data_size, uin
 
   mbedtls_rsa_set_padding(mbedtls_pk_rsa(pk), MBEDTLS_RSA_PKCS_V21, MBEDTLS_MD_SHA256 );
 
-  if((ret = compute_sha256(data, data_size, hash)) != 0) {
-    LOG(FATAL) <<"signing failed -- could not hash";
-  }
-
   if((ret = mbedtls_pk_sign(&pk, MBEDTLS_MD_SHA256, hash, 0, signature, sig_len, mbedtls_ctr_drbg_random, &m_ctr_drbg_context)) != 0) {
     LOG(FATAL) <<"signing failed -- mbedtls_pk_sign returned " << ret;
   }
+  mbedtls_ctr_drbg_free( &m_ctr_drbg_context );
+  mbedtls_entropy_free( &m_entropy_context );
   return 0;
 }
+
+static int sign_data(mbedtls_pk_context pk, uint8_t* data, size_t data_size, uint8_t* signature, size_t* sig_len) {
+  unsigned char hash[SHA_DIGEST_SIZE];
+  if(compute_sha256(data, data_size, hash) != 0) {
+    LOG(FATAL) <<"signing failed -- could not hash";
+  }
+  return sign_hash(pk, hash, signature, sig_len);
+}
 #endif // CRYPTO_H_
@@ -4,6 +4,7 @@
 #ifndef ENCLAVE_H
 #define ENCLAVE_H
 #include <openenclave/host.h>
+#include <mutex>
 
 class Enclave {
     private:
@@ -20,6 +21,9 @@ class Enclave {
 
         oe_enclave_t* enclave_ref;
         int enclave_ret;
+        // Held for the duration of each ecall. The enclave runs one ecall at a
+        // time, and all ecalls return their status through enclave_ret.
+        std::mutex ecall_mutex;
 
         static Enclave& getInstance() {
             static Enclave instance;
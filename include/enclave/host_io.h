@@ -0,0 +1,35 @@
+/*!
+ * Copyright 2020 by Secure XGBoost Contributors
+ * \file host_io.h
+ * \brief Counters of the OCALLs the enclave makes to read files from host storage.
+ */
+#ifndef ENCLAVE_HOST_IO_H_
+#define ENCLAVE_HOST_IO_H_
+
+#include <cstddef>
+#include <cstdint>
+
+/*! \brief size of the chunks the enclave reads from host storage in one OCALL */
+#define HOST_READ_CHUNK_SIZE (16UL << 20UL)
+
+/*! \brief size of the buffer the enclave fills before writing to host storage */
+#define HOST_WRITE_BUFFER_SIZE (4UL << 20UL)
+
+/*! \brief host reads issued by the enclave since the last reset */
+struct HostReadStats {
+  /*! \brief number of OCALLs, including open, seek and close */
+  uint64_t ocalls;
+  /*! \brief number of bytes copied from host memory into the enclave */
+  uint64_t bytes;
+};
+
+/*! \brief reset the host read counters */
+void ResetHostReadStats();
+
+/*! \brief get the host read counters */
+HostReadStats GetHostReadStats();
+
+/*! \brief record one OCALL that transferred nbytes into the enclave */
+void RecordHostRead(size_t nbytes);
+
+#endif  // ENCLAVE_HOST_IO_H_
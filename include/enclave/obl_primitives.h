@@ -6,6 +6,7 @@
 #include <cstdint>
 #include <type_traits>
 #include <cstring>
+#include <vector>
 
 #ifdef USE_AVX2
 #include <intrinsics/immintrin.h>
@@ -51,6 +52,9 @@ inline void ObliviousMerge(Iter begin, Iter end, Comparator cmp);
 template <typename Iter, typename Comparator>
 inline void ObliviousSort(Iter begin, Iter end, Comparator cmp);
 
+template <typename Iter, typename IsDummy>
+inline size_t ObliviousCompact(Iter begin, Iter end, IsDummy is_dummy);
+
 template <typename T>
 inline T ObliviousArrayAccess(const T *arr, size_t i, size_t n);
 
@@ -66,6 +70,8 @@ inline void ObliviousArrayAssign(T *arr, size_t i, size_t n, const T &val);
 inline void ObliviousArrayAssignBytes(void *array, const void *src,
                                       size_t nbytes, size_t i, size_t n);
 
+inline size_t ObliviousCountLessOrEqual(const float *arr, size_t n, float val);
+
 // Impl.
 
 namespace obl {
@@ -391,6 +397,35 @@ inline void ObliviousArrayAssignBytes(void *array, const void *src,
   }
 }
 
+// Return the number of elements in arr[0, n) that are <= val. Every element is
+// compared regardless of val, so the running time only depends on n.
+inline size_t ObliviousCountLessOrEqual(const float *arr, size_t n, float val) {
+  size_t count = 0;
+  size_t j = 0;
+#ifdef USE_AVX2
+  // Compare 8 elements per instruction. A lane of the comparison mask is all
+  // ones (i.e. -1) when the predicate holds, so subtracting the mask from the
+  // accumulator counts matches per lane.
+  __m256 needle = _mm256_set1_ps(val);
+  __m256i acc = _mm256_setzero_si256();
+  for (; j + 8 <= n; j += 8) {
+    __m256 elems = _mm256_loadu_ps(arr + j);
+    __m256 mask = _mm256_cmp_ps(elems, needle, _CMP_LE_OQ);
+    acc = _mm256_sub_epi32(acc, _mm256_castps_si256(mask));
+  }
+  uint32_t lanes[8];
+  _mm256_storeu_si256((__m256i *)lanes, acc);
+  for (int k = 0; k < 8; ++k) {
+    count += lanes[k];
+  }
+#endif
+  // Take care of remaining elements
+  for (; j < n; ++j) {
+    count += ObliviousChoose<size_t>(val >= arr[j], 1, 0);
+  }
+  return count;
+}
+
 namespace detail {
 
 inline uint32_t greatest_power_of_two_less_than(uint32_t n) {
@@ -496,6 +531,37 @@ inline void ObliviousSort(Iter begin, Iter end, Comparator cmp) {
   return detail::o_sort<value_type, Comparator>(array, 0, end - begin, cmp);
 }
 
+// Move the elements for which is_dummy is false to the front, preserving their
+// order, and return their count. The content of the remaining slots is
+// unspecified. Every element is routed left by the number of dummies before it,
+// one bit of that distance per pass; processing the bits from least to most
+// significant never moves an element onto an occupied slot. The access pattern
+// only depends on end - begin.
+template <typename Iter, typename IsDummy>
+inline size_t ObliviousCompact(Iter begin, Iter end, IsDummy is_dummy) {
+  using value_type = typename std::remove_reference<decltype(*begin)>::type;
+  value_type *array = &(*begin);
+  const size_t n = end - begin;
+  std::vector<size_t> shift(n);
+  std::vector<uint8_t> dummy(n);
+  size_t ndummy = 0;
+  for (size_t i = 0; i < n; ++i) {
+    shift[i] = ndummy;
+    dummy[i] = is_dummy(array[i]);
+    ndummy += dummy[i];
+  }
+  for (size_t d = 1; d < n; d <<= 1) {
+    for (size_t i = d; i < n; ++i) {
+      bool move = !dummy[i] & ObliviousEqual(shift[i] & d, d);
+      ObliviousAssign(move, array[i], array[i - d], &array[i - d]);
+      shift[i - d] = ObliviousChoose(move, shift[i], shift[i - d]);
+      dummy[i - d] = ObliviousChoose<uint8_t>(move, 0, dummy[i - d]);
+      dummy[i] = ObliviousChoose<uint8_t>(move, 1, dummy[i]);
+    }
+  }
+  return n - ndummy;
+}
+
 namespace obl {
 
 template <typename T,
@@ -101,6 +101,34 @@ class IEngine {
                          const char* _file = _FILE,
                          const int _line = _LINE,
                          const char* _caller = _CALLER) = 0;
+  /*!
+   * \brief performs in-place reduce-scatter on sendrecvbuf
+   *        this function is NOT thread-safe
+   *  The buffer is split into one shard per worker, shard k being the elements
+   *  [shard_ptr[k], shard_ptr[k + 1]). On return, the shard of the current worker
+   *  holds the reduced result and the content of other shards is unspecified.
+   *  Engines without a dedicated implementation fall back to Allreduce.
+   * \param sendrecvbuf_ buffer for both sending and receiving data
+   * \param type_nbytes the number of bytes the type has
+   * \param count number of elements to be reduced
+   * \param shard_ptr world_size + 1 offsets of the shards, in elements,
+   *                  with shard_ptr[0] == 0 and shard_ptr[world_size] == count
+   * \param reducer reduce function
+   * \param _file caller file name used to generate unique cache key
+   * \param _line caller line number used to generate unique cache key
+   * \param _caller caller function name used to generate unique cache key
+   */
+  virtual void ReduceScatter(void *sendrecvbuf_,
+                             size_t type_nbytes,
+                             size_t count,
+                             const size_t *shard_ptr,
+                             ReduceFunction reducer,
+                             const char* _file = _FILE,
+                             const int _line = _LINE,
+                             const char* _caller = _CALLER) {
+    this->Allreduce(sendrecvbuf_, type_nbytes, count, reducer, NULL, NULL,
+                    _file, _line, _caller);
+  }
   /*!
    * \brief broadcasts data from root to every other node
    * \param sendrecvbuf_ buffer for both sending and receiving data
@@ -328,6 +356,23 @@ class ReduceHandle {
                  const char* _file = _FILE,
                  const int _line = _LINE,
                  const char* _caller = _CALLER);
+  /*!
+   * \brief customized in-place reduce-scatter operation
+   * \param sendrecvbuf the in place send-recv buffer
+   * \param type_nbytes size of the type, in bytes
+   * \param count number of elements to send
+   * \param shard_ptr world_size + 1 offsets of the shards, in elements
+   * \param _file caller file name used to generate unique cache key
+   * \param _line caller line number used to generate unique cache key
+   * \param _caller caller function name used to generate unique cache key
+   */
+  void ReduceScatter(void *sendrecvbuf,
+                     size_t type_nbytes,
+                     size_t count,
+                     const size_t *shard_ptr,
+                     const char* _file = _FILE,
+                     const int _line = _LINE,
+                     const char* _caller = _CALLER);
   /*! \return the number of bytes occupied by the type */
   static int TypeSize(const MPI::Datatype &dtype);
 
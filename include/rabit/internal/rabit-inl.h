@@ -296,6 +296,15 @@ inline void Reducer<DType, freduce>::Allreduce(DType *sendrecvbuf, size_t count,
   handle_.Allreduce(sendrecvbuf, sizeof(DType), count, prepare_fun,
     prepare_arg, _file, _line, _caller);
 }
+template<typename DType, void (*freduce)(DType &dst, const DType &src)> // NOLINT(*)
+inline void Reducer<DType, freduce>::ReduceScatter(DType *sendrecvbuf, size_t count,
+                                                   const size_t *shard_ptr,
+                                                   const char* _file,
+                                                   const int _line,
+                                                   const char* _caller) {
+  handle_.ReduceScatter(sendrecvbuf, sizeof(DType), count, shard_ptr,
+    _file, _line, _caller);
+}
 // function to perform reduction for SerializeReducer
 template<typename DType>
 inline void SerializeReducerFunc_(const void *src_, void *dst_,
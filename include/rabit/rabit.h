@@ -387,6 +387,22 @@ class Reducer {
                         const int _line = _LINE,
                         const char* _caller = _CALLER);
 #endif  // DMLC_USE_CXX11
+  /*!
+   * \brief customized in-place reduce-scatter operation. On return, the
+   *  elements [shard_ptr[rank], shard_ptr[rank + 1]) of sendrecvbuf hold the
+   *  reduced result, the content of the rest of the buffer is unspecified.
+   * \param sendrecvbuf the in place send-recv buffer
+   * \param count number of elements to be reduced
+   * \param shard_ptr world_size + 1 offsets of the shards of each worker
+   * \param _file caller file name used to generate unique cache key
+   * \param _line caller line number used to generate unique cache key
+   * \param _caller caller function name used to generate unique cache key
+   */
+  inline void ReduceScatter(DType *sendrecvbuf, size_t count,
+                            const size_t *shard_ptr,
+                            const char* _file = _FILE,
+                            const int _line = _LINE,
+                            const char* _caller = _CALLER);
 
  private:
   /*! \brief function handle to do reduce */
@@ -102,7 +102,23 @@ XGB_DLL const char *XGBGetLastError(void);
 XGB_DLL int XGBRegisterLogCallback(void (*callback)(const char*));
 
 #if defined(__HOST__)
-XGB_DLL int XGBCreateEnclave(const char *enclave_image, char** usernames, size_t num_clients, int log_verbosity);
+/*!
+ * \brief launch the enclave
+ * \param enclave_image path to the signed enclave image
+ * \param usernames names of the clients allowed to use the enclave
+ * \param num_clients number of clients
+ * \param log_verbosity verbosity of the enclave logger
+ * \param switchless_workers number of host threads that serve switchless
+ *        OCALLs for file I/O and logging, 0 to exit the enclave on every OCALL
+ * \param memory_limit bytes of enclave memory DMatrices and prediction caches may
+ *        hold before idle DMatrices are evicted, 0 for three quarters of the heap
+ * \param spill_dir directory on the host that evicted DMatrices are sealed to
+ * \param identity_key_path file on the host that the enclave identity key is sealed
+ *        to, so that a relaunched enclave reuses it instead of generating a new
+ *        one. Empty to generate a new key at every launch.
+ * \return 0 when success, -1 when failure happens
+ */
+XGB_DLL int XGBCreateEnclave(const char *enclave_image, char** usernames, size_t num_clients, int log_verbosity, int switchless_workers, size_t memory_limit, const char* spill_dir, const char* identity_key_path);
 #endif
 
 /*!
@@ -122,6 +138,8 @@ XGB_DLL int XGDMatrixCreateFromFile(const char *fname,
  * \brief load a data matrix from an encrypted file
  * \param fname the name of the encrypted file
  * \param silent whether print messages during loading
+ * \param cache_dir directory on the host where parsed matrices are cached,
+ *  sealed to the owners of the files; empty disables the cache
  * \param out a loaded data matrix
  * \return 0 when success, -1 when failure happens
  */
@@ -129,6 +147,7 @@ XGB_DLL int XGDMatrixCreateFromEncryptedFile(const char *fnames[],
     char* usernames[],
     bst_ulong num_files,
     int silent,
+    const char* cache_dir,
     DMatrixHandle *out);
 
 /*!
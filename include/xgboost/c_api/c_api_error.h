@@ -15,8 +15,6 @@
 /*! \brief every function starts with API_BEGIN();
      and finishes with API_END() or API_END_HANDLE_ERROR */
 #define API_END() } catch(dmlc::Error &_except_) { return XGBAPIHandleException(_except_); } return 0;  // NOLINT(*)
-#define CHECK_SEQUENCE_NUMBER() if (!EnclaveContext::getInstance().check_seq_num(nonce, nonce_ctr)) \
-      LOG(FATAL) << "Incorrect sequence number detected. Exiting.";
 #define CHECK_HANDLE() if (handle == nullptr) \
   LOG(FATAL) << "DMatrix/Booster has not been intialized or has already been disposed.";
 /*!
@@ -100,7 +100,23 @@ XGB_DLL const char *XGBGetLastError(void);
 XGB_DLL int XGBRegisterLogCallback(void (*callback)(const char*));
 
 #if defined(__HOST__)
-XGB_DLL int XGBCreateEnclave(const char *enclave_image, char** usernames, size_t num_clients, int log_verbosity);
+/*!
+ * \brief launch the enclave
+ * \param enclave_image path to the signed enclave image
+ * \param usernames names of the clients allowed to use the enclave
+ * \param num_clients number of clients
+ * \param log_verbosity verbosity of the enclave logger
+ * \param switchless_workers number of host threads that serve switchless
+ *        OCALLs for file I/O and logging, 0 to exit the enclave on every OCALL
+ * \param memory_limit bytes of enclave memory DMatrices and prediction caches may
+ *        hold before idle DMatrices are evicted, 0 for three quarters of the heap
+ * \param spill_dir directory on the host that evicted DMatrices are sealed to
+ * \param identity_key_path file on the host that the enclave identity key is sealed
+ *        to, so that a relaunched enclave reuses it instead of generating a new
+ *        one. Empty to generate a new key at every launch.
+ * \return 0 when success, -1 when failure happens
+ */
+XGB_DLL int XGBCreateEnclave(const char *enclave_image, char** usernames, size_t num_clients, int log_verbosity, int switchless_workers, size_t memory_limit, const char* spill_dir, const char* identity_key_path);
 #endif
 
 /*!
@@ -118,6 +134,8 @@ XGB_DLL int XGDMatrixCreateFromFile(const char *fname,
  * \brief load a data matrix from an encrypted file
  * \param fname the name of the encrypted file
  * \param silent whether print messages during loading
+ * \param cache_dir directory on the host where parsed matrices are cached,
+ *  sealed to the owners of the files; empty disables the cache
  * \param nonce nonce received from the enclave during initialization
  * \param nonce_size size in bytes of nonce
  * \param nonce_ctr incrementing counter used to indicate sequence number of API call
@@ -133,6 +151,7 @@ XGB_DLL int XGDMatrixCreateFromEncryptedFile(const char *fnames[],
                                              char* usernames[],
                                              bst_ulong num_files,
                                              int silent,
+                                             const char* cache_dir,
                                              uint8_t* nonce,
                                              size_t nonce_size,
                                              uint32_t nonce_ctr,
@@ -434,10 +453,28 @@ XGB_DLL int XGDMatrixSliceDMatrixEx(DMatrixHandle handle,
     int allow_groups);
 
 /*!
- * \brief free space in data matrix
+ * \brief free space in data matrix. Boosters created with the matrix as a
+ *  cache keep it alive until they are freed themselves.
+ * \param handle handle to be freed
+ * \param nonce nonce received from the enclave during initialization
+ * \param nonce_size size in bytes of nonce
+ * \param nonce_ctr incrementing counter used to indicate sequence number of API call
+ * \param out_sig signature over the output and nonce
+ * \param out_sig_length length of output signature
+ * \param signers list of usernames of signing clients
+ * \param signatures list of client signatures
+ * \param sig_lengths list of signature lengths
  * \return 0 when success, -1 when failure happens
  */
-XGB_DLL int XGDMatrixFree(DMatrixHandle handle);
+XGB_DLL int XGDMatrixFree(DMatrixHandle handle,
+                          uint8_t *nonce,
+                          size_t nonce_size,
+                          uint32_t nonce_ctr,
+                          uint8_t** out_sig,
+                          size_t *out_sig_length,
+                          char **signers,
+                          uint8_t* signatures[],
+                          size_t* sig_lengths);
 /*!
  * \brief load a data matrix into binary file
  * \param handle a instance of data matrix
@@ -595,11 +632,51 @@ XGB_DLL int XGBoosterCreate(const DMatrixHandle dmats[],
                             size_t* sig_lengths);
 
 /*!
- * \brief free obj in handle
+ * \brief free obj in handle, releasing the DMatrices it caches
  * \param handle handle to be freed
+ * \param nonce nonce received from the enclave during initialization
+ * \param nonce_size size in bytes of nonce
+ * \param nonce_ctr incrementing counter used to indicate sequence number of API call
+ * \param out_sig signature over the output and nonce
+ * \param out_sig_length length of output signature
+ * \param signers list of usernames of signing clients
+ * \param signatures list of client signatures
+ * \param sig_lengths list of signature lengths
  * \return 0 when success, -1 when failure happens
  */
-XGB_DLL int XGBoosterFree(BoosterHandle handle);
+XGB_DLL int XGBoosterFree(BoosterHandle handle,
+                          uint8_t *nonce,
+                          size_t nonce_size,
+                          uint32_t nonce_ctr,
+                          uint8_t** out_sig,
+                          size_t *out_sig_length,
+                          char **signers,
+                          uint8_t* signatures[],
+                          size_t* sig_lengths);
+
+/*!
+ * \brief get the enclave memory held by each DMatrix and booster, and the number
+ *        of DMatrices evicted to and reloaded from host storage
+ * \param nonce nonce received from the enclave during initialization
+ * \param nonce_size size in bytes of nonce
+ * \param nonce_ctr incrementing counter used to indicate sequence number of API call
+ * \param out_stats statistics as a JSON string
+ * \param out_sig signature over the output and nonce
+ * \param out_sig_length length of output signature
+ * \param signers list of usernames of signing clients
+ * \param signatures list of client signatures
+ * \param sig_lengths list of signature lengths
+ * \return 0 when success, -1 when failure happens
+ */
+XGB_DLL int XGBGetEnclaveMemoryStats(uint8_t *nonce,
+                                     size_t nonce_size,
+                                     uint32_t nonce_ctr,
+                                     char **out_stats,
+                                     uint8_t** out_sig,
+                                     size_t *out_sig_length,
+                                     char **signers,
+                                     uint8_t* signatures[],
+                                     size_t* sig_lengths);
 
 /*!
  * \brief set parameters
@@ -677,7 +754,21 @@ XGB_DLL int XGBoosterBoostOneIter(BoosterHandle handle,
  * \param dmats pointers to data to be evaluated
  * \param evnames pointers to names of each data
  * \param len length of dmats
- * \param out_result the string containing evaluation statistics
+ * \param early_stopping_rounds stop once the last metric of the last data has not
+ *    improved in this many rounds, tracked per booster inside the enclave; 0 disables it
+ * \param nonce nonce received from the enclave during initialization
+ * \param nonce_size size in bytes of nonce
+ * \param nonce_ctr incrementing counter used to indicate sequence number of API call
+ * \param out_len length of output array, equal to the number of clients plus one
+ * \param out_result for each client in sorted client order, the statistics of the
+ *    evaluated data it owns, encrypted with its key; the entry is empty for clients
+ *    that own none of dmats. The last entry is the early stopping decision,
+ *    "<best_iteration> <stop>", where best_iteration is -1 without early stopping
+ * \param out_sig signature over the output and nonce
+ * \param out_sig_length length of output signature
+ * \param signers list of usernames of signing clients
+ * \param signatures list of client signatures
+ * \param sig_lengths list of signature lengths
  * \return 0 when success, -1 when failure happens
  */
 XGB_DLL int XGBoosterEvalOneIter(BoosterHandle handle,
@@ -685,7 +776,52 @@ XGB_DLL int XGBoosterEvalOneIter(BoosterHandle handle,
                                  DMatrixHandle dmats[],
                                  const char *evnames[],
                                  bst_ulong len,
-                                 const char **out_result);
+                                 int early_stopping_rounds,
+                                 uint8_t *nonce,
+                                 size_t nonce_size,
+                                 uint32_t nonce_ctr,
+                                 bst_ulong *out_len,
+                                 const char ***out_result,
+                                 uint8_t** out_sig,
+                                 size_t *out_sig_length,
+                                 char **signers,
+                                 uint8_t* signatures[],
+                                 size_t* sig_lengths);
+
+/*!
+ * \brief run a plan signed by every client as a single command: create a
+ *  booster, train it, evaluate it every round and predict with it
+ * \param plan the plan as JSON, with fields params (list of name, value pairs),
+ *    dtrain (DMatrix handle), num_boost_round, evals (list of DMatrix handle,
+ *    name pairs) and predict (list of DMatrix handles)
+ * \param nonce nonce received from the enclave during initialization
+ * \param nonce_size size in bytes of nonce
+ * \param nonce_ctr incrementing counter used to indicate sequence number of API call
+ * \param out handle of the trained booster
+ * \param out_len length of output array, equal to the number of clients
+ * \param out_result result of the plan for each client as JSON, encrypted with the
+ *    key of the client, in sorted client order. It holds the evaluation log if the
+ *    client owns one of the evaluation sets, and the predictions on the matrices
+ *    the client owns.
+ * \param out_sig signature over the booster handle, the output and nonce
+ * \param out_sig_length length of output signature
+ * \param signers list of usernames of signing clients
+ * \param signatures list of client signatures
+ * \param sig_lengths list of signature lengths
+ * \return 0 when success, -1 when failure happens
+ */
+XGB_DLL int XGBoosterRunPlan(const char *plan,
+                             uint8_t *nonce,
+                             size_t nonce_size,
+                             uint32_t nonce_ctr,
+                             BoosterHandle *out,
+                             bst_ulong *out_len,
+                             const char ***out_result,
+                             uint8_t** out_sig,
+                             size_t *out_sig_length,
+                             char **signers,
+                             uint8_t* signatures[],
+                             size_t* sig_lengths);
 
 /*!
  * \brief make prediction based on dmat
@@ -726,6 +862,72 @@ XGB_DLL int XGBoosterPredict(BoosterHandle handle,
                              uint8_t* signatures[],
                              size_t* sig_lengths);
 
+/*!
+ * \brief allow every client to predict with the booster on rows it sends
+ *  with XGBoosterPredictRows, without the agreement of the other clients.
+ *  Setting a parameter or loading a model disables the service again.
+ * \param handle handle
+ * \param nonce nonce received from the enclave during initialization
+ * \param nonce_size size in bytes of nonce
+ * \param nonce_ctr incrementing counter used to indicate sequence number of API call
+ * \param out_sig signature over the output and nonce
+ * \param out_sig_length length of output signature
+ * \param signers list of usernames of signing clients
+ * \param signatures list of client signatures
+ * \param sig_lengths list of signature lengths
+ * \return 0 when success, -1 when failure happens
+ */
+XGB_DLL int XGBoosterEnablePredictionService(BoosterHandle handle,
+                                             uint8_t *nonce,
+                                             size_t nonce_size,
+                                             uint32_t nonce_ctr,
+                                             uint8_t** out_sig,
+                                             size_t *out_sig_length,
+                                             char **signers,
+                                             uint8_t* signatures[],
+                                             size_t* sig_lengths);
+
+/*!
+ * \brief predict with a booster on dense rows sent by one or more clients,
+ *  in a single call. The rows of each request are encrypted with the key of
+ *  the requesting client, laid out as IV | tag | ciphertext, with the additional
+ *  data "XGBoosterPredictRows handle <handle> request <request_id> num_rows <num_rows>
+ *  num_col <num_col> output_margin <output_margin> ntree_limit <ntree_limit>".
+ *  The predictions of each request are encrypted with the same key and the
+ *  additional data "XGBoosterPredictRows handle <handle> request <request_id> result".
+ *  A request that fails authentication is dropped without failing the others.
+ * \param handle handle of a booster with the prediction service enabled
+ * \param num_requests number of requests
+ * \param usernames requesting client of each request
+ * \param request_ids identifier chosen by the client for each request
+ * \param num_rows number of rows in each request
+ * \param num_col number of columns of every row, NaN marks a missing value
+ * \param enc_rows encrypted rows of every request, one after the other
+ * \param enc_rows_size size in bytes of enc_rows
+ * \param output_margin whether to output the raw untransformed margin value
+ * \param ntree_limit limit number of boosting rounds used for prediction,
+ *    when the parameter is set to 0, we will use all the trees
+ * \param out_status set to 0 for each request that was predicted, and to -1 for
+ *    each request that was dropped
+ * \param out_len used to store the total number of predictions
+ * \param out_result encrypted predictions of every predicted request, one after
+ *    the other. The buffer is freed with free_buffer
+ * \return 0 when success, -1 when failure happens
+ */
+XGB_DLL int XGBoosterPredictRows(BoosterHandle handle,
+                                 bst_ulong num_requests,
+                                 char **usernames,
+                                 char **request_ids,
+                                 const bst_ulong *num_rows,
+                                 bst_ulong num_col,
+                                 const uint8_t *enc_rows,
+                                 size_t enc_rows_size,
+                                 int output_margin,
+                                 unsigned ntree_limit,
+                                 int *out_status,
+                                 bst_ulong *out_len,
+                                 uint8_t **out_result);
+
 /*!
  * \brief load model from existing file
  * \param handle handle
@@ -776,6 +978,65 @@ XGB_DLL int XGBoosterSaveModel(BoosterHandle handle,
                                uint8_t* signatures[],
                                size_t* sig_lengths);
 
+/*!
+ * \brief save a training checkpoint of the booster to host storage. The
+ *  model is sealed with AES-GCM under a key derived from the keys of all
+ *  clients, so that it can be resumed by a restarted cluster once the clients
+ *  have provisioned their keys again. Each worker writes its own copy and
+ *  alternates between two files, fname.rank<rank>.<version % 2>.
+ * \param handle handle
+ * \param fname prefix of the checkpoint files
+ * \param version number of boosting rounds completed, must be positive
+ * \param nonce nonce received from the enclave during initialization
+ * \param nonce_size size in bytes of nonce
+ * \param nonce_ctr incrementing counter used to indicate sequence number of API call
+ * \param out_sig signature over the output and nonce
+ * \param out_sig_length length of output signature
+ * \param signers list of usernames of signing clients
+ * \param signatures list of client signatures
+ * \param sig_lengths list of signature lengths
+ * \return 0 when success, -1 when failure happens
+ */
+XGB_DLL int XGBoosterSaveCheckpoint(BoosterHandle handle,
+                                    const char *fname,
+                                    uint32_t version,
+                                    uint8_t *nonce,
+                                    size_t nonce_size,
+                                    uint32_t nonce_ctr,
+                                    uint8_t** out_sig,
+                                    size_t *out_sig_length,
+                                    char** signers,
+                                    uint8_t* signatures[],
+                                    size_t* sig_lengths);
+
+/*!
+ * \brief load the latest training checkpoint that every worker holds
+ * \param handle handle
+ * \param fname prefix of the checkpoint files
+ * \param nonce nonce received from the enclave during initialization
+ * \param nonce_size size in bytes of nonce
+ * \param nonce_ctr incrementing counter used to indicate sequence number of API call
+ * \param out_version number of boosting rounds in the loaded checkpoint,
+ *        0 if there is no checkpoint and the booster is left untouched
+ * \param out_sig signature over the output and nonce
+ * \param out_sig_length length of output signature
+ * \param signers list of usernames of signing clients
+ * \param signatures list of client signatures
+ * \param sig_lengths list of signature lengths
+ * \return 0 when success, -1 when failure happens
+ */
+XGB_DLL int XGBoosterLoadCheckpoint(BoosterHandle handle,
+                                    const char *fname,
+                                    uint8_t *nonce,
+                                    size_t nonce_size,
+                                    uint32_t nonce_ctr,
+                                    uint32_t *out_version,
+                                    uint8_t** out_sig,
+                                    size_t *out_sig_length,
+                                    char** signers,
+                                    uint8_t* signatures[],
+                                    size_t* sig_lengths);
+
 /*!
  * \brief load model from in memory buffer
  * \param handle handle
@@ -952,6 +1213,50 @@ XGB_DLL int XGBoosterDumpModelExWithFeatures(BoosterHandle handle,
                                              uint8_t* signatures[],
                                              size_t* sig_lengths);
 
+/*!
+ * \brief dump model as a single encrypted blob. The trees are dumped in
+ *  parallel and framed as
+ *
+ *    number of trees n (uint64_t) | n + 1 offsets into the payload (uint64_t) | payload
+ *
+ *  which is encrypted once, laid out as IV | tag | ciphertext.
+ * \param handle handle
+ * \param fmap name to fmap can be empty string, used if fnum is 0
+ * \param fnum number of features
+ * \param fname names of features
+ * \param ftype types of features
+ * \param with_stats whether to dump with statistics
+ * \param format the format to dump the model in
+ * \param nonce nonce received from the enclave during initialization
+ * \param nonce_size size in bytes of nonce
+ * \param nonce_ctr incrementing counter used to indicate sequence number of API call
+ * \param out_len length of the encrypted dump in bytes
+ * \param out_dump encrypted dump
+ * \param out_sig signature over the output and nonce
+ * \param out_sig_length length of output signature
+ * \param signers list of usernames of signing clients
+ * \param signatures list of client signatures
+ * \param sig_lengths list of signature lengths
+ * \return 0 when success, -1 when failure happens
+ */
+XGB_DLL int XGBoosterDumpModelFramed(BoosterHandle handle,
+                                     const char *fmap,
+                                     int fnum,
+                                     const char **fname,
+                                     const char **ftype,
+                                     int with_stats,
+                                     const char *format,
+                                     uint8_t *nonce,
+                                     size_t nonce_size,
+                                     uint32_t nonce_ctr,
+                                     bst_ulong *out_len,
+                                     uint8_t **out_dump,
+                                     uint8_t** out_sig,
+                                     size_t *out_sig_length,
+                                     char **signers,
+                                     uint8_t* signatures[],
+                                     size_t* sig_lengths);
+
 /*!
  * \brief Get string attribute from Booster.
  * \param handle handle
@@ -1053,6 +1358,52 @@ XGB_DLL int get_enclave_symm_key(
     uint8_t** out,
     size_t* out_size);
 
+/*!
+ * \brief resume the session of a client that attested this enclave instance
+ *  before, so that a restarted client can skip attestation and key exchange
+ * \param username name of the client, which must have provisioned its key
+ * \param challenge fresh value chosen by the client, signed with the output
+ *        so that an earlier response cannot be replayed
+ * \param out_nonce_ctr the current sequence number of the session
+ * \param out_sig signature over the challenge, session nonce and sequence number
+ * \param out_sig_length length of output signature
+ * \return 0 when success, -1 when failure happens
+ */
+XGB_DLL int XGBResumeSession(
+    char* username,
+    char* challenge,
+    uint32_t* out_nonce_ctr,
+    uint8_t** out_sig,
+    size_t* out_sig_length);
+
+XGB_DLL int encrypt_data_with_keybuf(
+    char* key,
+    uint8_t* data,
+    size_t len,
+    uint8_t** out_data);
+
+XGB_DLL int decrypt_data_with_keybuf(
+    char* key,
+    uint8_t* encrypted_data,
+    size_t len,
+    uint8_t** out_data);
+
+XGB_DLL int encrypt_data_with_keybuf_and_aad(
+    char* key,
+    uint8_t* data,
+    size_t len,
+    uint8_t* aad,
+    size_t aad_len,
+    uint8_t** out_data);
+
+XGB_DLL int decrypt_data_with_keybuf_and_aad(
+    char* key,
+    uint8_t* encrypted_data,
+    size_t len,
+    uint8_t* aad,
+    size_t aad_len,
+    uint8_t** out_data);
+
 XGB_DLL int encrypt_data_with_pk(
     char* data,
     size_t len,
@@ -1082,6 +1433,18 @@ XGB_DLL int decrypt_predictions(
     size_t preds_len,
     bst_float** preds);
 
+XGB_DLL int decrypt_framed_dump(
+    char* key,
+    uint8_t* encrypted_dump,
+    size_t len,
+    uint8_t** out_dump);
+
+/*!
+ * \brief free a buffer that the host library or the enclave allocated on the
+ *  host and returned to the caller
+ */
+XGB_DLL int free_buffer(void* buf);
+
 XGB_DLL int decrypt_enclave_key(
     char* key,
     uint8_t* encrypted_key,
@@ -16,7 +16,10 @@
 #include <xgboost/span.h>
 #include <xgboost/host_device_vector.h>
 
+#include <functional>
+#include <map>
 #include <memory>
+#include <mutex>
 #include <numeric>
 #include <algorithm>
 #include <string>
@@ -148,6 +151,8 @@ class MetaInfo {
   }
   /*! \brief clear all the information */
   void Clear();
+  /*! \return estimation of memory cost of the meta info */
+  size_t MemCostBytes() const;
   /*!
    * \brief Load the Meta info from binary stream.
    * \param fi The input stream
@@ -464,6 +469,13 @@ class BatchSet {
 
 struct XGBAPIThreadLocalEntry;
 
+/*! \brief matrix derived from a DMatrix, see DMatrix::GetDerivedMatrix */
+struct DerivedMatrix {
+  std::shared_ptr<void> matrix;
+  /*! \brief estimation of the memory held by the matrix */
+  size_t bytes;
+};
+
 /*!
  * \brief Internal data structured used by XGBoost during training.
  */
@@ -505,6 +517,29 @@ class DMatrix {
     return Info().num_nonzero_ == Info().num_row_ * Info().num_col_;
   }
 
+  /*!
+   * \brief Get a matrix derived from this one, such as the quantized matrix of
+   *  the hist updater, building it with |build| on first use. Derived matrices
+   *  are keyed by the parameters they were built with, shared read-only by every
+   *  booster trained on this DMatrix and freed with it. Boosters asking for a
+   *  matrix at the same time wait for a single build.
+   */
+  std::shared_ptr<void> GetDerivedMatrix(const std::string& key,
+                                         const std::function<DerivedMatrix()>& build) {
+    std::lock_guard<std::mutex> guard(derived_mutex_);
+    auto it = derived_matrices_.find(key);
+    if (it == derived_matrices_.end()) {
+      it = derived_matrices_.emplace(key, build()).first;
+    }
+    return it->second.matrix;
+  }
+
+  /*!
+   * \brief Estimation of the memory held by the matrix, including its derived
+   *  matrices. Pages of external memory matrices that live on disk are not counted.
+   */
+  virtual size_t MemCostBytes() const;
+
   /*!
    * \brief Load DMatrix from URI.
    * \param uri The URI of input.
@@ -594,6 +629,11 @@ class DMatrix {
 
   virtual bool EllpackExists() const = 0;
   virtual bool SparsePageExists() const = 0;
+
+ private:
+  std::map<std::string, DerivedMatrix> derived_matrices_;
+  /*! \brief guards derived_matrices_ */
+  mutable std::mutex derived_mutex_;
 };
 
 template<>
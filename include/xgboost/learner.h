@@ -208,6 +208,10 @@ class Learner : public Model, public Configurable, public rabit::Serializable {
                                              std::string format) = 0;
 
   virtual XGBAPIThreadLocalEntry& GetThreadLocal() const = 0;
+  /*! \return estimation of memory cost of the model, from its serialized size */
+  virtual size_t ModelMemCostBytes() const = 0;
+  /*! \return memory cost of the cached predictions and of the prediction buffer */
+  virtual size_t PredictionCacheMemCostBytes() const = 0;
   /*!
    * \brief Create a new instance of learner.
    * \param cache_data The matrix to cache the prediction.
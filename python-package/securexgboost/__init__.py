@@ -10,10 +10,10 @@ import os
 
 from .core import DMatrix, Booster
 from .core import generate_client_key, encrypt_file
-from .core import init_client, init_server, attest
+from .core import init_client, init_server, attest, get_enclave_memory_stats, run_plan
 from .training import train #, cv
 from . import rabit                   # noqa
-from .remote_server import serve
+from .remote_server import serve, serve_async
 try:
     from .sklearn import XGBModel, XGBClassifier, XGBRegressor, XGBRanker
     from .sklearn import XGBRFClassifier, XGBRFRegressor
@@ -27,7 +27,7 @@ with open(VERSION_FILE) as f:
 
 __all__ = ['DMatrix', 'Booster',
            'train', 'cv', 'init_client', 'attest',
-           'init_server', 'serve',
+           'init_server', 'serve', 'serve_async', 'get_enclave_memory_stats', 'run_plan',
            'generate_client_key', 'encrypt_file',
            'XGBModel', 'XGBClassifier', 'XGBRegressor', 'XGBRanker',
            'XGBRFClassifier', 'XGBRFRegressor',
@@ -209,14 +209,16 @@ def early_stop(stopping_rounds, maximize=False, verbose=True):
         else:
             state['best_score'] = float('inf')
 
+        # Booster attributes are not exposed by the enclave, so the best round
+        # is kept on the Python object
         if bst is not None:
-            if bst.attr('best_score') is not None:
-                state['best_score'] = float(bst.attr('best_score'))
-                state['best_iteration'] = int(bst.attr('best_iteration'))
-                state['best_msg'] = bst.attr('best_msg')
+            if getattr(bst, 'best_score', None) is not None:
+                state['best_score'] = bst.best_score
+                state['best_iteration'] = bst.best_iteration
+                state['best_msg'] = bst.best_msg
             else:
-                bst.set_attr(best_iteration=str(state['best_iteration']))
-                bst.set_attr(best_score=str(state['best_score']))
+                bst.best_iteration = state['best_iteration']
+                bst.best_score = state['best_score']
         else:
             assert env.cvfolds is not None
 
@@ -236,11 +238,10 @@ def early_stop(stopping_rounds, maximize=False, verbose=True):
             state['best_msg'] = msg
             state['best_score'] = score
             state['best_iteration'] = env.iteration
-            # save the property to attributes, so they will occur in checkpoint.
             if env.model is not None:
-                env.model.set_attr(best_score=str(state['best_score']),
-                                   best_iteration=str(state['best_iteration']),
-                                   best_msg=state['best_msg'])
+                env.model.best_score = state['best_score']
+                env.model.best_iteration = state['best_iteration']
+                env.model.best_msg = state['best_msg']
         elif env.iteration - best_iteration >= stopping_rounds:
             best_msg = state['best_msg']
             if verbose and env.rank == 0:
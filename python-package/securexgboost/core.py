@@ -3,6 +3,7 @@
 # pylint: disable=too-many-branches, too-many-lines, too-many-locals
 """Core XGBoost Library."""
 from __future__ import absolute_import
+import base64
 import collections
 # pylint: disable=no-name-in-module,import-error
 try:
@@ -11,16 +12,21 @@ except ImportError:
     from collections import Mapping  # Python 2
 # pylint: enable=no-name-in-module,import-error
 import ctypes
+import json
 import os
 import re
+import struct
 import sys
+import tempfile
+import threading
 import warnings
 import configparser
+from concurrent.futures import ThreadPoolExecutor
 
 import grpc
 from .rpc import remote_pb2
 from .rpc import remote_pb2_grpc
-from rpc_utils import CIPHER_IV_SIZE, CIPHER_TAG_SIZE, CIPHER_NONCE_SIZE
+from rpc_utils import CIPHER_KEY_SIZE, CIPHER_IV_SIZE, CIPHER_TAG_SIZE, CIPHER_NONCE_SIZE
 
 import numpy as np
 from numproto import ndarray_to_proto, proto_to_ndarray
@@ -170,6 +176,14 @@ _LIB = _load_lib()
 # user and enclave configuration information
 _CONF = {}
 
+# Every command takes the next sequence number of the session when it is
+# signed, and keeps it in thread-local storage until its output is verified,
+# so that independent commands can be issued from several threads at once.
+# The enclave accepts each sequence number once, in any order, within a
+# window of recent sequence numbers.
+_NONCE_LOCK = threading.Lock()
+_COMMAND = threading.local()
+
 def _check_remote_call(ret):
     """check the return value of c api call
 
@@ -399,14 +413,89 @@ def add_to_sig_data(arr, pos=0, data=None, data_size=0):
 
 def add_nonce_to_sig_data(arr, pos=0):
     ctypes.memmove(ctypes.byref(arr, pos), _CONF["nonce"], 12)
-    ctypes.memmove(ctypes.byref(arr, pos + 12), _CONF["nonce_ctr"].to_bytes(4, 'big'), 4)
+    ctypes.memmove(ctypes.byref(arr, pos + 12), _command_nonce_ctr().to_bytes(4, 'big'), 4)
     return arr
 
+def _allocate_nonce_ctr():
+    """
+    Take the next sequence number of the session for a command issued by this thread
+    """
+    with _NONCE_LOCK:
+        nonce_ctr = _CONF["nonce_ctr"]
+        _CONF["nonce_ctr"] = nonce_ctr + 1
+    _COMMAND.nonce_ctr = nonce_ctr
+    return nonce_ctr
+
+def _command_nonce_ctr():
+    """
+    Sequence number of the command being issued by this thread
+    """
+    return _COMMAND.nonce_ctr
+
 def get_seq_num_proto():
     return remote_pb2.SequenceNumber(
                             nonce=pointer_to_proto(_CONF["nonce"], _CONF["nonce_size"].value),
                             nonce_size=_CONF["nonce_size"].value,
-                            nonce_ctr=_CONF["nonce_ctr"])
+                            nonce_ctr=_command_nonce_ctr())
+
+def _handle_command(api_name, handle):
+    """
+    Run a signed XGDMatrixFree, XGBoosterFree or XGBoosterEnablePredictionService
+    call on the DMatrix or Booster behind `handle` in the enclave
+    """
+    # Finalizers run this while a command of the same thread may be between
+    # signing and verifying its output, so that command's sequence number is restored
+    outer_nonce_ctr = getattr(_COMMAND, "nonce_ctr", None)
+    try:
+        args = "{} handle {}".format(api_name, handle.value.decode('utf-8'))
+        sig, sig_len = create_client_signature(args)
+
+        out_sig = ctypes.POINTER(ctypes.c_uint8)()
+        out_sig_length = c_bst_ulong()
+
+        channel_addr = _CONF["remote_addr"]
+        if channel_addr:
+            with grpc.insecure_channel(channel_addr) as channel:
+                stub = remote_pb2_grpc.RemoteStub(channel)
+                name_proto = remote_pb2.NameRequestParams(name=handle.value)
+                seq_num = get_seq_num_proto()
+                if api_name == "XGDMatrixFree":
+                    rpc, request = stub.rpc_XGDMatrixFree, remote_pb2.DMatrixFreeRequest
+                elif api_name == "XGBoosterFree":
+                    rpc, request = stub.rpc_XGBoosterFree, remote_pb2.BoosterFreeRequest
+                else:
+                    rpc, request = stub.rpc_XGBoosterEnablePredictionService, remote_pb2.PredictionServiceRequest
+                response = _check_remote_call(rpc(request(params=name_proto, seq_num=seq_num, username=_CONF["current_user"],
+                                                          signature=sig, sig_len=sig_len)))
+                out_sig = proto_to_pointer(response.signature)
+                out_sig_length = c_bst_ulong(response.sig_len)
+        else:
+            c_signatures, c_lengths = py2c_sigs([sig], [sig_len])
+            signers = from_pystr_to_cstr([_CONF["current_user"]])
+            _check_call(getattr(_LIB, api_name)(handle,
+                                                _CONF["nonce"],
+                                                _CONF["nonce_size"],
+                                                ctypes.c_uint32(_command_nonce_ctr()),
+                                                ctypes.byref(out_sig),
+                                                ctypes.byref(out_sig_length),
+                                                signers,
+                                                c_signatures,
+                                                c_lengths))
+
+        verify_enclave_signature("", 0, out_sig, out_sig_length)
+    finally:
+        if outer_nonce_ctr is not None:
+            _COMMAND.nonce_ctr = outer_nonce_ctr
+
+
+def _free_on_del():
+    """
+    Whether handles are freed when their Python objects are garbage collected.
+    With several users every party must sign the same free at the same sequence
+    number, which garbage collection cannot guarantee, so handles are then only
+    freed explicitly.
+    """
+    return "nonce" in _CONF and len(_CONF.get("client_list", [])) == 1
 
 
 class DMatrix(object):
@@ -425,7 +514,7 @@ class DMatrix(object):
 
     # TODO(rishabh): Enable disabled arguments: `label`, `weight`
     def __init__(self, data_dict, encrypted=True, silent=False,
-            feature_names=None, feature_types=None): 
+            feature_names=None, feature_types=None, cache_dir=None): 
         """
         Parameters
         ----------
@@ -435,6 +524,9 @@ class DMatrix(object):
             Whether data is encrypted
         silent : bool, optional
             Whether to print messages during construction
+        cache_dir : str, optional
+            Directory in the cloud where the enclave caches the parsed data, sealed to the data owners.
+            Later loads of the same encrypted files read the cache instead of parsing the files again.
         feature_names : list, optional
             Set names for features.
         feature_types : list, optional
@@ -523,7 +615,8 @@ class DMatrix(object):
                 args = "XGDMatrixCreateFromEncryptedFile"
                 for username, filename in zip(usernames, data):
                     args = args + " username {} filename {}".format(username, filename)
-                args = args + " silent {}".format(int(silent))
+                cache_dir = os.path.normpath(cache_dir) if cache_dir else ""
+                args = args + " silent {} cache_dir {}".format(int(silent), cache_dir)
                 sig, sig_len = create_client_signature(args)
 
                 out_sig = ctypes.POINTER(ctypes.c_uint8)()
@@ -536,7 +629,8 @@ class DMatrix(object):
                         dmatrix_attrs = remote_pb2.DMatrixAttrs(
                             filenames=data,
                             usernames=usernames,
-                            silent=silent)
+                            silent=silent,
+                            cache_dir=cache_dir)
                         seq_num = get_seq_num_proto() 
                         response = _check_remote_call(stub.rpc_XGDMatrixCreateFromEncryptedFile(remote_pb2.DMatrixAttrsRequest(params=dmatrix_attrs,
                                                                                                                                 seq_num=seq_num,
@@ -554,11 +648,12 @@ class DMatrix(object):
                     usrs = from_pystr_to_cstr(usernames)
                     nonce = _CONF["nonce"]
                     nonce_size = _CONF["nonce_size"]
-                    nonce_ctr = _CONF["nonce_ctr"]
+                    nonce_ctr = _command_nonce_ctr()
                     _check_call(_LIB.XGDMatrixCreateFromEncryptedFile(filenames,
                         usrs,
                         c_bst_ulong(len(data)),
                         ctypes.c_int(silent),
+                        c_str(cache_dir),
                         nonce,
                         nonce_size,
                         ctypes.c_uint32(nonce_ctr),
@@ -711,10 +806,30 @@ class DMatrix(object):
     #         nthread))
     #     self.handle = handle
 
+    def free(self):
+        """Free the DMatrix in the enclave.
+
+        Boosters that were created with this DMatrix keep it alive in the
+        enclave until they are freed themselves. In a session with several
+        users, every user must free the DMatrix.
+        """
+        if self.handle is not None:
+            handle, self.handle = self.handle, None
+            _handle_command("XGDMatrixFree", handle)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.free()
+
     def __del__(self):
         if hasattr(self, "handle") and self.handle is not None:
-            # FIXME free matrix after use using RPC
-            # _check_call(_LIB.XGDMatrixFree(self.handle))
+            if _free_on_del():
+                try:
+                    self.free()
+                except Exception:  # pylint: disable=broad-except
+                    pass
             self.handle = None
 
     # TODO(rishabh): Enable this API with encryption
@@ -1003,7 +1118,7 @@ class DMatrix(object):
             _check_call(_LIB.XGDMatrixNumRow(self.handle,
                                              _CONF["nonce"],
                                              _CONF["nonce_size"],
-                                             ctypes.c_uint32(_CONF["nonce_ctr"]),
+                                             ctypes.c_uint32(_command_nonce_ctr()),
                                              ctypes.byref(ret),
                                              ctypes.byref(out_sig),
                                              ctypes.byref(out_sig_length),
@@ -1049,7 +1164,7 @@ class DMatrix(object):
             _check_call(_LIB.XGDMatrixNumCol(self.handle,
                                              _CONF["nonce"],
                                              _CONF["nonce_size"],
-                                             ctypes.c_uint32(_CONF["nonce_ctr"]),
+                                             ctypes.c_uint32(_command_nonce_ctr()),
                                              ctypes.byref(ret),
                                              ctypes.byref(out_sig),
                                              ctypes.byref(out_sig_length),
@@ -1233,7 +1348,7 @@ class Booster(object):
             dmats = c_array(ctypes.c_char_p, [d.handle for d in cache])
             self.handle = ctypes.c_char_p()
             _check_call(_LIB.XGBoosterCreate(dmats, c_bst_ulong(len(cache)),
-                                             _CONF["nonce"], _CONF["nonce_size"], ctypes.c_uint32(_CONF["nonce_ctr"]),
+                                             _CONF["nonce"], _CONF["nonce_size"], ctypes.c_uint32(_command_nonce_ctr()),
                                              ctypes.byref(self.handle),
                                              ctypes.byref(out_sig),
                                              ctypes.byref(out_sig_length),
@@ -1253,10 +1368,28 @@ class Booster(object):
         if model_file is not None:
             self.load_model(model_file)
 
+    def free(self):
+        """Free the Booster in the enclave, together with the references it
+        holds to its cache DMatrices. In a session with several users, every
+        user must free the Booster.
+        """
+        if self.handle is not None:
+            handle, self.handle = self.handle, None
+            _handle_command("XGBoosterFree", handle)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.free()
+
     def __del__(self):
         if hasattr(self, "handle") and self.handle is not None:
-            # FIXME free booster after use using RPC
-            # _check_call(_LIB.XGBoosterFree(self.handle))
+            if _free_on_del():
+                try:
+                    self.free()
+                except Exception:  # pylint: disable=broad-except
+                    pass
             self.handle = None
 
     # TODO(rishabh): Add pickling support (two methods below)
@@ -1414,7 +1547,7 @@ class Booster(object):
                 c_signatures, c_sig_lengths = py2c_sigs([sig], [sig_len])
                 signers = from_pystr_to_cstr([_CONF["current_user"]])
                 _check_call(_LIB.XGBoosterSetParam(self.handle, c_str(key), c_str(str(val)), 
-                                                    _CONF["nonce"], _CONF["nonce_size"], ctypes.c_uint32(_CONF["nonce_ctr"]), 
+                                                    _CONF["nonce"], _CONF["nonce_size"], ctypes.c_uint32(_command_nonce_ctr()), 
                                                     ctypes.byref(out_sig),
                                                     ctypes.byref(out_sig_length),
                                                     signers, c_signatures, c_sig_lengths))
@@ -1462,7 +1595,7 @@ class Booster(object):
                 c_signatures, c_lengths = py2c_sigs([sig], [sig_len])
                 signers = from_pystr_to_cstr([_CONF["current_user"]])
                 _check_call(_LIB.XGBoosterUpdateOneIter(self.handle, ctypes.c_int(iteration), dtrain.handle, 
-                                                        _CONF["nonce"], _CONF["nonce_size"], ctypes.c_uint32(_CONF["nonce_ctr"]),
+                                                        _CONF["nonce"], _CONF["nonce_size"], ctypes.c_uint32(_command_nonce_ctr()),
                                                         
                                                         ctypes.byref(out_sig),
                                                         ctypes.byref(out_sig_length),
@@ -1502,73 +1635,160 @@ class Booster(object):
     #                                            c_array(ctypes.c_float, hess),
     #                                            c_bst_ulong(len(grad))))
 
-    # TODO(rishabh): Enable these functions
-    # def eval_set(self, evals, iteration=0, feval=None):
-    #     # pylint: disable=invalid-name
-    #     """Evaluate a set of data.
-    # 
-    #     Parameters
-    #     ----------
-    #     evals : list of tuples (DMatrix, string)
-    #         List of items to be evaluated.
-    #     iteration : int
-    #         Current iteration.
-    #     feval : function
-    #         Custom evaluation function.
-    # 
-    #     Returns
-    #     -------
-    #     result: str
-    #         Evaluation result string.
-    #     """
-    #     for d in evals:
-    #         if not isinstance(d[0], DMatrix):
-    #             raise TypeError('expected DMatrix, got {}'.format(type(d[0]).__name__))
-    #         if not isinstance(d[1], STRING_TYPES):
-    #             raise TypeError('expected string, got {}'.format(type(d[1]).__name__))
-    #         self._validate_features(d[0])
-    # 
-    #     dmats = c_array(ctypes.c_char_p, [d[0].handle for d in evals])
-    #     evnames = c_array(ctypes.c_char_p, [c_str(d[1]) for d in evals])
-    #     msg = ctypes.c_char_p()
-    #     _check_call(_LIB.XGBoosterEvalOneIter(self.handle, ctypes.c_int(iteration),
-    #                                           dmats, evnames,
-    #                                           c_bst_ulong(len(evals)),
-    #                                           ctypes.byref(msg)))
-    # 
-    #     res = msg.value.decode()
-    #     if feval is not None:
-    #         for dmat, evname in evals:
-    #             feval_ret = feval(self.predict(dmat), dmat)
-    #             if isinstance(feval_ret, list):
-    #                 for name, val in feval_ret:
-    #                     res += '\t%s-%s:%f' % (evname, name, val)
-    #             else:
-    #                 name, val = feval_ret
-    #                 res += '\t%s-%s:%f' % (evname, name, val)
-    #     return res
-    # 
-    # def eval(self, data, name='eval', iteration=0):
-    #     """Evaluate the model on mat.
-    # 
-    #     Parameters
-    #     ----------
-    #     data : DMatrix
-    #         The dmatrix storing the input.
-    # 
-    #     name : str, optional
-    #         The name of the dataset.
-    # 
-    #     iteration : int, optional
-    #         The current iteration number.
-    # 
-    #     Returns
-    #     -------
-    #     result: str
-    #         Evaluation result string.
-    #     """
-    #     self._validate_features(data)
-    #     return self.eval_set([(data, name)], iteration)
+    def eval_set(self, evals, iteration=0, decrypt=True):
+        # pylint: disable=invalid-name
+        """Evaluate a set of data.
+        The metrics of each DMatrix are encrypted with the symmetric key of each user
+        who owns it. Users who own none of the evaluated DMatrices receive no result.
+        If `decrypt` is True, then the result is decrypted by the client.
+
+        Parameters
+        ----------
+        evals : list of tuples (DMatrix, string)
+            List of items to be evaluated.
+        iteration : int
+            Current iteration.
+        decrypt: bool
+            When this is True, the result received from the enclave is decrypted using the user's symmetric key
+
+        Returns
+        -------
+        result: str
+            Evaluation result string with the metrics of the DMatrices the user owns,
+            or None if the user owns none of the evaluated data.
+        """
+        return self._eval_set(evals, iteration, 0, decrypt)[0]
+
+    def _eval_set(self, evals, iteration, early_stopping_rounds, decrypt=True):
+        """
+        Evaluate a set of data, and let the enclave decide whether to stop
+        training once the last metric of the last item in `evals` has not
+        improved in `early_stopping_rounds` rounds
+
+        Returns
+        -------
+        result: str
+            Evaluation result string, as returned by eval_set()
+        best_iteration : int
+            Best round so far, or -1 if early_stopping_rounds is 0
+        stop : bool
+            Whether to stop training
+        """
+        for d in evals:
+            if not isinstance(d[0], DMatrix):
+                raise TypeError('expected DMatrix, got {}'.format(type(d[0]).__name__))
+            if not isinstance(d[1], STRING_TYPES):
+                raise TypeError('expected string, got {}'.format(type(d[1]).__name__))
+            self._validate_features(d[0])
+
+        args = "XGBoosterEvalOneIter booster_handle {} iteration {} early_stopping_rounds {}".format(
+            self.handle.value.decode('utf-8'), int(iteration), int(early_stopping_rounds))
+        for d in evals:
+            args = args + " data_handle {} data_name {}".format(d[0].handle.value.decode('utf-8'), d[1])
+        sig, sig_len = create_client_signature(args)
+
+        length = c_bst_ulong()
+        sarr = ctypes.POINTER(ctypes.c_char_p)()
+        out_sig = ctypes.POINTER(ctypes.c_uint8)()
+        out_sig_length = c_bst_ulong()
+
+        channel_addr = _CONF["remote_addr"]
+        if channel_addr:
+            with grpc.insecure_channel(channel_addr) as channel:
+                stub = remote_pb2_grpc.RemoteStub(channel)
+                eval_pairs = [remote_pb2.Pair(x=d[0].handle.value, y=d[1]) for d in evals]
+                eval_set_params = remote_pb2.BoosterEvalSetParams(booster_handle=self.handle.value,
+                                                                  evals=eval_pairs,
+                                                                  iteration=iteration,
+                                                                  early_stopping_rounds=early_stopping_rounds)
+                seq_num = get_seq_num_proto()
+                response = _check_remote_call(stub.rpc_XGBoosterEvalOneIter(remote_pb2.BoosterEvalSetParamsRequest(params=eval_set_params, seq_num=seq_num, username=_CONF["current_user"],
+                                                                                                                  signature=sig, sig_len=sig_len)))
+                sarr = from_pystr_to_cstr(list(response.sarr))
+                length = c_bst_ulong(response.length)
+                out_sig = proto_to_pointer(response.signature)
+                out_sig_length = c_bst_ulong(response.sig_len)
+        else:
+            nonce = _CONF["nonce"]
+            nonce_size = _CONF["nonce_size"]
+            nonce_ctr = _command_nonce_ctr()
+            c_signatures, c_lengths = py2c_sigs([sig], [sig_len])
+            signers = from_pystr_to_cstr([_CONF["current_user"]])
+            dmats = c_array(ctypes.c_char_p, [d[0].handle for d in evals])
+            evnames = c_array(ctypes.c_char_p, [c_str(d[1]) for d in evals])
+            _check_call(_LIB.XGBoosterEvalOneIter(self.handle,
+                                                  ctypes.c_int(iteration),
+                                                  dmats,
+                                                  evnames,
+                                                  c_bst_ulong(len(evals)),
+                                                  ctypes.c_int(early_stopping_rounds),
+                                                  nonce,
+                                                  nonce_size,
+                                                  ctypes.c_uint32(nonce_ctr),
+                                                  ctypes.byref(length),
+                                                  ctypes.byref(sarr),
+                                                  ctypes.byref(out_sig),
+                                                  ctypes.byref(out_sig_length),
+                                                  signers,
+                                                  c_signatures,
+                                                  c_lengths))
+        py_sarr = from_cstr_to_pystr(sarr, length)
+        data = ''.join(py_sarr)
+        verify_enclave_signature(data, len(data), out_sig, out_sig_length)
+
+        # The enclave returns one entry per client, in sorted client order,
+        # followed by the early stopping decision
+        best_iteration, stop = (int(x) for x in py_sarr[-1].split())
+        res = py_sarr[_CONF["client_list"].index(_CONF["current_user"])]
+        if not res:
+            res = None
+        elif decrypt:
+            res = self.decrypt_eval(res)
+        return res, best_iteration, bool(stop)
+
+    def decrypt_eval(self, enc_res):
+        """
+        Decrypt the evaluation result obtained from eval_set()
+
+        Parameters
+        ----------
+        enc_res : str
+            Encrypted evaluation result obtained from eval_set()
+
+        Returns
+        -------
+        res : str
+            Evaluation result string
+        """
+        try:
+            sym_key = _CONF["current_user_sym_key"]
+        except:
+            raise ValueError("User not found. Please set your username, symmetric key, and public key using `init_user()`")
+        sarr = from_pystr_to_cstr([enc_res])
+        _check_call(_LIB.decrypt_dump(ctypes.c_char_p(sym_key), sarr, c_bst_ulong(1)))
+        return from_cstr_to_pystr(sarr, c_bst_ulong(1))[0]
+
+    def eval(self, data, name='eval', iteration=0):
+        """Evaluate the model on mat.
+
+        Parameters
+        ----------
+        data : DMatrix
+            The dmatrix storing the input.
+
+        name : str, optional
+            The name of the dataset.
+
+        iteration : int, optional
+            The current iteration number.
+
+        Returns
+        -------
+        result: str
+            Evaluation result string.
+        """
+        self._validate_features(data)
+        return self.eval_set([(data, name)], iteration)
 
     def predict(self, data, output_margin=False, ntree_limit=0, pred_leaf=False,
                 pred_contribs=False, approx_contribs=False, pred_interactions=False,
@@ -1576,11 +1796,10 @@ class Booster(object):
         """
         Predict with data.
 
-        .. note:: This function is not thread safe.
+        .. note:: Predictions on different data can be issued from several threads.
 
-          For each booster object, predict can only be called from one thread.
-          If you want to run prediction using multiple thread, call ``bst.copy()`` to make copies
-          of model object and then call ``predict()``.
+          Each call is signed with its own sequence number, so the calls are in flight at the
+          same time, while the enclave runs them one at a time. See ``predict_concurrent()``.
 
         .. note:: Using ``predict()`` with DART booster
 
@@ -1712,10 +1931,7 @@ class Booster(object):
                     out_sig = out_sigs[i]
                     out_sig_length = out_sig_lengths_ulong[i]
                     
-                    if i != len(preds_list) - 1:
-                        verify_enclave_signature(preds, size, out_sig, out_sig_length, increment_nonce=False)
-                    else:
-                        verify_enclave_signature(preds, size, out_sig, out_sig_length, increment_nonce=True)
+                    verify_enclave_signature(_encrypted_output_signed_data(preds, size), size, out_sig, out_sig_length)
 
                 if decrypt:
                     preds = self.decrypt_predictions(preds_list, length_list)
@@ -1725,7 +1941,7 @@ class Booster(object):
         else:
             nonce = _CONF["nonce"]
             nonce_size = _CONF["nonce_size"]
-            nonce_ctr = _CONF["nonce_ctr"]
+            nonce_ctr = _command_nonce_ctr()
             c_signatures, c_lengths = py2c_sigs([sig], [sig_len])
             signers = from_pystr_to_cstr([_CONF["current_user"]])
             _check_call(_LIB.XGBoosterPredict(self.handle,
@@ -1745,7 +1961,7 @@ class Booster(object):
                                               c_lengths))
 
             size = length.value * ctypes.sizeof(ctypes.c_float) + CIPHER_IV_SIZE + CIPHER_TAG_SIZE
-            verify_enclave_signature(preds, size, out_sig, out_sig_length)
+            verify_enclave_signature(_encrypted_output_signed_data(preds, size), size, out_sig, out_sig_length)
 
             # TODO(rishabh): implement this in decrypt_predictions
             #  preds = ctypes2numpy(preds, length.value, np.float32)
@@ -1774,6 +1990,110 @@ class Booster(object):
                 preds = self.decrypt_predictions(preds, length.value)
             return preds, length.value
 
+    def predict_concurrent(self, data_list, max_workers=None, **kwargs):
+        """
+        Predict with several DMatrices, with the predictions in flight at the same time.
+        Signing, verification and decryption at the client, and the round trips to the
+        server, overlap with predictions running in the enclave.
+
+        With several users, every party must issue the same commands in the same order,
+        so this is only supported for a single user.
+
+        Parameters
+        ----------
+        data_list : list of DMatrix
+            The matrices to predict with.
+
+        max_workers : int
+            Maximum number of predictions in flight; defaults to the number of matrices.
+
+        kwargs
+            Passed to ``predict()``.
+
+        Returns
+        -------
+        results : list
+            The return value of ``predict()`` for each matrix, in the order of `data_list`.
+        """
+        if len(_CONF.get("client_list", [])) > 1:
+            raise NotImplementedError("Concurrent commands are only supported with a single user")
+        if not data_list:
+            return []
+        with ThreadPoolExecutor(max_workers=max_workers or len(data_list)) as executor:
+            futures = [executor.submit(self.predict, data, **kwargs) for data in data_list]
+            return [future.result() for future in futures]
+
+    def enable_prediction_service(self):
+        """
+        Allow every user to predict with this booster on rows sent with the
+        request, using ``predict_rows()``, without the other users signing each
+        prediction. Like any other command, every user must call this.
+        Setting a parameter or loading a model disables the service again.
+        """
+        _handle_command("XGBoosterEnablePredictionService", self.handle)
+
+    def predict_rows(self, data, output_margin=False, ntree_limit=0):
+        """
+        Predict with rows sent with the request instead of a DMatrix loaded on
+        the server. The rows are encrypted with the user's symmetric key, and the
+        server may batch the request with concurrent requests of any user into a
+        single enclave call. The predictions are encrypted for the requesting
+        user only. Requires ``enable_prediction_service()``.
+
+        Parameters
+        ----------
+        data : numpy array
+            2-D array with one row per instance. NaN marks a missing value.
+
+        output_margin : bool
+            Whether to output the raw untransformed margin value.
+
+        ntree_limit : int
+            Limit number of boosting rounds used in the prediction; defaults to 0 (use all trees).
+
+        Returns
+        -------
+        prediction : numpy array
+            Predictions, with one row per row of `data` if there are several predictions per row
+        """
+        data = np.ascontiguousarray(data, dtype=np.float32)
+        if data.ndim != 2:
+            raise ValueError('expected a 2-D array, got {} dimensions'.format(data.ndim))
+        num_rows, num_col = data.shape
+        handle = self.handle.value.decode('utf-8')
+        # binds the predictions to this request
+        request_id = os.urandom(16).hex()
+
+        aad = "XGBoosterPredictRows handle {} request {} num_rows {} num_col {} output_margin {} ntree_limit {}".format(
+            handle, request_id, num_rows, num_col, int(output_margin), int(ntree_limit))
+        enc_rows = _encrypt_with_aad(data.tobytes(), aad.encode('utf-8'))
+        request = remote_pb2.PredictRowsRequest(username=_CONF["current_user"],
+                                                booster_handle=handle,
+                                                request_id=request_id,
+                                                enc_rows=ndarray_to_proto(np.frombuffer(enc_rows, dtype=np.uint8)),
+                                                num_rows=num_rows,
+                                                num_col=num_col,
+                                                output_margin=int(output_margin),
+                                                ntree_limit=ntree_limit)
+
+        channel_addr = _CONF["remote_addr"]
+        if channel_addr:
+            with grpc.insecure_channel(channel_addr) as channel:
+                stub = remote_pb2_grpc.RemoteStub(channel)
+                response = _check_remote_call(stub.rpc_XGBoosterPredictRows(request))
+                enc_preds = proto_to_ndarray(response.predictions).tobytes()
+        else:
+            result = RemoteAPI.XGBoosterPredictRows([request])[0]
+            if result is None:
+                raise XGBoostError("Prediction request failed authentication")
+            enc_preds, _ = result
+
+        aad = "XGBoosterPredictRows handle {} request {} result".format(handle, request_id)
+        preds = np.frombuffer(_decrypt_with_aad(enc_preds, aad.encode('utf-8')), dtype=np.float32)
+        if num_rows != 0 and preds.size != num_rows:
+            preds = preds.reshape(num_rows, preds.size // num_rows)
+        return preds
+
     # TODO(rishabh): change encrypted_preds to Python type from ctype
     def decrypt_predictions(self, encrypted_preds, num_preds):
         """
@@ -1872,7 +2192,7 @@ class Booster(object):
             else:
                 nonce = _CONF["nonce"]
                 nonce_size = _CONF["nonce_size"]
-                nonce_ctr = _CONF["nonce_ctr"]
+                nonce_ctr = _command_nonce_ctr()
                 c_signatures, c_sig_lengths = py2c_sigs([sig], [sig_len])
                 signers = from_pystr_to_cstr([_CONF["current_user"]])
                 _check_call(_LIB.XGBoosterSaveModel(self.handle, c_str(fname),
@@ -1927,7 +2247,7 @@ class Booster(object):
             _check_call(_LIB.XGBoosterGetModelRaw(self.handle,
                                                   _CONF["nonce"],
                                                   _CONF["nonce_size"],
-                                                  ctypes.c_uint32(_CONF["nonce_ctr"]),
+                                                  ctypes.c_uint32(_command_nonce_ctr()),
                                                   ctypes.byref(length),
                                                   ctypes.byref(cptr),
                                                   ctypes.byref(out_sig),
@@ -1935,7 +2255,7 @@ class Booster(object):
                                                   signers,
                                                   c_signatures,
                                                   c_lengths))
-        verify_enclave_signature(cptr, length.value, out_sig, out_sig_length)
+        verify_enclave_signature(_encrypted_output_signed_data(cptr, length.value), length.value, out_sig, out_sig_length)
         return ctypes2buffer(cptr, length.value)
 
 
@@ -1990,7 +2310,7 @@ class Booster(object):
                 signers = from_pystr_to_cstr([_CONF["current_user"]])
                 nonce = _CONF["nonce"]
                 nonce_size = _CONF["nonce_size"]
-                nonce_ctr = ctypes.c_uint32(_CONF["nonce_ctr"])
+                nonce_ctr = ctypes.c_uint32(_command_nonce_ctr())
                 _check_call(_LIB.XGBoosterLoadModel(self.handle, c_str(fname), nonce, nonce_size, nonce_ctr, ctypes.byref(out_sig), ctypes.byref(out_sig_length), signers, c_signatures, c_lengths))
 
             verify_enclave_signature("", 0, out_sig, out_sig_length)
@@ -2003,6 +2323,128 @@ class Booster(object):
             # _check_call(_LIB.XGBoosterLoadModelFromBuffer(self.handle, ptr, length, c_str(username)))
 
 
+    def save_checkpoint(self, fname, version):
+        """
+        Save a training checkpoint of the model.
+
+        The checkpoint is sealed inside the enclave with a key derived from the
+        keys of all registered users, so that it can be restored by a relaunched
+        enclave once the same users have attested and provisioned their keys.
+        Each worker writes its own copy, alternating between two files per
+        worker so that a crash while writing never destroys the last checkpoint.
+
+        Parameters
+        ----------
+        fname : string
+            Path prefix of the checkpoint files
+        version : int
+            Number of completed boosting rounds, must be positive
+        """
+        if "current_user" not in _CONF:
+            raise ValueError("Please set your username with the init_user() function")
+        if not isinstance(fname, STRING_TYPES):
+            raise TypeError("fname must be a string")
+        if version <= 0:
+            raise ValueError("Checkpoint version must be positive")
+
+        # Normalize file paths (otherwise signatures might differ)
+        fname = os.path.normpath(fname)
+
+        args = "XGBoosterSaveCheckpoint handle {} filename {} version {}".format(self.handle.value.decode('utf-8'), fname, version)
+        sig, sig_len = create_client_signature(args)
+
+        out_sig = ctypes.POINTER(ctypes.c_uint8)()
+        out_sig_length = c_bst_ulong()
+
+        channel_addr = _CONF["remote_addr"]
+        if channel_addr:
+            with grpc.insecure_channel(channel_addr) as channel:
+                stub = remote_pb2_grpc.RemoteStub(channel)
+                checkpoint_params = remote_pb2.CheckpointParams(
+                    booster_handle=self.handle.value,
+                    filename=fname,
+                    version=version)
+                seq_num = get_seq_num_proto()
+                response = _check_remote_call(stub.rpc_XGBoosterSaveCheckpoint(remote_pb2.CheckpointParamsRequest(params=checkpoint_params,
+                                                                                                                  seq_num=seq_num,
+                                                                                                                  username=_CONF["current_user"],
+                                                                                                                  signature=sig,
+                                                                                                                  sig_len=sig_len)))
+                out_sig = proto_to_pointer(response.signature)
+                out_sig_length = c_bst_ulong(response.sig_len)
+        else:
+            c_signatures, c_lengths = py2c_sigs([sig], [sig_len])
+            signers = from_pystr_to_cstr([_CONF["current_user"]])
+            nonce = _CONF["nonce"]
+            nonce_size = _CONF["nonce_size"]
+            nonce_ctr = ctypes.c_uint32(_command_nonce_ctr())
+            _check_call(_LIB.XGBoosterSaveCheckpoint(self.handle, c_str(fname), ctypes.c_uint32(version), nonce, nonce_size, nonce_ctr, ctypes.byref(out_sig), ctypes.byref(out_sig_length), signers, c_signatures, c_lengths))
+
+        verify_enclave_signature("", 0, out_sig, out_sig_length)
+
+    def load_checkpoint(self, fname):
+        """
+        Load the latest training checkpoint written by save_checkpoint.
+
+        Every worker restores the newest version that all workers hold, so
+        training resumes consistently even if a worker died between writes.
+
+        Parameters
+        ----------
+        fname : string
+            Path prefix of the checkpoint files
+
+        Returns
+        -------
+        version : int
+            Number of boosting rounds in the restored model, 0 if no checkpoint
+            was found and the booster is left unchanged
+        """
+        if "current_user" not in _CONF:
+            raise ValueError("Please set your username with the init_user() function")
+        if not isinstance(fname, STRING_TYPES):
+            raise TypeError("fname must be a string")
+
+        # Normalize file paths (otherwise signatures might differ)
+        fname = os.path.normpath(fname)
+
+        args = "XGBoosterLoadCheckpoint handle {} filename {}".format(self.handle.value.decode('utf-8'), fname)
+        sig, sig_len = create_client_signature(args)
+
+        version = ctypes.c_uint32()
+        out_sig = ctypes.POINTER(ctypes.c_uint8)()
+        out_sig_length = c_bst_ulong()
+
+        channel_addr = _CONF["remote_addr"]
+        if channel_addr:
+            with grpc.insecure_channel(channel_addr) as channel:
+                stub = remote_pb2_grpc.RemoteStub(channel)
+                checkpoint_params = remote_pb2.CheckpointParams(
+                    booster_handle=self.handle.value,
+                    filename=fname)
+                seq_num = get_seq_num_proto()
+                response = _check_remote_call(stub.rpc_XGBoosterLoadCheckpoint(remote_pb2.CheckpointParamsRequest(params=checkpoint_params,
+                                                                                                                  seq_num=seq_num,
+                                                                                                                  username=_CONF["current_user"],
+                                                                                                                  signature=sig,
+                                                                                                                  sig_len=sig_len)))
+                out_sig = proto_to_pointer(response.signature)
+                out_sig_length = c_bst_ulong(response.sig_len)
+                version = response.value
+        else:
+            c_signatures, c_lengths = py2c_sigs([sig], [sig_len])
+            signers = from_pystr_to_cstr([_CONF["current_user"]])
+            nonce = _CONF["nonce"]
+            nonce_size = _CONF["nonce_size"]
+            nonce_ctr = ctypes.c_uint32(_command_nonce_ctr())
+            _check_call(_LIB.XGBoosterLoadCheckpoint(self.handle, c_str(fname), nonce, nonce_size, nonce_ctr, ctypes.byref(version), ctypes.byref(out_sig), ctypes.byref(out_sig_length), signers, c_signatures, c_lengths))
+            version = version.value
+
+        args = "{}".format(version)
+        verify_enclave_signature(args, len(args), out_sig, out_sig_length)
+
+        return version
+
     def dump_model(self, fout, fmap='', with_stats=False, dump_format="text"):
         """
         Dump model into a text or JSON file.
@@ -2038,7 +2480,7 @@ class Booster(object):
         if need_close:
             fout.close()
 
-    def get_dump(self, fmap='', with_stats=False, dump_format="text", decrypt=True):
+    def get_dump(self, fmap='', with_stats=False, dump_format="text", decrypt=True, framed=False):
         """
         Returns the (encrypted) model dump as a list of strings.
         The model is encrypted with the user's symmetric key.
@@ -2054,12 +2496,19 @@ class Booster(object):
             Format of model dump. Can be 'text' or 'json'.
         decrypt: bool
             When this is True, the model dump received from the enclave is decrypted using the user's symmetric key
+        framed: bool
+            When this is True, the enclave dumps the trees in parallel and encrypts the whole
+            dump at once, instead of encrypting and encoding each tree. If `decrypt` is False,
+            the encrypted dump is returned as bytes.
 
         Returns
         -------
         res : str
             A string representation of the model dump
         """
+        if framed:
+            return self._get_dump_framed(fmap, with_stats, dump_format, decrypt)
+
         length = c_bst_ulong()
         sarr = ctypes.POINTER(ctypes.c_char_p)()
         if self.feature_names is not None and fmap == '':
@@ -2103,7 +2552,7 @@ class Booster(object):
             else:
                 nonce = _CONF["nonce"]
                 nonce_size = _CONF["nonce_size"]
-                nonce_ctr = _CONF["nonce_ctr"]
+                nonce_ctr = _command_nonce_ctr()
                 c_signatures, c_lengths = py2c_sigs([sig], [sig_len])
                 signers = from_pystr_to_cstr([_CONF["current_user"]])
                 _check_call(_LIB.XGBoosterDumpModelExWithFeatures(
@@ -2153,7 +2602,7 @@ class Booster(object):
             else:
                 nonce = _CONF["nonce"]
                 nonce_size = _CONF["nonce_size"]
-                nonce_ctr = _CONF["nonce_ctr"]
+                nonce_ctr = _command_nonce_ctr()
                 c_signatures, c_lengths = py2c_sigs([sig], [sig_len])
                 signers = from_pystr_to_cstr([_CONF["current_user"]])
                 _check_call(_LIB.XGBoosterDumpModelEx(self.handle,
@@ -2179,25 +2628,107 @@ class Booster(object):
         res = from_cstr_to_pystr(sarr, length)
         return res
 
-    def decrypt_dump(self, sarr, length):
-        """ 
-        Decrypt the models obtained from get_dump()
-        
-        Parameters
-        ----------
-        sarr: str
-            Encrypted string representation of the model obtained from get_dump()
-        length : int
-           length of sarr 
-        """ 
-        try:
-            sym_key = _CONF["enclave_sym_key"]
-        except:
-            raise ValueError("Please set your username with the init_user() function")
-        _check_call(_LIB.decrypt_dump(sym_key, sarr, length))
+    def _get_dump_framed(self, fmap, with_stats, dump_format, decrypt):
+        """
+        Get the model dump encrypted as a single framed blob, see get_dump()
+        """
+        if self.feature_names is not None and fmap == '':
+            fname = self.feature_names
+            # use quantitative as default
+            ftype = self.feature_types if self.feature_types is not None else ['q'] * len(fname)
+        else:
+            if fmap != '' and not os.path.exists(fmap):
+                raise ValueError("No such file: {0}".format(fmap))
+            fname, ftype = [], []
+        flen = len(fname)
 
+        args = "XGBoosterDumpModelFramed booster_handle {} fmap {} with_stats {} dump_format {} flen {}".format(self.handle.value.decode('utf-8'), fmap, int(with_stats), dump_format, flen)
+        for i in range(flen):
+            args = args + " fname {} ftype {}".format(fname[i], ftype[i])
+        sig, sig_len = create_client_signature(args)
 
-    def get_fscore(self, fmap=''):
+        length = c_bst_ulong()
+        dump = ctypes.POINTER(ctypes.c_uint8)()
+        out_sig = ctypes.POINTER(ctypes.c_uint8)()
+        out_sig_length = c_bst_ulong()
+
+        channel_addr = _CONF["remote_addr"]
+        if channel_addr:
+            with grpc.insecure_channel(channel_addr) as channel:
+                stub = remote_pb2_grpc.RemoteStub(channel)
+                dump_model_params = remote_pb2.DumpModelFramedParams(
+                    booster_handle=self.handle.value,
+                    fmap=fmap,
+                    flen=flen,
+                    fname=fname,
+                    ftype=ftype,
+                    with_stats=with_stats,
+                    dump_format=dump_format)
+                seq_num = get_seq_num_proto()
+                response = _check_remote_call(stub.rpc_XGBoosterDumpModelFramed(remote_pb2.DumpModelFramedParamsRequest(
+                    params=dump_model_params, seq_num=seq_num, username=_CONF["current_user"],
+                    signature=sig, sig_len=sig_len)))
+                dump = proto_to_pointer(response.dump)
+                length = c_bst_ulong(response.length)
+                out_sig = proto_to_pointer(response.signature)
+                out_sig_length = c_bst_ulong(response.sig_len)
+        else:
+            c_signatures, c_lengths = py2c_sigs([sig], [sig_len])
+            signers = from_pystr_to_cstr([_CONF["current_user"]])
+            _check_call(_LIB.XGBoosterDumpModelFramed(
+                self.handle,
+                c_str(fmap),
+                ctypes.c_int(flen),
+                from_pystr_to_cstr(fname),
+                from_pystr_to_cstr(ftype),
+                ctypes.c_int(with_stats),
+                c_str(dump_format),
+                _CONF["nonce"],
+                _CONF["nonce_size"],
+                ctypes.c_uint32(_command_nonce_ctr()),
+                ctypes.byref(length),
+                ctypes.byref(dump),
+                ctypes.byref(out_sig),
+                ctypes.byref(out_sig_length),
+                signers,
+                c_signatures,
+                c_lengths))
+
+        verify_enclave_signature(_encrypted_output_signed_data(dump, length.value), length.value, out_sig, out_sig_length)
+        if not decrypt:
+            return ctypes.string_at(dump, length.value)
+
+        try:
+            sym_key = _CONF["enclave_sym_key"]
+        except:
+            raise ValueError("Please set your username with the init_user() function")
+        framed_len = length.value - CIPHER_IV_SIZE - CIPHER_TAG_SIZE
+        framed_dump = ctypes.POINTER(ctypes.c_uint8)()
+        _check_call(_LIB.decrypt_framed_dump(sym_key, dump, ctypes.c_size_t(framed_len), ctypes.byref(framed_dump)))
+        try:
+            return decode_framed_dump(ctypes.string_at(framed_dump, framed_len))
+        finally:
+            _check_call(_LIB.free_buffer(framed_dump))
+
+    def decrypt_dump(self, sarr, length):
+        """ 
+        Decrypt the models obtained from get_dump()
+        
+        Parameters
+        ----------
+        sarr: str
+            Encrypted string representation of the model obtained from get_dump()
+        length : int
+           length of sarr 
+        """ 
+        try:
+            sym_key = _CONF["enclave_sym_key"]
+        except:
+            raise ValueError("Please set your username with the init_user() function")
+        _check_call(_LIB.decrypt_dump(sym_key, sarr, length))
+
+
+    def get_fscore(self, fmap=''):
         """Get feature importance of each feature.
 
         .. note:: Feature importance is defined only for tree boosters
@@ -2592,7 +3123,8 @@ def init_client(config=None, remote_addr=None, user_name=None, client_list=[],
     _CONF["nonce_ctr"] = 0 
 
 
-def init_server(enclave_image=None, client_list=[], log_verbosity=0):
+def init_server(enclave_image=None, client_list=[], log_verbosity=0, switchless_workers=0,
+                memory_limit=0, spill_dir=None, identity_key_path=None):
     """
     Launch the enclave from an image. This API should be invoked only by the servers and not the clients.
 
@@ -2604,11 +3136,29 @@ def init_server(enclave_image=None, client_list=[], log_verbosity=0):
         List of usernames (strings) of clients in the collaboration allowed to use the enclaves
     log_verbosity: int, optional
         Verbosity level for enclave (for enclaves in debug mode)
+    switchless_workers: int, optional
+        Number of host threads serving switchless OCALLs for file I/O and logging.
+        Each worker busy-polls a core while the enclave is running. With 0, every
+        OCALL exits the enclave.
+    memory_limit: int, optional
+        Bytes of enclave memory that DMatrices and prediction caches may hold before
+        idle DMatrices are sealed to host storage. With 0, three quarters of the
+        enclave heap.
+    spill_dir: str, optional
+        Directory on the host that evicted DMatrices are written to. Defaults to
+        the system temporary directory.
+    identity_key_path: str, optional
+        File on the host that the enclave seals its identity key to. A relaunched
+        enclave built from the same image reuses the sealed key instead of
+        generating a new one. By default a new key is generated at every launch.
     """
-    _check_call(_LIB.XGBCreateEnclave(c_str(enclave_image), from_pystr_to_cstr(client_list), len(client_list), log_verbosity))
+    if spill_dir is None:
+        spill_dir = tempfile.gettempdir()
+    _check_call(_LIB.XGBCreateEnclave(c_str(enclave_image), from_pystr_to_cstr(client_list), len(client_list), log_verbosity, switchless_workers,
+                                      ctypes.c_size_t(memory_limit), c_str(spill_dir), c_str(identity_key_path or "")))
 
 
-def attest(verify=True):
+def attest(verify=True, session_ticket=None):
     # TODO(rishabh): user-defined mrsigner/mrenclave for verification
     # TODO(rishabh): Handle verification failures
     """
@@ -2622,7 +3172,14 @@ def attest(verify=True):
         If true, the client verifies the enclave report 
 
         .. warning:: ``verify`` should be set to ``False`` only for development and testing in simulation mode
+    session_ticket: str, optional
+        Path of a session ticket, encrypted with the user's symmetric key. If the
+        ticket holds a session with the running enclave, the session is resumed
+        without attesting the enclave or exchanging keys again. Otherwise the
+        enclave is attested and a ticket for the new session is written to this path.
     """
+    if session_ticket is not None and _resume_session(session_ticket):
+        return
 
     pem_key = ctypes.POINTER(ctypes.c_uint8)()
     pem_key_size = ctypes.c_size_t()
@@ -2677,6 +3234,163 @@ def attest(verify=True):
     _add_client_key()
     _get_enclave_symm_key()
 
+    if session_ticket is not None:
+        _save_session_ticket(session_ticket)
+
+
+def _bytes_to_pointer(data):
+    """
+    Copy bytes to a uint8 pointer that keeps its buffer alive
+    """
+    return ctypes.cast(ctypes.create_string_buffer(data, len(data)), ctypes.POINTER(ctypes.c_uint8))
+
+
+def _encrypt_with_aad(data, aad):
+    """
+    Encrypt `data` with the user's symmetric key, authenticating `aad` with it
+
+    Returns
+    -------
+    encrypted : bytes
+        IV | tag | ciphertext
+    """
+    encrypted = ctypes.POINTER(ctypes.c_uint8)()
+    _check_call(_LIB.encrypt_data_with_keybuf_and_aad(ctypes.c_char_p(_CONF["current_user_sym_key"]),
+                                                      _bytes_to_pointer(data),
+                                                      ctypes.c_size_t(len(data)),
+                                                      _bytes_to_pointer(aad),
+                                                      ctypes.c_size_t(len(aad)),
+                                                      ctypes.byref(encrypted)))
+    return ctypes.string_at(encrypted, CIPHER_IV_SIZE + CIPHER_TAG_SIZE + len(data))
+
+
+def _decrypt_with_aad(encrypted, aad):
+    """
+    Decrypt data encrypted with the user's symmetric key and `aad`, raising
+    XGBoostError if either does not match
+    """
+    size = len(encrypted) - CIPHER_IV_SIZE - CIPHER_TAG_SIZE
+    data = ctypes.POINTER(ctypes.c_uint8)()
+    _check_call(_LIB.decrypt_data_with_keybuf_and_aad(ctypes.c_char_p(_CONF["current_user_sym_key"]),
+                                                      _bytes_to_pointer(encrypted),
+                                                      ctypes.c_size_t(size),
+                                                      _bytes_to_pointer(aad),
+                                                      ctypes.c_size_t(len(aad)),
+                                                      ctypes.byref(data)))
+    return ctypes.string_at(data, size)
+
+
+def _save_session_ticket(path):
+    """
+    Write the state of the current session with the enclave to `path`, encrypted
+    with the user's symmetric key
+    """
+    ticket = json.dumps({
+        "user": _CONF["current_user"],
+        "client_list": _CONF["client_list"],
+        "remote_addr": _CONF["remote_addr"],
+        "enclave_pk": ctypes.string_at(_CONF["enclave_pk"], _CONF["enclave_pk_size"].value).hex(),
+        "nonce": ctypes.string_at(_CONF["nonce"], _CONF["nonce_size"].value).hex(),
+        "enclave_sym_key": ctypes.string_at(_CONF["enclave_sym_key"], CIPHER_KEY_SIZE).hex(),
+    }).encode('utf-8')
+
+    encrypted = ctypes.POINTER(ctypes.c_uint8)()
+    _check_call(_LIB.encrypt_data_with_keybuf(ctypes.c_char_p(_CONF["current_user_sym_key"]),
+                                              _bytes_to_pointer(ticket),
+                                              ctypes.c_size_t(len(ticket)),
+                                              ctypes.byref(encrypted)))
+    encrypted = ctypes.string_at(encrypted, CIPHER_IV_SIZE + CIPHER_TAG_SIZE + len(ticket))
+
+    # replace the ticket atomically, readable by the user only
+    tmp_path = path + ".tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(encrypted)
+    os.replace(tmp_path, path)
+
+
+def _resume_session(path):
+    """
+    Resume the session saved in the ticket at `path`. The enclave signs a fresh
+    challenge together with the session nonce and its current sequence number,
+    which only the enclave instance that the ticket was issued by can do.
+
+    Returns
+    -------
+    resumed : bool
+        False if there is no ticket, or its session has ended
+    """
+    if not os.path.exists(path):
+        return False
+    with open(path, "rb") as f:
+        encrypted = f.read()
+    size = len(encrypted) - CIPHER_IV_SIZE - CIPHER_TAG_SIZE
+    if size <= 0:
+        warnings.warn("Ignoring truncated session ticket {}".format(path))
+        return False
+
+    ticket = ctypes.POINTER(ctypes.c_uint8)()
+    try:
+        _check_call(_LIB.decrypt_data_with_keybuf(ctypes.c_char_p(_CONF["current_user_sym_key"]),
+                                                  _bytes_to_pointer(encrypted),
+                                                  ctypes.c_size_t(size),
+                                                  ctypes.byref(ticket)))
+    except XGBoostError:
+        warnings.warn("Ignoring session ticket {} that failed authentication".format(path))
+        return False
+    ticket = json.loads(ctypes.string_at(ticket, size).decode('utf-8'))
+    if (ticket["user"] != _CONF["current_user"] or ticket["client_list"] != _CONF["client_list"]
+            or ticket["remote_addr"] != _CONF["remote_addr"]):
+        return False
+
+    username = _CONF["current_user"]
+    challenge = os.urandom(16).hex()
+    try:
+        channel_addr = _CONF["remote_addr"]
+        if channel_addr:
+            with grpc.insecure_channel(channel_addr) as channel:
+                stub = remote_pb2_grpc.RemoteStub(channel)
+                response = _check_remote_call(stub.rpc_XGBResumeSession(remote_pb2.ResumeSessionRequest(
+                    username=username, challenge=challenge)))
+                nonce_ctr = response.nonce_ctr
+                out_sig = proto_to_pointer(response.signature)
+                out_sig_length = ctypes.c_size_t(response.sig_len)
+        else:
+            c_nonce_ctr = ctypes.c_uint32()
+            out_sig = ctypes.POINTER(ctypes.c_uint8)()
+            out_sig_length = ctypes.c_size_t()
+            _check_call(_LIB.XGBResumeSession(c_str(username),
+                                              c_str(challenge),
+                                              ctypes.byref(c_nonce_ctr),
+                                              ctypes.byref(out_sig),
+                                              ctypes.byref(out_sig_length)))
+            nonce_ctr = c_nonce_ctr.value
+    except XGBoostError:
+        # the enclave was relaunched since the ticket was issued
+        return False
+
+    keys = ["enclave_pk", "enclave_pk_size", "nonce", "nonce_size", "nonce_ctr", "enclave_sym_key"]
+    previous = {key: _CONF.get(key) for key in keys}
+    enclave_pk = bytes.fromhex(ticket["enclave_pk"])
+    nonce = bytes.fromhex(ticket["nonce"])
+    _CONF["enclave_pk"] = _bytes_to_pointer(enclave_pk)
+    _CONF["enclave_pk_size"] = ctypes.c_size_t(len(enclave_pk))
+    _CONF["nonce"] = _bytes_to_pointer(nonce)
+    _CONF["nonce_size"] = ctypes.c_size_t(len(nonce))
+    _CONF["nonce_ctr"] = nonce_ctr
+    _CONF["enclave_sym_key"] = _bytes_to_pointer(bytes.fromhex(ticket["enclave_sym_key"]))
+
+    # the enclave signs the response with the sequence number it returns
+    _COMMAND.nonce_ctr = nonce_ctr
+    args = "XGBResumeSession username {} challenge {}".format(username, challenge)
+    try:
+        verify_enclave_signature(args, len(args), out_sig, out_sig_length)
+    except XGBoostError:
+        # a different enclave instance, or a forged response
+        _CONF.update(previous)
+        return False
+    return True
+
 
 def _add_client_key():
     """
@@ -2767,6 +3481,177 @@ def _get_enclave_symm_key():
     _CONF["enclave_sym_key"] = enclave_symm_key
 
 
+def get_enclave_memory_stats():
+    """
+    Get the enclave memory held by each DMatrix and Booster. In distributed
+    mode, the statistics are those of the master enclave.
+
+    Returns
+    -------
+    stats : dict
+        Keys are ``heap_size``, ``memory_limit`` (None if unlimited),
+        ``accounted_bytes``, ``num_evictions``, ``num_reloads``, ``dmatrices``,
+        mapping each DMatrix handle to its ``bytes`` and whether it is
+        ``resident`` or evicted to host storage, and ``boosters``, mapping each
+        Booster handle to its ``model_bytes`` and ``prediction_cache_bytes``.
+    """
+    args = "XGBGetEnclaveMemoryStats"
+    sig, sig_len = create_client_signature(args)
+
+    out_sig = ctypes.POINTER(ctypes.c_uint8)()
+    out_sig_length = c_bst_ulong()
+
+    channel_addr = _CONF["remote_addr"]
+    if channel_addr:
+        with grpc.insecure_channel(channel_addr) as channel:
+            stub = remote_pb2_grpc.RemoteStub(channel)
+            response = _check_remote_call(stub.rpc_XGBGetEnclaveMemoryStats(remote_pb2.MemoryStatsRequest(
+                params=remote_pb2.Status(status=0), seq_num=get_seq_num_proto(), username=_CONF["current_user"],
+                signature=sig, sig_len=sig_len)))
+            stats = response.stats
+            out_sig = proto_to_pointer(response.signature)
+            out_sig_length = c_bst_ulong(response.sig_len)
+    else:
+        out_stats = ctypes.c_char_p()
+        c_signatures, c_lengths = py2c_sigs([sig], [sig_len])
+        signers = from_pystr_to_cstr([_CONF["current_user"]])
+        _check_call(_LIB.XGBGetEnclaveMemoryStats(_CONF["nonce"],
+                                                  _CONF["nonce_size"],
+                                                  ctypes.c_uint32(_command_nonce_ctr()),
+                                                  ctypes.byref(out_stats),
+                                                  ctypes.byref(out_sig),
+                                                  ctypes.byref(out_sig_length),
+                                                  signers,
+                                                  c_signatures,
+                                                  c_lengths))
+        stats = py_str(out_stats.value)
+
+    verify_enclave_signature(stats, len(stats), out_sig, out_sig_length)
+    return json.loads(stats)
+
+
+def run_plan(params, dtrain, num_boost_round=10, evals=(), predict=(), decrypt=True):
+    # pylint: disable=too-many-locals
+    """
+    Train a booster, evaluate it after every round and predict with it, as a
+    single command. Every user calls ``run_plan`` with the same arguments and
+    signs the whole plan once; the enclave verifies the signatures of all users
+    and runs the plan, instead of every user signing every round of training.
+
+    Parameters
+    ----------
+    params : dict or list of tuples
+        Booster params.
+    dtrain : DMatrix
+        Data to be trained.
+    num_boost_round: int
+        Number of boosting iterations.
+    evals: list of pairs (DMatrix, string)
+        Evaluation sets, evaluated after every round.
+    predict : list of DMatrix
+        Matrices to predict with once the booster is trained. Each must be owned by a single user.
+    decrypt: bool
+        When this is True, the result received from the enclave is decrypted using the user's symmetric key
+
+    Returns
+    -------
+    booster : Booster
+        The trained booster.
+    result : dict
+        ``evals`` holds the evaluation result string of every round, with the metrics of
+        the evaluation sets the user owns, and is empty if the user owns none of them. ``predictions`` holds the predictions on
+        each matrix in `predict`, or None for matrices the user does not own. If
+        `decrypt` is False, the result is the list of encrypted results of each enclave.
+    """
+    if isinstance(params, Mapping):
+        params = params.items()
+    # Sorted by name, so that users who build their params in a different order
+    # sign the same plan. The sort is stable, keeping repeated names in order.
+    param_pairs = []
+    for key, val in sorted(params, key=lambda pair: pair[0]):
+        for v in (val if isinstance(val, (list, tuple)) else [val]):
+            param_pairs.append([key, str(v)])
+
+    bst = Booster.__new__(Booster)
+    for d in [dtrain] + [d[0] for d in evals] + list(predict):
+        if not isinstance(d, DMatrix):
+            raise TypeError('expected DMatrix, got {}'.format(type(d).__name__))
+        bst._validate_features(d)
+
+    # Every user must produce the same plan, byte for byte
+    plan = json.dumps({
+        "params": param_pairs,
+        "dtrain": dtrain.handle.value.decode('utf-8'),
+        "num_boost_round": int(num_boost_round),
+        "evals": [[d.handle.value.decode('utf-8'), name] for d, name in evals],
+        "predict": [d.handle.value.decode('utf-8') for d in predict],
+    }, sort_keys=True)
+    args = "XGBoosterRunPlan plan " + plan
+    sig, sig_len = create_client_signature(args)
+
+    channel_addr = _CONF["remote_addr"]
+    if channel_addr:
+        with grpc.insecure_channel(channel_addr) as channel:
+            stub = remote_pb2_grpc.RemoteStub(channel)
+            response = _check_remote_call(stub.rpc_XGBoosterRunPlan(remote_pb2.PlanRequest(
+                params=remote_pb2.PlanParams(plan=plan), seq_num=get_seq_num_proto(), username=_CONF["current_user"],
+                signature=sig, sig_len=sig_len)))
+            handle = response.name
+            length = response.length
+            sarr = list(response.sarr)
+            out_sigs = [proto_to_pointer(sig_proto) for sig_proto in response.signatures]
+            out_sig_lengths = [c_bst_ulong(sig_length) for sig_length in response.sig_lens]
+    else:
+        c_handle = ctypes.c_char_p()
+        c_length = c_bst_ulong()
+        c_sarr = ctypes.POINTER(ctypes.c_char_p)()
+        out_sig = ctypes.POINTER(ctypes.c_uint8)()
+        out_sig_length = c_bst_ulong()
+        c_signatures, c_lengths = py2c_sigs([sig], [sig_len])
+        signers = from_pystr_to_cstr([_CONF["current_user"]])
+        _check_call(_LIB.XGBoosterRunPlan(c_str(plan),
+                                          _CONF["nonce"],
+                                          _CONF["nonce_size"],
+                                          ctypes.c_uint32(_command_nonce_ctr()),
+                                          ctypes.byref(c_handle),
+                                          ctypes.byref(c_length),
+                                          ctypes.byref(c_sarr),
+                                          ctypes.byref(out_sig),
+                                          ctypes.byref(out_sig_length),
+                                          signers,
+                                          c_signatures,
+                                          c_lengths))
+        handle = py_str(c_handle.value)
+        length = c_length.value
+        sarr = from_cstr_to_pystr(c_sarr, c_length)
+        out_sigs = [out_sig]
+        out_sig_lengths = [out_sig_length]
+
+    # Each enclave returns one entry per client, in sorted client order
+    index = _CONF["client_list"].index(_CONF["current_user"])
+    enc_results = []
+    for i, (out_sig, out_sig_length) in enumerate(zip(out_sigs, out_sig_lengths)):
+        entries = sarr[i * length:(i + 1) * length]
+        data = "handle {}".format(handle) + ''.join(entries)
+        verify_enclave_signature(data, len(data), out_sig, out_sig_length)
+        enc_results.append(entries[index])
+
+    bst.handle = c_str(handle)
+    bst.booster = dict(param_pairs).get('booster', 'gbtree')
+    if not decrypt:
+        return bst, enc_results
+
+    # Evaluation results are allreduced across the cluster, while every enclave
+    # predicts on its own part of the data
+    results = [json.loads(bst.decrypt_eval(enc_result)) for enc_result in enc_results]
+    predictions = []
+    for i in range(len(predict)):
+        parts = [np.frombuffer(base64.b64decode(result["predictions"][str(i)]), dtype=np.float32)
+                 for result in results if str(i) in result["predictions"]]
+        predictions.append(np.concatenate(parts) if parts else None)
+    return bst, {"evals": results[0]["evals"], "predictions": predictions}
+
+
 ##########################################
 # APIs invoked by RPC server
 ##########################################
@@ -2781,6 +3666,18 @@ class RemoteAPI:
             ctypes.byref(enc_key_size)))
         return enc_key, enc_key_size.value
 
+    def XGBResumeSession(request):
+        nonce_ctr = ctypes.c_uint32()
+        out_sig = ctypes.POINTER(ctypes.c_uint8)()
+        out_sig_length = ctypes.c_size_t()
+        _check_call(_LIB.XGBResumeSession(
+            c_str(request.username),
+            c_str(request.challenge),
+            ctypes.byref(nonce_ctr),
+            ctypes.byref(out_sig),
+            ctypes.byref(out_sig_length)))
+        return nonce_ctr.value, out_sig, out_sig_length.value
+
     def get_remote_report_with_pubkey_and_nonce(request):
         pem_key = ctypes.POINTER(ctypes.c_uint)()
         key_size = ctypes.c_size_t()
@@ -2885,6 +3782,67 @@ class RemoteAPI:
             c_sig_lengths))
         return out_sig, out_sig_len.value
 
+    def XGBoosterEvalOneIter(request, signers, signatures, sig_lengths):
+        booster_handle = request.params.booster_handle
+        dmatrix_handles = [pair.x for pair in request.params.evals]
+        evnames = [pair.y for pair in request.params.evals]
+        iteration = request.params.iteration
+        early_stopping_rounds = request.params.early_stopping_rounds
+        nonce = proto_to_pointer(request.seq_num.nonce)
+        nonce_size = request.seq_num.nonce_size
+        nonce_ctr = request.seq_num.nonce_ctr
+        c_signatures, c_sig_lengths = py2c_sigs(signatures, sig_lengths)
+
+        length = c_bst_ulong()
+        sarr = ctypes.POINTER(ctypes.c_char_p)()
+        out_sig = ctypes.POINTER(ctypes.c_uint8)()
+        out_sig_len = c_bst_ulong()
+        _check_call(_LIB.XGBoosterEvalOneIter(
+            c_str(booster_handle),
+            ctypes.c_int(iteration),
+            from_pystr_to_cstr(dmatrix_handles),
+            from_pystr_to_cstr(evnames),
+            c_bst_ulong(len(dmatrix_handles)),
+            ctypes.c_int(early_stopping_rounds),
+            nonce,
+            ctypes.c_size_t(nonce_size),
+            ctypes.c_uint32(nonce_ctr),
+            ctypes.byref(length),
+            ctypes.byref(sarr),
+            ctypes.byref(out_sig),
+            ctypes.byref(out_sig_len),
+            from_pystr_to_cstr(signers),
+            c_signatures,
+            c_sig_lengths))
+        return length.value, from_cstr_to_pystr(sarr, length), out_sig, out_sig_len.value
+
+    def XGBoosterRunPlan(request, signers, signatures, sig_lengths):
+        plan = request.params.plan
+        nonce = proto_to_pointer(request.seq_num.nonce)
+        nonce_size = request.seq_num.nonce_size
+        nonce_ctr = request.seq_num.nonce_ctr
+        c_signatures, c_sig_lengths = py2c_sigs(signatures, sig_lengths)
+
+        bst_handle = ctypes.c_char_p()
+        length = c_bst_ulong()
+        sarr = ctypes.POINTER(ctypes.c_char_p)()
+        out_sig = ctypes.POINTER(ctypes.c_uint8)()
+        out_sig_len = c_bst_ulong()
+        _check_call(_LIB.XGBoosterRunPlan(
+            c_str(plan),
+            nonce,
+            ctypes.c_size_t(nonce_size),
+            ctypes.c_uint32(nonce_ctr),
+            ctypes.byref(bst_handle),
+            ctypes.byref(length),
+            ctypes.byref(sarr),
+            ctypes.byref(out_sig),
+            ctypes.byref(out_sig_len),
+            from_pystr_to_cstr(signers),
+            c_signatures,
+            c_sig_lengths))
+        return bst_handle.value.decode('utf-8'), length.value, from_cstr_to_pystr(sarr, length), out_sig, out_sig_len.value
+
     def XGBoosterCreate(request, signers, signatures, sig_lengths):
         cache = list(request.params.cache)
         length = request.params.length
@@ -2940,6 +3898,7 @@ class RemoteAPI:
         filenames = list(request.params.filenames)
         usernames = list(request.params.usernames)
         silent = request.params.silent
+        cache_dir = request.params.cache_dir
         nonce = proto_to_pointer(request.seq_num.nonce)
         nonce_size = request.seq_num.nonce_size
         nonce_ctr = request.seq_num.nonce_ctr
@@ -2953,6 +3912,7 @@ class RemoteAPI:
             from_pystr_to_cstr(usernames),
             c_bst_ulong(len(filenames)),
             ctypes.c_int(silent),
+            c_str(cache_dir),
             nonce,
             ctypes.c_size_t(nonce_size),
             ctypes.c_uint32(nonce_ctr),
@@ -3012,6 +3972,56 @@ class RemoteAPI:
             c_sig_lengths))
         return out_sig, out_sig_len.value
 
+    def XGBoosterSaveCheckpoint(request, signers, signatures, sig_lengths):
+        booster_handle = request.params.booster_handle
+        filename = request.params.filename
+        version = request.params.version
+        nonce = proto_to_pointer(request.seq_num.nonce)
+        nonce_size = request.seq_num.nonce_size
+        nonce_ctr = request.seq_num.nonce_ctr
+        c_signatures, c_sig_lengths = py2c_sigs(signatures, sig_lengths)
+
+        out_sig = ctypes.POINTER(ctypes.c_uint8)()
+        out_sig_len = c_bst_ulong()
+        _check_call(_LIB.XGBoosterSaveCheckpoint(
+            c_str(booster_handle),
+            c_str(filename),
+            ctypes.c_uint32(version),
+            nonce,
+            ctypes.c_size_t(nonce_size),
+            ctypes.c_uint32(nonce_ctr),
+            ctypes.byref(out_sig),
+            ctypes.byref(out_sig_len),
+            from_pystr_to_cstr(signers),
+            c_signatures,
+            c_sig_lengths))
+        return out_sig, out_sig_len.value
+
+    def XGBoosterLoadCheckpoint(request, signers, signatures, sig_lengths):
+        booster_handle = request.params.booster_handle
+        filename = request.params.filename
+        nonce = proto_to_pointer(request.seq_num.nonce)
+        nonce_size = request.seq_num.nonce_size
+        nonce_ctr = request.seq_num.nonce_ctr
+        c_signatures, c_sig_lengths = py2c_sigs(signatures, sig_lengths)
+
+        version = ctypes.c_uint32()
+        out_sig = ctypes.POINTER(ctypes.c_uint8)()
+        out_sig_len = c_bst_ulong()
+        _check_call(_LIB.XGBoosterLoadCheckpoint(
+            c_str(booster_handle),
+            c_str(filename),
+            nonce,
+            ctypes.c_size_t(nonce_size),
+            ctypes.c_uint32(nonce_ctr),
+            ctypes.byref(version),
+            ctypes.byref(out_sig),
+            ctypes.byref(out_sig_len),
+            from_pystr_to_cstr(signers),
+            c_signatures,
+            c_sig_lengths))
+        return version.value, out_sig, out_sig_len.value
+
     # TODO test this
     def XGBoosterDumpModelEx(request, signers, signatures, sig_lengths):
         booster_handle = request.params.booster_handle
@@ -3079,6 +4089,43 @@ class RemoteAPI:
             c_sig_lengths))
         return length.value, from_cstr_to_pystr(sarr, length), out_sig, out_sig_len.value
 
+    def XGBoosterDumpModelFramed(request, signers, signatures, sig_lengths):
+        booster_handle = request.params.booster_handle
+        fmap = request.params.fmap
+        flen = request.params.flen
+        fname = list(request.params.fname)
+        ftype = list(request.params.ftype)
+        with_stats = request.params.with_stats
+        dump_format = request.params.dump_format
+        nonce = proto_to_pointer(request.seq_num.nonce)
+        nonce_size = request.seq_num.nonce_size
+        nonce_ctr = request.seq_num.nonce_ctr
+
+        c_signatures, c_sig_lengths = py2c_sigs(signatures, sig_lengths)
+        length = c_bst_ulong()
+        dump = ctypes.POINTER(ctypes.c_uint8)()
+        out_sig = ctypes.POINTER(ctypes.c_uint8)()
+        out_sig_len = c_bst_ulong()
+        _check_call(_LIB.XGBoosterDumpModelFramed(
+            c_str(booster_handle),
+            c_str(fmap),
+            ctypes.c_int(flen),
+            from_pystr_to_cstr(fname),
+            from_pystr_to_cstr(ftype),
+            ctypes.c_int(with_stats),
+            c_str(dump_format),
+            nonce,
+            ctypes.c_size_t(nonce_size),
+            ctypes.c_uint32(nonce_ctr),
+            ctypes.byref(length),
+            ctypes.byref(dump),
+            ctypes.byref(out_sig),
+            ctypes.byref(out_sig_len),
+            from_pystr_to_cstr(signers),
+            c_signatures,
+            c_sig_lengths))
+        return length.value, dump, out_sig, out_sig_len.value
+
     # TODO test this
     def XGBoosterGetModelRaw(request, signers, signatures, sig_lengths):
         booster_handle = request.params.booster_handle
@@ -3106,6 +4153,140 @@ class RemoteAPI:
             c_sig_lengths))
         return length.value, from_cstr_to_pystr(sarr, length), out_sig, out_sig_len.value
 
+    def XGDMatrixFree(request, signers, signatures, sig_lengths):
+        dmatrix_handle = request.params.name
+        nonce = proto_to_pointer(request.seq_num.nonce)
+        nonce_size = request.seq_num.nonce_size
+        nonce_ctr = request.seq_num.nonce_ctr
+        c_signatures, c_sig_lengths = py2c_sigs(signatures, sig_lengths)
+
+        out_sig = ctypes.POINTER(ctypes.c_uint8)()
+        out_sig_len = c_bst_ulong()
+        _check_call(_LIB.XGDMatrixFree(
+            c_str(dmatrix_handle),
+            nonce,
+            ctypes.c_size_t(nonce_size),
+            ctypes.c_uint32(nonce_ctr),
+            ctypes.byref(out_sig),
+            ctypes.byref(out_sig_len),
+            from_pystr_to_cstr(signers),
+            c_signatures,
+            c_sig_lengths))
+        return out_sig, out_sig_len.value
+
+    def XGBoosterFree(request, signers, signatures, sig_lengths):
+        booster_handle = request.params.name
+        nonce = proto_to_pointer(request.seq_num.nonce)
+        nonce_size = request.seq_num.nonce_size
+        nonce_ctr = request.seq_num.nonce_ctr
+        c_signatures, c_sig_lengths = py2c_sigs(signatures, sig_lengths)
+
+        out_sig = ctypes.POINTER(ctypes.c_uint8)()
+        out_sig_len = c_bst_ulong()
+        _check_call(_LIB.XGBoosterFree(
+            c_str(booster_handle),
+            nonce,
+            ctypes.c_size_t(nonce_size),
+            ctypes.c_uint32(nonce_ctr),
+            ctypes.byref(out_sig),
+            ctypes.byref(out_sig_len),
+            from_pystr_to_cstr(signers),
+            c_signatures,
+            c_sig_lengths))
+        return out_sig, out_sig_len.value
+
+    def XGBoosterEnablePredictionService(request, signers, signatures, sig_lengths):
+        booster_handle = request.params.name
+        nonce = proto_to_pointer(request.seq_num.nonce)
+        nonce_size = request.seq_num.nonce_size
+        nonce_ctr = request.seq_num.nonce_ctr
+        c_signatures, c_sig_lengths = py2c_sigs(signatures, sig_lengths)
+
+        out_sig = ctypes.POINTER(ctypes.c_uint8)()
+        out_sig_len = c_bst_ulong()
+        _check_call(_LIB.XGBoosterEnablePredictionService(
+            c_str(booster_handle),
+            nonce,
+            ctypes.c_size_t(nonce_size),
+            ctypes.c_uint32(nonce_ctr),
+            ctypes.byref(out_sig),
+            ctypes.byref(out_sig_len),
+            from_pystr_to_cstr(signers),
+            c_signatures,
+            c_sig_lengths))
+        return out_sig, out_sig_len.value
+
+    def XGBoosterPredictRows(requests):
+        """
+        Predict with the rows of several requests, for the same booster and
+        prediction options, in a single enclave call
+
+        Returns
+        -------
+        results : list
+            Encrypted predictions and number of predictions of each request,
+            or None for each request that failed authentication
+        """
+        first = requests[0]
+        enc_rows = np.concatenate([proto_to_ndarray(request.enc_rows) for request in requests])
+        num_rows = [request.num_rows for request in requests]
+
+        status = (ctypes.c_int * len(requests))()
+        length = c_bst_ulong()
+        preds = ctypes.POINTER(ctypes.c_uint8)()
+        _check_call(_LIB.XGBoosterPredictRows(
+            c_str(first.booster_handle),
+            c_bst_ulong(len(requests)),
+            from_pystr_to_cstr([request.username for request in requests]),
+            from_pystr_to_cstr([request.request_id for request in requests]),
+            c_array(c_bst_ulong, num_rows),
+            c_bst_ulong(first.num_col),
+            enc_rows.ctypes.data_as(ctypes.POINTER(ctypes.c_uint8)),
+            ctypes.c_size_t(enc_rows.size),
+            ctypes.c_int(first.output_margin),
+            ctypes.c_uint(first.ntree_limit),
+            status,
+            ctypes.byref(length),
+            ctypes.byref(preds)))
+
+        # Split the encrypted predictions of each predicted request
+        try:
+            predicted_rows = sum(rows for rows, ok in zip(num_rows, status) if ok == 0)
+            preds_per_row = length.value // predicted_rows if predicted_rows else 0
+            results = []
+            offset = 0
+            for rows, ok in zip(num_rows, status):
+                if ok != 0:
+                    results.append(None)
+                    continue
+                size = rows * preds_per_row * ctypes.sizeof(ctypes.c_float) + CIPHER_IV_SIZE + CIPHER_TAG_SIZE
+                results.append((ctypes.string_at(ctypes.addressof(preds.contents) + offset, size), rows * preds_per_row))
+                offset += size
+            return results
+        finally:
+            _check_call(_LIB.free_buffer(preds))
+
+    def XGBGetEnclaveMemoryStats(request, signers, signatures, sig_lengths):
+        nonce = proto_to_pointer(request.seq_num.nonce)
+        nonce_size = request.seq_num.nonce_size
+        nonce_ctr = request.seq_num.nonce_ctr
+        c_signatures, c_sig_lengths = py2c_sigs(signatures, sig_lengths)
+
+        out_stats = ctypes.c_char_p()
+        out_sig = ctypes.POINTER(ctypes.c_uint8)()
+        out_sig_len = c_bst_ulong()
+        _check_call(_LIB.XGBGetEnclaveMemoryStats(
+            nonce,
+            ctypes.c_size_t(nonce_size),
+            ctypes.c_uint32(nonce_ctr),
+            ctypes.byref(out_stats),
+            ctypes.byref(out_sig),
+            ctypes.byref(out_sig_len),
+            from_pystr_to_cstr(signers),
+            c_signatures,
+            c_sig_lengths))
+        return py_str(out_stats.value), out_sig, out_sig_len.value
+
     def XGDMatrixNumCol(request, signers, signatures, sig_lengths):
         dmatrix_handle = request.params.name
         nonce = proto_to_pointer(request.seq_num.nonce)
@@ -3275,9 +4456,43 @@ def sign_data(key, data, data_size):
 
     return signature, sig_len_as_int
 
-def verify_enclave_signature(data, size, sig, sig_len, increment_nonce=True):
+def decode_framed_dump(buf):
     """
-    Verify the signature returned by the enclave with nonce
+    Split a decrypted framed model dump into the list of trees returned by
+    Booster.get_dump(). The dump is laid out as the number of trees n, then n + 1
+    offsets into the payload, all little-endian uint64, followed by the payload.
+
+    Parameters
+    ----------
+    buf : bytes
+        decrypted dump
+
+    Returns
+    -------
+    res : list of str
+        dump of each tree
+    """
+    num_trees, = struct.unpack_from('<Q', buf, 0)
+    offsets = struct.unpack_from('<{}Q'.format(num_trees + 1), buf, 8)
+    payload = 8 * (num_trees + 2)
+    if payload + offsets[-1] != len(buf):
+        raise XGBoostError("Malformed model dump")
+    return [py_str(buf[payload + offsets[i]:payload + offsets[i + 1]]) for i in range(num_trees)]
+
+
+def _encrypted_output_signed_data(buf, size):
+    """
+    Bytes the enclave signs for an encrypted output laid out as IV | tag | ciphertext.
+    The enclave hashes the ciphertext as it is produced, so the tag comes last.
+    """
+    data = ctypes.string_at(buf, size)
+    return data[:CIPHER_IV_SIZE] + data[CIPHER_IV_SIZE + CIPHER_TAG_SIZE:] + data[CIPHER_IV_SIZE:CIPHER_IV_SIZE + CIPHER_TAG_SIZE]
+
+
+def verify_enclave_signature(data, size, sig, sig_len):
+    """
+    Verify the signature returned by the enclave with the nonce and the
+    sequence number of the command issued by this thread
     """
     arr = (ctypes.c_char * (size + CIPHER_NONCE_SIZE))()
     add_to_sig_data(arr, data=data, data_size=size)
@@ -3289,14 +4504,12 @@ def verify_enclave_signature(data, size, sig, sig_len, increment_nonce=True):
     # Verify signature
     _check_call(_LIB.verify_signature(pem_key, pem_key_len, arr, size, sig, sig_len))
 
-    if increment_nonce:
-        _CONF["nonce_ctr"] += 1
-
 
 def create_client_signature(args):
     """
-    Sign the data for the enclave with nonce
+    Sign the data for the enclave with nonce, under a new sequence number
     """
+    _allocate_nonce_ctr()
     arr = (ctypes.c_char * (len(args) + CIPHER_NONCE_SIZE))()
     add_to_sig_data(arr, data=args)
     add_nonce_to_sig_data(arr, pos=len(args))
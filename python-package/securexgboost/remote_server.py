@@ -13,6 +13,7 @@
 # limitations under the License.
 """The Python implementation of the GRPC RemoteAttestation server."""
 
+import asyncio
 from concurrent import futures
 import logging
 
@@ -32,6 +33,7 @@ from .rabit import RemoteAPI as rabit_remote_api
 # c_bst_ulong corresponds to bst_ulong defined in xgboost/c_api.h
 c_bst_ulong = ctypes.c_uint64
 
+import itertools
 import threading
 import types
 
@@ -102,298 +104,469 @@ class Command(object):
             # Returns <return_value>, signature, sig_len
             self._ret = self._func(self._request, self._usernames, self._signatures, self._sig_lengths)
         else: # We're the RPC orchestrator
-            node_ips = globals()["nodes"]
-            seq_num = self._seq_num
-            signers = self._usernames
-            signatures = self._signatures
-            sig_lengths = self._sig_lengths
+            rpc_name, node_request = self._node_request()
             channels = []
-            for channel_addr in node_ips:
+            for channel_addr in globals()["nodes"]:
                 channels.append(grpc.insecure_channel(channel_addr))
-        
+
             # Store futures in a list
             # Futures hold the result of asynchronous calls to each gRPC server
             futures = []
-        
             for channel in channels:
                 stub = remote_pb2_grpc.RemoteStub(channel)
-        
                 # Asynchronous calls to start job on each node
-                if self._func == rabit_remote_api.RabitInit:
-                    response_future = stub.rpc_RabitInit.future(remote_pb2.RabitParams(
-                        seq_num=seq_num,
-                        signers=signers,
-                        signatures=signatures,
-                        sig_lengths=sig_lengths
-                        ))
-                elif self._func == rabit_remote_api.RabitFinalize:
-                    response_future = stub.rpc_RabitFinalize.future(remote_pb2.RabitParams(
-                        seq_num=seq_num,
-                        signers=signers,
-                        signatures=signatures,
-                        sig_lengths=sig_lengths
-                        ))
-                elif self._func == remote_api.XGDMatrixCreateFromEncryptedFile:
-                    response_future = stub.rpc_XGDMatrixCreateFromEncryptedFile.future(remote_pb2.DMatrixAttrsRequest(
-                        params=self._request.params,
-                        seq_num=seq_num,
-                        signers=signers,
-                        signatures=signatures,
-                        sig_lengths=sig_lengths,
-                        ))
-                elif self._func == remote_api.XGBoosterSetParam:
-                    response_future = stub.rpc_XGBoosterSetParam.future(remote_pb2.BoosterParamRequest(
-                        params=self._request.params,
-                        seq_num=seq_num,
-                        signers=signers,
-                        signatures=signatures,
-                        sig_lengths=sig_lengths
-                        ))
-                elif self._func == remote_api.XGBoosterCreate:
-                    response_future = stub.rpc_XGBoosterCreate.future(remote_pb2.BoosterAttrsRequest(
-                        params=self._request.params,
-                        seq_num=seq_num,
-                        signers=signers,
-                        signatures=signatures,
-                        sig_lengths=sig_lengths
-                        ))
-                elif self._func == remote_api.XGBoosterUpdateOneIter:
-                    response_future = stub.rpc_XGBoosterUpdateOneIter.future(remote_pb2.BoosterUpdateParamsRequest(
-                        params=self._request.params,
-                        seq_num=seq_num,
-                        signers=signers,
-                        signatures=signatures,
-                        sig_lengths=sig_lengths
-                        ))
-                elif self._func == remote_api.XGBoosterSaveModel:
-                    response_future = stub.rpc_XGBoosterSaveModel.future(remote_pb2.SaveModelParamsRequest(
-                        params=self._request.params,
-                        seq_num=seq_num,
-                        signers=signers,
-                        signatures=signatures,
-                        sig_lengths=sig_lengths
-                        ))
-                elif self._func == remote_api.XGBoosterLoadModel:
-                    response_future = stub.rpc_XGBoosterLoadModel.future(remote_pb2.LoadModelParamsRequest(
-                        params=self._request.params,
-                        seq_num=seq_num,
-                        signers=signers,
-                        signatures=signatures,
-                        sig_lengths=sig_lengths
-                        ))
-                elif self._func == remote_api.XGBoosterDumpModelEx:
-                    response_future = stub.rpc_XGBoosterDumpModelEx.future(remote_pb2.DumpModelParamsRequest(
-                        params=self._request.params,
-                        seq_num=seq_num,
-                        signers=signers,
-                        signatures=signatures,
-                        sig_lengths=sig_lengths
-                        ))
-                elif self._func == remote_api.XGBoosterDumpModelExWithFeatures:
-                    response_future = stub.rpc_XGBoosterDumpModelExWithFeatures.future(remote_pb2.DumpModelWithFeaturesParamsRequest(
-                        params=self._request.params,
-                        seq_num=seq_num,
-                        signers=signers,
-                        signatures=signatures,
-                        sig_lengths=sig_lengths
-                        ))
-                elif self._func == remote_api.XGBoosterGetModelRaw:
-                    response_future = stub.rpc_XGBoosterGetModelRaw.future(remote_pb2.ModelRawParamsRequest(
-                        params=self._request.params,
-                        seq_num=seq_num,
-                        signers=signers,
-                        signatures=signatures,
-                        sig_lengths=sig_lengths
-                        ))
-                elif self._func == remote_api.XGDMatrixNumRow:
-                    response_future = stub.rpc_XGDMatrixNumRow.future(remote_pb2.NumRowRequest(
-                        params=self._request.params,
-                        seq_num=seq_num,
-                        signers=signers,
-                        signatures=signatures,
-                        sig_lengths=sig_lengths
-                        ))
-                elif self._func == remote_api.XGDMatrixNumCol:
-                    response_future = stub.rpc_XGDMatrixNumCol.future(remote_pb2.NumColRequest(
-                        params=self._request.params,
-                        seq_num=seq_num,
-                        signers=signers,
-                        signatures=signatures,
-                        sig_lengths=sig_lengths
-                        ))
-                elif self._func == remote_api.XGBoosterPredict:
-                    response_future = stub.rpc_XGBoosterPredict.future(remote_pb2.PredictParamsRequest(
-                        params=self._request.params,
-                        seq_num=seq_num,
-                        signers=signers,
-                        signatures=signatures,
-                        sig_lengths=sig_lengths
-                        ))
-                futures.append(response_future)
-        
+                futures.append(getattr(stub, rpc_name).future(node_request))
+
             results = []
             for future in futures:
                 results.append(future.result())
+            self._set_result(results)
 
-            statuses = [result.status.status for result in results]
-            
-            # Check for error
-            error = False
-            exception = None
-            if -1 in statuses:
-                exceptions = [result.status.exception for result in results]
-                error = True
-                i = statuses.index(-1)
-                exception = exceptions[i]
-
-            # Collect all signatures
-            master_signature = None
-            master_sig_len = None
-
-            if self._func != remote_api.XGBoosterPredict:
-                sig_protos = []
-                sig_lens = []
-                for result in results:
-                    sig_protos.append(result.signature)
-                    sig_lens.append(result.sig_len)
-
-                # If we return only one signature, return the signature from the master enclave
-                master_signature = sig_protos[0]
-                master_sig_len = sig_lens[0]
-                
-            # Set return value
-            if self._func == rabit_remote_api.RabitInit:
-                if error:
-                    self._ret = remote_pb2.Status(status=-1, exception=exception)
-                else:
-                    # FIXME: add signatures
-                    self._ret = remote_pb2.Status(status=0)
-            elif self._func == rabit_remote_api.RabitFinalize:
-                if error:
-                    self._ret = remote_pb2.Status(status=-1, exception=exception)
-                else:
-                    # FIXME: add signatures
-                    self._ret = remote_pb2.Status(status=0)
-            elif self._func == remote_api.XGDMatrixCreateFromEncryptedFile:
-                if error:
-                    self._ret = (None, None, None, remote_pb2.Status(status=-1, exception=exception)) 
-                else:
-                    dmatrix_handles = [result.name for result in results]
-                    if dmatrix_handles.count(dmatrix_handles[0]) == len(dmatrix_handles):
-                        # Every enclave returned the same handle string
-                        self._ret = (dmatrix_handles[0], master_signature, master_sig_len, remote_pb2.Status(status=0))
-                    else:
-                        self._ret = (None, None, None, remote_pb2.Status(status=-1, exception="ERROR: Inconsistent dmatrix handles returned by enclaves in XGDMatrixCreateFromEncryptedFile call"))
-            elif self._func == remote_api.XGBoosterSetParam:
-                if error:
-                    self._ret = (None, None, remote_pb2.Status(status=-1, exception=exception))
+    async def invoke_async(self, username, node_timeout=None):
+        """
+        Relay the command to every node concurrently from an asyncio event loop.
+        A node that has not answered within `node_timeout` seconds fails the command.
+        """
+        if self._is_error:
+            self.handle_error(username)
+
+        rpc_name, node_request = self._node_request()
+        channels = [grpc.aio.insecure_channel(channel_addr) for channel_addr in globals()["nodes"]]
+        try:
+            results = await asyncio.gather(*[
+                getattr(remote_pb2_grpc.RemoteStub(channel), rpc_name)(node_request, timeout=node_timeout)
+                for channel in channels])
+        except grpc.aio.AioRpcError as e:
+            # Fail the command for every user, so that the next command can be submitted
+            self._is_error = True
+            self._error = "A node did not complete the command: {} ({})".format(e.details(), e.code())
+            self.handle_error(username)
+        finally:
+            for channel in channels:
+                await channel.close()
+        self._set_result(results)
+
+    def _node_request(self):
+        """
+        Name of the RPC that runs this command on each node, and its request
+        """
+        seq_num = self._seq_num
+        signers = self._usernames
+        signatures = self._signatures
+        sig_lengths = self._sig_lengths
+
+        if self._func == rabit_remote_api.RabitInit:
+            return "rpc_RabitInit", remote_pb2.RabitParams(
+                seq_num=seq_num,
+                signers=signers,
+                signatures=signatures,
+                sig_lengths=sig_lengths
+                )
+        elif self._func == rabit_remote_api.RabitFinalize:
+            return "rpc_RabitFinalize", remote_pb2.RabitParams(
+                seq_num=seq_num,
+                signers=signers,
+                signatures=signatures,
+                sig_lengths=sig_lengths
+                )
+        elif self._func == remote_api.XGDMatrixCreateFromEncryptedFile:
+            return "rpc_XGDMatrixCreateFromEncryptedFile", remote_pb2.DMatrixAttrsRequest(
+                params=self._request.params,
+                seq_num=seq_num,
+                signers=signers,
+                signatures=signatures,
+                sig_lengths=sig_lengths,
+                )
+        elif self._func == remote_api.XGBoosterSetParam:
+            return "rpc_XGBoosterSetParam", remote_pb2.BoosterParamRequest(
+                params=self._request.params,
+                seq_num=seq_num,
+                signers=signers,
+                signatures=signatures,
+                sig_lengths=sig_lengths
+                )
+        elif self._func == remote_api.XGBoosterCreate:
+            return "rpc_XGBoosterCreate", remote_pb2.BoosterAttrsRequest(
+                params=self._request.params,
+                seq_num=seq_num,
+                signers=signers,
+                signatures=signatures,
+                sig_lengths=sig_lengths
+                )
+        elif self._func == remote_api.XGBoosterUpdateOneIter:
+            return "rpc_XGBoosterUpdateOneIter", remote_pb2.BoosterUpdateParamsRequest(
+                params=self._request.params,
+                seq_num=seq_num,
+                signers=signers,
+                signatures=signatures,
+                sig_lengths=sig_lengths
+                )
+        elif self._func == remote_api.XGBoosterEvalOneIter:
+            return "rpc_XGBoosterEvalOneIter", remote_pb2.BoosterEvalSetParamsRequest(
+                params=self._request.params,
+                seq_num=seq_num,
+                signers=signers,
+                signatures=signatures,
+                sig_lengths=sig_lengths
+                )
+        elif self._func == remote_api.XGBoosterSaveModel:
+            return "rpc_XGBoosterSaveModel", remote_pb2.SaveModelParamsRequest(
+                params=self._request.params,
+                seq_num=seq_num,
+                signers=signers,
+                signatures=signatures,
+                sig_lengths=sig_lengths
+                )
+        elif self._func == remote_api.XGBoosterLoadModel:
+            return "rpc_XGBoosterLoadModel", remote_pb2.LoadModelParamsRequest(
+                params=self._request.params,
+                seq_num=seq_num,
+                signers=signers,
+                signatures=signatures,
+                sig_lengths=sig_lengths
+                )
+        elif self._func == remote_api.XGBoosterSaveCheckpoint:
+            return "rpc_XGBoosterSaveCheckpoint", remote_pb2.CheckpointParamsRequest(
+                params=self._request.params,
+                seq_num=seq_num,
+                signers=signers,
+                signatures=signatures,
+                sig_lengths=sig_lengths
+                )
+        elif self._func == remote_api.XGBoosterLoadCheckpoint:
+            return "rpc_XGBoosterLoadCheckpoint", remote_pb2.CheckpointParamsRequest(
+                params=self._request.params,
+                seq_num=seq_num,
+                signers=signers,
+                signatures=signatures,
+                sig_lengths=sig_lengths
+                )
+        elif self._func == remote_api.XGBoosterDumpModelEx:
+            return "rpc_XGBoosterDumpModelEx", remote_pb2.DumpModelParamsRequest(
+                params=self._request.params,
+                seq_num=seq_num,
+                signers=signers,
+                signatures=signatures,
+                sig_lengths=sig_lengths
+                )
+        elif self._func == remote_api.XGBoosterDumpModelExWithFeatures:
+            return "rpc_XGBoosterDumpModelExWithFeatures", remote_pb2.DumpModelWithFeaturesParamsRequest(
+                params=self._request.params,
+                seq_num=seq_num,
+                signers=signers,
+                signatures=signatures,
+                sig_lengths=sig_lengths
+                )
+        elif self._func == remote_api.XGBoosterDumpModelFramed:
+            return "rpc_XGBoosterDumpModelFramed", remote_pb2.DumpModelFramedParamsRequest(
+                params=self._request.params,
+                seq_num=seq_num,
+                signers=signers,
+                signatures=signatures,
+                sig_lengths=sig_lengths
+                )
+        elif self._func == remote_api.XGBoosterGetModelRaw:
+            return "rpc_XGBoosterGetModelRaw", remote_pb2.ModelRawParamsRequest(
+                params=self._request.params,
+                seq_num=seq_num,
+                signers=signers,
+                signatures=signatures,
+                sig_lengths=sig_lengths
+                )
+        elif self._func == remote_api.XGDMatrixNumRow:
+            return "rpc_XGDMatrixNumRow", remote_pb2.NumRowRequest(
+                params=self._request.params,
+                seq_num=seq_num,
+                signers=signers,
+                signatures=signatures,
+                sig_lengths=sig_lengths
+                )
+        elif self._func == remote_api.XGDMatrixFree:
+            return "rpc_XGDMatrixFree", remote_pb2.DMatrixFreeRequest(
+                params=self._request.params,
+                seq_num=seq_num,
+                signers=signers,
+                signatures=signatures,
+                sig_lengths=sig_lengths
+                )
+        elif self._func == remote_api.XGBoosterFree:
+            return "rpc_XGBoosterFree", remote_pb2.BoosterFreeRequest(
+                params=self._request.params,
+                seq_num=seq_num,
+                signers=signers,
+                signatures=signatures,
+                sig_lengths=sig_lengths
+                )
+        elif self._func == remote_api.XGBoosterEnablePredictionService:
+            return "rpc_XGBoosterEnablePredictionService", remote_pb2.PredictionServiceRequest(
+                params=self._request.params,
+                seq_num=seq_num,
+                signers=signers,
+                signatures=signatures,
+                sig_lengths=sig_lengths
+                )
+        elif self._func == remote_api.XGBGetEnclaveMemoryStats:
+            return "rpc_XGBGetEnclaveMemoryStats", remote_pb2.MemoryStatsRequest(
+                params=self._request.params,
+                seq_num=seq_num,
+                signers=signers,
+                signatures=signatures,
+                sig_lengths=sig_lengths
+                )
+        elif self._func == remote_api.XGDMatrixNumCol:
+            return "rpc_XGDMatrixNumCol", remote_pb2.NumColRequest(
+                params=self._request.params,
+                seq_num=seq_num,
+                signers=signers,
+                signatures=signatures,
+                sig_lengths=sig_lengths
+                )
+        elif self._func == remote_api.XGBoosterPredict:
+            return "rpc_XGBoosterPredict", remote_pb2.PredictParamsRequest(
+                params=self._request.params,
+                seq_num=seq_num,
+                signers=signers,
+                signatures=signatures,
+                sig_lengths=sig_lengths
+                )
+        elif self._func == remote_api.XGBoosterRunPlan:
+            return "rpc_XGBoosterRunPlan", remote_pb2.PlanRequest(
+                params=self._request.params,
+                seq_num=seq_num,
+                signers=signers,
+                signatures=signatures,
+                sig_lengths=sig_lengths
+                )
+        else:
+            raise NotImplementedError
+
+    def _set_result(self, results):
+        """
+        Combine the responses of all nodes into the return value of the command
+        """
+        statuses = [result.status.status for result in results]
+
+        # Check for error
+        error = False
+        exception = None
+        if -1 in statuses:
+            exceptions = [result.status.exception for result in results]
+            error = True
+            i = statuses.index(-1)
+            exception = exceptions[i]
+
+        # Collect all signatures
+        master_signature = None
+        master_sig_len = None
+
+        if self._func not in (remote_api.XGBoosterPredict, remote_api.XGBoosterRunPlan):
+            sig_protos = []
+            sig_lens = []
+            for result in results:
+                sig_protos.append(result.signature)
+                sig_lens.append(result.sig_len)
+
+            # If we return only one signature, return the signature from the master enclave
+            master_signature = sig_protos[0]
+            master_sig_len = sig_lens[0]
+
+        # Set return value
+        if self._func == rabit_remote_api.RabitInit:
+            if error:
+                self._ret = remote_pb2.Status(status=-1, exception=exception)
+            else:
+                # FIXME: add signatures
+                self._ret = remote_pb2.Status(status=0)
+        elif self._func == rabit_remote_api.RabitFinalize:
+            if error:
+                self._ret = remote_pb2.Status(status=-1, exception=exception)
+            else:
+                # FIXME: add signatures
+                self._ret = remote_pb2.Status(status=0)
+        elif self._func == remote_api.XGDMatrixCreateFromEncryptedFile:
+            if error:
+                self._ret = (None, None, None, remote_pb2.Status(status=-1, exception=exception)) 
+            else:
+                dmatrix_handles = [result.name for result in results]
+                if dmatrix_handles.count(dmatrix_handles[0]) == len(dmatrix_handles):
+                    # Every enclave returned the same handle string
+                    self._ret = (dmatrix_handles[0], master_signature, master_sig_len, remote_pb2.Status(status=0))
                 else:
-                    self._ret = (master_signature, master_sig_len, remote_pb2.Status(status=0))
-            elif self._func == remote_api.XGBoosterCreate:
-                if error:
-                    self._ret = (None, None, None, remote_pb2.Status(status=-1, exception=exception)) 
+                    self._ret = (None, None, None, remote_pb2.Status(status=-1, exception="ERROR: Inconsistent dmatrix handles returned by enclaves in XGDMatrixCreateFromEncryptedFile call"))
+        elif self._func == remote_api.XGBoosterSetParam:
+            if error:
+                self._ret = (None, None, remote_pb2.Status(status=-1, exception=exception))
+            else:
+                self._ret = (master_signature, master_sig_len, remote_pb2.Status(status=0))
+        elif self._func == remote_api.XGBoosterCreate:
+            if error:
+                self._ret = (None, None, None, remote_pb2.Status(status=-1, exception=exception)) 
+            else:
+                bst_handles = [result.name for result in results]
+                if bst_handles.count(bst_handles[0]) == len(bst_handles):
+                    # Every enclave returned the same booster handle string
+                    self._ret = (bst_handles[0], master_signature, master_sig_len, remote_pb2.Status(status=0))
                 else:
-                    bst_handles = [result.name for result in results]
-                    if bst_handles.count(bst_handles[0]) == len(bst_handles):
-                        # Every enclave returned the same booster handle string
-                        self._ret = (bst_handles[0], master_signature, master_sig_len, remote_pb2.Status(status=0))
-                    else:
-                        self._ret = (None, None, None, remote_pb2.Status(status=-1, exception="ERROR: Inconsistent booster handles returned by enclaves in XGBoosterCreate call"))
-            elif self._func == remote_api.XGBoosterUpdateOneIter:
-                if error:
-                    self._ret = (None, None, remote_pb2.Status(status=-1, exception=exception))
+                    self._ret = (None, None, None, remote_pb2.Status(status=-1, exception="ERROR: Inconsistent booster handles returned by enclaves in XGBoosterCreate call"))
+        elif self._func == remote_api.XGBoosterUpdateOneIter:
+            if error:
+                self._ret = (None, None, remote_pb2.Status(status=-1, exception=exception))
+            else:
+                self._ret = (master_signature, master_sig_len, remote_pb2.Status(status=0))
+        elif self._func == remote_api.XGBoosterEvalOneIter:
+            if error:
+                self._ret = (None, None, None, None, remote_pb2.Status(status=-1, exception=exception))
+            else:
+                sarrs = [result.sarr for result in results]
+                lengths = [result.length for result in results]
+                if lengths.count(lengths[0]) == len(lengths):
+                    # Metrics are allreduced across the cluster, so every enclave computed the same result
+                    # We cannot check if the results are the same because they are encrypted
+                    self._ret = (lengths[0], sarrs[0], master_signature, master_sig_len, remote_pb2.Status(status=0))
                 else:
-                    self._ret = (master_signature, master_sig_len, remote_pb2.Status(status=0))
-            elif self._func == remote_api.XGBoosterSaveModel:
-                if error:
-                    self._ret = (None, None, remote_pb2.Status(status=-1, exception=exception))
+                    self._ret = (None, None, None, None, remote_pb2.Status(status=-1, exception="ERROR: Inconsistent results from enclaves in XGBoosterEvalOneIter call"))
+        elif self._func == remote_api.XGBoosterSaveModel:
+            if error:
+                self._ret = (None, None, remote_pb2.Status(status=-1, exception=exception))
+            else:
+                self._ret = (master_signature, master_sig_len, remote_pb2.Status(status=0))
+        elif self._func == remote_api.XGBoosterLoadModel:
+            if error:
+                self._ret = (None, None, remote_pb2.Status(status=-1, exception=exception))
+            else:
+                self._ret = (master_signature, master_sig_len, remote_pb2.Status(status=0))
+        elif self._func in (remote_api.XGBoosterSaveCheckpoint, remote_api.XGDMatrixFree, remote_api.XGBoosterFree,
+                            remote_api.XGBoosterEnablePredictionService):
+            if error:
+                self._ret = (None, None, remote_pb2.Status(status=-1, exception=exception))
+            else:
+                self._ret = (master_signature, master_sig_len, remote_pb2.Status(status=0))
+        elif self._func == remote_api.XGBGetEnclaveMemoryStats:
+            if error:
+                self._ret = (None, None, None, remote_pb2.Status(status=-1, exception=exception))
+            else:
+                # Memory use differs across enclaves, return the statistics of the master enclave
+                self._ret = (results[0].stats, master_signature, master_sig_len, remote_pb2.Status(status=0))
+        elif self._func == remote_api.XGBoosterLoadCheckpoint:
+            if error:
+                self._ret = (None, None, None, remote_pb2.Status(status=-1, exception=exception))
+            else:
+                versions = [result.value for result in results]
+                if versions.count(versions[0]) == len(versions):
+                    # Each enclave resumes from the same checkpoint version
+                    self._ret = (versions[0], master_signature, master_sig_len, remote_pb2.Status(status=0))
                 else:
-                    self._ret = (master_signature, master_sig_len, remote_pb2.Status(status=0))
-            elif self._func == remote_api.XGBoosterLoadModel:
-                if error:
-                    self._ret = (None, None, remote_pb2.Status(status=-1, exception=exception))
+                    self._ret = (None, None, None, remote_pb2.Status(status=-1, exception="ERROR: Inconsistent versions from enclaves in XGBoosterLoadCheckpoint call"))
+        elif self._func == remote_api.XGBoosterDumpModelEx:
+            if error:
+                self._ret = (None, None, None, None, remote_pb2.Status(status=-1, exception=exception)) 
+            else:
+                sarrs = [result.sarr for result in results]
+                lengths = [result.length for result in results]
+                if lengths.count(lengths[0]) == len(lengths):
+                    # Every enclave returned the same length
+                    # We cannot check if the dumps are the same because they are encrypted
+                    self._ret = (lengths[0], sarrs[0], master_signature, master_sig_len, remote_pb2.Status(status=0))
                 else:
-                    self._ret = (master_signature, master_sig_len, remote_pb2.Status(status=0))
-            elif self._func == remote_api.XGBoosterDumpModelEx:
-                if error:
-                    self._ret = (None, None, None, None, remote_pb2.Status(status=-1, exception=exception)) 
+                    self._ret = (None, None, None, None, remote_pb2.Status(status=-1, exception="ERROR: Inconsistent results from enclaves in XGBoosterDumpModelEx call"))
+        elif self._func == remote_api.XGBoosterDumpModelExWithFeatures:
+            if error:
+                self._ret = (None, None, None, None, remote_pb2.Status(status=-1, exception=exceptions)) 
+            else:
+                sarrs = [result.sarr for result in results]
+                lengths = [result.length for result in results]
+                if lengths.count(lengths[0]) == len(lengths):
+                    # Every enclave returned the same length
+                    # We cannot check if the dumps are the same because they are encrypted
+                    self._ret = (lengths[0], sarrs[0], master_signature, master_sig_len, remote_pb2.Status(status=0))
                 else:
-                    sarrs = [result.sarr for result in results]
-                    lengths = [result.length for result in results]
-                    if lengths.count(lengths[0]) == len(lengths):
-                        # Every enclave returned the same length
-                        # We cannot check if the dumps are the same because they are encrypted
-                        self._ret = (lengths[0], sarrs[0], master_signature, master_sig_len, remote_pb2.Status(status=0))
-                    else:
-                        self._ret = (None, None, None, None, remote_pb2.Status(status=-1, exception="ERROR: Inconsistent results from enclaves in XGBoosterDumpModelEx call"))
-            elif self._func == remote_api.XGBoosterDumpModelExWithFeatures:
-                if error:
-                    self._ret = (None, None, None, None, remote_pb2.Status(status=-1, exception=exceptions)) 
+                    self._ret = (None, None, None, None, remote_pb2.Status(status=-1, exception="ERROR: Inconsistent results from enclaves in XGBoosterDumpModelExWithFeatures call"))
+        elif self._func == remote_api.XGBoosterDumpModelFramed:
+            if error:
+                self._ret = (None, None, None, None, remote_pb2.Status(status=-1, exception=exception))
+            else:
+                lengths = [result.length for result in results]
+                if lengths.count(lengths[0]) == len(lengths):
+                    # Every enclave returned the same length
+                    # We cannot check if the dumps are the same because they are encrypted
+                    self._ret = (lengths[0], results[0].dump, master_signature, master_sig_len, remote_pb2.Status(status=0))
                 else:
-                    sarrs = [result.sarr for result in results]
-                    lengths = [result.length for result in results]
-                    if lengths.count(lengths[0]) == len(lengths):
-                        # Every enclave returned the same length
-                        # We cannot check if the dumps are the same because they are encrypted
-                        self._ret = (lengths[0], sarrs[0], master_signature, master_sig_len, remote_pb2.Status(status=0))
-                    else:
-                        self._ret = (None, None, None, None, remote_pb2.Status(status=-1, exception="ERROR: Inconsistent results from enclaves in XGBoosterDumpModelExWithFeatures call"))
-            elif self._func == remote_api.XGBoosterGetModelRaw:
-                if error:
-                    self._ret = (None, None, None, None, remote_pb2.Status(status=-1, exception=exceptions)) 
+                    self._ret = (None, None, None, None, remote_pb2.Status(status=-1, exception="ERROR: Inconsistent results from enclaves in XGBoosterDumpModelFramed call"))
+        elif self._func == remote_api.XGBoosterGetModelRaw:
+            if error:
+                self._ret = (None, None, None, None, remote_pb2.Status(status=-1, exception=exceptions)) 
+            else:
+                sarrs = [result.sarr for result in results]
+                lengths = [result.length for result in results]
+                if lengths.count(lengths[0]) == len(lengths):
+                    # Every enclave returned the same length
+                    # We cannot check if the dumps are the same because they are encrypted
+                    self._ret = (lengths[0], sarrs[0], master_signature, master_sig_len, remote_pb2.Status(status=0))
                 else:
-                    sarrs = [result.sarr for result in results]
-                    lengths = [result.length for result in results]
-                    if lengths.count(lengths[0]) == len(lengths):
-                        # Every enclave returned the same length
-                        # We cannot check if the dumps are the same because they are encrypted
-                        self._ret = (lengths[0], sarrs[0], master_signature, master_sig_len, remote_pb2.Status(status=0))
-                    else:
-                        self._ret = (None, None, None, None, remote_pb2.Status(status=-1, exception="ERROR: Inconsistent results from enclaves in XGBoosterGetModelRaw call"))
-            elif self._func == remote_api.XGDMatrixNumRow:
-                if error:
-                    self._ret = (None, None, None, remote_pb2.Status(status=-1, exception=exception)) 
+                    self._ret = (None, None, None, None, remote_pb2.Status(status=-1, exception="ERROR: Inconsistent results from enclaves in XGBoosterGetModelRaw call"))
+        elif self._func == remote_api.XGDMatrixNumRow:
+            if error:
+                self._ret = (None, None, None, remote_pb2.Status(status=-1, exception=exception)) 
+            else:
+                num_rows = [result.value for result in results]
+                if num_rows.count(num_rows[0]) == len(num_rows):
+                    # Each enclave agrees on the number of rows in the DMatrix
+                    self._ret = (num_rows[0], master_signature, master_sig_len, remote_pb2.Status(status=0))
                 else:
-                    num_rows = [result.value for result in results]
-                    if num_rows.count(num_rows[0]) == len(num_rows):
-                        # Each enclave agrees on the number of rows in the DMatrix
-                        self._ret = (num_rows[0], master_signature, master_sig_len, remote_pb2.Status(status=0))
-                    else:
-                        self._ret = (None, None, None, remote_pb2.Status(status=-1, exception="ERROR: Inconsistent numbers from enclaves in XGDMatrixNumRow call")) 
-            elif self._func == remote_api.XGDMatrixNumCol:
-                if error:
-                    self._ret = (None, None, None, remote_pb2.Status(status=-1, exception=exception)) 
+                    self._ret = (None, None, None, remote_pb2.Status(status=-1, exception="ERROR: Inconsistent numbers from enclaves in XGDMatrixNumRow call")) 
+        elif self._func == remote_api.XGDMatrixNumCol:
+            if error:
+                self._ret = (None, None, None, remote_pb2.Status(status=-1, exception=exception)) 
+            else:
+                num_cols = [result.value for result in results]
+                if num_cols.count(num_cols[0]) == len(num_cols):
+                    # Each enclave agrees on the number of columns in the DMatrix
+                    self._ret = (num_cols[0], master_signature, master_sig_len, remote_pb2.Status(status=0))
                 else:
-                    num_cols = [result.value for result in results]
-                    if num_cols.count(num_cols[0]) == len(num_cols):
-                        # Each enclave agrees on the number of columns in the DMatrix
-                        self._ret = (num_cols[0], master_signature, master_sig_len, remote_pb2.Status(status=0))
-                    else:
-                        self._ret = (None, None, None, remote_pb2.Status(status=-1, exception="ERROR: Inconsistent numbers from enclaves in XGDMatrixNumCol call"))
-            elif self._func == remote_api.XGBoosterPredict:
-                if error: 
-                    self._ret = (None, None, None, None, remote_pb2.Status(status=-1, exception=exception)) 
+                    self._ret = (None, None, None, remote_pb2.Status(status=-1, exception="ERROR: Inconsistent numbers from enclaves in XGDMatrixNumCol call"))
+        elif self._func == remote_api.XGBoosterPredict:
+            if error: 
+                self._ret = (None, None, None, None, remote_pb2.Status(status=-1, exception=exception)) 
+            else:
+                enc_preds_ret = []
+                num_preds_ret = []
+                sig_protos_ret = []
+                sig_lens_ret = []
+
+                for result in results:
+                    # Collect encrypted predictions
+                    enc_preds_ret.extend(result.predictions)
+                    num_preds_ret.extend(result.num_preds)
+
+                    # Collect signatures
+                    sig_protos_ret.extend(result.signatures)
+                    sig_lens_ret.extend(result.sig_lens)
+
+                if len(enc_preds_ret) == len(num_preds_ret):
+                    self._ret = (enc_preds_ret, num_preds_ret, sig_protos_ret, sig_lens_ret, remote_pb2.Status(status=0))
                 else:
-                    enc_preds_ret = []
-                    num_preds_ret = []
+                    self._ret = (None, None, None, None, remote_pb2.Status(status=-1, exception="ERROR: Inconsistent results in XGBoosterPredict call"))
+        elif self._func == remote_api.XGBoosterRunPlan:
+            if error:
+                self._ret = (None, None, None, None, None, remote_pb2.Status(status=-1, exception=exception))
+            else:
+                bst_handles = [result.name for result in results]
+                lengths = [result.length for result in results]
+                if bst_handles.count(bst_handles[0]) == len(bst_handles) and lengths.count(lengths[0]) == len(lengths):
+                    # Every enclave predicts on its own part of the data, so the results of
+                    # every enclave are returned, each with its own signature
+                    sarr_ret = []
                     sig_protos_ret = []
                     sig_lens_ret = []
-
                     for result in results:
-                        # Collect encrypted predictions
-                        enc_preds_ret.extend(result.predictions)
-                        num_preds_ret.extend(result.num_preds)
-
-                        # Collect signatures
+                        sarr_ret.extend(result.sarr)
                         sig_protos_ret.extend(result.signatures)
                         sig_lens_ret.extend(result.sig_lens)
-                        
-                    if len(enc_preds_ret) == len(num_preds_ret):
-                        self._ret = (enc_preds_ret, num_preds_ret, sig_protos_ret, sig_lens_ret, remote_pb2.Status(status=0))
-                    else:
-                        self._ret = (None, None, None, None, remote_pb2.Status(status=-1, exception="ERROR: Inconsistent results in XGBoosterPredict call"))
-            else:
-                raise NotImplementedError
+                    self._ret = (bst_handles[0], lengths[0], sarr_ret, sig_protos_ret, sig_lens_ret, remote_pb2.Status(status=0))
+                else:
+                    self._ret = (None, None, None, None, None, remote_pb2.Status(status=-1, exception="ERROR: Inconsistent results from enclaves in XGBoosterRunPlan call"))
+        else:
+            raise NotImplementedError
 
     def result(self, username):
         if self._is_error:
@@ -420,11 +593,101 @@ def handle_exception():
     return remote_pb2.Status(status=-1, exception=str(e[1]))
 
 
+# Same as kMaxPredictRowsPerRequest in the enclave
+_MAX_PREDICT_ROWS_PER_REQUEST = 1 << 20
+
+
+class _PredictionBatch(object):
+    def __init__(self):
+        self.requests = []
+        self.num_rows = 0
+        self.results = None
+        self.error = None
+        # Set once the batch takes no more requests, and once its predictions are ready
+        self.closed = threading.Event()
+        self.done = threading.Event()
+
+
+class PredictionBatcher(object):
+    """
+    Coalesces concurrent PredictRowsRequests for the same booster and prediction
+    options into a single enclave call.
+
+    The first request of a batch waits up to `window` seconds, or until the batch
+    holds `max_rows` rows, for other requests to join. Batches run one at a time,
+    and a batch keeps taking requests while the previous batch is in the enclave.
+    Malformed requests are rejected before they join a batch, and a request that
+    fails authentication in the enclave fails alone, so that one request cannot
+    fail the requests of other users.
+    """
+    def __init__(self, window=0.002, max_rows=4096):
+        self.window = window
+        self.max_rows = max_rows
+        self._lock = threading.Lock()
+        self._run_lock = threading.Lock()
+        self._open = {}
+
+    def _close(self, key, batch):
+        if self._open.get(key) is batch:
+            del self._open[key]
+        batch.closed.set()
+
+    def predict(self, request):
+        """
+        Returns
+        -------
+        enc_preds : bytes
+            Predictions on the rows of `request`, encrypted for its user
+        num_preds : int
+        """
+        if request.num_rows > _MAX_PREDICT_ROWS_PER_REQUEST:
+            raise ValueError("A request holds at most {} rows".format(_MAX_PREDICT_ROWS_PER_REQUEST))
+        enc_size = request.num_rows * request.num_col * ctypes.sizeof(ctypes.c_float) + CIPHER_IV_SIZE + CIPHER_TAG_SIZE
+        if proto_to_ndarray(request.enc_rows).size != enc_size:
+            raise ValueError("Encrypted rows do not match num_rows and num_col")
+
+        key = (request.booster_handle, request.num_col, request.output_margin, request.ntree_limit)
+        with self._lock:
+            batch = self._open.get(key)
+            leader = batch is None
+            if leader:
+                batch = _PredictionBatch()
+                self._open[key] = batch
+            index = len(batch.requests)
+            batch.requests.append(request)
+            batch.num_rows += request.num_rows
+            if batch.num_rows >= self.max_rows:
+                self._close(key, batch)
+
+        if leader:
+            batch.closed.wait(self.window)
+            with self._run_lock:
+                with self._lock:
+                    self._close(key, batch)
+                try:
+                    batch.results = remote_api.XGBoosterPredictRows(batch.requests)
+                except Exception as e:
+                    batch.error = e
+                finally:
+                    batch.done.set()
+        else:
+            batch.done.wait()
+
+        if batch.error is not None:
+            raise batch.error
+        if batch.results[index] is None:
+            raise ValueError("Prediction request failed authentication")
+        return batch.results[index]
+
+
 class RemoteServicer(remote_pb2_grpc.RemoteServicer):
 
-    def __init__(self, condition, command):
+    def __init__(self, condition, command, batcher=None):
         self.condition = condition
         self.command = command
+        self.batcher = batcher or PredictionBatcher()
+        self._node_stubs = None
+        self._node_lock = threading.Lock()
 
     def _synchronize(self, func, params):
         username = params.username
@@ -551,6 +814,30 @@ class RemoteServicer(remote_pb2_grpc.RemoteServicer):
             status = handle_exception()
             return remote_pb2.EnclaveKey(status=status)
 
+    def rpc_XGBResumeSession(self, request, context):
+        """
+        Get the current sequence number of the session for a restarted client
+        """
+        try:
+            if not globals()["is_orchestrator"]:
+                nonce_ctr, sig, sig_len = self._serialize(remote_api.XGBResumeSession, request)
+                sig_proto = pointer_to_proto(sig, sig_len)
+                return remote_pb2.SessionState(nonce_ctr=nonce_ctr, signature=sig_proto, sig_len=sig_len,
+                                               status=remote_pb2.Status(status=0))
+            else:
+                node_ips = globals()["nodes"]
+                master_enclave_ip = node_ips[0]
+                with grpc.insecure_channel(master_enclave_ip) as channel:
+                    stub = remote_pb2_grpc.RemoteStub(channel)
+                    response = stub.rpc_XGBResumeSession(remote_pb2.ResumeSessionRequest(
+                        username=request.username, challenge=request.challenge))
+
+                return response
+
+        except:
+            status = handle_exception()
+            return remote_pb2.SessionState(status=status)
+
     def rpc_XGDMatrixCreateFromEncryptedFile(self, request, context):
         """
         Create DMatrix from encrypted file
@@ -619,6 +906,41 @@ class RemoteServicer(remote_pb2_grpc.RemoteServicer):
             status = handle_exception()
             return remote_pb2.StatusMsg(status=status)
 
+    def rpc_XGBoosterEvalOneIter(self, request, context):
+        """
+        Get encrypted evaluation results
+        """
+        try:
+            if globals()["is_orchestrator"]:
+                length, sarr, sig_proto, sig_len, status = self._synchronize(remote_api.XGBoosterEvalOneIter, request)
+            else:
+                signers, signatures, sig_lengths = get_signers_signatures_sig_lengths(request)
+                length, sarr, sig, sig_len = remote_api.XGBoosterEvalOneIter(request, signers, signatures, sig_lengths)
+                sig_proto = pointer_to_proto(sig, sig_len)
+                status = remote_pb2.Status(status=0)
+            return remote_pb2.Dump(sarr=sarr, length=length, status=status, signature=sig_proto, sig_len=sig_len)
+        except:
+            status = handle_exception()
+            return remote_pb2.Dump(status=status)
+
+    def rpc_XGBoosterRunPlan(self, request, context):
+        """
+        Run a plan signed by every client and get the encrypted results
+        """
+        try:
+            if globals()["is_orchestrator"]:
+                name, length, sarr, sig_proto_list, sig_len_list, status = self._synchronize(remote_api.XGBoosterRunPlan, request)
+            else:
+                signers, signatures, sig_lengths = get_signers_signatures_sig_lengths(request)
+                name, length, sarr, sig, sig_len = remote_api.XGBoosterRunPlan(request, signers, signatures, sig_lengths)
+                sig_proto_list = [pointer_to_proto(sig, sig_len)]
+                sig_len_list = [sig_len]
+                status = remote_pb2.Status(status=0)
+            return remote_pb2.PlanResult(name=name, length=length, sarr=sarr, status=status, signatures=sig_proto_list, sig_lens=sig_len_list)
+        except:
+            status = handle_exception()
+            return remote_pb2.PlanResult(status=status)
+
     def rpc_XGBoosterPredict(self, request, context):
         """
         Get encrypted predictions
@@ -680,6 +1002,40 @@ class RemoteServicer(remote_pb2_grpc.RemoteServicer):
             status = handle_exception()
             return remote_pb2.StatusMsg(status=status)
 
+    def rpc_XGBoosterSaveCheckpoint(self, request, context):
+        """
+        Save sealed training checkpoint
+        """
+        try:
+            if globals()["is_orchestrator"]:
+                sig_proto, sig_len, status = self._synchronize(remote_api.XGBoosterSaveCheckpoint, request)
+            else:
+                signers, signatures, sig_lengths = get_signers_signatures_sig_lengths(request)
+                sig, sig_len = remote_api.XGBoosterSaveCheckpoint(request, signers, signatures, sig_lengths)
+                sig_proto = pointer_to_proto(sig, sig_len)
+                status = remote_pb2.Status(status=0)
+            return remote_pb2.StatusMsg(status=status, signature=sig_proto, sig_len=sig_len)
+        except:
+            status = handle_exception()
+            return remote_pb2.StatusMsg(status=status)
+
+    def rpc_XGBoosterLoadCheckpoint(self, request, context):
+        """
+        Load latest sealed training checkpoint
+        """
+        try:
+            if globals()["is_orchestrator"]:
+                ret, sig_proto, sig_len, status = self._synchronize(remote_api.XGBoosterLoadCheckpoint, request)
+            else:
+                signers, signatures, sig_lengths = get_signers_signatures_sig_lengths(request)
+                ret, sig, sig_len = remote_api.XGBoosterLoadCheckpoint(request, signers, signatures, sig_lengths)
+                sig_proto = pointer_to_proto(sig, sig_len)
+                status = remote_pb2.Status(status=0)
+            return remote_pb2.Integer(value=ret, status=status, signature=sig_proto, sig_len=sig_len)
+        except:
+            status = handle_exception()
+            return remote_pb2.Integer(status=status)
+
     def rpc_XGBoosterDumpModelEx(self, request, context):
         """
         Get encrypted model dump
@@ -714,6 +1070,24 @@ class RemoteServicer(remote_pb2_grpc.RemoteServicer):
             status = handle_exception()
             return remote_pb2.Dump(status=status)
 
+    def rpc_XGBoosterDumpModelFramed(self, request, context):
+        """
+        Get encrypted model dump as a single blob
+        """
+        try:
+            if globals()["is_orchestrator"]:
+                length, dump_proto, sig_proto, sig_len, status = self._synchronize(remote_api.XGBoosterDumpModelFramed, request)
+            else:
+                signers, signatures, sig_lengths = get_signers_signatures_sig_lengths(request)
+                length, dump, sig, sig_len = remote_api.XGBoosterDumpModelFramed(request, signers, signatures, sig_lengths)
+                dump_proto = pointer_to_proto(dump, length)
+                sig_proto = pointer_to_proto(sig, sig_len)
+                status = remote_pb2.Status(status=0)
+            return remote_pb2.FramedDump(dump=dump_proto, length=length, status=status, signature=sig_proto, sig_len=sig_len)
+        except:
+            status = handle_exception()
+            return remote_pb2.FramedDump(status=status)
+
     def rpc_XGBoosterGetModelRaw(self, request, context):
         """
         Get encrypted raw model dump
@@ -731,6 +1105,98 @@ class RemoteServicer(remote_pb2_grpc.RemoteServicer):
             status = handle_exception()
             return remote_pb2.Dump(status=status)
 
+    def rpc_XGDMatrixFree(self, request, context):
+        """
+        Free a DMatrix in the enclave
+        """
+        try:
+            if globals()["is_orchestrator"]:
+                sig_proto, sig_len, status = self._synchronize(remote_api.XGDMatrixFree, request)
+            else:
+                signers, signatures, sig_lengths = get_signers_signatures_sig_lengths(request)
+                sig, sig_len = remote_api.XGDMatrixFree(request, signers, signatures, sig_lengths)
+                sig_proto = pointer_to_proto(sig, sig_len)
+                status = remote_pb2.Status(status=0)
+            return remote_pb2.StatusMsg(status=status, signature=sig_proto, sig_len=sig_len)
+        except:
+            status = handle_exception()
+            return remote_pb2.StatusMsg(status=status)
+
+    def rpc_XGBoosterEnablePredictionService(self, request, context):
+        """
+        Allow every user to predict with a booster on rows sent with the request
+        """
+        try:
+            if globals()["is_orchestrator"]:
+                sig_proto, sig_len, status = self._synchronize(remote_api.XGBoosterEnablePredictionService, request)
+            else:
+                signers, signatures, sig_lengths = get_signers_signatures_sig_lengths(request)
+                sig, sig_len = remote_api.XGBoosterEnablePredictionService(request, signers, signatures, sig_lengths)
+                sig_proto = pointer_to_proto(sig, sig_len)
+                status = remote_pb2.Status(status=0)
+            return remote_pb2.StatusMsg(status=status, signature=sig_proto, sig_len=sig_len)
+        except:
+            status = handle_exception()
+            return remote_pb2.StatusMsg(status=status)
+
+    def _next_node_stub(self):
+        with self._node_lock:
+            if self._node_stubs is None:
+                stubs = [remote_pb2_grpc.RemoteStub(grpc.insecure_channel(addr)) for addr in globals()["nodes"]]
+                self._node_stubs = itertools.cycle(stubs)
+            return next(self._node_stubs)
+
+    def rpc_XGBoosterPredictRows(self, request, context):
+        """
+        Predict with encrypted rows sent with the request. Requests are not
+        synchronized across users: the orchestrator forwards each request to one
+        node, and the node batches it with concurrent requests
+        """
+        try:
+            if globals()["is_orchestrator"]:
+                return self._next_node_stub().rpc_XGBoosterPredictRows(request)
+            enc_preds, num_preds = self.batcher.predict(request)
+            return remote_pb2.RowPredictions(predictions=ndarray_to_proto(np.frombuffer(enc_preds, dtype=np.uint8)),
+                                             num_preds=num_preds,
+                                             status=remote_pb2.Status(status=0))
+        except:
+            status = handle_exception()
+            return remote_pb2.RowPredictions(status=status)
+
+    def rpc_XGBoosterFree(self, request, context):
+        """
+        Free a Booster in the enclave
+        """
+        try:
+            if globals()["is_orchestrator"]:
+                sig_proto, sig_len, status = self._synchronize(remote_api.XGBoosterFree, request)
+            else:
+                signers, signatures, sig_lengths = get_signers_signatures_sig_lengths(request)
+                sig, sig_len = remote_api.XGBoosterFree(request, signers, signatures, sig_lengths)
+                sig_proto = pointer_to_proto(sig, sig_len)
+                status = remote_pb2.Status(status=0)
+            return remote_pb2.StatusMsg(status=status, signature=sig_proto, sig_len=sig_len)
+        except:
+            status = handle_exception()
+            return remote_pb2.StatusMsg(status=status)
+
+    def rpc_XGBGetEnclaveMemoryStats(self, request, context):
+        """
+        Get the enclave memory held by each DMatrix and Booster
+        """
+        try:
+            if globals()["is_orchestrator"]:
+                stats, sig_proto, sig_len, status = self._synchronize(remote_api.XGBGetEnclaveMemoryStats, request)
+            else:
+                signers, signatures, sig_lengths = get_signers_signatures_sig_lengths(request)
+                stats, sig, sig_len = remote_api.XGBGetEnclaveMemoryStats(request, signers, signatures, sig_lengths)
+                sig_proto = pointer_to_proto(sig, sig_len)
+                status = remote_pb2.Status(status=0)
+            return remote_pb2.MemoryStats(stats=stats, status=status, signature=sig_proto, sig_len=sig_len)
+        except:
+            status = handle_exception()
+            return remote_pb2.MemoryStats(status=status)
+
     def rpc_XGDMatrixNumCol(self, request, context):
         """
         Get number of columns in DMatrix
@@ -799,25 +1265,108 @@ class RemoteServicer(remote_pb2_grpc.RemoteServicer):
             return status
 
 
-def serve(all_users=[], nodes=[], nodes_port=50051, num_workers=10, port=50051):
+class _ResolvedCommand(object):
     """
-    Launch the RPC server.
+    Stands in for a RemoteServicer while one of its handlers builds the response
+    to a command that an AsyncRemoteServicer has already run
+    """
+    def __init__(self, ret, error):
+        self._ret = ret
+        self._error = error
 
-    Parameters
-    ----------
-    all_users : list
-        list of usernames participating in the joint computation
-    nodes : list
-        list of IP addresses of nodes in the cluster. Passing in this argument means that this RPC server is the RPC orchestrator
-    nodes_port : int
-        port of each RPC server in cluster 
-    num_workers : int
-        number of threads to use
-    port : int
-        port on which to start this RPC server 
+    def _synchronize(self, func, params):
+        if self._error is not None:
+            raise self._error
+        return self._ret
+
+
+# Commands that the orchestrator only relays to the nodes once every user has submitted them
+_SYNCHRONIZED = {"rpc_" + func.__name__: func for func in [
+    remote_api.XGDMatrixCreateFromEncryptedFile,
+    remote_api.XGBoosterSetParam,
+    remote_api.XGBoosterCreate,
+    remote_api.XGBoosterUpdateOneIter,
+    remote_api.XGBoosterEvalOneIter,
+    remote_api.XGBoosterRunPlan,
+    remote_api.XGBoosterPredict,
+    remote_api.XGBoosterSaveModel,
+    remote_api.XGBoosterLoadModel,
+    remote_api.XGBoosterSaveCheckpoint,
+    remote_api.XGBoosterLoadCheckpoint,
+    remote_api.XGBoosterDumpModelEx,
+    remote_api.XGBoosterDumpModelExWithFeatures,
+    remote_api.XGBoosterDumpModelFramed,
+    remote_api.XGBoosterGetModelRaw,
+    remote_api.XGDMatrixFree,
+    remote_api.XGBoosterFree,
+    remote_api.XGBoosterEnablePredictionService,
+    remote_api.XGBGetEnclaveMemoryStats,
+    remote_api.XGDMatrixNumCol,
+    remote_api.XGDMatrixNumRow,
+    rabit_remote_api.RabitInit,
+    rabit_remote_api.RabitFinalize,
+]}
+
+
+class AsyncRemoteServicer(remote_pb2_grpc.RemoteServicer):
     """
-    condition = threading.Condition()
-    command = Command()
+    RemoteServicer for a grpc.aio server.
+
+    On the orchestrator, a user waiting for the other users to submit a command
+    awaits an asyncio.Condition instead of holding a server thread, and the
+    command is relayed to all nodes concurrently. Every other request, including
+    every enclave call, runs the RemoteServicer handler in `executor`.
+    """
+
+    def __init__(self, command, executor, node_timeout=None, batcher=None):
+        self.condition = asyncio.Condition()
+        self.command = command
+        self.executor = executor
+        self.node_timeout = node_timeout
+        self.servicer = RemoteServicer(threading.Condition(), command, batcher)
+
+    async def _synchronize(self, func, params):
+        username = params.username
+
+        async with self.condition:
+            self.command.submit(func, params, username)
+            if self.command.is_ready():
+                try:
+                    await self.command.invoke_async(username, self.node_timeout)
+                finally:
+                    self.condition.notify_all()
+            else:
+                await self.condition.wait()
+            return self.command.result(username)
+
+
+def _async_handler(name):
+    handler = getattr(RemoteServicer, name)
+    func = _SYNCHRONIZED.get(name)
+
+    async def async_handler(self, request, context):
+        if func is not None and globals()["is_orchestrator"]:
+            ret, error = None, None
+            try:
+                ret = await self._synchronize(func, request)
+            except Exception as e:
+                error = e
+            # Building the response does not call the enclave
+            return handler(_ResolvedCommand(ret, error), request, context)
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(self.executor, handler, self.servicer, request, context)
+
+    async_handler.__name__ = name
+    async_handler.__doc__ = handler.__doc__
+    return async_handler
+
+
+for _name in dir(RemoteServicer):
+    if _name.startswith("rpc_"):
+        setattr(AsyncRemoteServicer, _name, _async_handler(_name))
+
+
+def _init_server(all_users, nodes, nodes_port):
     _USERS.extend(all_users)
 
     # Sort node IPs to ensure that first element in list is rank 0
@@ -835,9 +1384,78 @@ def serve(all_users=[], nodes=[], nodes_port=50051, num_workers=10, port=50051):
 
         print("Hello from the orchestrator!")
 
+
+def serve(all_users=[], nodes=[], nodes_port=50051, num_workers=10, port=50051, batch_window=0.002, max_batch_rows=4096):
+    """
+    Launch the RPC server.
+
+    Parameters
+    ----------
+    all_users : list
+        list of usernames participating in the joint computation
+    nodes : list
+        list of IP addresses of nodes in the cluster. Passing in this argument means that this RPC server is the RPC orchestrator
+    nodes_port : int
+        port of each RPC server in cluster 
+    num_workers : int
+        number of threads to use
+    port : int
+        port on which to start this RPC server 
+    batch_window : float
+        seconds a prediction request sent with its rows waits for concurrent requests to batch with
+    max_batch_rows : int
+        number of rows at which a batch of prediction requests runs without waiting further
+    """
+    condition = threading.Condition()
+    command = Command()
+    _init_server(all_users, nodes, nodes_port)
+
     rpc_server = grpc.server(futures.ThreadPoolExecutor(max_workers=num_workers))
-    remote_pb2_grpc.add_RemoteServicer_to_server(RemoteServicer(condition, command), rpc_server)
+    batcher = PredictionBatcher(batch_window, max_batch_rows)
+    remote_pb2_grpc.add_RemoteServicer_to_server(RemoteServicer(condition, command, batcher), rpc_server)
     rpc_server.add_insecure_port('[::]:' + str(port))
     rpc_server.start()
     rpc_server.wait_for_termination()
 
+
+
+def serve_async(all_users=[], nodes=[], nodes_port=50051, num_workers=10, port=50051, node_timeout=None,
+                batch_window=0.002, max_batch_rows=4096):
+    """
+    Launch the RPC server on grpc.aio.
+
+    Unlike `serve`, users waiting for the other users to submit a command do not
+    hold a thread, so the number of users is not limited by `num_workers`.
+
+    Parameters
+    ----------
+    all_users : list
+        list of usernames participating in the joint computation
+    nodes : list
+        list of IP addresses of nodes in the cluster. Passing in this argument means that this RPC server is the RPC orchestrator
+    nodes_port : int
+        port of each RPC server in cluster
+    num_workers : int
+        number of threads running enclave calls
+    port : int
+        port on which to start this RPC server
+    node_timeout : float
+        seconds the orchestrator waits for each node to complete a command. By default it waits indefinitely
+    batch_window : float
+        seconds a prediction request sent with its rows waits for concurrent requests to batch with
+    max_batch_rows : int
+        number of rows at which a batch of prediction requests runs without waiting further
+    """
+    command = Command()
+    _init_server(all_users, nodes, nodes_port)
+
+    async def run():
+        rpc_server = grpc.aio.server()
+        batcher = PredictionBatcher(batch_window, max_batch_rows)
+        servicer = AsyncRemoteServicer(command, futures.ThreadPoolExecutor(max_workers=num_workers), node_timeout, batcher)
+        remote_pb2_grpc.add_RemoteServicer_to_server(servicer, rpc_server)
+        rpc_server.add_insecure_port('[::]:' + str(port))
+        await rpc_server.start()
+        await rpc_server.wait_for_termination()
+
+    asyncio.get_event_loop().run_until_complete(run())
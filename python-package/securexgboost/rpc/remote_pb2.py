@@ -19,7 +19,7 @@ DESCRIPTOR = _descriptor.FileDescriptor(
   package='remote',
   syntax='proto3',
   serialized_options=None,
-  serialized_pb=b'\n\x0cremote.proto\x12\x06remote\x1a\rndarray.proto\"k\n\tStatusMsg\x12\x1e\n\x06status\x18\x01 \x01(\x0b\x32\x0e.remote.Status\x12-\n\tsignature\x18\x02 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x0f\n\x07sig_len\x18\x03 \x01(\r\"+\n\x06Status\x12\x0e\n\x06status\x18\x01 \x01(\x05\x12\x11\n\texception\x18\x02 \x01(\t\"\xa8\x02\n\x06Report\x12+\n\x07pem_key\x18\x01 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x14\n\x0cpem_key_size\x18\x02 \x01(\r\x12\x31\n\rremote_report\x18\x03 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x1a\n\x12remote_report_size\x18\x04 \x01(\r\x12\x13\n\x0b\x63lient_list\x18\x05 \x03(\t\x12\x18\n\x10\x63lient_list_size\x18\x06 \x01(\r\x12\x1e\n\x06status\x18\x07 \x01(\x0b\x32\x0e.remote.Status\x12)\n\x05nonce\x18\x08 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x12\n\nnonce_size\x18\t \x01(\r\"b\n\x0eSequenceNumber\x12)\n\x05nonce\x18\x01 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x12\n\nnonce_size\x18\x02 \x01(\r\x12\x11\n\tnonce_ctr\x18\x03 \x01(\r\"\xa6\x01\n\x0c\x44\x61taMetadata\x12/\n\x0b\x65nc_sym_key\x18\x01 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x10\n\x08key_size\x18\x02 \x01(\r\x12-\n\tsignature\x18\x03 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x0f\n\x07sig_len\x18\x04 \x01(\r\x12\x13\n\x0b\x63\x65rtificate\x18\x05 \x01(\t\"D\n\x0c\x44MatrixAttrs\x12\x11\n\tfilenames\x18\x01 \x03(\t\x12\x11\n\tusernames\x18\x02 \x03(\t\x12\x0e\n\x06silent\x18\x03 \x01(\r\"\x8c\x02\n\x13\x44MatrixAttrsRequest\x12$\n\x06params\x18\x01 \x01(\x0b\x32\x14.remote.DMatrixAttrs\x12\'\n\x07seq_num\x18\x02 \x01(\x0b\x32\x16.remote.SequenceNumber\x12\x10\n\x08username\x18\x03 \x01(\t\x12-\n\tsignature\x18\x04 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x0f\n\x07sig_len\x18\x05 \x01(\r\x12\x0f\n\x07signers\x18\x06 \x03(\t\x12.\n\nsignatures\x18\x07 \x03(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x13\n\x0bsig_lengths\x18\x08 \x03(\r\"-\n\x0c\x42oosterAttrs\x12\r\n\x05\x63\x61\x63he\x18\x01 \x03(\t\x12\x0e\n\x06length\x18\x02 \x01(\x04\"\x8c\x02\n\x13\x42oosterAttrsRequest\x12$\n\x06params\x18\x01 \x01(\x0b\x32\x14.remote.BoosterAttrs\x12\'\n\x07seq_num\x18\x02 \x01(\x0b\x32\x16.remote.SequenceNumber\x12\x10\n\x08username\x18\x03 \x01(\t\x12-\n\tsignature\x18\x04 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x0f\n\x07sig_len\x18\x05 \x01(\r\x12\x0f\n\x07signers\x18\x06 \x03(\t\x12.\n\nsignatures\x18\x07 \x03(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x13\n\x0bsig_lengths\x18\x08 \x03(\r\"B\n\x0c\x42oosterParam\x12\x16\n\x0e\x62ooster_handle\x18\x01 \x01(\t\x12\x0b\n\x03key\x18\x02 \x01(\t\x12\r\n\x05value\x18\x03 \x01(\t\"\x8c\x02\n\x13\x42oosterParamRequest\x12$\n\x06params\x18\x01 \x01(\x0b\x32\x14.remote.BoosterParam\x12\'\n\x07seq_num\x18\x02 \x01(\x0b\x32\x16.remote.SequenceNumber\x12\x10\n\x08username\x18\x03 \x01(\t\x12-\n\tsignature\x18\x04 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x0f\n\x07sig_len\x18\x05 \x01(\r\x12\x0f\n\x07signers\x18\x06 \x03(\t\x12.\n\nsignatures\x18\x07 \x03(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x13\n\x0bsig_lengths\x18\x08 \x03(\r\"W\n\x13\x42oosterUpdateParams\x12\x16\n\x0e\x62ooster_handle\x18\x01 \x01(\t\x12\x15\n\rdtrain_handle\x18\x02 \x01(\t\x12\x11\n\titeration\x18\x03 \x01(\r\"\x9a\x02\n\x1a\x42oosterUpdateParamsRequest\x12+\n\x06params\x18\x01 \x01(\x0b\x32\x1b.remote.BoosterUpdateParams\x12\'\n\x07seq_num\x18\x02 \x01(\x0b\x32\x16.remote.SequenceNumber\x12\x10\n\x08username\x18\x03 \x01(\t\x12-\n\tsignature\x18\x04 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x0f\n\x07sig_len\x18\x05 \x01(\r\x12\x0f\n\x07signers\x18\x06 \x03(\t\x12.\n\nsignatures\x18\x07 \x03(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x13\n\x0bsig_lengths\x18\x08 \x03(\r\"\x96\x01\n\x14\x42oosterEvalSetParams\x12\x0e\n\x06handle\x18\x01 \x01(\t\x12\x1b\n\x05\x65vals\x18\x02 \x03(\x0b\x32\x0c.remote.Pair\x12\x11\n\titeration\x18\x03 \x01(\r\x12-\n\tsignature\x18\x04 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x0f\n\x07sig_len\x18\x05 \x01(\r\"{\n\rPredictParams\x12\x16\n\x0e\x62ooster_handle\x18\x01 \x01(\t\x12\x16\n\x0e\x64matrix_handle\x18\x02 \x01(\t\x12\x13\n\x0boption_mask\x18\x03 \x01(\r\x12\x13\n\x0bntree_limit\x18\x04 \x01(\r\x12\x10\n\x08training\x18\x05 \x01(\r\"\x8e\x02\n\x14PredictParamsRequest\x12%\n\x06params\x18\x01 \x01(\x0b\x32\x15.remote.PredictParams\x12\'\n\x07seq_num\x18\x02 \x01(\x0b\x32\x16.remote.SequenceNumber\x12\x10\n\x08username\x18\x03 \x01(\t\x12-\n\tsignature\x18\x04 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x0f\n\x07sig_len\x18\x05 \x01(\r\x12\x0f\n\x07signers\x18\x06 \x03(\t\x12.\n\nsignatures\x18\x07 \x03(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x13\n\x0bsig_lengths\x18\x08 \x03(\r\";\n\x0fSaveModelParams\x12\x16\n\x0e\x62ooster_handle\x18\x01 \x01(\t\x12\x10\n\x08\x66ilename\x18\x02 \x01(\t\"\x92\x02\n\x16SaveModelParamsRequest\x12\'\n\x06params\x18\x01 \x01(\x0b\x32\x17.remote.SaveModelParams\x12\'\n\x07seq_num\x18\x02 \x01(\x0b\x32\x16.remote.SequenceNumber\x12\x10\n\x08username\x18\x03 \x01(\t\x12-\n\tsignature\x18\x04 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x0f\n\x07sig_len\x18\x05 \x01(\r\x12\x0f\n\x07signers\x18\x06 \x03(\t\x12.\n\nsignatures\x18\x07 \x03(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x13\n\x0bsig_lengths\x18\x08 \x03(\r\";\n\x0fLoadModelParams\x12\x16\n\x0e\x62ooster_handle\x18\x01 \x01(\t\x12\x10\n\x08\x66ilename\x18\x02 \x01(\t\"\x92\x02\n\x16LoadModelParamsRequest\x12\'\n\x06params\x18\x01 \x01(\x0b\x32\x17.remote.LoadModelParams\x12\'\n\x07seq_num\x18\x02 \x01(\x0b\x32\x16.remote.SequenceNumber\x12\x10\n\x08username\x18\x03 \x01(\t\x12-\n\tsignature\x18\x04 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x0f\n\x07sig_len\x18\x05 \x01(\r\x12\x0f\n\x07signers\x18\x06 \x03(\t\x12.\n\nsignatures\x18\x07 \x03(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x13\n\x0bsig_lengths\x18\x08 \x03(\r\"`\n\x0f\x44umpModelParams\x12\x16\n\x0e\x62ooster_handle\x18\x01 \x01(\t\x12\x0c\n\x04\x66map\x18\x02 \x01(\t\x12\x12\n\nwith_stats\x18\x03 \x01(\r\x12\x13\n\x0b\x64ump_format\x18\x04 \x01(\t\"\x92\x02\n\x16\x44umpModelParamsRequest\x12\'\n\x06params\x18\x01 \x01(\x0b\x32\x17.remote.DumpModelParams\x12\'\n\x07seq_num\x18\x02 \x01(\x0b\x32\x16.remote.SequenceNumber\x12\x10\n\x08username\x18\x03 \x01(\t\x12-\n\tsignature\x18\x04 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x0f\n\x07sig_len\x18\x05 \x01(\r\x12\x0f\n\x07signers\x18\x06 \x03(\t\x12.\n\nsignatures\x18\x07 \x03(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x13\n\x0bsig_lengths\x18\x08 \x03(\r\"\x8a\x01\n\x1b\x44umpModelWithFeaturesParams\x12\x16\n\x0e\x62ooster_handle\x18\x01 \x01(\t\x12\x0c\n\x04\x66len\x18\x02 \x01(\r\x12\r\n\x05\x66name\x18\x03 \x03(\t\x12\r\n\x05\x66type\x18\x04 \x03(\t\x12\x12\n\nwith_stats\x18\x05 \x01(\r\x12\x13\n\x0b\x64ump_format\x18\x06 \x01(\t\"\xaa\x02\n\"DumpModelWithFeaturesParamsRequest\x12\x33\n\x06params\x18\x01 \x01(\x0b\x32#.remote.DumpModelWithFeaturesParams\x12\'\n\x07seq_num\x18\x02 \x01(\x0b\x32\x16.remote.SequenceNumber\x12\x10\n\x08username\x18\x03 \x01(\t\x12-\n\tsignature\x18\x04 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x0f\n\x07sig_len\x18\x05 \x01(\r\x12\x0f\n\x07signers\x18\x06 \x03(\t\x12.\n\nsignatures\x18\x07 \x03(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x13\n\x0bsig_lengths\x18\x08 \x03(\r\"(\n\x0eModelRawParams\x12\x16\n\x0e\x62ooster_handle\x18\x01 \x01(\t\"\x90\x02\n\x15ModelRawParamsRequest\x12&\n\x06params\x18\x01 \x01(\x0b\x32\x16.remote.ModelRawParams\x12\'\n\x07seq_num\x18\x02 \x01(\x0b\x32\x16.remote.SequenceNumber\x12\x10\n\x08username\x18\x03 \x01(\t\x12-\n\tsignature\x18\x04 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x0f\n\x07sig_len\x18\x05 \x01(\r\x12\x0f\n\x07signers\x18\x06 \x03(\t\x12.\n\nsignatures\x18\x07 \x03(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x13\n\x0bsig_lengths\x18\x08 \x03(\r\"\x84\x01\n\x04\x44ump\x12\x0c\n\x04sarr\x18\x01 \x03(\t\x12\x0e\n\x06length\x18\x02 \x01(\x04\x12\x1e\n\x06status\x18\x03 \x01(\x0b\x32\x0e.remote.Status\x12-\n\tsignature\x18\x04 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x0f\n\x07sig_len\x18\x05 \x01(\r\"\x1c\n\x04Pair\x12\t\n\x01x\x18\x01 \x01(\t\x12\t\n\x01y\x18\x02 \x01(\t\"!\n\x11NameRequestParams\x12\x0c\n\x04name\x18\x01 \x01(\t\"\x86\x01\n\x04Name\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x10\n\x08username\x18\x02 \x01(\t\x12-\n\tsignature\x18\x03 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x0f\n\x07sig_len\x18\x04 \x01(\r\x12\x1e\n\x06status\x18\x05 \x01(\x0b\x32\x0e.remote.Status\"\x8b\x02\n\rNumColRequest\x12)\n\x06params\x18\x01 \x01(\x0b\x32\x19.remote.NameRequestParams\x12\'\n\x07seq_num\x18\x02 \x01(\x0b\x32\x16.remote.SequenceNumber\x12\x10\n\x08username\x18\x03 \x01(\t\x12-\n\tsignature\x18\x04 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x0f\n\x07sig_len\x18\x05 \x01(\r\x12\x0f\n\x07signers\x18\x06 \x03(\t\x12.\n\nsignatures\x18\x07 \x03(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x13\n\x0bsig_lengths\x18\x08 \x03(\r\"\x8b\x02\n\rNumRowRequest\x12)\n\x06params\x18\x01 \x01(\x0b\x32\x19.remote.NameRequestParams\x12\'\n\x07seq_num\x18\x02 \x01(\x0b\x32\x16.remote.SequenceNumber\x12\x10\n\x08username\x18\x03 \x01(\t\x12-\n\tsignature\x18\x04 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x0f\n\x07sig_len\x18\x05 \x01(\r\x12\x0f\n\x07signers\x18\x06 \x03(\t\x12.\n\nsignatures\x18\x07 \x03(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x13\n\x0bsig_lengths\x18\x08 \x03(\r\"x\n\x07Integer\x12\r\n\x05value\x18\x01 \x01(\r\x12\x1e\n\x06status\x18\x02 \x01(\x0b\x32\x0e.remote.Status\x12-\n\tsignature\x18\x03 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x0f\n\x07sig_len\x18\x04 \x01(\r\"c\n\nEnclaveKey\x12\'\n\x03key\x18\x01 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x0c\n\x04size\x18\x02 \x01(\r\x12\x1e\n\x06status\x18\x03 \x01(\x0b\x32\x0e.remote.Status\"\xb3\x01\n\x0bPredictions\x12/\n\x0bpredictions\x18\x01 \x03(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x11\n\tnum_preds\x18\x02 \x03(\r\x12\x1e\n\x06status\x18\x03 \x01(\x0b\x32\x0e.remote.Status\x12.\n\nsignatures\x18\x04 \x03(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x10\n\x08sig_lens\x18\x05 \x03(\r\"$\n\rClusterParams\x12\x13\n\x0bnum_workers\x18\x01 \x01(\r\"\xfe\x01\n\x0bRabitParams\x12\x1e\n\x06params\x18\x01 \x01(\x0b\x32\x0e.remote.Status\x12\x10\n\x08username\x18\x02 \x01(\t\x12\'\n\x07seq_num\x18\x03 \x01(\x0b\x32\x16.remote.SequenceNumber\x12-\n\tsignature\x18\x04 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x0f\n\x07sig_len\x18\x05 \x01(\r\x12\x0f\n\x07signers\x18\x06 \x03(\t\x12.\n\nsignatures\x18\x07 \x03(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x13\n\x0bsig_lengths\x18\x08 \x03(\r2\xc9\n\n\x06Remote\x12O\n+rpc_get_remote_report_with_pubkey_and_nonce\x12\x0e.remote.Status\x1a\x0e.remote.Report\"\x00\x12?\n\x12rpc_add_client_key\x12\x14.remote.DataMetadata\x1a\x11.remote.StatusMsg\"\x00\x12P\n#rpc_add_client_key_with_certificate\x12\x14.remote.DataMetadata\x1a\x11.remote.StatusMsg\"\x00\x12>\n\x18rpc_get_enclave_symm_key\x12\x0c.remote.Name\x1a\x12.remote.EnclaveKey\"\x00\x12S\n$rpc_XGDMatrixCreateFromEncryptedFile\x12\x1b.remote.DMatrixAttrsRequest\x1a\x0c.remote.Name\"\x00\x12\x42\n\x13rpc_XGBoosterCreate\x12\x1b.remote.BoosterAttrsRequest\x1a\x0c.remote.Name\"\x00\x12I\n\x15rpc_XGBoosterSetParam\x12\x1b.remote.BoosterParamRequest\x1a\x11.remote.StatusMsg\"\x00\x12U\n\x1arpc_XGBoosterUpdateOneIter\x12\".remote.BoosterUpdateParamsRequest\x1a\x11.remote.StatusMsg\"\x00\x12K\n\x14rpc_XGBoosterPredict\x12\x1c.remote.PredictParamsRequest\x1a\x13.remote.Predictions\"\x00\x12M\n\x16rpc_XGBoosterSaveModel\x12\x1e.remote.SaveModelParamsRequest\x1a\x11.remote.StatusMsg\"\x00\x12M\n\x16rpc_XGBoosterLoadModel\x12\x1e.remote.LoadModelParamsRequest\x1a\x11.remote.StatusMsg\"\x00\x12J\n\x18rpc_XGBoosterDumpModelEx\x12\x1e.remote.DumpModelParamsRequest\x1a\x0c.remote.Dump\"\x00\x12\x62\n$rpc_XGBoosterDumpModelExWithFeatures\x12*.remote.DumpModelWithFeaturesParamsRequest\x1a\x0c.remote.Dump\"\x00\x12I\n\x18rpc_XGBoosterGetModelRaw\x12\x1d.remote.ModelRawParamsRequest\x1a\x0c.remote.Dump\"\x00\x12?\n\x13rpc_XGDMatrixNumCol\x12\x15.remote.NumColRequest\x1a\x0f.remote.Integer\"\x00\x12?\n\x13rpc_XGDMatrixNumRow\x12\x15.remote.NumRowRequest\x1a\x0f.remote.Integer\"\x00\x12\x39\n\rrpc_RabitInit\x12\x13.remote.RabitParams\x1a\x11.remote.StatusMsg\"\x00\x12=\n\x11rpc_RabitFinalize\x12\x13.remote.RabitParams\x1a\x11.remote.StatusMsg\"\x00\x62\x06proto3'
+  serialized_pb=b'\n\x0cremote.proto\x12\x06remote\x1a\rndarray.proto\"k\n\tStatusMsg\x12\x1e\n\x06status\x18\x01 \x01(\x0b\x32\x0e.remote.Status\x12-\n\tsignature\x18\x02 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x0f\n\x07sig_len\x18\x03 \x01(\r\"+\n\x06Status\x12\x0e\n\x06status\x18\x01 \x01(\x05\x12\x11\n\texception\x18\x02 \x01(\t\"\xa8\x02\n\x06Report\x12+\n\x07pem_key\x18\x01 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x14\n\x0cpem_key_size\x18\x02 \x01(\r\x12\x31\n\rremote_report\x18\x03 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x1a\n\x12remote_report_size\x18\x04 \x01(\r\x12\x13\n\x0b\x63lient_list\x18\x05 \x03(\t\x12\x18\n\x10\x63lient_list_size\x18\x06 \x01(\r\x12\x1e\n\x06status\x18\x07 \x01(\x0b\x32\x0e.remote.Status\x12)\n\x05nonce\x18\x08 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x12\n\nnonce_size\x18\t \x01(\r\"b\n\x0eSequenceNumber\x12)\n\x05nonce\x18\x01 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x12\n\nnonce_size\x18\x02 \x01(\r\x12\x11\n\tnonce_ctr\x18\x03 \x01(\r\"\xa6\x01\n\x0c\x44\x61taMetadata\x12/\n\x0b\x65nc_sym_key\x18\x01 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x10\n\x08key_size\x18\x02 \x01(\r\x12-\n\tsignature\x18\x03 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x0f\n\x07sig_len\x18\x04 \x01(\r\x12\x13\n\x0b\x63\x65rtificate\x18\x05 \x01(\t\"W\n\x0c\x44MatrixAttrs\x12\x11\n\tfilenames\x18\x01 \x03(\t\x12\x11\n\tusernames\x18\x02 \x03(\t\x12\x0e\n\x06silent\x18\x03 \x01(\r\x12\x11\n\tcache_dir\x18\x04 \x01(\t\"\x8c\x02\n\x13\x44MatrixAttrsRequest\x12$\n\x06params\x18\x01 \x01(\x0b\x32\x14.remote.DMatrixAttrs\x12\'\n\x07seq_num\x18\x02 \x01(\x0b\x32\x16.remote.SequenceNumber\x12\x10\n\x08username\x18\x03 \x01(\t\x12-\n\tsignature\x18\x04 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x0f\n\x07sig_len\x18\x05 \x01(\r\x12\x0f\n\x07signers\x18\x06 \x03(\t\x12.\n\nsignatures\x18\x07 \x03(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x13\n\x0bsig_lengths\x18\x08 \x03(\r\"-\n\x0c\x42oosterAttrs\x12\r\n\x05\x63\x61\x63he\x18\x01 \x03(\t\x12\x0e\n\x06length\x18\x02 \x01(\x04\"\x8c\x02\n\x13\x42oosterAttrsRequest\x12$\n\x06params\x18\x01 \x01(\x0b\x32\x14.remote.BoosterAttrs\x12\'\n\x07seq_num\x18\x02 \x01(\x0b\x32\x16.remote.SequenceNumber\x12\x10\n\x08username\x18\x03 \x01(\t\x12-\n\tsignature\x18\x04 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x0f\n\x07sig_len\x18\x05 \x01(\r\x12\x0f\n\x07signers\x18\x06 \x03(\t\x12.\n\nsignatures\x18\x07 \x03(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x13\n\x0bsig_lengths\x18\x08 \x03(\r\"B\n\x0c\x42oosterParam\x12\x16\n\x0e\x62ooster_handle\x18\x01 \x01(\t\x12\x0b\n\x03key\x18\x02 \x01(\t\x12\r\n\x05value\x18\x03 \x01(\t\"\x8c\x02\n\x13\x42oosterParamRequest\x12$\n\x06params\x18\x01 \x01(\x0b\x32\x14.remote.BoosterParam\x12\'\n\x07seq_num\x18\x02 \x01(\x0b\x32\x16.remote.SequenceNumber\x12\x10\n\x08username\x18\x03 \x01(\t\x12-\n\tsignature\x18\x04 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x0f\n\x07sig_len\x18\x05 \x01(\r\x12\x0f\n\x07signers\x18\x06 \x03(\t\x12.\n\nsignatures\x18\x07 \x03(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x13\n\x0bsig_lengths\x18\x08 \x03(\r\"W\n\x13\x42oosterUpdateParams\x12\x16\n\x0e\x62ooster_handle\x18\x01 \x01(\t\x12\x15\n\rdtrain_handle\x18\x02 \x01(\t\x12\x11\n\titeration\x18\x03 \x01(\r\"\x9a\x02\n\x1a\x42oosterUpdateParamsRequest\x12+\n\x06params\x18\x01 \x01(\x0b\x32\x1b.remote.BoosterUpdateParams\x12\'\n\x07seq_num\x18\x02 \x01(\x0b\x32\x16.remote.SequenceNumber\x12\x10\n\x08username\x18\x03 \x01(\t\x12-\n\tsignature\x18\x04 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x0f\n\x07sig_len\x18\x05 \x01(\r\x12\x0f\n\x07signers\x18\x06 \x03(\t\x12.\n\nsignatures\x18\x07 \x03(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x13\n\x0bsig_lengths\x18\x08 \x03(\r\"}\n\x14\x42oosterEvalSetParams\x12\x16\n\x0e\x62ooster_handle\x18\x01 \x01(\t\x12\x1b\n\x05\x65vals\x18\x02 \x03(\x0b\x32\x0c.remote.Pair\x12\x11\n\titeration\x18\x03 \x01(\r\x12\x1d\n\x15\x65\x61rly_stopping_rounds\x18\x04 \x01(\r\"\x9c\x02\n\x1b\x42oosterEvalSetParamsRequest\x12,\n\x06params\x18\x01 \x01(\x0b\x32\x1c.remote.BoosterEvalSetParams\x12\'\n\x07seq_num\x18\x02 \x01(\x0b\x32\x16.remote.SequenceNumber\x12\x10\n\x08username\x18\x03 \x01(\t\x12-\n\tsignature\x18\x04 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x0f\n\x07sig_len\x18\x05 \x01(\r\x12\x0f\n\x07signers\x18\x06 \x03(\t\x12.\n\nsignatures\x18\x07 \x03(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x13\n\x0bsig_lengths\x18\x08 \x03(\r\"\x1a\n\nPlanParams\x12\x0c\n\x04plan\x18\x01 \x01(\t\"\x82\x02\n\x0bPlanRequest\x12\"\n\x06params\x18\x01 \x01(\x0b\x32\x12.remote.PlanParams\x12\'\n\x07seq_num\x18\x02 \x01(\x0b\x32\x16.remote.SequenceNumber\x12\x10\n\x08username\x18\x03 \x01(\t\x12-\n\tsignature\x18\x04 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x0f\n\x07sig_len\x18\x05 \x01(\r\x12\x0f\n\x07signers\x18\x06 \x03(\t\x12.\n\nsignatures\x18\x07 \x03(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x13\n\x0bsig_lengths\x18\x08 \x03(\r\"\x9a\x01\n\nPlanResult\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04sarr\x18\x02 \x03(\t\x12\x0e\n\x06length\x18\x03 \x01(\x04\x12\x1e\n\x06status\x18\x04 \x01(\x0b\x32\x0e.remote.Status\x12.\n\nsignatures\x18\x05 \x03(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x10\n\x08sig_lens\x18\x06 \x03(\r\"{\n\rPredictParams\x12\x16\n\x0e\x62ooster_handle\x18\x01 \x01(\t\x12\x16\n\x0e\x64matrix_handle\x18\x02 \x01(\t\x12\x13\n\x0boption_mask\x18\x03 \x01(\r\x12\x13\n\x0bntree_limit\x18\x04 \x01(\r\x12\x10\n\x08training\x18\x05 \x01(\r\"\x8e\x02\n\x14PredictParamsRequest\x12%\n\x06params\x18\x01 \x01(\x0b\x32\x15.remote.PredictParams\x12\'\n\x07seq_num\x18\x02 \x01(\x0b\x32\x16.remote.SequenceNumber\x12\x10\n\x08username\x18\x03 \x01(\t\x12-\n\tsignature\x18\x04 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x0f\n\x07sig_len\x18\x05 \x01(\r\x12\x0f\n\x07signers\x18\x06 \x03(\t\x12.\n\nsignatures\x18\x07 \x03(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x13\n\x0bsig_lengths\x18\x08 \x03(\r\"\x96\x02\n\x18PredictionServiceRequest\x12)\n\x06params\x18\x01 \x01(\x0b\x32\x19.remote.NameRequestParams\x12\'\n\x07seq_num\x18\x02 \x01(\x0b\x32\x16.remote.SequenceNumber\x12\x10\n\x08username\x18\x03 \x01(\t\x12-\n\tsignature\x18\x04 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x0f\n\x07sig_len\x18\x05 \x01(\r\x12\x0f\n\x07signers\x18\x06 \x03(\t\x12.\n\nsignatures\x18\x07 \x03(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x13\n\x0bsig_lengths\x18\x08 \x03(\r\"\xcf\x01\n\x12PredictRowsRequest\x12\x10\n\x08username\x18\x01 \x01(\t\x12\x16\n\x0e\x62ooster_handle\x18\x02 \x01(\t\x12\x12\n\nrequest_id\x18\x03 \x01(\t\x12,\n\x08\x65nc_rows\x18\x04 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x10\n\x08num_rows\x18\x05 \x01(\x04\x12\x0f\n\x07num_col\x18\x06 \x01(\x04\x12\x15\n\routput_margin\x18\x07 \x01(\x05\x12\x13\n\x0bntree_limit\x18\x08 \x01(\r\"t\n\x0eRowPredictions\x12/\n\x0bpredictions\x18\x01 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x11\n\tnum_preds\x18\x02 \x01(\x04\x12\x1e\n\x06status\x18\x03 \x01(\x0b\x32\x0e.remote.Status\";\n\x0fSaveModelParams\x12\x16\n\x0e\x62ooster_handle\x18\x01 \x01(\t\x12\x10\n\x08\x66ilename\x18\x02 \x01(\t\"\x92\x02\n\x16SaveModelParamsRequest\x12\'\n\x06params\x18\x01 \x01(\x0b\x32\x17.remote.SaveModelParams\x12\'\n\x07seq_num\x18\x02 \x01(\x0b\x32\x16.remote.SequenceNumber\x12\x10\n\x08username\x18\x03 \x01(\t\x12-\n\tsignature\x18\x04 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x0f\n\x07sig_len\x18\x05 \x01(\r\x12\x0f\n\x07signers\x18\x06 \x03(\t\x12.\n\nsignatures\x18\x07 \x03(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x13\n\x0bsig_lengths\x18\x08 \x03(\r\"M\n\x10\x43heckpointParams\x12\x16\n\x0e\x62ooster_handle\x18\x01 \x01(\t\x12\x10\n\x08\x66ilename\x18\x02 \x01(\t\x12\x0f\n\x07version\x18\x03 \x01(\r\"\x94\x02\n\x17\x43heckpointParamsRequest\x12(\n\x06params\x18\x01 \x01(\x0b\x32\x18.remote.CheckpointParams\x12\'\n\x07seq_num\x18\x02 \x01(\x0b\x32\x16.remote.SequenceNumber\x12\x10\n\x08username\x18\x03 \x01(\t\x12-\n\tsignature\x18\x04 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x0f\n\x07sig_len\x18\x05 \x01(\r\x12\x0f\n\x07signers\x18\x06 \x03(\t\x12.\n\nsignatures\x18\x07 \x03(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x13\n\x0bsig_lengths\x18\x08 \x03(\r\";\n\x0fLoadModelParams\x12\x16\n\x0e\x62ooster_handle\x18\x01 \x01(\t\x12\x10\n\x08\x66ilename\x18\x02 \x01(\t\"\x92\x02\n\x16LoadModelParamsRequest\x12\'\n\x06params\x18\x01 \x01(\x0b\x32\x17.remote.LoadModelParams\x12\'\n\x07seq_num\x18\x02 \x01(\x0b\x32\x16.remote.SequenceNumber\x12\x10\n\x08username\x18\x03 \x01(\t\x12-\n\tsignature\x18\x04 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x0f\n\x07sig_len\x18\x05 \x01(\r\x12\x0f\n\x07signers\x18\x06 \x03(\t\x12.\n\nsignatures\x18\x07 \x03(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x13\n\x0bsig_lengths\x18\x08 \x03(\r\"`\n\x0f\x44umpModelParams\x12\x16\n\x0e\x62ooster_handle\x18\x01 \x01(\t\x12\x0c\n\x04\x66map\x18\x02 \x01(\t\x12\x12\n\nwith_stats\x18\x03 \x01(\r\x12\x13\n\x0b\x64ump_format\x18\x04 \x01(\t\"\x92\x02\n\x16\x44umpModelParamsRequest\x12\'\n\x06params\x18\x01 \x01(\x0b\x32\x17.remote.DumpModelParams\x12\'\n\x07seq_num\x18\x02 \x01(\x0b\x32\x16.remote.SequenceNumber\x12\x10\n\x08username\x18\x03 \x01(\t\x12-\n\tsignature\x18\x04 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x0f\n\x07sig_len\x18\x05 \x01(\r\x12\x0f\n\x07signers\x18\x06 \x03(\t\x12.\n\nsignatures\x18\x07 \x03(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x13\n\x0bsig_lengths\x18\x08 \x03(\r\"\x8a\x01\n\x1b\x44umpModelWithFeaturesParams\x12\x16\n\x0e\x62ooster_handle\x18\x01 \x01(\t\x12\x0c\n\x04\x66len\x18\x02 \x01(\r\x12\r\n\x05\x66name\x18\x03 \x03(\t\x12\r\n\x05\x66type\x18\x04 \x03(\t\x12\x12\n\nwith_stats\x18\x05 \x01(\r\x12\x13\n\x0b\x64ump_format\x18\x06 \x01(\t\"\xaa\x02\n\"DumpModelWithFeaturesParamsRequest\x12\x33\n\x06params\x18\x01 \x01(\x0b\x32#.remote.DumpModelWithFeaturesParams\x12\'\n\x07seq_num\x18\x02 \x01(\x0b\x32\x16.remote.SequenceNumber\x12\x10\n\x08username\x18\x03 \x01(\t\x12-\n\tsignature\x18\x04 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x0f\n\x07sig_len\x18\x05 \x01(\r\x12\x0f\n\x07signers\x18\x06 \x03(\t\x12.\n\nsignatures\x18\x07 \x03(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x13\n\x0bsig_lengths\x18\x08 \x03(\r\"(\n\x0eModelRawParams\x12\x16\n\x0e\x62ooster_handle\x18\x01 \x01(\t\"\x90\x02\n\x15ModelRawParamsRequest\x12&\n\x06params\x18\x01 \x01(\x0b\x32\x16.remote.ModelRawParams\x12\'\n\x07seq_num\x18\x02 \x01(\x0b\x32\x16.remote.SequenceNumber\x12\x10\n\x08username\x18\x03 \x01(\t\x12-\n\tsignature\x18\x04 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x0f\n\x07sig_len\x18\x05 \x01(\r\x12\x0f\n\x07signers\x18\x06 \x03(\t\x12.\n\nsignatures\x18\x07 \x03(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x13\n\x0bsig_lengths\x18\x08 \x03(\r\"\x84\x01\n\x04\x44ump\x12\x0c\n\x04sarr\x18\x01 \x03(\t\x12\x0e\n\x06length\x18\x02 \x01(\x04\x12\x1e\n\x06status\x18\x03 \x01(\x0b\x32\x0e.remote.Status\x12-\n\tsignature\x18\x04 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x0f\n\x07sig_len\x18\x05 \x01(\r\"\x92\x01\n\x15\x44umpModelFramedParams\x12\x16\n\x0e\x62ooster_handle\x18\x01 \x01(\t\x12\x0c\n\x04\x66map\x18\x02 \x01(\t\x12\x0c\n\x04\x66len\x18\x03 \x01(\r\x12\r\n\x05\x66name\x18\x04 \x03(\t\x12\r\n\x05\x66type\x18\x05 \x03(\t\x12\x12\n\nwith_stats\x18\x06 \x01(\r\x12\x13\n\x0b\x64ump_format\x18\x07 \x01(\t\"\x9e\x02\n\x1c\x44umpModelFramedParamsRequest\x12-\n\x06params\x18\x01 \x01(\x0b\x32\x1d.remote.DumpModelFramedParams\x12\'\n\x07seq_num\x18\x02 \x01(\x0b\x32\x16.remote.SequenceNumber\x12\x10\n\x08username\x18\x03 \x01(\t\x12-\n\tsignature\x18\x04 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x0f\n\x07sig_len\x18\x05 \x01(\r\x12\x0f\n\x07signers\x18\x06 \x03(\t\x12.\n\nsignatures\x18\x07 \x03(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x13\n\x0bsig_lengths\x18\x08 \x03(\r\"\xa6\x01\n\nFramedDump\x12(\n\x04\x64ump\x18\x01 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x0e\n\x06length\x18\x02 \x01(\x04\x12\x1e\n\x06status\x18\x03 \x01(\x0b\x32\x0e.remote.Status\x12-\n\tsignature\x18\x04 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x0f\n\x07sig_len\x18\x05 \x01(\r\"\x1c\n\x04Pair\x12\t\n\x01x\x18\x01 \x01(\t\x12\t\n\x01y\x18\x02 \x01(\t\"!\n\x11NameRequestParams\x12\x0c\n\x04name\x18\x01 \x01(\t\"\x86\x01\n\x04Name\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x10\n\x08username\x18\x02 \x01(\t\x12-\n\tsignature\x18\x03 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x0f\n\x07sig_len\x18\x04 \x01(\r\x12\x1e\n\x06status\x18\x05 \x01(\x0b\x32\x0e.remote.Status\"\x8b\x02\n\rNumColRequest\x12)\n\x06params\x18\x01 \x01(\x0b\x32\x19.remote.NameRequestParams\x12\'\n\x07seq_num\x18\x02 \x01(\x0b\x32\x16.remote.SequenceNumber\x12\x10\n\x08username\x18\x03 \x01(\t\x12-\n\tsignature\x18\x04 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x0f\n\x07sig_len\x18\x05 \x01(\r\x12\x0f\n\x07signers\x18\x06 \x03(\t\x12.\n\nsignatures\x18\x07 \x03(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x13\n\x0bsig_lengths\x18\x08 \x03(\r\"\x8b\x02\n\rNumRowRequest\x12)\n\x06params\x18\x01 \x01(\x0b\x32\x19.remote.NameRequestParams\x12\'\n\x07seq_num\x18\x02 \x01(\x0b\x32\x16.remote.SequenceNumber\x12\x10\n\x08username\x18\x03 \x01(\t\x12-\n\tsignature\x18\x04 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x0f\n\x07sig_len\x18\x05 \x01(\r\x12\x0f\n\x07signers\x18\x06 \x03(\t\x12.\n\nsignatures\x18\x07 \x03(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x13\n\x0bsig_lengths\x18\x08 \x03(\r\"\x90\x02\n\x12\x44MatrixFreeRequest\x12)\n\x06params\x18\x01 \x01(\x0b\x32\x19.remote.NameRequestParams\x12\'\n\x07seq_num\x18\x02 \x01(\x0b\x32\x16.remote.SequenceNumber\x12\x10\n\x08username\x18\x03 \x01(\t\x12-\n\tsignature\x18\x04 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x0f\n\x07sig_len\x18\x05 \x01(\r\x12\x0f\n\x07signers\x18\x06 \x03(\t\x12.\n\nsignatures\x18\x07 \x03(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x13\n\x0bsig_lengths\x18\x08 \x03(\r\"\x90\x02\n\x12\x42oosterFreeRequest\x12)\n\x06params\x18\x01 \x01(\x0b\x32\x19.remote.NameRequestParams\x12\'\n\x07seq_num\x18\x02 \x01(\x0b\x32\x16.remote.SequenceNumber\x12\x10\n\x08username\x18\x03 \x01(\t\x12-\n\tsignature\x18\x04 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x0f\n\x07sig_len\x18\x05 \x01(\r\x12\x0f\n\x07signers\x18\x06 \x03(\t\x12.\n\nsignatures\x18\x07 \x03(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x13\n\x0bsig_lengths\x18\x08 \x03(\r\"\x85\x02\n\x12MemoryStatsRequest\x12\x1e\n\x06params\x18\x01 \x01(\x0b\x32\x0e.remote.Status\x12\'\n\x07seq_num\x18\x02 \x01(\x0b\x32\x16.remote.SequenceNumber\x12\x10\n\x08username\x18\x03 \x01(\t\x12-\n\tsignature\x18\x04 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x0f\n\x07sig_len\x18\x05 \x01(\r\x12\x0f\n\x07signers\x18\x06 \x03(\t\x12.\n\nsignatures\x18\x07 \x03(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x13\n\x0bsig_lengths\x18\x08 \x03(\r\"|\n\x0bMemoryStats\x12\r\n\x05stats\x18\x01 \x01(\t\x12\x1e\n\x06status\x18\x02 \x01(\x0b\x32\x0e.remote.Status\x12-\n\tsignature\x18\x03 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x0f\n\x07sig_len\x18\x04 \x01(\r\"x\n\x07Integer\x12\r\n\x05value\x18\x01 \x01(\r\x12\x1e\n\x06status\x18\x02 \x01(\x0b\x32\x0e.remote.Status\x12-\n\tsignature\x18\x03 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x0f\n\x07sig_len\x18\x04 \x01(\r\"c\n\nEnclaveKey\x12\'\n\x03key\x18\x01 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x0c\n\x04size\x18\x02 \x01(\r\x12\x1e\n\x06status\x18\x03 \x01(\x0b\x32\x0e.remote.Status\";\n\x14ResumeSessionRequest\x12\x10\n\x08username\x18\x01 \x01(\t\x12\x11\n\tchallenge\x18\x02 \x01(\t\"\x81\x01\n\x0cSessionState\x12\x11\n\tnonce_ctr\x18\x01 \x01(\r\x12\x1e\n\x06status\x18\x02 \x01(\x0b\x32\x0e.remote.Status\x12-\n\tsignature\x18\x03 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x0f\n\x07sig_len\x18\x04 \x01(\r\"\xb3\x01\n\x0bPredictions\x12/\n\x0bpredictions\x18\x01 \x03(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x11\n\tnum_preds\x18\x02 \x03(\r\x12\x1e\n\x06status\x18\x03 \x01(\x0b\x32\x0e.remote.Status\x12.\n\nsignatures\x18\x04 \x03(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x10\n\x08sig_lens\x18\x05 \x03(\r\"$\n\rClusterParams\x12\x13\n\x0bnum_workers\x18\x01 \x01(\r\"\xfe\x01\n\x0bRabitParams\x12\x1e\n\x06params\x18\x01 \x01(\x0b\x32\x0e.remote.Status\x12\x10\n\x08username\x18\x02 \x01(\t\x12\'\n\x07seq_num\x18\x03 \x01(\x0b\x32\x16.remote.SequenceNumber\x12-\n\tsignature\x18\x04 \x01(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x0f\n\x07sig_len\x18\x05 \x01(\r\x12\x0f\n\x07signers\x18\x06 \x03(\t\x12.\n\nsignatures\x18\x07 \x03(\x0b\x32\x1a.numproto.protobuf.NDArray\x12\x13\n\x0bsig_lengths\x18\x08 \x03(\r2\xbf\x11\n\x06Remote\x12O\n+rpc_get_remote_report_with_pubkey_and_nonce\x12\x0e.remote.Status\x1a\x0e.remote.Report\"\x00\x12?\n\x12rpc_add_client_key\x12\x14.remote.DataMetadata\x1a\x11.remote.StatusMsg\"\x00\x12P\n#rpc_add_client_key_with_certificate\x12\x14.remote.DataMetadata\x1a\x11.remote.StatusMsg\"\x00\x12>\n\x18rpc_get_enclave_symm_key\x12\x0c.remote.Name\x1a\x12.remote.EnclaveKey\"\x00\x12L\n\x14rpc_XGBResumeSession\x12\x1c.remote.ResumeSessionRequest\x1a\x14.remote.SessionState\"\x00\x12S\n$rpc_XGDMatrixCreateFromEncryptedFile\x12\x1b.remote.DMatrixAttrsRequest\x1a\x0c.remote.Name\"\x00\x12\x42\n\x13rpc_XGBoosterCreate\x12\x1b.remote.BoosterAttrsRequest\x1a\x0c.remote.Name\"\x00\x12I\n\x15rpc_XGBoosterSetParam\x12\x1b.remote.BoosterParamRequest\x1a\x11.remote.StatusMsg\"\x00\x12U\n\x1arpc_XGBoosterUpdateOneIter\x12\".remote.BoosterUpdateParamsRequest\x1a\x11.remote.StatusMsg\"\x00\x12O\n\x18rpc_XGBoosterEvalOneIter\x12#.remote.BoosterEvalSetParamsRequest\x1a\x0c.remote.Dump\"\x00\x12K\n\x14rpc_XGBoosterPredict\x12\x1c.remote.PredictParamsRequest\x1a\x13.remote.Predictions\"\x00\x12]\n$rpc_XGBoosterEnablePredictionService\x12 .remote.PredictionServiceRequest\x1a\x11.remote.StatusMsg\"\x00\x12P\n\x18rpc_XGBoosterPredictRows\x12\x1a.remote.PredictRowsRequest\x1a\x16.remote.RowPredictions\"\x00\x12M\n\x16rpc_XGBoosterSaveModel\x12\x1e.remote.SaveModelParamsRequest\x1a\x11.remote.StatusMsg\"\x00\x12M\n\x16rpc_XGBoosterLoadModel\x12\x1e.remote.LoadModelParamsRequest\x1a\x11.remote.StatusMsg\"\x00\x12S\n\x1brpc_XGBoosterSaveCheckpoint\x12\x1f.remote.CheckpointParamsRequest\x1a\x11.remote.StatusMsg\"\x00\x12Q\n\x1brpc_XGBoosterLoadCheckpoint\x12\x1f.remote.CheckpointParamsRequest\x1a\x0f.remote.Integer\"\x00\x12J\n\x18rpc_XGBoosterDumpModelEx\x12\x1e.remote.DumpModelParamsRequest\x1a\x0c.remote.Dump\"\x00\x12\x62\n$rpc_XGBoosterDumpModelExWithFeatures\x12*.remote.DumpModelWithFeaturesParamsRequest\x1a\x0c.remote.Dump\"\x00\x12Z\n\x1crpc_XGBoosterDumpModelFramed\x12$.remote.DumpModelFramedParamsRequest\x1a\x12.remote.FramedDump\"\x00\x12I\n\x18rpc_XGBoosterGetModelRaw\x12\x1d.remote.ModelRawParamsRequest\x1a\x0c.remote.Dump\"\x00\x12?\n\x13rpc_XGDMatrixNumCol\x12\x15.remote.NumColRequest\x1a\x0f.remote.Integer\"\x00\x12?\n\x13rpc_XGDMatrixNumRow\x12\x15.remote.NumRowRequest\x1a\x0f.remote.Integer\"\x00\x12\x44\n\x11rpc_XGDMatrixFree\x12\x1a.remote.DMatrixFreeRequest\x1a\x11.remote.StatusMsg\"\x00\x12\x44\n\x11rpc_XGBoosterFree\x12\x1a.remote.BoosterFreeRequest\x1a\x11.remote.StatusMsg\"\x00\x12Q\n\x1crpc_XGBGetEnclaveMemoryStats\x12\x1a.remote.MemoryStatsRequest\x1a\x13.remote.MemoryStats\"\x00\x12\x41\n\x14rpc_XGBoosterRunPlan\x12\x13.remote.PlanRequest\x1a\x12.remote.PlanResult\"\x00\x12\x39\n\rrpc_RabitInit\x12\x13.remote.RabitParams\x1a\x11.remote.StatusMsg\"\x00\x12=\n\x11rpc_RabitFinalize\x12\x13.remote.RabitParams\x1a\x11.remote.StatusMsg\"\x00\x62\x06proto3'
   ,
   dependencies=[ndarray__pb2.DESCRIPTOR,])
 
@@ -328,6 +328,13 @@ _DMATRIXATTRS = _descriptor.Descriptor(
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='cache_dir', full_name='remote.DMatrixAttrs.cache_dir', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
@@ -341,7 +348,7 @@ _DMATRIXATTRS = _descriptor.Descriptor(
   oneofs=[
   ],
   serialized_start=761,
-  serialized_end=829,
+  serialized_end=848,
 )
 
 
@@ -420,8 +427,8 @@ _DMATRIXATTRSREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=832,
-  serialized_end=1100,
+  serialized_start=851,
+  serialized_end=1119,
 )
 
 
@@ -458,8 +465,8 @@ _BOOSTERATTRS = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1102,
-  serialized_end=1147,
+  serialized_start=1121,
+  serialized_end=1166,
 )
 
 
@@ -538,8 +545,8 @@ _BOOSTERATTRSREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1150,
-  serialized_end=1418,
+  serialized_start=1169,
+  serialized_end=1437,
 )
 
 
@@ -583,8 +590,8 @@ _BOOSTERPARAM = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1420,
-  serialized_end=1486,
+  serialized_start=1439,
+  serialized_end=1505,
 )
 
 
@@ -663,8 +670,8 @@ _BOOSTERPARAMREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1489,
-  serialized_end=1757,
+  serialized_start=1508,
+  serialized_end=1776,
 )
 
 
@@ -708,8 +715,8 @@ _BOOSTERUPDATEPARAMS = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1759,
-  serialized_end=1846,
+  serialized_start=1778,
+  serialized_end=1865,
 )
 
 
@@ -788,8 +795,8 @@ _BOOSTERUPDATEPARAMSREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1849,
-  serialized_end=2131,
+  serialized_start=1868,
+  serialized_end=2150,
 )
 
 
@@ -801,7 +808,7 @@ _BOOSTEREVALSETPARAMS = _descriptor.Descriptor(
   containing_type=None,
   fields=[
     _descriptor.FieldDescriptor(
-      name='handle', full_name='remote.BoosterEvalSetParams.handle', index=0,
+      name='booster_handle', full_name='remote.BoosterEvalSetParams.booster_handle', index=0,
       number=1, type=9, cpp_type=9, label=1,
       has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
@@ -822,78 +829,12 @@ _BOOSTEREVALSETPARAMS = _descriptor.Descriptor(
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='signature', full_name='remote.BoosterEvalSetParams.signature', index=3,
-      number=4, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='sig_len', full_name='remote.BoosterEvalSetParams.sig_len', index=4,
-      number=5, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=2134,
-  serialized_end=2284,
-)
-
-
-_PREDICTPARAMS = _descriptor.Descriptor(
-  name='PredictParams',
-  full_name='remote.PredictParams',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='booster_handle', full_name='remote.PredictParams.booster_handle', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='dmatrix_handle', full_name='remote.PredictParams.dmatrix_handle', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='option_mask', full_name='remote.PredictParams.option_mask', index=2,
-      number=3, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='ntree_limit', full_name='remote.PredictParams.ntree_limit', index=3,
+      name='early_stopping_rounds', full_name='remote.BoosterEvalSetParams.early_stopping_rounds', index=3,
       number=4, type=13, cpp_type=3, label=1,
       has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='training', full_name='remote.PredictParams.training', index=4,
-      number=5, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
@@ -906,69 +847,69 @@ _PREDICTPARAMS = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2286,
-  serialized_end=2409,
+  serialized_start=2152,
+  serialized_end=2277,
 )
 
 
-_PREDICTPARAMSREQUEST = _descriptor.Descriptor(
-  name='PredictParamsRequest',
-  full_name='remote.PredictParamsRequest',
+_BOOSTEREVALSETPARAMSREQUEST = _descriptor.Descriptor(
+  name='BoosterEvalSetParamsRequest',
+  full_name='remote.BoosterEvalSetParamsRequest',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   fields=[
     _descriptor.FieldDescriptor(
-      name='params', full_name='remote.PredictParamsRequest.params', index=0,
+      name='params', full_name='remote.BoosterEvalSetParamsRequest.params', index=0,
       number=1, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='seq_num', full_name='remote.PredictParamsRequest.seq_num', index=1,
+      name='seq_num', full_name='remote.BoosterEvalSetParamsRequest.seq_num', index=1,
       number=2, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='username', full_name='remote.PredictParamsRequest.username', index=2,
+      name='username', full_name='remote.BoosterEvalSetParamsRequest.username', index=2,
       number=3, type=9, cpp_type=9, label=1,
       has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='signature', full_name='remote.PredictParamsRequest.signature', index=3,
+      name='signature', full_name='remote.BoosterEvalSetParamsRequest.signature', index=3,
       number=4, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='sig_len', full_name='remote.PredictParamsRequest.sig_len', index=4,
+      name='sig_len', full_name='remote.BoosterEvalSetParamsRequest.sig_len', index=4,
       number=5, type=13, cpp_type=3, label=1,
       has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='signers', full_name='remote.PredictParamsRequest.signers', index=5,
+      name='signers', full_name='remote.BoosterEvalSetParamsRequest.signers', index=5,
       number=6, type=9, cpp_type=9, label=3,
       has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='signatures', full_name='remote.PredictParamsRequest.signatures', index=6,
+      name='signatures', full_name='remote.BoosterEvalSetParamsRequest.signatures', index=6,
       number=7, type=11, cpp_type=10, label=3,
       has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='sig_lengths', full_name='remote.PredictParamsRequest.sig_lengths', index=7,
+      name='sig_lengths', full_name='remote.BoosterEvalSetParamsRequest.sig_lengths', index=7,
       number=8, type=13, cpp_type=3, label=3,
       has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
@@ -986,32 +927,25 @@ _PREDICTPARAMSREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2412,
-  serialized_end=2682,
+  serialized_start=2280,
+  serialized_end=2564,
 )
 
 
-_SAVEMODELPARAMS = _descriptor.Descriptor(
-  name='SaveModelParams',
-  full_name='remote.SaveModelParams',
+_PLANPARAMS = _descriptor.Descriptor(
+  name='PlanParams',
+  full_name='remote.PlanParams',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   fields=[
     _descriptor.FieldDescriptor(
-      name='booster_handle', full_name='remote.SaveModelParams.booster_handle', index=0,
+      name='plan', full_name='remote.PlanParams.plan', index=0,
       number=1, type=9, cpp_type=9, label=1,
       has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='filename', full_name='remote.SaveModelParams.filename', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
@@ -1024,69 +958,69 @@ _SAVEMODELPARAMS = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2684,
-  serialized_end=2743,
+  serialized_start=2566,
+  serialized_end=2592,
 )
 
 
-_SAVEMODELPARAMSREQUEST = _descriptor.Descriptor(
-  name='SaveModelParamsRequest',
-  full_name='remote.SaveModelParamsRequest',
+_PLANREQUEST = _descriptor.Descriptor(
+  name='PlanRequest',
+  full_name='remote.PlanRequest',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   fields=[
     _descriptor.FieldDescriptor(
-      name='params', full_name='remote.SaveModelParamsRequest.params', index=0,
+      name='params', full_name='remote.PlanRequest.params', index=0,
       number=1, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='seq_num', full_name='remote.SaveModelParamsRequest.seq_num', index=1,
+      name='seq_num', full_name='remote.PlanRequest.seq_num', index=1,
       number=2, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='username', full_name='remote.SaveModelParamsRequest.username', index=2,
+      name='username', full_name='remote.PlanRequest.username', index=2,
       number=3, type=9, cpp_type=9, label=1,
       has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='signature', full_name='remote.SaveModelParamsRequest.signature', index=3,
+      name='signature', full_name='remote.PlanRequest.signature', index=3,
       number=4, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='sig_len', full_name='remote.SaveModelParamsRequest.sig_len', index=4,
+      name='sig_len', full_name='remote.PlanRequest.sig_len', index=4,
       number=5, type=13, cpp_type=3, label=1,
       has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='signers', full_name='remote.SaveModelParamsRequest.signers', index=5,
+      name='signers', full_name='remote.PlanRequest.signers', index=5,
       number=6, type=9, cpp_type=9, label=3,
       has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='signatures', full_name='remote.SaveModelParamsRequest.signatures', index=6,
+      name='signatures', full_name='remote.PlanRequest.signatures', index=6,
       number=7, type=11, cpp_type=10, label=3,
       has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='sig_lengths', full_name='remote.SaveModelParamsRequest.sig_lengths', index=7,
+      name='sig_lengths', full_name='remote.PlanRequest.sig_lengths', index=7,
       number=8, type=13, cpp_type=3, label=3,
       has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
@@ -1104,108 +1038,56 @@ _SAVEMODELPARAMSREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2746,
-  serialized_end=3020,
+  serialized_start=2595,
+  serialized_end=2853,
 )
 
 
-_LOADMODELPARAMS = _descriptor.Descriptor(
-  name='LoadModelParams',
-  full_name='remote.LoadModelParams',
+_PLANRESULT = _descriptor.Descriptor(
+  name='PlanResult',
+  full_name='remote.PlanResult',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   fields=[
     _descriptor.FieldDescriptor(
-      name='booster_handle', full_name='remote.LoadModelParams.booster_handle', index=0,
+      name='name', full_name='remote.PlanResult.name', index=0,
       number=1, type=9, cpp_type=9, label=1,
       has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='filename', full_name='remote.LoadModelParams.filename', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=3022,
-  serialized_end=3081,
-)
-
-
-_LOADMODELPARAMSREQUEST = _descriptor.Descriptor(
-  name='LoadModelParamsRequest',
-  full_name='remote.LoadModelParamsRequest',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='params', full_name='remote.LoadModelParamsRequest.params', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='seq_num', full_name='remote.LoadModelParamsRequest.seq_num', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
+      name='sarr', full_name='remote.PlanResult.sarr', index=1,
+      number=2, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='username', full_name='remote.LoadModelParamsRequest.username', index=2,
-      number=3, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
+      name='length', full_name='remote.PlanResult.length', index=2,
+      number=3, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='signature', full_name='remote.LoadModelParamsRequest.signature', index=3,
+      name='status', full_name='remote.PlanResult.status', index=3,
       number=4, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='sig_len', full_name='remote.LoadModelParamsRequest.sig_len', index=4,
-      number=5, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='signers', full_name='remote.LoadModelParamsRequest.signers', index=5,
-      number=6, type=9, cpp_type=9, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='signatures', full_name='remote.LoadModelParamsRequest.signatures', index=6,
-      number=7, type=11, cpp_type=10, label=3,
+      name='signatures', full_name='remote.PlanResult.signatures', index=4,
+      number=5, type=11, cpp_type=10, label=3,
       has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='sig_lengths', full_name='remote.LoadModelParamsRequest.sig_lengths', index=7,
-      number=8, type=13, cpp_type=3, label=3,
+      name='sig_lens', full_name='remote.PlanResult.sig_lens', index=5,
+      number=6, type=13, cpp_type=3, label=3,
       has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
@@ -1222,43 +1104,50 @@ _LOADMODELPARAMSREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=3084,
-  serialized_end=3358,
+  serialized_start=2856,
+  serialized_end=3010,
 )
 
 
-_DUMPMODELPARAMS = _descriptor.Descriptor(
-  name='DumpModelParams',
-  full_name='remote.DumpModelParams',
+_PREDICTPARAMS = _descriptor.Descriptor(
+  name='PredictParams',
+  full_name='remote.PredictParams',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   fields=[
     _descriptor.FieldDescriptor(
-      name='booster_handle', full_name='remote.DumpModelParams.booster_handle', index=0,
+      name='booster_handle', full_name='remote.PredictParams.booster_handle', index=0,
       number=1, type=9, cpp_type=9, label=1,
       has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='fmap', full_name='remote.DumpModelParams.fmap', index=1,
+      name='dmatrix_handle', full_name='remote.PredictParams.dmatrix_handle', index=1,
       number=2, type=9, cpp_type=9, label=1,
       has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='with_stats', full_name='remote.DumpModelParams.with_stats', index=2,
+      name='option_mask', full_name='remote.PredictParams.option_mask', index=2,
       number=3, type=13, cpp_type=3, label=1,
       has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='dump_format', full_name='remote.DumpModelParams.dump_format', index=3,
-      number=4, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
+      name='ntree_limit', full_name='remote.PredictParams.ntree_limit', index=3,
+      number=4, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='training', full_name='remote.PredictParams.training', index=4,
+      number=5, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
@@ -1274,69 +1163,69 @@ _DUMPMODELPARAMS = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=3360,
-  serialized_end=3456,
+  serialized_start=3012,
+  serialized_end=3135,
 )
 
 
-_DUMPMODELPARAMSREQUEST = _descriptor.Descriptor(
-  name='DumpModelParamsRequest',
-  full_name='remote.DumpModelParamsRequest',
+_PREDICTPARAMSREQUEST = _descriptor.Descriptor(
+  name='PredictParamsRequest',
+  full_name='remote.PredictParamsRequest',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   fields=[
     _descriptor.FieldDescriptor(
-      name='params', full_name='remote.DumpModelParamsRequest.params', index=0,
+      name='params', full_name='remote.PredictParamsRequest.params', index=0,
       number=1, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='seq_num', full_name='remote.DumpModelParamsRequest.seq_num', index=1,
+      name='seq_num', full_name='remote.PredictParamsRequest.seq_num', index=1,
       number=2, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='username', full_name='remote.DumpModelParamsRequest.username', index=2,
+      name='username', full_name='remote.PredictParamsRequest.username', index=2,
       number=3, type=9, cpp_type=9, label=1,
       has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='signature', full_name='remote.DumpModelParamsRequest.signature', index=3,
+      name='signature', full_name='remote.PredictParamsRequest.signature', index=3,
       number=4, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='sig_len', full_name='remote.DumpModelParamsRequest.sig_len', index=4,
+      name='sig_len', full_name='remote.PredictParamsRequest.sig_len', index=4,
       number=5, type=13, cpp_type=3, label=1,
       has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='signers', full_name='remote.DumpModelParamsRequest.signers', index=5,
+      name='signers', full_name='remote.PredictParamsRequest.signers', index=5,
       number=6, type=9, cpp_type=9, label=3,
       has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='signatures', full_name='remote.DumpModelParamsRequest.signatures', index=6,
+      name='signatures', full_name='remote.PredictParamsRequest.signatures', index=6,
       number=7, type=11, cpp_type=10, label=3,
       has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='sig_lengths', full_name='remote.DumpModelParamsRequest.sig_lengths', index=7,
+      name='sig_lengths', full_name='remote.PredictParamsRequest.sig_lengths', index=7,
       number=8, type=13, cpp_type=3, label=3,
       has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
@@ -1354,137 +1243,151 @@ _DUMPMODELPARAMSREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=3459,
-  serialized_end=3733,
+  serialized_start=3138,
+  serialized_end=3408,
 )
 
 
-_DUMPMODELWITHFEATURESPARAMS = _descriptor.Descriptor(
-  name='DumpModelWithFeaturesParams',
-  full_name='remote.DumpModelWithFeaturesParams',
+_PREDICTIONSERVICEREQUEST = _descriptor.Descriptor(
+  name='PredictionServiceRequest',
+  full_name='remote.PredictionServiceRequest',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   fields=[
     _descriptor.FieldDescriptor(
-      name='booster_handle', full_name='remote.DumpModelWithFeaturesParams.booster_handle', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
+      name='params', full_name='remote.PredictionServiceRequest.params', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='flen', full_name='remote.DumpModelWithFeaturesParams.flen', index=1,
-      number=2, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
+      name='seq_num', full_name='remote.PredictionServiceRequest.seq_num', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='fname', full_name='remote.DumpModelWithFeaturesParams.fname', index=2,
-      number=3, type=9, cpp_type=9, label=3,
-      has_default_value=False, default_value=[],
+      name='username', full_name='remote.PredictionServiceRequest.username', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='ftype', full_name='remote.DumpModelWithFeaturesParams.ftype', index=3,
-      number=4, type=9, cpp_type=9, label=3,
-      has_default_value=False, default_value=[],
+      name='signature', full_name='remote.PredictionServiceRequest.signature', index=3,
+      number=4, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='with_stats', full_name='remote.DumpModelWithFeaturesParams.with_stats', index=4,
+      name='sig_len', full_name='remote.PredictionServiceRequest.sig_len', index=4,
       number=5, type=13, cpp_type=3, label=1,
       has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='dump_format', full_name='remote.DumpModelWithFeaturesParams.dump_format', index=5,
-      number=6, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
+      name='signers', full_name='remote.PredictionServiceRequest.signers', index=5,
+      number=6, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
+    _descriptor.FieldDescriptor(
+      name='signatures', full_name='remote.PredictionServiceRequest.signatures', index=6,
+      number=7, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='sig_lengths', full_name='remote.PredictionServiceRequest.sig_lengths', index=7,
+      number=8, type=13, cpp_type=3, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=3736,
-  serialized_end=3874,
+  serialized_start=3411,
+  serialized_end=3689,
 )
 
 
-_DUMPMODELWITHFEATURESPARAMSREQUEST = _descriptor.Descriptor(
-  name='DumpModelWithFeaturesParamsRequest',
-  full_name='remote.DumpModelWithFeaturesParamsRequest',
+_PREDICTROWSREQUEST = _descriptor.Descriptor(
+  name='PredictRowsRequest',
+  full_name='remote.PredictRowsRequest',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   fields=[
     _descriptor.FieldDescriptor(
-      name='params', full_name='remote.DumpModelWithFeaturesParamsRequest.params', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
+      name='username', full_name='remote.PredictRowsRequest.username', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='seq_num', full_name='remote.DumpModelWithFeaturesParamsRequest.seq_num', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
+      name='booster_handle', full_name='remote.PredictRowsRequest.booster_handle', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='username', full_name='remote.DumpModelWithFeaturesParamsRequest.username', index=2,
+      name='request_id', full_name='remote.PredictRowsRequest.request_id', index=2,
       number=3, type=9, cpp_type=9, label=1,
       has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='signature', full_name='remote.DumpModelWithFeaturesParamsRequest.signature', index=3,
+      name='enc_rows', full_name='remote.PredictRowsRequest.enc_rows', index=3,
       number=4, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='sig_len', full_name='remote.DumpModelWithFeaturesParamsRequest.sig_len', index=4,
-      number=5, type=13, cpp_type=3, label=1,
+      name='num_rows', full_name='remote.PredictRowsRequest.num_rows', index=4,
+      number=5, type=4, cpp_type=4, label=1,
       has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='signers', full_name='remote.DumpModelWithFeaturesParamsRequest.signers', index=5,
-      number=6, type=9, cpp_type=9, label=3,
-      has_default_value=False, default_value=[],
+      name='num_col', full_name='remote.PredictRowsRequest.num_col', index=5,
+      number=6, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='signatures', full_name='remote.DumpModelWithFeaturesParamsRequest.signatures', index=6,
-      number=7, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
+      name='output_margin', full_name='remote.PredictRowsRequest.output_margin', index=6,
+      number=7, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='sig_lengths', full_name='remote.DumpModelWithFeaturesParamsRequest.sig_lengths', index=7,
-      number=8, type=13, cpp_type=3, label=3,
-      has_default_value=False, default_value=[],
+      name='ntree_limit', full_name='remote.PredictRowsRequest.ntree_limit', index=7,
+      number=8, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
@@ -1500,25 +1403,77 @@ _DUMPMODELWITHFEATURESPARAMSREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=3877,
-  serialized_end=4175,
+  serialized_start=3692,
+  serialized_end=3899,
 )
 
 
-_MODELRAWPARAMS = _descriptor.Descriptor(
-  name='ModelRawParams',
-  full_name='remote.ModelRawParams',
+_ROWPREDICTIONS = _descriptor.Descriptor(
+  name='RowPredictions',
+  full_name='remote.RowPredictions',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   fields=[
     _descriptor.FieldDescriptor(
-      name='booster_handle', full_name='remote.ModelRawParams.booster_handle', index=0,
+      name='predictions', full_name='remote.RowPredictions.predictions', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='num_preds', full_name='remote.RowPredictions.num_preds', index=1,
+      number=2, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='status', full_name='remote.RowPredictions.status', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3901,
+  serialized_end=4017,
+)
+
+
+_SAVEMODELPARAMS = _descriptor.Descriptor(
+  name='SaveModelParams',
+  full_name='remote.SaveModelParams',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='booster_handle', full_name='remote.SaveModelParams.booster_handle', index=0,
       number=1, type=9, cpp_type=9, label=1,
       has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='filename', full_name='remote.SaveModelParams.filename', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
@@ -1531,69 +1486,69 @@ _MODELRAWPARAMS = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=4177,
-  serialized_end=4217,
+  serialized_start=4019,
+  serialized_end=4078,
 )
 
 
-_MODELRAWPARAMSREQUEST = _descriptor.Descriptor(
-  name='ModelRawParamsRequest',
-  full_name='remote.ModelRawParamsRequest',
+_SAVEMODELPARAMSREQUEST = _descriptor.Descriptor(
+  name='SaveModelParamsRequest',
+  full_name='remote.SaveModelParamsRequest',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   fields=[
     _descriptor.FieldDescriptor(
-      name='params', full_name='remote.ModelRawParamsRequest.params', index=0,
+      name='params', full_name='remote.SaveModelParamsRequest.params', index=0,
       number=1, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='seq_num', full_name='remote.ModelRawParamsRequest.seq_num', index=1,
+      name='seq_num', full_name='remote.SaveModelParamsRequest.seq_num', index=1,
       number=2, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='username', full_name='remote.ModelRawParamsRequest.username', index=2,
+      name='username', full_name='remote.SaveModelParamsRequest.username', index=2,
       number=3, type=9, cpp_type=9, label=1,
       has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='signature', full_name='remote.ModelRawParamsRequest.signature', index=3,
+      name='signature', full_name='remote.SaveModelParamsRequest.signature', index=3,
       number=4, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='sig_len', full_name='remote.ModelRawParamsRequest.sig_len', index=4,
+      name='sig_len', full_name='remote.SaveModelParamsRequest.sig_len', index=4,
       number=5, type=13, cpp_type=3, label=1,
       has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='signers', full_name='remote.ModelRawParamsRequest.signers', index=5,
+      name='signers', full_name='remote.SaveModelParamsRequest.signers', index=5,
       number=6, type=9, cpp_type=9, label=3,
       has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='signatures', full_name='remote.ModelRawParamsRequest.signatures', index=6,
+      name='signatures', full_name='remote.SaveModelParamsRequest.signatures', index=6,
       number=7, type=11, cpp_type=10, label=3,
       has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='sig_lengths', full_name='remote.ModelRawParamsRequest.sig_lengths', index=7,
+      name='sig_lengths', full_name='remote.SaveModelParamsRequest.sig_lengths', index=7,
       number=8, type=13, cpp_type=3, label=3,
       has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
@@ -1611,49 +1566,35 @@ _MODELRAWPARAMSREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=4220,
-  serialized_end=4492,
+  serialized_start=4081,
+  serialized_end=4355,
 )
 
 
-_DUMP = _descriptor.Descriptor(
-  name='Dump',
-  full_name='remote.Dump',
+_CHECKPOINTPARAMS = _descriptor.Descriptor(
+  name='CheckpointParams',
+  full_name='remote.CheckpointParams',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   fields=[
     _descriptor.FieldDescriptor(
-      name='sarr', full_name='remote.Dump.sarr', index=0,
-      number=1, type=9, cpp_type=9, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='length', full_name='remote.Dump.length', index=1,
-      number=2, type=4, cpp_type=4, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='status', full_name='remote.Dump.status', index=2,
-      number=3, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
+      name='booster_handle', full_name='remote.CheckpointParams.booster_handle', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='signature', full_name='remote.Dump.signature', index=3,
-      number=4, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
+      name='filename', full_name='remote.CheckpointParams.filename', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='sig_len', full_name='remote.Dump.sig_len', index=4,
-      number=5, type=13, cpp_type=3, label=1,
+      name='version', full_name='remote.CheckpointParams.version', index=2,
+      number=3, type=13, cpp_type=3, label=1,
       has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
@@ -1670,32 +1611,74 @@ _DUMP = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=4495,
-  serialized_end=4627,
+  serialized_start=4357,
+  serialized_end=4434,
 )
 
 
-_PAIR = _descriptor.Descriptor(
-  name='Pair',
-  full_name='remote.Pair',
+_CHECKPOINTPARAMSREQUEST = _descriptor.Descriptor(
+  name='CheckpointParamsRequest',
+  full_name='remote.CheckpointParamsRequest',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   fields=[
     _descriptor.FieldDescriptor(
-      name='x', full_name='remote.Pair.x', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
+      name='params', full_name='remote.CheckpointParamsRequest.params', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='y', full_name='remote.Pair.y', index=1,
-      number=2, type=9, cpp_type=9, label=1,
+      name='seq_num', full_name='remote.CheckpointParamsRequest.seq_num', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='username', full_name='remote.CheckpointParamsRequest.username', index=2,
+      number=3, type=9, cpp_type=9, label=1,
       has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='signature', full_name='remote.CheckpointParamsRequest.signature', index=3,
+      number=4, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='sig_len', full_name='remote.CheckpointParamsRequest.sig_len', index=4,
+      number=5, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='signers', full_name='remote.CheckpointParamsRequest.signers', index=5,
+      number=6, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='signatures', full_name='remote.CheckpointParamsRequest.signatures', index=6,
+      number=7, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='sig_lengths', full_name='remote.CheckpointParamsRequest.sig_lengths', index=7,
+      number=8, type=13, cpp_type=3, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
@@ -1708,25 +1691,32 @@ _PAIR = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=4629,
-  serialized_end=4657,
+  serialized_start=4437,
+  serialized_end=4713,
 )
 
 
-_NAMEREQUESTPARAMS = _descriptor.Descriptor(
-  name='NameRequestParams',
-  full_name='remote.NameRequestParams',
+_LOADMODELPARAMS = _descriptor.Descriptor(
+  name='LoadModelParams',
+  full_name='remote.LoadModelParams',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   fields=[
     _descriptor.FieldDescriptor(
-      name='name', full_name='remote.NameRequestParams.name', index=0,
+      name='booster_handle', full_name='remote.LoadModelParams.booster_handle', index=0,
       number=1, type=9, cpp_type=9, label=1,
       has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='filename', full_name='remote.LoadModelParams.filename', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
@@ -1739,55 +1729,944 @@ _NAMEREQUESTPARAMS = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=4659,
-  serialized_end=4692,
+  serialized_start=4715,
+  serialized_end=4774,
 )
 
 
-_NAME = _descriptor.Descriptor(
-  name='Name',
-  full_name='remote.Name',
+_LOADMODELPARAMSREQUEST = _descriptor.Descriptor(
+  name='LoadModelParamsRequest',
+  full_name='remote.LoadModelParamsRequest',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   fields=[
     _descriptor.FieldDescriptor(
-      name='name', full_name='remote.Name.name', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
+      name='params', full_name='remote.LoadModelParamsRequest.params', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='username', full_name='remote.Name.username', index=1,
-      number=2, type=9, cpp_type=9, label=1,
+      name='seq_num', full_name='remote.LoadModelParamsRequest.seq_num', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='username', full_name='remote.LoadModelParamsRequest.username', index=2,
+      number=3, type=9, cpp_type=9, label=1,
       has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='signature', full_name='remote.Name.signature', index=2,
-      number=3, type=11, cpp_type=10, label=1,
+      name='signature', full_name='remote.LoadModelParamsRequest.signature', index=3,
+      number=4, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='sig_len', full_name='remote.Name.sig_len', index=3,
-      number=4, type=13, cpp_type=3, label=1,
+      name='sig_len', full_name='remote.LoadModelParamsRequest.sig_len', index=4,
+      number=5, type=13, cpp_type=3, label=1,
       has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='status', full_name='remote.Name.status', index=4,
-      number=5, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
+      name='signers', full_name='remote.LoadModelParamsRequest.signers', index=5,
+      number=6, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
+    _descriptor.FieldDescriptor(
+      name='signatures', full_name='remote.LoadModelParamsRequest.signatures', index=6,
+      number=7, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='sig_lengths', full_name='remote.LoadModelParamsRequest.sig_lengths', index=7,
+      number=8, type=13, cpp_type=3, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4777,
+  serialized_end=5051,
+)
+
+
+_DUMPMODELPARAMS = _descriptor.Descriptor(
+  name='DumpModelParams',
+  full_name='remote.DumpModelParams',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='booster_handle', full_name='remote.DumpModelParams.booster_handle', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='fmap', full_name='remote.DumpModelParams.fmap', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='with_stats', full_name='remote.DumpModelParams.with_stats', index=2,
+      number=3, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='dump_format', full_name='remote.DumpModelParams.dump_format', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=5053,
+  serialized_end=5149,
+)
+
+
+_DUMPMODELPARAMSREQUEST = _descriptor.Descriptor(
+  name='DumpModelParamsRequest',
+  full_name='remote.DumpModelParamsRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='params', full_name='remote.DumpModelParamsRequest.params', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='seq_num', full_name='remote.DumpModelParamsRequest.seq_num', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='username', full_name='remote.DumpModelParamsRequest.username', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='signature', full_name='remote.DumpModelParamsRequest.signature', index=3,
+      number=4, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='sig_len', full_name='remote.DumpModelParamsRequest.sig_len', index=4,
+      number=5, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='signers', full_name='remote.DumpModelParamsRequest.signers', index=5,
+      number=6, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='signatures', full_name='remote.DumpModelParamsRequest.signatures', index=6,
+      number=7, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='sig_lengths', full_name='remote.DumpModelParamsRequest.sig_lengths', index=7,
+      number=8, type=13, cpp_type=3, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=5152,
+  serialized_end=5426,
+)
+
+
+_DUMPMODELWITHFEATURESPARAMS = _descriptor.Descriptor(
+  name='DumpModelWithFeaturesParams',
+  full_name='remote.DumpModelWithFeaturesParams',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='booster_handle', full_name='remote.DumpModelWithFeaturesParams.booster_handle', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='flen', full_name='remote.DumpModelWithFeaturesParams.flen', index=1,
+      number=2, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='fname', full_name='remote.DumpModelWithFeaturesParams.fname', index=2,
+      number=3, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='ftype', full_name='remote.DumpModelWithFeaturesParams.ftype', index=3,
+      number=4, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='with_stats', full_name='remote.DumpModelWithFeaturesParams.with_stats', index=4,
+      number=5, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='dump_format', full_name='remote.DumpModelWithFeaturesParams.dump_format', index=5,
+      number=6, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=5429,
+  serialized_end=5567,
+)
+
+
+_DUMPMODELWITHFEATURESPARAMSREQUEST = _descriptor.Descriptor(
+  name='DumpModelWithFeaturesParamsRequest',
+  full_name='remote.DumpModelWithFeaturesParamsRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='params', full_name='remote.DumpModelWithFeaturesParamsRequest.params', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='seq_num', full_name='remote.DumpModelWithFeaturesParamsRequest.seq_num', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='username', full_name='remote.DumpModelWithFeaturesParamsRequest.username', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='signature', full_name='remote.DumpModelWithFeaturesParamsRequest.signature', index=3,
+      number=4, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='sig_len', full_name='remote.DumpModelWithFeaturesParamsRequest.sig_len', index=4,
+      number=5, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='signers', full_name='remote.DumpModelWithFeaturesParamsRequest.signers', index=5,
+      number=6, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='signatures', full_name='remote.DumpModelWithFeaturesParamsRequest.signatures', index=6,
+      number=7, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='sig_lengths', full_name='remote.DumpModelWithFeaturesParamsRequest.sig_lengths', index=7,
+      number=8, type=13, cpp_type=3, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=5570,
+  serialized_end=5868,
+)
+
+
+_MODELRAWPARAMS = _descriptor.Descriptor(
+  name='ModelRawParams',
+  full_name='remote.ModelRawParams',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='booster_handle', full_name='remote.ModelRawParams.booster_handle', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=5870,
+  serialized_end=5910,
+)
+
+
+_MODELRAWPARAMSREQUEST = _descriptor.Descriptor(
+  name='ModelRawParamsRequest',
+  full_name='remote.ModelRawParamsRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='params', full_name='remote.ModelRawParamsRequest.params', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='seq_num', full_name='remote.ModelRawParamsRequest.seq_num', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='username', full_name='remote.ModelRawParamsRequest.username', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='signature', full_name='remote.ModelRawParamsRequest.signature', index=3,
+      number=4, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='sig_len', full_name='remote.ModelRawParamsRequest.sig_len', index=4,
+      number=5, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='signers', full_name='remote.ModelRawParamsRequest.signers', index=5,
+      number=6, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='signatures', full_name='remote.ModelRawParamsRequest.signatures', index=6,
+      number=7, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='sig_lengths', full_name='remote.ModelRawParamsRequest.sig_lengths', index=7,
+      number=8, type=13, cpp_type=3, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=5913,
+  serialized_end=6185,
+)
+
+
+_DUMP = _descriptor.Descriptor(
+  name='Dump',
+  full_name='remote.Dump',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='sarr', full_name='remote.Dump.sarr', index=0,
+      number=1, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='length', full_name='remote.Dump.length', index=1,
+      number=2, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='status', full_name='remote.Dump.status', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='signature', full_name='remote.Dump.signature', index=3,
+      number=4, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='sig_len', full_name='remote.Dump.sig_len', index=4,
+      number=5, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=6188,
+  serialized_end=6320,
+)
+
+
+_DUMPMODELFRAMEDPARAMS = _descriptor.Descriptor(
+  name='DumpModelFramedParams',
+  full_name='remote.DumpModelFramedParams',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='booster_handle', full_name='remote.DumpModelFramedParams.booster_handle', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='fmap', full_name='remote.DumpModelFramedParams.fmap', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='flen', full_name='remote.DumpModelFramedParams.flen', index=2,
+      number=3, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='fname', full_name='remote.DumpModelFramedParams.fname', index=3,
+      number=4, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='ftype', full_name='remote.DumpModelFramedParams.ftype', index=4,
+      number=5, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='with_stats', full_name='remote.DumpModelFramedParams.with_stats', index=5,
+      number=6, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='dump_format', full_name='remote.DumpModelFramedParams.dump_format', index=6,
+      number=7, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=6323,
+  serialized_end=6469,
+)
+
+
+_DUMPMODELFRAMEDPARAMSREQUEST = _descriptor.Descriptor(
+  name='DumpModelFramedParamsRequest',
+  full_name='remote.DumpModelFramedParamsRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='params', full_name='remote.DumpModelFramedParamsRequest.params', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='seq_num', full_name='remote.DumpModelFramedParamsRequest.seq_num', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='username', full_name='remote.DumpModelFramedParamsRequest.username', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='signature', full_name='remote.DumpModelFramedParamsRequest.signature', index=3,
+      number=4, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='sig_len', full_name='remote.DumpModelFramedParamsRequest.sig_len', index=4,
+      number=5, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='signers', full_name='remote.DumpModelFramedParamsRequest.signers', index=5,
+      number=6, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='signatures', full_name='remote.DumpModelFramedParamsRequest.signatures', index=6,
+      number=7, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='sig_lengths', full_name='remote.DumpModelFramedParamsRequest.sig_lengths', index=7,
+      number=8, type=13, cpp_type=3, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=6472,
+  serialized_end=6758,
+)
+
+
+_FRAMEDDUMP = _descriptor.Descriptor(
+  name='FramedDump',
+  full_name='remote.FramedDump',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='dump', full_name='remote.FramedDump.dump', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='length', full_name='remote.FramedDump.length', index=1,
+      number=2, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='status', full_name='remote.FramedDump.status', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='signature', full_name='remote.FramedDump.signature', index=3,
+      number=4, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='sig_len', full_name='remote.FramedDump.sig_len', index=4,
+      number=5, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=6761,
+  serialized_end=6927,
+)
+
+
+_PAIR = _descriptor.Descriptor(
+  name='Pair',
+  full_name='remote.Pair',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='x', full_name='remote.Pair.x', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='y', full_name='remote.Pair.y', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=6929,
+  serialized_end=6957,
+)
+
+
+_NAMEREQUESTPARAMS = _descriptor.Descriptor(
+  name='NameRequestParams',
+  full_name='remote.NameRequestParams',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='name', full_name='remote.NameRequestParams.name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=6959,
+  serialized_end=6992,
+)
+
+
+_NAME = _descriptor.Descriptor(
+  name='Name',
+  full_name='remote.Name',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='name', full_name='remote.Name.name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='username', full_name='remote.Name.username', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='signature', full_name='remote.Name.signature', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='sig_len', full_name='remote.Name.sig_len', index=3,
+      number=4, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='status', full_name='remote.Name.status', index=4,
+      number=5, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=6995,
+  serialized_end=7129,
+)
+
+
+_NUMCOLREQUEST = _descriptor.Descriptor(
+  name='NumColRequest',
+  full_name='remote.NumColRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='params', full_name='remote.NumColRequest.params', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='seq_num', full_name='remote.NumColRequest.seq_num', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='username', full_name='remote.NumColRequest.username', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='signature', full_name='remote.NumColRequest.signature', index=3,
+      number=4, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='sig_len', full_name='remote.NumColRequest.sig_len', index=4,
+      number=5, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='signers', full_name='remote.NumColRequest.signers', index=5,
+      number=6, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='signatures', full_name='remote.NumColRequest.signatures', index=6,
+      number=7, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='sig_lengths', full_name='remote.NumColRequest.sig_lengths', index=7,
+      number=8, type=13, cpp_type=3, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
   ],
   nested_types=[],
   enum_types=[
@@ -1798,69 +2677,309 @@ _NAME = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=4695,
-  serialized_end=4829,
+  serialized_start=7132,
+  serialized_end=7399,
 )
 
 
-_NUMCOLREQUEST = _descriptor.Descriptor(
-  name='NumColRequest',
-  full_name='remote.NumColRequest',
+_NUMROWREQUEST = _descriptor.Descriptor(
+  name='NumRowRequest',
+  full_name='remote.NumRowRequest',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   fields=[
     _descriptor.FieldDescriptor(
-      name='params', full_name='remote.NumColRequest.params', index=0,
+      name='params', full_name='remote.NumRowRequest.params', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='seq_num', full_name='remote.NumRowRequest.seq_num', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='username', full_name='remote.NumRowRequest.username', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='signature', full_name='remote.NumRowRequest.signature', index=3,
+      number=4, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='sig_len', full_name='remote.NumRowRequest.sig_len', index=4,
+      number=5, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='signers', full_name='remote.NumRowRequest.signers', index=5,
+      number=6, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='signatures', full_name='remote.NumRowRequest.signatures', index=6,
+      number=7, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='sig_lengths', full_name='remote.NumRowRequest.sig_lengths', index=7,
+      number=8, type=13, cpp_type=3, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=7402,
+  serialized_end=7669,
+)
+
+
+_DMATRIXFREEREQUEST = _descriptor.Descriptor(
+  name='DMatrixFreeRequest',
+  full_name='remote.DMatrixFreeRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='params', full_name='remote.DMatrixFreeRequest.params', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='seq_num', full_name='remote.DMatrixFreeRequest.seq_num', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='username', full_name='remote.DMatrixFreeRequest.username', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='signature', full_name='remote.DMatrixFreeRequest.signature', index=3,
+      number=4, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='sig_len', full_name='remote.DMatrixFreeRequest.sig_len', index=4,
+      number=5, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='signers', full_name='remote.DMatrixFreeRequest.signers', index=5,
+      number=6, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='signatures', full_name='remote.DMatrixFreeRequest.signatures', index=6,
+      number=7, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='sig_lengths', full_name='remote.DMatrixFreeRequest.sig_lengths', index=7,
+      number=8, type=13, cpp_type=3, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=7672,
+  serialized_end=7944,
+)
+
+
+_BOOSTERFREEREQUEST = _descriptor.Descriptor(
+  name='BoosterFreeRequest',
+  full_name='remote.BoosterFreeRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='params', full_name='remote.BoosterFreeRequest.params', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='seq_num', full_name='remote.BoosterFreeRequest.seq_num', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='username', full_name='remote.BoosterFreeRequest.username', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='signature', full_name='remote.BoosterFreeRequest.signature', index=3,
+      number=4, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='sig_len', full_name='remote.BoosterFreeRequest.sig_len', index=4,
+      number=5, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='signers', full_name='remote.BoosterFreeRequest.signers', index=5,
+      number=6, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='signatures', full_name='remote.BoosterFreeRequest.signatures', index=6,
+      number=7, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='sig_lengths', full_name='remote.BoosterFreeRequest.sig_lengths', index=7,
+      number=8, type=13, cpp_type=3, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=7947,
+  serialized_end=8219,
+)
+
+
+_MEMORYSTATSREQUEST = _descriptor.Descriptor(
+  name='MemoryStatsRequest',
+  full_name='remote.MemoryStatsRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='params', full_name='remote.MemoryStatsRequest.params', index=0,
       number=1, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='seq_num', full_name='remote.NumColRequest.seq_num', index=1,
+      name='seq_num', full_name='remote.MemoryStatsRequest.seq_num', index=1,
       number=2, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='username', full_name='remote.NumColRequest.username', index=2,
+      name='username', full_name='remote.MemoryStatsRequest.username', index=2,
       number=3, type=9, cpp_type=9, label=1,
       has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='signature', full_name='remote.NumColRequest.signature', index=3,
+      name='signature', full_name='remote.MemoryStatsRequest.signature', index=3,
       number=4, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='sig_len', full_name='remote.NumColRequest.sig_len', index=4,
+      name='sig_len', full_name='remote.MemoryStatsRequest.sig_len', index=4,
       number=5, type=13, cpp_type=3, label=1,
       has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='signers', full_name='remote.NumColRequest.signers', index=5,
+      name='signers', full_name='remote.MemoryStatsRequest.signers', index=5,
       number=6, type=9, cpp_type=9, label=3,
       has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='signatures', full_name='remote.NumColRequest.signatures', index=6,
+      name='signatures', full_name='remote.MemoryStatsRequest.signatures', index=6,
       number=7, type=11, cpp_type=10, label=3,
       has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='sig_lengths', full_name='remote.NumColRequest.sig_lengths', index=7,
+      name='sig_lengths', full_name='remote.MemoryStatsRequest.sig_lengths', index=7,
       number=8, type=13, cpp_type=3, label=3,
       has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
@@ -1878,74 +2997,46 @@ _NUMCOLREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=4832,
-  serialized_end=5099,
+  serialized_start=8222,
+  serialized_end=8483,
 )
 
 
-_NUMROWREQUEST = _descriptor.Descriptor(
-  name='NumRowRequest',
-  full_name='remote.NumRowRequest',
+_MEMORYSTATS = _descriptor.Descriptor(
+  name='MemoryStats',
+  full_name='remote.MemoryStats',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   fields=[
     _descriptor.FieldDescriptor(
-      name='params', full_name='remote.NumRowRequest.params', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
+      name='stats', full_name='remote.MemoryStats.stats', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='seq_num', full_name='remote.NumRowRequest.seq_num', index=1,
+      name='status', full_name='remote.MemoryStats.status', index=1,
       number=2, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='username', full_name='remote.NumRowRequest.username', index=2,
-      number=3, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='signature', full_name='remote.NumRowRequest.signature', index=3,
-      number=4, type=11, cpp_type=10, label=1,
+      name='signature', full_name='remote.MemoryStats.signature', index=2,
+      number=3, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='sig_len', full_name='remote.NumRowRequest.sig_len', index=4,
-      number=5, type=13, cpp_type=3, label=1,
+      name='sig_len', full_name='remote.MemoryStats.sig_len', index=3,
+      number=4, type=13, cpp_type=3, label=1,
       has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='signers', full_name='remote.NumRowRequest.signers', index=5,
-      number=6, type=9, cpp_type=9, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='signatures', full_name='remote.NumRowRequest.signatures', index=6,
-      number=7, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='sig_lengths', full_name='remote.NumRowRequest.sig_lengths', index=7,
-      number=8, type=13, cpp_type=3, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
@@ -1958,8 +3049,8 @@ _NUMROWREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=5102,
-  serialized_end=5369,
+  serialized_start=8485,
+  serialized_end=8609,
 )
 
 
@@ -2010,8 +3101,8 @@ _INTEGER = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=5371,
-  serialized_end=5491,
+  serialized_start=8611,
+  serialized_end=8731,
 )
 
 
@@ -2055,8 +3146,98 @@ _ENCLAVEKEY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=5493,
-  serialized_end=5592,
+  serialized_start=8733,
+  serialized_end=8832,
+)
+
+
+_RESUMESESSIONREQUEST = _descriptor.Descriptor(
+  name='ResumeSessionRequest',
+  full_name='remote.ResumeSessionRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='username', full_name='remote.ResumeSessionRequest.username', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='challenge', full_name='remote.ResumeSessionRequest.challenge', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=8834,
+  serialized_end=8893,
+)
+
+
+_SESSIONSTATE = _descriptor.Descriptor(
+  name='SessionState',
+  full_name='remote.SessionState',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='nonce_ctr', full_name='remote.SessionState.nonce_ctr', index=0,
+      number=1, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='status', full_name='remote.SessionState.status', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='signature', full_name='remote.SessionState.signature', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='sig_len', full_name='remote.SessionState.sig_len', index=3,
+      number=4, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=8896,
+  serialized_end=9025,
 )
 
 
@@ -2114,8 +3295,8 @@ _PREDICTIONS = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=5595,
-  serialized_end=5774,
+  serialized_start=9028,
+  serialized_end=9207,
 )
 
 
@@ -2145,8 +3326,8 @@ _CLUSTERPARAMS = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=5776,
-  serialized_end=5812,
+  serialized_start=9209,
+  serialized_end=9245,
 )
 
 
@@ -2225,8 +3406,8 @@ _RABITPARAMS = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=5815,
-  serialized_end=6069,
+  serialized_start=9248,
+  serialized_end=9502,
 )
 
 _STATUSMSG.fields_by_name['status'].message_type = _STATUS
@@ -2255,15 +3436,35 @@ _BOOSTERUPDATEPARAMSREQUEST.fields_by_name['seq_num'].message_type = _SEQUENCENU
 _BOOSTERUPDATEPARAMSREQUEST.fields_by_name['signature'].message_type = ndarray__pb2._NDARRAY
 _BOOSTERUPDATEPARAMSREQUEST.fields_by_name['signatures'].message_type = ndarray__pb2._NDARRAY
 _BOOSTEREVALSETPARAMS.fields_by_name['evals'].message_type = _PAIR
-_BOOSTEREVALSETPARAMS.fields_by_name['signature'].message_type = ndarray__pb2._NDARRAY
+_BOOSTEREVALSETPARAMSREQUEST.fields_by_name['params'].message_type = _BOOSTEREVALSETPARAMS
+_BOOSTEREVALSETPARAMSREQUEST.fields_by_name['seq_num'].message_type = _SEQUENCENUMBER
+_BOOSTEREVALSETPARAMSREQUEST.fields_by_name['signature'].message_type = ndarray__pb2._NDARRAY
+_BOOSTEREVALSETPARAMSREQUEST.fields_by_name['signatures'].message_type = ndarray__pb2._NDARRAY
+_PLANREQUEST.fields_by_name['params'].message_type = _PLANPARAMS
+_PLANREQUEST.fields_by_name['seq_num'].message_type = _SEQUENCENUMBER
+_PLANREQUEST.fields_by_name['signature'].message_type = ndarray__pb2._NDARRAY
+_PLANREQUEST.fields_by_name['signatures'].message_type = ndarray__pb2._NDARRAY
+_PLANRESULT.fields_by_name['status'].message_type = _STATUS
+_PLANRESULT.fields_by_name['signatures'].message_type = ndarray__pb2._NDARRAY
 _PREDICTPARAMSREQUEST.fields_by_name['params'].message_type = _PREDICTPARAMS
 _PREDICTPARAMSREQUEST.fields_by_name['seq_num'].message_type = _SEQUENCENUMBER
 _PREDICTPARAMSREQUEST.fields_by_name['signature'].message_type = ndarray__pb2._NDARRAY
 _PREDICTPARAMSREQUEST.fields_by_name['signatures'].message_type = ndarray__pb2._NDARRAY
+_PREDICTIONSERVICEREQUEST.fields_by_name['params'].message_type = _NAMEREQUESTPARAMS
+_PREDICTIONSERVICEREQUEST.fields_by_name['seq_num'].message_type = _SEQUENCENUMBER
+_PREDICTIONSERVICEREQUEST.fields_by_name['signature'].message_type = ndarray__pb2._NDARRAY
+_PREDICTIONSERVICEREQUEST.fields_by_name['signatures'].message_type = ndarray__pb2._NDARRAY
+_PREDICTROWSREQUEST.fields_by_name['enc_rows'].message_type = ndarray__pb2._NDARRAY
+_ROWPREDICTIONS.fields_by_name['predictions'].message_type = ndarray__pb2._NDARRAY
+_ROWPREDICTIONS.fields_by_name['status'].message_type = _STATUS
 _SAVEMODELPARAMSREQUEST.fields_by_name['params'].message_type = _SAVEMODELPARAMS
 _SAVEMODELPARAMSREQUEST.fields_by_name['seq_num'].message_type = _SEQUENCENUMBER
 _SAVEMODELPARAMSREQUEST.fields_by_name['signature'].message_type = ndarray__pb2._NDARRAY
 _SAVEMODELPARAMSREQUEST.fields_by_name['signatures'].message_type = ndarray__pb2._NDARRAY
+_CHECKPOINTPARAMSREQUEST.fields_by_name['params'].message_type = _CHECKPOINTPARAMS
+_CHECKPOINTPARAMSREQUEST.fields_by_name['seq_num'].message_type = _SEQUENCENUMBER
+_CHECKPOINTPARAMSREQUEST.fields_by_name['signature'].message_type = ndarray__pb2._NDARRAY
+_CHECKPOINTPARAMSREQUEST.fields_by_name['signatures'].message_type = ndarray__pb2._NDARRAY
 _LOADMODELPARAMSREQUEST.fields_by_name['params'].message_type = _LOADMODELPARAMS
 _LOADMODELPARAMSREQUEST.fields_by_name['seq_num'].message_type = _SEQUENCENUMBER
 _LOADMODELPARAMSREQUEST.fields_by_name['signature'].message_type = ndarray__pb2._NDARRAY
@@ -2282,6 +3483,13 @@ _MODELRAWPARAMSREQUEST.fields_by_name['signature'].message_type = ndarray__pb2._
 _MODELRAWPARAMSREQUEST.fields_by_name['signatures'].message_type = ndarray__pb2._NDARRAY
 _DUMP.fields_by_name['status'].message_type = _STATUS
 _DUMP.fields_by_name['signature'].message_type = ndarray__pb2._NDARRAY
+_DUMPMODELFRAMEDPARAMSREQUEST.fields_by_name['params'].message_type = _DUMPMODELFRAMEDPARAMS
+_DUMPMODELFRAMEDPARAMSREQUEST.fields_by_name['seq_num'].message_type = _SEQUENCENUMBER
+_DUMPMODELFRAMEDPARAMSREQUEST.fields_by_name['signature'].message_type = ndarray__pb2._NDARRAY
+_DUMPMODELFRAMEDPARAMSREQUEST.fields_by_name['signatures'].message_type = ndarray__pb2._NDARRAY
+_FRAMEDDUMP.fields_by_name['dump'].message_type = ndarray__pb2._NDARRAY
+_FRAMEDDUMP.fields_by_name['status'].message_type = _STATUS
+_FRAMEDDUMP.fields_by_name['signature'].message_type = ndarray__pb2._NDARRAY
 _NAME.fields_by_name['signature'].message_type = ndarray__pb2._NDARRAY
 _NAME.fields_by_name['status'].message_type = _STATUS
 _NUMCOLREQUEST.fields_by_name['params'].message_type = _NAMEREQUESTPARAMS
@@ -2292,10 +3500,26 @@ _NUMROWREQUEST.fields_by_name['params'].message_type = _NAMEREQUESTPARAMS
 _NUMROWREQUEST.fields_by_name['seq_num'].message_type = _SEQUENCENUMBER
 _NUMROWREQUEST.fields_by_name['signature'].message_type = ndarray__pb2._NDARRAY
 _NUMROWREQUEST.fields_by_name['signatures'].message_type = ndarray__pb2._NDARRAY
+_DMATRIXFREEREQUEST.fields_by_name['params'].message_type = _NAMEREQUESTPARAMS
+_DMATRIXFREEREQUEST.fields_by_name['seq_num'].message_type = _SEQUENCENUMBER
+_DMATRIXFREEREQUEST.fields_by_name['signature'].message_type = ndarray__pb2._NDARRAY
+_DMATRIXFREEREQUEST.fields_by_name['signatures'].message_type = ndarray__pb2._NDARRAY
+_BOOSTERFREEREQUEST.fields_by_name['params'].message_type = _NAMEREQUESTPARAMS
+_BOOSTERFREEREQUEST.fields_by_name['seq_num'].message_type = _SEQUENCENUMBER
+_BOOSTERFREEREQUEST.fields_by_name['signature'].message_type = ndarray__pb2._NDARRAY
+_BOOSTERFREEREQUEST.fields_by_name['signatures'].message_type = ndarray__pb2._NDARRAY
+_MEMORYSTATSREQUEST.fields_by_name['params'].message_type = _STATUS
+_MEMORYSTATSREQUEST.fields_by_name['seq_num'].message_type = _SEQUENCENUMBER
+_MEMORYSTATSREQUEST.fields_by_name['signature'].message_type = ndarray__pb2._NDARRAY
+_MEMORYSTATSREQUEST.fields_by_name['signatures'].message_type = ndarray__pb2._NDARRAY
+_MEMORYSTATS.fields_by_name['status'].message_type = _STATUS
+_MEMORYSTATS.fields_by_name['signature'].message_type = ndarray__pb2._NDARRAY
 _INTEGER.fields_by_name['status'].message_type = _STATUS
 _INTEGER.fields_by_name['signature'].message_type = ndarray__pb2._NDARRAY
 _ENCLAVEKEY.fields_by_name['key'].message_type = ndarray__pb2._NDARRAY
 _ENCLAVEKEY.fields_by_name['status'].message_type = _STATUS
+_SESSIONSTATE.fields_by_name['status'].message_type = _STATUS
+_SESSIONSTATE.fields_by_name['signature'].message_type = ndarray__pb2._NDARRAY
 _PREDICTIONS.fields_by_name['predictions'].message_type = ndarray__pb2._NDARRAY
 _PREDICTIONS.fields_by_name['status'].message_type = _STATUS
 _PREDICTIONS.fields_by_name['signatures'].message_type = ndarray__pb2._NDARRAY
@@ -2317,10 +3541,19 @@ DESCRIPTOR.message_types_by_name['BoosterParamRequest'] = _BOOSTERPARAMREQUEST
 DESCRIPTOR.message_types_by_name['BoosterUpdateParams'] = _BOOSTERUPDATEPARAMS
 DESCRIPTOR.message_types_by_name['BoosterUpdateParamsRequest'] = _BOOSTERUPDATEPARAMSREQUEST
 DESCRIPTOR.message_types_by_name['BoosterEvalSetParams'] = _BOOSTEREVALSETPARAMS
+DESCRIPTOR.message_types_by_name['BoosterEvalSetParamsRequest'] = _BOOSTEREVALSETPARAMSREQUEST
+DESCRIPTOR.message_types_by_name['PlanParams'] = _PLANPARAMS
+DESCRIPTOR.message_types_by_name['PlanRequest'] = _PLANREQUEST
+DESCRIPTOR.message_types_by_name['PlanResult'] = _PLANRESULT
 DESCRIPTOR.message_types_by_name['PredictParams'] = _PREDICTPARAMS
 DESCRIPTOR.message_types_by_name['PredictParamsRequest'] = _PREDICTPARAMSREQUEST
+DESCRIPTOR.message_types_by_name['PredictionServiceRequest'] = _PREDICTIONSERVICEREQUEST
+DESCRIPTOR.message_types_by_name['PredictRowsRequest'] = _PREDICTROWSREQUEST
+DESCRIPTOR.message_types_by_name['RowPredictions'] = _ROWPREDICTIONS
 DESCRIPTOR.message_types_by_name['SaveModelParams'] = _SAVEMODELPARAMS
 DESCRIPTOR.message_types_by_name['SaveModelParamsRequest'] = _SAVEMODELPARAMSREQUEST
+DESCRIPTOR.message_types_by_name['CheckpointParams'] = _CHECKPOINTPARAMS
+DESCRIPTOR.message_types_by_name['CheckpointParamsRequest'] = _CHECKPOINTPARAMSREQUEST
 DESCRIPTOR.message_types_by_name['LoadModelParams'] = _LOADMODELPARAMS
 DESCRIPTOR.message_types_by_name['LoadModelParamsRequest'] = _LOADMODELPARAMSREQUEST
 DESCRIPTOR.message_types_by_name['DumpModelParams'] = _DUMPMODELPARAMS
@@ -2330,13 +3563,22 @@ DESCRIPTOR.message_types_by_name['DumpModelWithFeaturesParamsRequest'] = _DUMPMO
 DESCRIPTOR.message_types_by_name['ModelRawParams'] = _MODELRAWPARAMS
 DESCRIPTOR.message_types_by_name['ModelRawParamsRequest'] = _MODELRAWPARAMSREQUEST
 DESCRIPTOR.message_types_by_name['Dump'] = _DUMP
+DESCRIPTOR.message_types_by_name['DumpModelFramedParams'] = _DUMPMODELFRAMEDPARAMS
+DESCRIPTOR.message_types_by_name['DumpModelFramedParamsRequest'] = _DUMPMODELFRAMEDPARAMSREQUEST
+DESCRIPTOR.message_types_by_name['FramedDump'] = _FRAMEDDUMP
 DESCRIPTOR.message_types_by_name['Pair'] = _PAIR
 DESCRIPTOR.message_types_by_name['NameRequestParams'] = _NAMEREQUESTPARAMS
 DESCRIPTOR.message_types_by_name['Name'] = _NAME
 DESCRIPTOR.message_types_by_name['NumColRequest'] = _NUMCOLREQUEST
 DESCRIPTOR.message_types_by_name['NumRowRequest'] = _NUMROWREQUEST
+DESCRIPTOR.message_types_by_name['DMatrixFreeRequest'] = _DMATRIXFREEREQUEST
+DESCRIPTOR.message_types_by_name['BoosterFreeRequest'] = _BOOSTERFREEREQUEST
+DESCRIPTOR.message_types_by_name['MemoryStatsRequest'] = _MEMORYSTATSREQUEST
+DESCRIPTOR.message_types_by_name['MemoryStats'] = _MEMORYSTATS
 DESCRIPTOR.message_types_by_name['Integer'] = _INTEGER
 DESCRIPTOR.message_types_by_name['EnclaveKey'] = _ENCLAVEKEY
+DESCRIPTOR.message_types_by_name['ResumeSessionRequest'] = _RESUMESESSIONREQUEST
+DESCRIPTOR.message_types_by_name['SessionState'] = _SESSIONSTATE
 DESCRIPTOR.message_types_by_name['Predictions'] = _PREDICTIONS
 DESCRIPTOR.message_types_by_name['ClusterParams'] = _CLUSTERPARAMS
 DESCRIPTOR.message_types_by_name['RabitParams'] = _RABITPARAMS
@@ -2440,6 +3682,34 @@ BoosterEvalSetParams = _reflection.GeneratedProtocolMessageType('BoosterEvalSetP
   })
 _sym_db.RegisterMessage(BoosterEvalSetParams)
 
+BoosterEvalSetParamsRequest = _reflection.GeneratedProtocolMessageType('BoosterEvalSetParamsRequest', (_message.Message,), {
+  'DESCRIPTOR' : _BOOSTEREVALSETPARAMSREQUEST,
+  '__module__' : 'remote_pb2'
+  # @@protoc_insertion_point(class_scope:remote.BoosterEvalSetParamsRequest)
+  })
+_sym_db.RegisterMessage(BoosterEvalSetParamsRequest)
+
+PlanParams = _reflection.GeneratedProtocolMessageType('PlanParams', (_message.Message,), {
+  'DESCRIPTOR' : _PLANPARAMS,
+  '__module__' : 'remote_pb2'
+  # @@protoc_insertion_point(class_scope:remote.PlanParams)
+  })
+_sym_db.RegisterMessage(PlanParams)
+
+PlanRequest = _reflection.GeneratedProtocolMessageType('PlanRequest', (_message.Message,), {
+  'DESCRIPTOR' : _PLANREQUEST,
+  '__module__' : 'remote_pb2'
+  # @@protoc_insertion_point(class_scope:remote.PlanRequest)
+  })
+_sym_db.RegisterMessage(PlanRequest)
+
+PlanResult = _reflection.GeneratedProtocolMessageType('PlanResult', (_message.Message,), {
+  'DESCRIPTOR' : _PLANRESULT,
+  '__module__' : 'remote_pb2'
+  # @@protoc_insertion_point(class_scope:remote.PlanResult)
+  })
+_sym_db.RegisterMessage(PlanResult)
+
 PredictParams = _reflection.GeneratedProtocolMessageType('PredictParams', (_message.Message,), {
   'DESCRIPTOR' : _PREDICTPARAMS,
   '__module__' : 'remote_pb2'
@@ -2454,6 +3724,27 @@ PredictParamsRequest = _reflection.GeneratedProtocolMessageType('PredictParamsRe
   })
 _sym_db.RegisterMessage(PredictParamsRequest)
 
+PredictionServiceRequest = _reflection.GeneratedProtocolMessageType('PredictionServiceRequest', (_message.Message,), {
+  'DESCRIPTOR' : _PREDICTIONSERVICEREQUEST,
+  '__module__' : 'remote_pb2'
+  # @@protoc_insertion_point(class_scope:remote.PredictionServiceRequest)
+  })
+_sym_db.RegisterMessage(PredictionServiceRequest)
+
+PredictRowsRequest = _reflection.GeneratedProtocolMessageType('PredictRowsRequest', (_message.Message,), {
+  'DESCRIPTOR' : _PREDICTROWSREQUEST,
+  '__module__' : 'remote_pb2'
+  # @@protoc_insertion_point(class_scope:remote.PredictRowsRequest)
+  })
+_sym_db.RegisterMessage(PredictRowsRequest)
+
+RowPredictions = _reflection.GeneratedProtocolMessageType('RowPredictions', (_message.Message,), {
+  'DESCRIPTOR' : _ROWPREDICTIONS,
+  '__module__' : 'remote_pb2'
+  # @@protoc_insertion_point(class_scope:remote.RowPredictions)
+  })
+_sym_db.RegisterMessage(RowPredictions)
+
 SaveModelParams = _reflection.GeneratedProtocolMessageType('SaveModelParams', (_message.Message,), {
   'DESCRIPTOR' : _SAVEMODELPARAMS,
   '__module__' : 'remote_pb2'
@@ -2468,6 +3759,20 @@ SaveModelParamsRequest = _reflection.GeneratedProtocolMessageType('SaveModelPara
   })
 _sym_db.RegisterMessage(SaveModelParamsRequest)
 
+CheckpointParams = _reflection.GeneratedProtocolMessageType('CheckpointParams', (_message.Message,), {
+  'DESCRIPTOR' : _CHECKPOINTPARAMS,
+  '__module__' : 'remote_pb2'
+  # @@protoc_insertion_point(class_scope:remote.CheckpointParams)
+  })
+_sym_db.RegisterMessage(CheckpointParams)
+
+CheckpointParamsRequest = _reflection.GeneratedProtocolMessageType('CheckpointParamsRequest', (_message.Message,), {
+  'DESCRIPTOR' : _CHECKPOINTPARAMSREQUEST,
+  '__module__' : 'remote_pb2'
+  # @@protoc_insertion_point(class_scope:remote.CheckpointParamsRequest)
+  })
+_sym_db.RegisterMessage(CheckpointParamsRequest)
+
 LoadModelParams = _reflection.GeneratedProtocolMessageType('LoadModelParams', (_message.Message,), {
   'DESCRIPTOR' : _LOADMODELPARAMS,
   '__module__' : 'remote_pb2'
@@ -2531,6 +3836,27 @@ Dump = _reflection.GeneratedProtocolMessageType('Dump', (_message.Message,), {
   })
 _sym_db.RegisterMessage(Dump)
 
+DumpModelFramedParams = _reflection.GeneratedProtocolMessageType('DumpModelFramedParams', (_message.Message,), {
+  'DESCRIPTOR' : _DUMPMODELFRAMEDPARAMS,
+  '__module__' : 'remote_pb2'
+  # @@protoc_insertion_point(class_scope:remote.DumpModelFramedParams)
+  })
+_sym_db.RegisterMessage(DumpModelFramedParams)
+
+DumpModelFramedParamsRequest = _reflection.GeneratedProtocolMessageType('DumpModelFramedParamsRequest', (_message.Message,), {
+  'DESCRIPTOR' : _DUMPMODELFRAMEDPARAMSREQUEST,
+  '__module__' : 'remote_pb2'
+  # @@protoc_insertion_point(class_scope:remote.DumpModelFramedParamsRequest)
+  })
+_sym_db.RegisterMessage(DumpModelFramedParamsRequest)
+
+FramedDump = _reflection.GeneratedProtocolMessageType('FramedDump', (_message.Message,), {
+  'DESCRIPTOR' : _FRAMEDDUMP,
+  '__module__' : 'remote_pb2'
+  # @@protoc_insertion_point(class_scope:remote.FramedDump)
+  })
+_sym_db.RegisterMessage(FramedDump)
+
 Pair = _reflection.GeneratedProtocolMessageType('Pair', (_message.Message,), {
   'DESCRIPTOR' : _PAIR,
   '__module__' : 'remote_pb2'
@@ -2566,6 +3892,34 @@ NumRowRequest = _reflection.GeneratedProtocolMessageType('NumRowRequest', (_mess
   })
 _sym_db.RegisterMessage(NumRowRequest)
 
+DMatrixFreeRequest = _reflection.GeneratedProtocolMessageType('DMatrixFreeRequest', (_message.Message,), {
+  'DESCRIPTOR' : _DMATRIXFREEREQUEST,
+  '__module__' : 'remote_pb2'
+  # @@protoc_insertion_point(class_scope:remote.DMatrixFreeRequest)
+  })
+_sym_db.RegisterMessage(DMatrixFreeRequest)
+
+BoosterFreeRequest = _reflection.GeneratedProtocolMessageType('BoosterFreeRequest', (_message.Message,), {
+  'DESCRIPTOR' : _BOOSTERFREEREQUEST,
+  '__module__' : 'remote_pb2'
+  # @@protoc_insertion_point(class_scope:remote.BoosterFreeRequest)
+  })
+_sym_db.RegisterMessage(BoosterFreeRequest)
+
+MemoryStatsRequest = _reflection.GeneratedProtocolMessageType('MemoryStatsRequest', (_message.Message,), {
+  'DESCRIPTOR' : _MEMORYSTATSREQUEST,
+  '__module__' : 'remote_pb2'
+  # @@protoc_insertion_point(class_scope:remote.MemoryStatsRequest)
+  })
+_sym_db.RegisterMessage(MemoryStatsRequest)
+
+MemoryStats = _reflection.GeneratedProtocolMessageType('MemoryStats', (_message.Message,), {
+  'DESCRIPTOR' : _MEMORYSTATS,
+  '__module__' : 'remote_pb2'
+  # @@protoc_insertion_point(class_scope:remote.MemoryStats)
+  })
+_sym_db.RegisterMessage(MemoryStats)
+
 Integer = _reflection.GeneratedProtocolMessageType('Integer', (_message.Message,), {
   'DESCRIPTOR' : _INTEGER,
   '__module__' : 'remote_pb2'
@@ -2580,6 +3934,20 @@ EnclaveKey = _reflection.GeneratedProtocolMessageType('EnclaveKey', (_message.Me
   })
 _sym_db.RegisterMessage(EnclaveKey)
 
+ResumeSessionRequest = _reflection.GeneratedProtocolMessageType('ResumeSessionRequest', (_message.Message,), {
+  'DESCRIPTOR' : _RESUMESESSIONREQUEST,
+  '__module__' : 'remote_pb2'
+  # @@protoc_insertion_point(class_scope:remote.ResumeSessionRequest)
+  })
+_sym_db.RegisterMessage(ResumeSessionRequest)
+
+SessionState = _reflection.GeneratedProtocolMessageType('SessionState', (_message.Message,), {
+  'DESCRIPTOR' : _SESSIONSTATE,
+  '__module__' : 'remote_pb2'
+  # @@protoc_insertion_point(class_scope:remote.SessionState)
+  })
+_sym_db.RegisterMessage(SessionState)
+
 Predictions = _reflection.GeneratedProtocolMessageType('Predictions', (_message.Message,), {
   'DESCRIPTOR' : _PREDICTIONS,
   '__module__' : 'remote_pb2'
@@ -2609,8 +3977,8 @@ _REMOTE = _descriptor.ServiceDescriptor(
   file=DESCRIPTOR,
   index=0,
   serialized_options=None,
-  serialized_start=6072,
-  serialized_end=7425,
+  serialized_start=9505,
+  serialized_end=11744,
   methods=[
   _descriptor.MethodDescriptor(
     name='rpc_get_remote_report_with_pubkey_and_nonce',
@@ -2648,10 +4016,19 @@ _REMOTE = _descriptor.ServiceDescriptor(
     output_type=_ENCLAVEKEY,
     serialized_options=None,
   ),
+  _descriptor.MethodDescriptor(
+    name='rpc_XGBResumeSession',
+    full_name='remote.Remote.rpc_XGBResumeSession',
+    index=4,
+    containing_service=None,
+    input_type=_RESUMESESSIONREQUEST,
+    output_type=_SESSIONSTATE,
+    serialized_options=None,
+  ),
   _descriptor.MethodDescriptor(
     name='rpc_XGDMatrixCreateFromEncryptedFile',
     full_name='remote.Remote.rpc_XGDMatrixCreateFromEncryptedFile',
-    index=4,
+    index=5,
     containing_service=None,
     input_type=_DMATRIXATTRSREQUEST,
     output_type=_NAME,
@@ -2660,7 +4037,7 @@ _REMOTE = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='rpc_XGBoosterCreate',
     full_name='remote.Remote.rpc_XGBoosterCreate',
-    index=5,
+    index=6,
     containing_service=None,
     input_type=_BOOSTERATTRSREQUEST,
     output_type=_NAME,
@@ -2669,7 +4046,7 @@ _REMOTE = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='rpc_XGBoosterSetParam',
     full_name='remote.Remote.rpc_XGBoosterSetParam',
-    index=6,
+    index=7,
     containing_service=None,
     input_type=_BOOSTERPARAMREQUEST,
     output_type=_STATUSMSG,
@@ -2678,25 +4055,52 @@ _REMOTE = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='rpc_XGBoosterUpdateOneIter',
     full_name='remote.Remote.rpc_XGBoosterUpdateOneIter',
-    index=7,
+    index=8,
     containing_service=None,
     input_type=_BOOSTERUPDATEPARAMSREQUEST,
     output_type=_STATUSMSG,
     serialized_options=None,
   ),
+  _descriptor.MethodDescriptor(
+    name='rpc_XGBoosterEvalOneIter',
+    full_name='remote.Remote.rpc_XGBoosterEvalOneIter',
+    index=9,
+    containing_service=None,
+    input_type=_BOOSTEREVALSETPARAMSREQUEST,
+    output_type=_DUMP,
+    serialized_options=None,
+  ),
   _descriptor.MethodDescriptor(
     name='rpc_XGBoosterPredict',
     full_name='remote.Remote.rpc_XGBoosterPredict',
-    index=8,
+    index=10,
     containing_service=None,
     input_type=_PREDICTPARAMSREQUEST,
     output_type=_PREDICTIONS,
     serialized_options=None,
   ),
+  _descriptor.MethodDescriptor(
+    name='rpc_XGBoosterEnablePredictionService',
+    full_name='remote.Remote.rpc_XGBoosterEnablePredictionService',
+    index=11,
+    containing_service=None,
+    input_type=_PREDICTIONSERVICEREQUEST,
+    output_type=_STATUSMSG,
+    serialized_options=None,
+  ),
+  _descriptor.MethodDescriptor(
+    name='rpc_XGBoosterPredictRows',
+    full_name='remote.Remote.rpc_XGBoosterPredictRows',
+    index=12,
+    containing_service=None,
+    input_type=_PREDICTROWSREQUEST,
+    output_type=_ROWPREDICTIONS,
+    serialized_options=None,
+  ),
   _descriptor.MethodDescriptor(
     name='rpc_XGBoosterSaveModel',
     full_name='remote.Remote.rpc_XGBoosterSaveModel',
-    index=9,
+    index=13,
     containing_service=None,
     input_type=_SAVEMODELPARAMSREQUEST,
     output_type=_STATUSMSG,
@@ -2705,16 +4109,34 @@ _REMOTE = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='rpc_XGBoosterLoadModel',
     full_name='remote.Remote.rpc_XGBoosterLoadModel',
-    index=10,
+    index=14,
     containing_service=None,
     input_type=_LOADMODELPARAMSREQUEST,
     output_type=_STATUSMSG,
     serialized_options=None,
   ),
+  _descriptor.MethodDescriptor(
+    name='rpc_XGBoosterSaveCheckpoint',
+    full_name='remote.Remote.rpc_XGBoosterSaveCheckpoint',
+    index=15,
+    containing_service=None,
+    input_type=_CHECKPOINTPARAMSREQUEST,
+    output_type=_STATUSMSG,
+    serialized_options=None,
+  ),
+  _descriptor.MethodDescriptor(
+    name='rpc_XGBoosterLoadCheckpoint',
+    full_name='remote.Remote.rpc_XGBoosterLoadCheckpoint',
+    index=16,
+    containing_service=None,
+    input_type=_CHECKPOINTPARAMSREQUEST,
+    output_type=_INTEGER,
+    serialized_options=None,
+  ),
   _descriptor.MethodDescriptor(
     name='rpc_XGBoosterDumpModelEx',
     full_name='remote.Remote.rpc_XGBoosterDumpModelEx',
-    index=11,
+    index=17,
     containing_service=None,
     input_type=_DUMPMODELPARAMSREQUEST,
     output_type=_DUMP,
@@ -2723,16 +4145,25 @@ _REMOTE = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='rpc_XGBoosterDumpModelExWithFeatures',
     full_name='remote.Remote.rpc_XGBoosterDumpModelExWithFeatures',
-    index=12,
+    index=18,
     containing_service=None,
     input_type=_DUMPMODELWITHFEATURESPARAMSREQUEST,
     output_type=_DUMP,
     serialized_options=None,
   ),
+  _descriptor.MethodDescriptor(
+    name='rpc_XGBoosterDumpModelFramed',
+    full_name='remote.Remote.rpc_XGBoosterDumpModelFramed',
+    index=19,
+    containing_service=None,
+    input_type=_DUMPMODELFRAMEDPARAMSREQUEST,
+    output_type=_FRAMEDDUMP,
+    serialized_options=None,
+  ),
   _descriptor.MethodDescriptor(
     name='rpc_XGBoosterGetModelRaw',
     full_name='remote.Remote.rpc_XGBoosterGetModelRaw',
-    index=13,
+    index=20,
     containing_service=None,
     input_type=_MODELRAWPARAMSREQUEST,
     output_type=_DUMP,
@@ -2741,7 +4172,7 @@ _REMOTE = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='rpc_XGDMatrixNumCol',
     full_name='remote.Remote.rpc_XGDMatrixNumCol',
-    index=14,
+    index=21,
     containing_service=None,
     input_type=_NUMCOLREQUEST,
     output_type=_INTEGER,
@@ -2750,16 +4181,52 @@ _REMOTE = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='rpc_XGDMatrixNumRow',
     full_name='remote.Remote.rpc_XGDMatrixNumRow',
-    index=15,
+    index=22,
     containing_service=None,
     input_type=_NUMROWREQUEST,
     output_type=_INTEGER,
     serialized_options=None,
   ),
+  _descriptor.MethodDescriptor(
+    name='rpc_XGDMatrixFree',
+    full_name='remote.Remote.rpc_XGDMatrixFree',
+    index=23,
+    containing_service=None,
+    input_type=_DMATRIXFREEREQUEST,
+    output_type=_STATUSMSG,
+    serialized_options=None,
+  ),
+  _descriptor.MethodDescriptor(
+    name='rpc_XGBoosterFree',
+    full_name='remote.Remote.rpc_XGBoosterFree',
+    index=24,
+    containing_service=None,
+    input_type=_BOOSTERFREEREQUEST,
+    output_type=_STATUSMSG,
+    serialized_options=None,
+  ),
+  _descriptor.MethodDescriptor(
+    name='rpc_XGBGetEnclaveMemoryStats',
+    full_name='remote.Remote.rpc_XGBGetEnclaveMemoryStats',
+    index=25,
+    containing_service=None,
+    input_type=_MEMORYSTATSREQUEST,
+    output_type=_MEMORYSTATS,
+    serialized_options=None,
+  ),
+  _descriptor.MethodDescriptor(
+    name='rpc_XGBoosterRunPlan',
+    full_name='remote.Remote.rpc_XGBoosterRunPlan',
+    index=26,
+    containing_service=None,
+    input_type=_PLANREQUEST,
+    output_type=_PLANRESULT,
+    serialized_options=None,
+  ),
   _descriptor.MethodDescriptor(
     name='rpc_RabitInit',
     full_name='remote.Remote.rpc_RabitInit',
-    index=16,
+    index=27,
     containing_service=None,
     input_type=_RABITPARAMS,
     output_type=_STATUSMSG,
@@ -2768,7 +4235,7 @@ _REMOTE = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='rpc_RabitFinalize',
     full_name='remote.Remote.rpc_RabitFinalize',
-    index=17,
+    index=28,
     containing_service=None,
     input_type=_RABITPARAMS,
     output_type=_STATUSMSG,
@@ -34,6 +34,11 @@ class RemoteStub(object):
         request_serializer=remote__pb2.Name.SerializeToString,
         response_deserializer=remote__pb2.EnclaveKey.FromString,
         )
+    self.rpc_XGBResumeSession = channel.unary_unary(
+        '/remote.Remote/rpc_XGBResumeSession',
+        request_serializer=remote__pb2.ResumeSessionRequest.SerializeToString,
+        response_deserializer=remote__pb2.SessionState.FromString,
+        )
     self.rpc_XGDMatrixCreateFromEncryptedFile = channel.unary_unary(
         '/remote.Remote/rpc_XGDMatrixCreateFromEncryptedFile',
         request_serializer=remote__pb2.DMatrixAttrsRequest.SerializeToString,
@@ -54,11 +59,26 @@ class RemoteStub(object):
         request_serializer=remote__pb2.BoosterUpdateParamsRequest.SerializeToString,
         response_deserializer=remote__pb2.StatusMsg.FromString,
         )
+    self.rpc_XGBoosterEvalOneIter = channel.unary_unary(
+        '/remote.Remote/rpc_XGBoosterEvalOneIter',
+        request_serializer=remote__pb2.BoosterEvalSetParamsRequest.SerializeToString,
+        response_deserializer=remote__pb2.Dump.FromString,
+        )
     self.rpc_XGBoosterPredict = channel.unary_unary(
         '/remote.Remote/rpc_XGBoosterPredict',
         request_serializer=remote__pb2.PredictParamsRequest.SerializeToString,
         response_deserializer=remote__pb2.Predictions.FromString,
         )
+    self.rpc_XGBoosterEnablePredictionService = channel.unary_unary(
+        '/remote.Remote/rpc_XGBoosterEnablePredictionService',
+        request_serializer=remote__pb2.PredictionServiceRequest.SerializeToString,
+        response_deserializer=remote__pb2.StatusMsg.FromString,
+        )
+    self.rpc_XGBoosterPredictRows = channel.unary_unary(
+        '/remote.Remote/rpc_XGBoosterPredictRows',
+        request_serializer=remote__pb2.PredictRowsRequest.SerializeToString,
+        response_deserializer=remote__pb2.RowPredictions.FromString,
+        )
     self.rpc_XGBoosterSaveModel = channel.unary_unary(
         '/remote.Remote/rpc_XGBoosterSaveModel',
         request_serializer=remote__pb2.SaveModelParamsRequest.SerializeToString,
@@ -69,6 +89,16 @@ class RemoteStub(object):
         request_serializer=remote__pb2.LoadModelParamsRequest.SerializeToString,
         response_deserializer=remote__pb2.StatusMsg.FromString,
         )
+    self.rpc_XGBoosterSaveCheckpoint = channel.unary_unary(
+        '/remote.Remote/rpc_XGBoosterSaveCheckpoint',
+        request_serializer=remote__pb2.CheckpointParamsRequest.SerializeToString,
+        response_deserializer=remote__pb2.StatusMsg.FromString,
+        )
+    self.rpc_XGBoosterLoadCheckpoint = channel.unary_unary(
+        '/remote.Remote/rpc_XGBoosterLoadCheckpoint',
+        request_serializer=remote__pb2.CheckpointParamsRequest.SerializeToString,
+        response_deserializer=remote__pb2.Integer.FromString,
+        )
     self.rpc_XGBoosterDumpModelEx = channel.unary_unary(
         '/remote.Remote/rpc_XGBoosterDumpModelEx',
         request_serializer=remote__pb2.DumpModelParamsRequest.SerializeToString,
@@ -79,6 +109,11 @@ class RemoteStub(object):
         request_serializer=remote__pb2.DumpModelWithFeaturesParamsRequest.SerializeToString,
         response_deserializer=remote__pb2.Dump.FromString,
         )
+    self.rpc_XGBoosterDumpModelFramed = channel.unary_unary(
+        '/remote.Remote/rpc_XGBoosterDumpModelFramed',
+        request_serializer=remote__pb2.DumpModelFramedParamsRequest.SerializeToString,
+        response_deserializer=remote__pb2.FramedDump.FromString,
+        )
     self.rpc_XGBoosterGetModelRaw = channel.unary_unary(
         '/remote.Remote/rpc_XGBoosterGetModelRaw',
         request_serializer=remote__pb2.ModelRawParamsRequest.SerializeToString,
@@ -94,6 +129,26 @@ class RemoteStub(object):
         request_serializer=remote__pb2.NumRowRequest.SerializeToString,
         response_deserializer=remote__pb2.Integer.FromString,
         )
+    self.rpc_XGDMatrixFree = channel.unary_unary(
+        '/remote.Remote/rpc_XGDMatrixFree',
+        request_serializer=remote__pb2.DMatrixFreeRequest.SerializeToString,
+        response_deserializer=remote__pb2.StatusMsg.FromString,
+        )
+    self.rpc_XGBoosterFree = channel.unary_unary(
+        '/remote.Remote/rpc_XGBoosterFree',
+        request_serializer=remote__pb2.BoosterFreeRequest.SerializeToString,
+        response_deserializer=remote__pb2.StatusMsg.FromString,
+        )
+    self.rpc_XGBGetEnclaveMemoryStats = channel.unary_unary(
+        '/remote.Remote/rpc_XGBGetEnclaveMemoryStats',
+        request_serializer=remote__pb2.MemoryStatsRequest.SerializeToString,
+        response_deserializer=remote__pb2.MemoryStats.FromString,
+        )
+    self.rpc_XGBoosterRunPlan = channel.unary_unary(
+        '/remote.Remote/rpc_XGBoosterRunPlan',
+        request_serializer=remote__pb2.PlanRequest.SerializeToString,
+        response_deserializer=remote__pb2.PlanResult.FromString,
+        )
     self.rpc_RabitInit = channel.unary_unary(
         '/remote.Remote/rpc_RabitInit',
         request_serializer=remote__pb2.RabitParams.SerializeToString,
@@ -139,6 +194,13 @@ class RemoteServicer(object):
     context.set_details('Method not implemented!')
     raise NotImplementedError('Method not implemented!')
 
+  def rpc_XGBResumeSession(self, request, context):
+    """Resume the session of a client that attested the enclave before
+    """
+    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+    context.set_details('Method not implemented!')
+    raise NotImplementedError('Method not implemented!')
+
   def rpc_XGDMatrixCreateFromEncryptedFile(self, request, context):
     """Send params of a DMatrix to the server for initialization
     Returns the name assigned to this DMatrix
@@ -169,6 +231,13 @@ class RemoteServicer(object):
     context.set_details('Method not implemented!')
     raise NotImplementedError('Method not implemented!')
 
+  def rpc_XGBoosterEvalOneIter(self, request, context):
+    """Evaluate the booster on a set of DMatrices
+    """
+    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+    context.set_details('Method not implemented!')
+    raise NotImplementedError('Method not implemented!')
+
   def rpc_XGBoosterPredict(self, request, context):
     """Run predictions
     """
@@ -176,6 +245,20 @@ class RemoteServicer(object):
     context.set_details('Method not implemented!')
     raise NotImplementedError('Method not implemented!')
 
+  def rpc_XGBoosterEnablePredictionService(self, request, context):
+    """Allow every client to predict with a booster on rows sent with the request
+    """
+    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+    context.set_details('Method not implemented!')
+    raise NotImplementedError('Method not implemented!')
+
+  def rpc_XGBoosterPredictRows(self, request, context):
+    """Predict with encrypted rows sent with the request, batched with concurrent requests
+    """
+    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+    context.set_details('Method not implemented!')
+    raise NotImplementedError('Method not implemented!')
+
   def rpc_XGBoosterSaveModel(self, request, context):
     """Save model to a file on the server
     """
@@ -190,6 +273,20 @@ class RemoteServicer(object):
     context.set_details('Method not implemented!')
     raise NotImplementedError('Method not implemented!')
 
+  def rpc_XGBoosterSaveCheckpoint(self, request, context):
+    """Save a sealed training checkpoint to files on the server
+    """
+    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+    context.set_details('Method not implemented!')
+    raise NotImplementedError('Method not implemented!')
+
+  def rpc_XGBoosterLoadCheckpoint(self, request, context):
+    """Load the latest sealed training checkpoint held by every node
+    """
+    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+    context.set_details('Method not implemented!')
+    raise NotImplementedError('Method not implemented!')
+
   def rpc_XGBoosterDumpModelEx(self, request, context):
     """Dump model 
     """
@@ -204,6 +301,13 @@ class RemoteServicer(object):
     context.set_details('Method not implemented!')
     raise NotImplementedError('Method not implemented!')
 
+  def rpc_XGBoosterDumpModelFramed(self, request, context):
+    """Dump model as a single encrypted blob
+    """
+    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+    context.set_details('Method not implemented!')
+    raise NotImplementedError('Method not implemented!')
+
   def rpc_XGBoosterGetModelRaw(self, request, context):
     """Save model to buffer
     """
@@ -225,6 +329,34 @@ class RemoteServicer(object):
     context.set_details('Method not implemented!')
     raise NotImplementedError('Method not implemented!')
 
+  def rpc_XGDMatrixFree(self, request, context):
+    """Free a DMatrix in the enclave
+    """
+    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+    context.set_details('Method not implemented!')
+    raise NotImplementedError('Method not implemented!')
+
+  def rpc_XGBoosterFree(self, request, context):
+    """Free a Booster in the enclave
+    """
+    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+    context.set_details('Method not implemented!')
+    raise NotImplementedError('Method not implemented!')
+
+  def rpc_XGBGetEnclaveMemoryStats(self, request, context):
+    """Get the enclave memory held by each DMatrix and Booster
+    """
+    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+    context.set_details('Method not implemented!')
+    raise NotImplementedError('Method not implemented!')
+
+  def rpc_XGBoosterRunPlan(self, request, context):
+    """Train, evaluate and predict with a booster as a single command signed by every client
+    """
+    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+    context.set_details('Method not implemented!')
+    raise NotImplementedError('Method not implemented!')
+
   def rpc_RabitInit(self, request, context):
     """Initialize Rabit
     """
@@ -262,6 +394,11 @@ def add_RemoteServicer_to_server(servicer, server):
           request_deserializer=remote__pb2.Name.FromString,
           response_serializer=remote__pb2.EnclaveKey.SerializeToString,
       ),
+      'rpc_XGBResumeSession': grpc.unary_unary_rpc_method_handler(
+          servicer.rpc_XGBResumeSession,
+          request_deserializer=remote__pb2.ResumeSessionRequest.FromString,
+          response_serializer=remote__pb2.SessionState.SerializeToString,
+      ),
       'rpc_XGDMatrixCreateFromEncryptedFile': grpc.unary_unary_rpc_method_handler(
           servicer.rpc_XGDMatrixCreateFromEncryptedFile,
           request_deserializer=remote__pb2.DMatrixAttrsRequest.FromString,
@@ -282,11 +419,26 @@ def add_RemoteServicer_to_server(servicer, server):
           request_deserializer=remote__pb2.BoosterUpdateParamsRequest.FromString,
           response_serializer=remote__pb2.StatusMsg.SerializeToString,
       ),
+      'rpc_XGBoosterEvalOneIter': grpc.unary_unary_rpc_method_handler(
+          servicer.rpc_XGBoosterEvalOneIter,
+          request_deserializer=remote__pb2.BoosterEvalSetParamsRequest.FromString,
+          response_serializer=remote__pb2.Dump.SerializeToString,
+      ),
       'rpc_XGBoosterPredict': grpc.unary_unary_rpc_method_handler(
           servicer.rpc_XGBoosterPredict,
           request_deserializer=remote__pb2.PredictParamsRequest.FromString,
           response_serializer=remote__pb2.Predictions.SerializeToString,
       ),
+      'rpc_XGBoosterEnablePredictionService': grpc.unary_unary_rpc_method_handler(
+          servicer.rpc_XGBoosterEnablePredictionService,
+          request_deserializer=remote__pb2.PredictionServiceRequest.FromString,
+          response_serializer=remote__pb2.StatusMsg.SerializeToString,
+      ),
+      'rpc_XGBoosterPredictRows': grpc.unary_unary_rpc_method_handler(
+          servicer.rpc_XGBoosterPredictRows,
+          request_deserializer=remote__pb2.PredictRowsRequest.FromString,
+          response_serializer=remote__pb2.RowPredictions.SerializeToString,
+      ),
       'rpc_XGBoosterSaveModel': grpc.unary_unary_rpc_method_handler(
           servicer.rpc_XGBoosterSaveModel,
           request_deserializer=remote__pb2.SaveModelParamsRequest.FromString,
@@ -297,6 +449,16 @@ def add_RemoteServicer_to_server(servicer, server):
           request_deserializer=remote__pb2.LoadModelParamsRequest.FromString,
           response_serializer=remote__pb2.StatusMsg.SerializeToString,
       ),
+      'rpc_XGBoosterSaveCheckpoint': grpc.unary_unary_rpc_method_handler(
+          servicer.rpc_XGBoosterSaveCheckpoint,
+          request_deserializer=remote__pb2.CheckpointParamsRequest.FromString,
+          response_serializer=remote__pb2.StatusMsg.SerializeToString,
+      ),
+      'rpc_XGBoosterLoadCheckpoint': grpc.unary_unary_rpc_method_handler(
+          servicer.rpc_XGBoosterLoadCheckpoint,
+          request_deserializer=remote__pb2.CheckpointParamsRequest.FromString,
+          response_serializer=remote__pb2.Integer.SerializeToString,
+      ),
       'rpc_XGBoosterDumpModelEx': grpc.unary_unary_rpc_method_handler(
           servicer.rpc_XGBoosterDumpModelEx,
           request_deserializer=remote__pb2.DumpModelParamsRequest.FromString,
@@ -307,6 +469,11 @@ def add_RemoteServicer_to_server(servicer, server):
           request_deserializer=remote__pb2.DumpModelWithFeaturesParamsRequest.FromString,
           response_serializer=remote__pb2.Dump.SerializeToString,
       ),
+      'rpc_XGBoosterDumpModelFramed': grpc.unary_unary_rpc_method_handler(
+          servicer.rpc_XGBoosterDumpModelFramed,
+          request_deserializer=remote__pb2.DumpModelFramedParamsRequest.FromString,
+          response_serializer=remote__pb2.FramedDump.SerializeToString,
+      ),
       'rpc_XGBoosterGetModelRaw': grpc.unary_unary_rpc_method_handler(
           servicer.rpc_XGBoosterGetModelRaw,
           request_deserializer=remote__pb2.ModelRawParamsRequest.FromString,
@@ -322,6 +489,26 @@ def add_RemoteServicer_to_server(servicer, server):
           request_deserializer=remote__pb2.NumRowRequest.FromString,
           response_serializer=remote__pb2.Integer.SerializeToString,
       ),
+      'rpc_XGDMatrixFree': grpc.unary_unary_rpc_method_handler(
+          servicer.rpc_XGDMatrixFree,
+          request_deserializer=remote__pb2.DMatrixFreeRequest.FromString,
+          response_serializer=remote__pb2.StatusMsg.SerializeToString,
+      ),
+      'rpc_XGBoosterFree': grpc.unary_unary_rpc_method_handler(
+          servicer.rpc_XGBoosterFree,
+          request_deserializer=remote__pb2.BoosterFreeRequest.FromString,
+          response_serializer=remote__pb2.StatusMsg.SerializeToString,
+      ),
+      'rpc_XGBGetEnclaveMemoryStats': grpc.unary_unary_rpc_method_handler(
+          servicer.rpc_XGBGetEnclaveMemoryStats,
+          request_deserializer=remote__pb2.MemoryStatsRequest.FromString,
+          response_serializer=remote__pb2.MemoryStats.SerializeToString,
+      ),
+      'rpc_XGBoosterRunPlan': grpc.unary_unary_rpc_method_handler(
+          servicer.rpc_XGBoosterRunPlan,
+          request_deserializer=remote__pb2.PlanRequest.FromString,
+          response_serializer=remote__pb2.PlanResult.SerializeToString,
+      ),
       'rpc_RabitInit': grpc.unary_unary_rpc_method_handler(
           servicer.rpc_RabitInit,
           request_deserializer=remote__pb2.RabitParams.FromString,
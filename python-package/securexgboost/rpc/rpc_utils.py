@@ -2,6 +2,7 @@ from numproto import ndarray_to_proto, proto_to_ndarray
 import numpy as np
 import ctypes
 
+CIPHER_KEY_SIZE = 32
 CIPHER_IV_SIZE = 12
 CIPHER_TAG_SIZE = 16
 CIPHER_NONCE_SIZE = 16
@@ -18,8 +18,9 @@ from . import callback
 
 def _train_internal(params, dtrain,
                     num_boost_round=10, evals=(),
-                    obj=None, feval=None,
-                    xgb_model=None, callbacks=None):
+                    obj=None, xgb_model=None, callbacks=None,
+                    early_stopping_rounds=None, verbose=False,
+                    checkpoint_path=None, checkpoint_interval=1):
     """internal training function"""
     callbacks = [] if callbacks is None else callbacks
     evals = list(evals)
@@ -51,18 +52,27 @@ def _train_internal(params, dtrain,
     if 'num_class' in _params:
         nboost //= _params['num_class']
 
-    # Distributed code: Load the checkpoint from rabit.
-    # TODO: port load_rabit_checkpoint and relevant rabit calls
-    #  version = bst.load_rabit_checkpoint()
-    #  assert rabit.get_world_size() != 1 or version == 0
-    #  rank = rabit.get_rank()
-    #  start_iteration = int(version / 2)
-    #  nboost += start_iteration
+    if checkpoint_interval < 1:
+        raise ValueError("checkpoint_interval must be a positive integer")
 
-    version = 0
+    # Resume from the latest sealed checkpoint, if a previous run left one.
     start_iteration = 0
+    if checkpoint_path is not None:
+        start_iteration = bst.load_checkpoint(checkpoint_path)
+        if start_iteration > num_boost_round:
+            raise XGBoostError("Checkpoint at {} holds {} rounds, more than num_boost_round={}"
+                               .format(checkpoint_path, start_iteration, num_boost_round))
+        nboost += start_iteration
+
     # FIXME: rpc
     # rank = rabit.get_rank()
+    # Evaluation results are allreduced inside the enclaves, so every
+    # client acts as rank 0
+    rank = 0
+
+    if early_stopping_rounds and verbose:
+        msg = "Will train until {} hasn't improved in {} rounds.\n"
+        rabit.tracker_print(msg.format(evals[-1][1], early_stopping_rounds))
 
     callbacks_before_iter = [
         cb for cb in callbacks if cb.__dict__.get('before_iteration', False)]
@@ -78,50 +88,51 @@ def _train_internal(params, dtrain,
                            end_iteration=num_boost_round,
                            rank=rank,
                            evaluation_result_list=None))
-        # Distributed code: need to resume to this point.
-        # Skip the first update if it is a recovery step.
-        if version % 2 == 0:
-            bst.update(dtrain, i, obj)
-            #  bst.save_rabit_checkpoint()
-            version += 1
-
-        #  assert rabit.get_world_size() == 1 or version == rabit.version_number()
-
+        bst.update(dtrain, i, obj)
         nboost += 1
         evaluation_result_list = []
+        stop = False
         # check evaluation result.
-        # FIXME: disabling evals during training
-        # if evals:
-        #     bst_eval_set = bst.eval_set(evals, i, feval)
-        #     if isinstance(bst_eval_set, STRING_TYPES):
-        #         msg = bst_eval_set
-        #     else:
-        #         msg = bst_eval_set.decode()
-        #     res = [x.split(':') for x in msg.split()]
-        #     evaluation_result_list = [(k, float(v)) for k, v in res[1:]]
-        # FIXME: disabling callbacks
-        # try:
-        #     for cb in callbacks_after_iter:
-        #         cb(CallbackEnv(model=bst,
-        #                        cvfolds=None,
-        #                        iteration=i,
-        #                        begin_iteration=start_iteration,
-        #                        end_iteration=num_boost_round,
-        #                        rank=rank,
-        #                        evaluation_result_list=evaluation_result_list))
-        # except EarlyStopException:
-        #     break
+        if evals:
+            # The enclave decides whether to stop, so that every user stops at the
+            # same round, including users who own none of the evaluation sets
+            msg, best_iteration, stop = bst._eval_set(evals, i, early_stopping_rounds or 0)
+            # Users only see the metrics of the evaluation sets they own
+            if msg is not None:
+                res = [x.split(':') for x in msg.split()]
+                evaluation_result_list = [(k, float(v)) for k, v in res[1:]]
+            if early_stopping_rounds and best_iteration == i:
+                scores = [v for k, v in evaluation_result_list if k.startswith(evals[-1][1] + '-')]
+                bst.best_iteration = best_iteration
+                bst.best_score = scores[-1] if scores else None
+                bst.best_msg = msg if msg is not None else '[%d]' % i
+        try:
+            for cb in callbacks_after_iter:
+                cb(CallbackEnv(model=bst,
+                               cvfolds=None,
+                               iteration=i,
+                               begin_iteration=start_iteration,
+                               end_iteration=num_boost_round,
+                               rank=rank,
+                               evaluation_result_list=evaluation_result_list))
+        except EarlyStopException:
+            break
+        if stop:
+            if verbose:
+                rabit.tracker_print("Stopping. Best iteration:\n{}\n\n".format(bst.best_msg))
+            break
         # do checkpoint after evaluation, in case evaluation also updates booster.
-        #  bst.save_rabit_checkpoint()
-        version += 1
+        if checkpoint_path is not None and \
+                ((i + 1) % checkpoint_interval == 0 or i + 1 == num_boost_round):
+            bst.save_checkpoint(checkpoint_path, i + 1)
 
-    # FIXME: disabling attr
-    # if bst.attr('best_score') is not None:
-    #     bst.best_score = float(bst.attr('best_score'))
-    #     bst.best_iteration = int(bst.attr('best_iteration'))
-    # else:
-    #     bst.best_iteration = nboost - 1
-    # bst.best_ntree_limit = (bst.best_iteration + 1) * num_parallel_tree
+    # Booster attributes are not exposed by the enclave, so early stopping
+    # records the best round on the Python object instead. best_score is None
+    # for users who do not own the last evaluation set. A run resumed from a
+    # checkpoint of the last round trains no round and keeps the last one.
+    if not early_stopping_rounds or not hasattr(bst, 'best_iteration'):
+        bst.best_iteration = nboost - 1
+    bst.best_ntree_limit = (bst.best_iteration + 1) * num_parallel_tree
     return bst
 
 # TODO(rishabh): Support original training function. Currently replaced with a simpler implementation below.
@@ -213,7 +224,9 @@ def _train_internal(params, dtrain,
 #             evals=evals, callbacks=callbacks)
 
 
-def train(params, dtrain, num_boost_round=10, evals=()):
+def train(params, dtrain, num_boost_round=10, evals=(), early_stopping_rounds=None,
+          evals_result=None, verbose_eval=True, callbacks=None,
+          checkpoint_path=None, checkpoint_interval=1, feval=None):
     # pylint: disable=too-many-statements,too-many-branches, attribute-defined-outside-init
     """Train a booster with given parameters.
 
@@ -227,15 +240,70 @@ def train(params, dtrain, num_boost_round=10, evals=()):
         Number of boosting iterations.
     evals: list of pairs (DMatrix, string)
         List of items to be evaluated during training, this allows user to watch
-        performance on the validation set.
+        performance on the validation set. Evaluation runs inside the enclave, and
+        the metrics of each DMatrix are returned encrypted to its owners.
+    early_stopping_rounds: int
+        Activates early stopping. Validation error needs to decrease at least
+        every **early_stopping_rounds** round(s) to continue training.
+        Requires at least one item in **evals**.
+        If there's more than one, will use the last.
+        The enclave decides when to stop and tells every user, so users who do
+        not own the evaluation sets stop at the same round.
+        Returns the model from the last iteration (not the best one).
+        If early stopping occurs, the model will have three additional fields:
+        ``bst.best_score``, ``bst.best_iteration`` and ``bst.best_ntree_limit``.
+        ``bst.best_score`` is None for users who do not own the last item in **evals**.
+    evals_result: dict
+        This dictionary stores the evaluation results of all the items in watchlist.
+    verbose_eval : bool or int
+        Requires at least one item in **evals**.
+        If **verbose_eval** is True then the evaluation metric on the validation set is
+        printed at each boosting stage.
+        If **verbose_eval** is an integer then the evaluation metric on the validation set
+        is printed at every given **verbose_eval** boosting stage.
+    callbacks : list of callback functions
+        List of callback functions that are applied at end of each iteration.
+    checkpoint_path : str
+        Path prefix, on the server, of sealed training checkpoints. If a checkpoint
+        is found there, training resumes from it instead of starting over, so a
+        failed job can simply be rerun with the same arguments. Checkpoints are
+        encrypted with a key derived from the keys of all registered users and
+        can only be restored by an enclave those users have provisioned.
+        Early stopping state is not saved and restarts from the resumed round.
+    checkpoint_interval : int
+        Number of boosting rounds between checkpoints. A checkpoint is always
+        written after the last round.
+    feval : function
+        Custom evaluation functions are not supported, as they would run on the
+        client. Passing one raises ValueError.
 
     Returns
     -------
     Booster : a trained booster model
     """
+    if feval is not None:
+        raise ValueError("Custom evaluation functions are not supported")
+    if early_stopping_rounds is not None and not evals:
+        raise ValueError('For early stopping you need at least one set in evals.')
+
+    callbacks = [] if callbacks is None else list(callbacks)
+
+    if evals:
+        if isinstance(verbose_eval, bool) and verbose_eval:
+            callbacks.append(callback.print_evaluation())
+        elif not isinstance(verbose_eval, bool) and isinstance(verbose_eval, int):
+            callbacks.append(callback.print_evaluation(verbose_eval))
+
+    if evals_result is not None:
+        callbacks.append(callback.record_evaluation(evals_result))
+
     return _train_internal(params, dtrain,
                            num_boost_round=num_boost_round,
-                           evals=evals)
+                           evals=evals, callbacks=callbacks,
+                           early_stopping_rounds=early_stopping_rounds,
+                           verbose=bool(verbose_eval),
+                           checkpoint_path=checkpoint_path,
+                           checkpoint_interval=checkpoint_interval)
 
 
 # TODO(rishabh): Enable CV
@@ -10,12 +10,15 @@ except ImportError:
 import numpy as np
 import unittest
 import json
+import subprocess
+import tempfile
 from pathlib import Path
 
 import securexgboost as xgb
 import os
-from sklearn.datasets import dump_svmlight_file
+from sklearn.datasets import dump_svmlight_file, load_svmlight_file
 from config import sym_key_file, priv_key_file, cert_file
+import testing as tm
 
 username = "user1"
 HOME_DIR = os.path.dirname(os.path.realpath(__file__)) + "/../../"
@@ -26,6 +29,27 @@ temp_enc_name = HOME_DIR + "demo/data/temp_file.txt.enc"
 dpath = HOME_DIR + 'demo/data/'
 rng = np.random.RandomState(1994)
 
+# Launches an enclave in a separate process, as there is one enclave per process,
+# and prints its public key
+LAUNCH_SCRIPT = """
+import ctypes
+import sys
+import securexgboost as xgb
+
+home_dir, username, sym_key_file, priv_key_file, cert_file, identity_key_path = sys.argv[1:]
+xgb.init_client(user_name=username, sym_key_file=sym_key_file, priv_key_file=priv_key_file, cert_file=cert_file)
+xgb.init_server(enclave_image=home_dir + "build/enclave/xgboost_enclave.signed", client_list=[username],
+                identity_key_path=identity_key_path or None)
+xgb.attest(verify=False)
+print(ctypes.string_at(xgb.core._CONF["enclave_pk"], xgb.core._CONF["enclave_pk_size"].value).hex())
+"""
+
+
+def launch_enclave(identity_key_path=""):
+    out = subprocess.check_output([sys.executable, '-c', LAUNCH_SCRIPT, HOME_DIR, username,
+                                   sym_key_file, priv_key_file, cert_file, identity_key_path])
+    return out.decode().strip().splitlines()[-1]
+
 
 @contextmanager
 def captured_output():
@@ -176,6 +200,125 @@ class TestBasic(unittest.TestCase):
         dump4j = json.loads(dump4[0])
         self.assertIn("gain", dump4j, "Expected 'gain' to be dumped in JSON.")
 
+    def test_dump_framed(self):
+        data = np.random.randn(100, 2)
+        target = np.array([0, 1] * 50)
+
+        dump_svmlight_file(data, target, temp_name)
+        xgb.encrypt_file(temp_name, temp_enc_name, sym_key_file)
+
+        dm = xgb.DMatrix({username: temp_enc_name}, feature_names=['Feature1', 'Feature2'])
+        params = {'objective': 'binary:logistic', 'max_depth': 2}
+        bst = xgb.train(params, dm, num_boost_round=8)
+
+        for kwargs in [{}, {'with_stats': True}, {'dump_format': 'json'}]:
+            dump = bst.get_dump(framed=True, **kwargs)
+            self.assertEqual(len(dump), 8)
+            self.assertEqual(dump, bst.get_dump(**kwargs))
+
+        encrypted = bst.get_dump(framed=True, decrypt=False)
+        self.assertIsInstance(encrypted, bytes)
+        self.assertNotIn(b'Feature1', encrypted)
+
+    def test_resume_session(self):
+        ticket = os.path.join(tempfile.mkdtemp(), 'session.ticket')
+        xgb.attest(verify=False, session_ticket=ticket)
+        with open(ticket, 'rb') as f:
+            self.assertNotIn(b'enclave_pk', f.read())
+        nonce_ctr = xgb.core._CONF["nonce_ctr"]
+
+        # a restarted client resumes at the current sequence number
+        xgb.init_client(user_name=username, sym_key_file=sym_key_file, priv_key_file=priv_key_file, cert_file=cert_file)
+        self.assertEqual(xgb.core._CONF["nonce_ctr"], 0)
+        self.assertTrue(xgb.core._resume_session(ticket))
+        self.assertEqual(xgb.core._CONF["nonce_ctr"], nonce_ctr)
+        dtest = xgb.DMatrix({username: dpath + 'agaricus.txt.test.enc'})
+        self.assertEqual(dtest.num_row(), 1611)
+
+        # a tampered ticket is ignored
+        tm.tamper_last_byte(ticket)
+        self.assertFalse(xgb.core._resume_session(ticket))
+        os.remove(ticket)
+
+    def test_sealed_identity_key(self):
+        identity_key_path = os.path.join(tempfile.mkdtemp(), 'identity.sealed')
+        first = launch_enclave(identity_key_path)
+        self.assertTrue(os.path.exists(identity_key_path))
+        # a relaunch unseals the same key
+        self.assertEqual(launch_enclave(identity_key_path), first)
+        # without a sealed key every launch generates a new one
+        self.assertNotEqual(launch_enclave(), first)
+
+        # a tampered key file is replaced with a newly generated key
+        tm.tamper_last_byte(identity_key_path)
+        replaced = launch_enclave(identity_key_path)
+        self.assertNotEqual(replaced, first)
+        self.assertEqual(launch_enclave(identity_key_path), replaced)
+        os.remove(identity_key_path)
+
+    def test_run_plan(self):
+        dtrain = xgb.DMatrix({username: dpath + 'agaricus.txt.train.enc'})
+        dtest = xgb.DMatrix({username: dpath + 'agaricus.txt.test.enc'})
+        param = {'max_depth': 2, 'eta': 1, 'objective': 'binary:logistic'}
+        bst, result = xgb.run_plan(param, dtrain, num_boost_round=3,
+                                   evals=[(dtest, 'test')], predict=[dtest])
+        self.assertEqual(len(result['evals']), 3)
+        self.assertTrue(result['evals'][2].startswith('[2]\ttest-'))
+        self.assertEqual(len(result['predictions'][0]), 1611)
+
+        # the same as training and predicting one command at a time
+        expected = xgb.train(param, dtrain, num_boost_round=3).predict(dtest)[0]
+        np.testing.assert_allclose(result['predictions'][0], expected)
+        np.testing.assert_allclose(bst.predict(dtest)[0], expected)
+
+    def test_concurrent_predict(self):
+        dtrain = xgb.DMatrix({username: dpath + 'agaricus.txt.train.enc'})
+        dtests = [xgb.DMatrix({username: dpath + 'agaricus.txt.test.enc'}) for _ in range(4)]
+        bst = xgb.train({'max_depth': 2, 'objective': 'binary:logistic'}, dtrain, num_boost_round=2)
+        expected = bst.predict(dtests[0])[0]
+        for preds, num_preds in bst.predict_concurrent(dtests, max_workers=4):
+            self.assertEqual(num_preds, 1611)
+            np.testing.assert_array_equal(preds, expected)
+
+        # a sequence number is only accepted once
+        nonce_ctr = xgb.core._CONF["nonce_ctr"]
+        xgb.core._CONF["nonce_ctr"] = nonce_ctr - 1
+        self.assertRaises(xgb.core.XGBoostError, dtrain.num_row)
+        xgb.core._CONF["nonce_ctr"] = nonce_ctr
+        self.assertEqual(dtrain.num_row(), 6513)
+
+    def test_free_during_command(self):
+        dtrain = xgb.DMatrix({username: dpath + 'agaricus.txt.train.enc'})
+        dtmp = xgb.DMatrix({username: dpath + 'agaricus.txt.test.enc'})
+        # a finalizer that frees a matrix between signing a command and verifying
+        # its output leaves the sequence number of that command in place
+        xgb.core.create_client_signature("XGDMatrixNumRow")
+        nonce_ctr = xgb.core._command_nonce_ctr()
+        dtmp.free()
+        self.assertEqual(xgb.core._command_nonce_ctr(), nonce_ctr)
+        self.assertEqual(dtrain.num_row(), 6513)
+
+    def test_predict_rows(self):
+        dtrain = xgb.DMatrix({username: dpath + 'agaricus.txt.train.enc'})
+        dtest = xgb.DMatrix({username: dpath + 'agaricus.txt.test.enc'})
+        bst = xgb.train({'max_depth': 2, 'objective': 'binary:logistic'}, dtrain, num_boost_round=2)
+        rows, _ = load_svmlight_file(dpath + 'agaricus.txt.test', n_features=dtest.num_col())
+        rows = rows.toarray()
+        rows[rows == 0] = np.nan
+
+        # the service must be enabled first
+        self.assertRaises(xgb.core.XGBoostError, bst.predict_rows, rows[:10])
+        bst.enable_prediction_service()
+        expected = bst.predict(dtest)[0]
+        np.testing.assert_allclose(bst.predict_rows(rows), expected, rtol=1e-6)
+        np.testing.assert_allclose(bst.predict_rows(rows[:1]), expected[:1], rtol=1e-6)
+        margin = bst.predict(dtest, output_margin=True)[0]
+        np.testing.assert_allclose(bst.predict_rows(rows[:10], output_margin=True), margin[:10], rtol=1e-6)
+
+        # setting a parameter disables the service again
+        bst.set_param({'eta': 0.5})
+        self.assertRaises(xgb.core.XGBoostError, bst.predict_rows, rows[:10])
+
     def test_load_file_invalid(self):
         # TODO(rishabh): implement load_model()
         self.assertRaises(xgb.core.XGBoostError, xgb.Booster,
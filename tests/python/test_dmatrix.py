@@ -6,8 +6,14 @@ from scipy.sparse import rand
 
 import securexgboost as xgb
 import os
+import shutil
+import struct
+import subprocess
+import sys
+import tempfile
 from sklearn.datasets import dump_svmlight_file
 from config import sym_key_file, priv_key_file, cert_file
+import testing as tm
 
 username = "user1"
 HOME_DIR = os.path.dirname(os.path.realpath(__file__)) + "/../../"
@@ -18,6 +24,38 @@ temp_enc_name = HOME_DIR + "demo/data/temp_file.txt.enc"
 dpath = HOME_DIR + 'demo/data/'
 rng = np.random.RandomState(1994)
 
+# Runs in a separate process, as the enclave of this process has no memory limit
+EVICTION_SCRIPT = """
+import sys
+import numpy as np
+import securexgboost as xgb
+
+home_dir, username, sym_key_file, priv_key_file, cert_file, spill_dir, out = sys.argv[1:]
+xgb.init_client(user_name=username, sym_key_file=sym_key_file, priv_key_file=priv_key_file, cert_file=cert_file)
+xgb.init_server(enclave_image=home_dir + "build/enclave/xgboost_enclave.signed", client_list=[username],
+                memory_limit=1, spill_dir=spill_dir)
+xgb.attest(verify=False)
+
+dtrain = xgb.DMatrix({username: home_dir + "demo/data/agaricus.txt.train.enc"})
+dtest = xgb.DMatrix({username: home_dir + "demo/data/agaricus.txt.test.enc"})
+handle = dtrain.handle.value.decode("utf-8")
+stats = xgb.get_enclave_memory_stats()
+assert not stats["dmatrices"][handle]["resident"], stats
+assert stats["num_evictions"] >= 1, stats
+assert stats["num_reloads"] == 0, stats
+
+# using the evicted matrix reloads it
+assert dtrain.num_row() == 6513
+assert dtrain.num_col() == 127
+bst = xgb.train({"max_depth": 2, "objective": "binary:logistic"}, dtrain, num_boost_round=2)
+stats = xgb.get_enclave_memory_stats()
+assert stats["num_reloads"] >= 1, stats
+np.save(out, bst.predict(dtest)[0])
+bst.free()
+dtrain.free()
+dtest.free()
+"""
+
 
 class TestDMatrix(unittest.TestCase):
     def test_dmatrix_dimensions(self):
@@ -37,6 +75,122 @@ class TestDMatrix(unittest.TestCase):
         assert dm.num_row() == 2
         assert dm.num_col() == 2
 
+    def test_sealed_cache(self):
+        cache_dir = tempfile.mkdtemp()
+        data = np.random.randn(5, 5)
+        target = np.random.randn(5)
+        dump_svmlight_file(data, target, temp_name)
+        xgb.encrypt_file(temp_name, temp_enc_name, sym_key_file)
+
+        dm = xgb.DMatrix({username: temp_enc_name}, cache_dir=cache_dir)
+        entries = os.listdir(cache_dir)
+        assert len(entries) == 1
+        dm = xgb.DMatrix({username: temp_enc_name}, cache_dir=cache_dir)
+        assert os.listdir(cache_dir) == entries
+        assert dm.num_row() == 5
+        assert dm.num_col() == 5
+
+        # a tampered entry is ignored and the file is parsed again
+        tm.tamper_last_byte(os.path.join(cache_dir, entries[0]))
+        dm = xgb.DMatrix({username: temp_enc_name}, cache_dir=cache_dir)
+        assert dm.num_row() == 5
+
+        # so is an entry whose size field is larger than the file
+        with open(os.path.join(cache_dir, entries[0]), 'r+b') as f:
+            # after the magic number and the digest of the inputs
+            f.seek(4 + 32)
+            f.write(struct.pack('<Q', 1 << 62))
+        dm = xgb.DMatrix({username: temp_enc_name}, cache_dir=cache_dir)
+        assert dm.num_row() == 5
+
+        # different contents under the same path get their own entry
+        data = np.random.randn(2, 2)
+        target = np.random.randn(2)
+        dump_svmlight_file(data, target, temp_name)
+        xgb.encrypt_file(temp_name, temp_enc_name, sym_key_file)
+        dm = xgb.DMatrix({username: temp_enc_name}, cache_dir=cache_dir)
+        assert len(os.listdir(cache_dir)) == 2
+        assert dm.num_row() == 2
+        shutil.rmtree(cache_dir)
+
+    def test_free(self):
+        dtrain = xgb.DMatrix({username: dpath + 'agaricus.txt.train.enc'})
+        dtest = xgb.DMatrix({username: dpath + 'agaricus.txt.test.enc'})
+        bst = xgb.train({'max_depth': 2, 'objective': 'binary:logistic'}, dtrain, num_boost_round=2)
+        handle = dtrain.handle
+        dtrain.free()
+        assert dtrain.handle is None
+        dtrain.handle = handle
+        self.assertRaises(xgb.core.XGBoostError, dtrain.num_col)
+        dtrain.handle = None
+
+        # the booster still holds its cache matrix
+        bst.predict(dtest)
+        bst.free()
+        assert bst.handle is None
+
+        with xgb.DMatrix({username: dpath + 'agaricus.txt.test.enc'}) as dm:
+            assert dm.num_row() == dtest.num_row()
+        assert dm.handle is None
+
+    def test_free_soak(self):
+        def rss_kb():
+            # the enclave heap lives in this process in simulation mode
+            with open('/proc/self/status') as f:
+                for line in f:
+                    if line.startswith('VmRSS:'):
+                        return int(line.split()[1])
+
+        data = np.random.randn(1000, 20)
+        target = np.random.randn(1000)
+        dump_svmlight_file(data, target, temp_name)
+        xgb.encrypt_file(temp_name, temp_enc_name, sym_key_file)
+
+        for _ in range(100):
+            xgb.DMatrix({username: temp_enc_name}).free()
+        warm = rss_kb()
+        for _ in range(900):
+            xgb.DMatrix({username: temp_enc_name}).free()
+        # 900 leaked matrices would take well over 100MB
+        assert rss_kb() - warm < 16 * 1024
+
+    def test_memory_stats(self):
+        dtrain = xgb.DMatrix({username: dpath + 'agaricus.txt.train.enc'})
+        bst = xgb.train({'max_depth': 2, 'objective': 'binary:logistic'}, dtrain, num_boost_round=2)
+        handle = dtrain.handle.value.decode('utf-8')
+        bst_handle = bst.handle.value.decode('utf-8')
+
+        stats = xgb.get_enclave_memory_stats()
+        for key in ['heap_size', 'memory_limit', 'accounted_bytes', 'num_evictions',
+                    'num_reloads', 'dmatrices', 'boosters']:
+            assert key in stats
+        assert stats['dmatrices'][handle]['resident']
+        # 6513 rows with 22 entries each
+        assert stats['dmatrices'][handle]['bytes'] > 6513 * 22 * 8
+        assert stats['boosters'][bst_handle]['model_bytes'] > 0
+        assert stats['boosters'][bst_handle]['prediction_cache_bytes'] >= 6513 * 4
+
+        bst.free()
+        dtrain.free()
+        stats = xgb.get_enclave_memory_stats()
+        assert handle not in stats['dmatrices']
+        assert bst_handle not in stats['boosters']
+
+    def test_evict_and_reload(self):
+        spill_dir = tempfile.mkdtemp()
+        out = os.path.join(spill_dir, 'preds.npy')
+        subprocess.check_call([sys.executable, '-c', EVICTION_SCRIPT, HOME_DIR, username,
+                               sym_key_file, priv_key_file, cert_file, spill_dir, out])
+
+        # a reloaded matrix trains the same model as one that stayed in memory
+        dtrain = xgb.DMatrix({username: dpath + 'agaricus.txt.train.enc'})
+        dtest = xgb.DMatrix({username: dpath + 'agaricus.txt.test.enc'})
+        bst = xgb.train({'max_depth': 2, 'objective': 'binary:logistic'}, dtrain, num_boost_round=2)
+        np.testing.assert_allclose(np.load(out), bst.predict(dtest)[0])
+        # freed matrices leave no sealed files behind
+        assert [f for f in os.listdir(spill_dir) if f.endswith('.evicted')] == []
+        shutil.rmtree(spill_dir)
+
     def test_slice(self):
         X = rng.randn(100, 100)
         y = rng.randint(low=0, high=3, size=100)
@@ -14,6 +14,8 @@ HOME_DIR = os.path.dirname(os.path.realpath(__file__)) + "/../../"
 temp_name = HOME_DIR + "demo/data/temp_file.txt"
 temp_enc_name = HOME_DIR + "demo/data/temp_file.txt.enc"
 
+dpath = HOME_DIR + 'demo/data/'
+
 rng = np.random.RandomState(1994)
 
 
@@ -31,6 +33,41 @@ class TestEarlyStopping(unittest.TestCase):
         for key, value in cv.items():
           assert len(value) == expected_length
 
+    def test_train_early_stopping(self):
+        dtrain = xgb.DMatrix({username: dpath + 'agaricus.txt.train.enc'})
+        dtest = xgb.DMatrix({username: dpath + 'agaricus.txt.test.enc'})
+        params = {'max_depth': 2, 'eta': 1, 'objective': 'binary:logistic',
+                  'eval_metric': 'error'}
+        num_round = 20
+        evals_result = {}
+        bst = xgb.train(params, dtrain, num_round, evals=[(dtest, 'eval')],
+                        early_stopping_rounds=2, evals_result=evals_result,
+                        verbose_eval=False)
+        history = evals_result['eval']['error']
+        assert len(history) < num_round
+        assert bst.best_iteration == len(history) - 3
+        assert bst.best_score == min(history)
+        assert bst.best_ntree_limit == bst.best_iteration + 1
+
+    def test_train_early_stopping_requires_evals(self):
+        dtrain = xgb.DMatrix({username: dpath + 'agaricus.txt.train.enc'})
+        params = {'max_depth': 2, 'objective': 'binary:logistic'}
+        self.assertRaises(ValueError, xgb.train, params, dtrain, 2, early_stopping_rounds=2)
+        self.assertRaises(ValueError, xgb.train, params, dtrain, 2, evals=[(dtrain, 'train')],
+                          feval=lambda preds, dtrain: ('error', 0.0))
+
+    def test_eval_set(self):
+        dtrain = xgb.DMatrix({username: dpath + 'agaricus.txt.train.enc'})
+        dtest = xgb.DMatrix({username: dpath + 'agaricus.txt.test.enc'})
+        params = {'max_depth': 2, 'eta': 1, 'objective': 'binary:logistic',
+                  'eval_metric': 'logloss'}
+        bst = xgb.train(params, dtrain, 2, evals=[(dtest, 'eval')], verbose_eval=False)
+
+        res = bst.eval_set([(dtest, 'eval'), (dtrain, 'train')], 1)
+        assert res.startswith('[1]\teval-logloss:')
+        assert '\ttrain-logloss:' in res
+        assert bst.eval(dtest, 'test', 1).startswith('[1]\ttest-logloss:')
+
     @pytest.mark.skipif(**tm.no_sklearn())
     def test_cv_early_stopping(self):
         from sklearn.datasets import load_digits
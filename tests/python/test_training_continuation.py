@@ -158,6 +158,63 @@ class TestTrainingContinuation(unittest.TestCase):
         np.testing.assert_almost_equal(res1, res2)
         """
 
+    @pytest.mark.skipif(**tm.no_sklearn())
+    def test_training_checkpoint_resume(self):
+        from sklearn.datasets import load_digits
+
+        digits_2class = load_digits(2)
+        dump_svmlight_file(digits_2class['data'], digits_2class['target'], temp_name)
+        xgb.encrypt_file(temp_name, temp_enc_name, sym_key_file)
+        dtrain = xgb.DMatrix({username: temp_enc_name})
+
+        params = {'nthread': 1}
+        checkpoint = HOME_DIR + "demo/data/xgb_tc.checkpoint"
+        checkpoint_files = [checkpoint + ".rank0." + str(slot) for slot in range(2)]
+        for f in checkpoint_files:
+            if os.path.exists(f):
+                os.remove(f)
+
+        try:
+            # Nothing to resume from yet
+            bst = xgb.Booster(params, [dtrain])
+            assert bst.load_checkpoint(checkpoint) == 0
+
+            # Interrupted run: 3 of 10 rounds, with a checkpoint every other round
+            gbdt_01 = xgb.train(params, dtrain, num_boost_round=3,
+                                checkpoint_path=checkpoint, checkpoint_interval=2)
+            assert len(gbdt_01.get_dump()) == 3
+
+            bst = xgb.Booster(params, [dtrain])
+            assert bst.load_checkpoint(checkpoint) == 3
+
+            # Rerunning with the same arguments resumes at round 3
+            gbdt_02 = xgb.train(params, dtrain, num_boost_round=10,
+                                checkpoint_path=checkpoint, checkpoint_interval=2)
+            assert len(gbdt_02.get_dump()) == 10
+
+            gbdt_03 = xgb.train(params, dtrain, num_boost_round=10)
+            preds_02, num_preds = gbdt_02.predict(dtrain)
+            preds_03, _ = gbdt_03.predict(dtrain)
+            np.testing.assert_almost_equal(preds_02, preds_03)
+
+            # Resuming a finished run trains no round, the last one is the best
+            gbdt_04 = xgb.train(params, dtrain, num_boost_round=10,
+                                evals=[(dtrain, 'train')], early_stopping_rounds=2,
+                                checkpoint_path=checkpoint, checkpoint_interval=2)
+            assert len(gbdt_04.get_dump()) == 10
+            assert gbdt_04.best_iteration == 9
+            assert gbdt_04.best_ntree_limit == 10
+
+            # Tampered checkpoints are rejected, leaving nothing to resume from
+            for f in checkpoint_files:
+                tm.tamper_last_byte(f)
+            bst = xgb.Booster(params, [dtrain])
+            assert bst.load_checkpoint(checkpoint) == 0
+        finally:
+            for f in checkpoint_files:
+                if os.path.exists(f):
+                    os.remove(f)
+
     @pytest.mark.skipif(**tm.no_sklearn())
     def test_training_continuation_binary(self):
         params = self.generate_parameters(False)
@@ -100,3 +100,31 @@ class TestUpdaters(unittest.TestCase):
         assert hist_res['test']['auc'] == exact_res['test']['auc']
         """
 
+
+    def test_shared_quantized_matrix(self):
+        # boosters on the same DMatrix share its quantized matrix, which must
+        # give the same trees as quantizing a fresh copy of the data
+        dpath = HOME_DIR + 'demo/data/'
+        param = {'max_depth': 3, 'tree_method': 'hist', 'verbosity': 0,
+                 'objective': 'binary:logistic'}
+        dtrain = xgb.DMatrix({username: dpath + 'agaricus.txt.train.enc'})
+        handle = dtrain.handle.value.decode('utf-8')
+
+        def dtrain_bytes():
+            # the bytes of a DMatrix include the matrices derived from it
+            return xgb.get_enclave_memory_stats()['dmatrices'][handle]['bytes']
+
+        first = xgb.train(param, dtrain, 5)
+        quantized_bytes = dtrain_bytes()
+        second = xgb.train(param, dtrain, 5)
+        assert dtrain_bytes() == quantized_bytes
+        fresh = xgb.train(param, xgb.DMatrix({username: dpath + 'agaricus.txt.train.enc'}), 5)
+        assert first.get_dump() == second.get_dump()
+        assert first.get_dump() == fresh.get_dump()
+
+        # other bin counts are quantized separately
+        param['max_bin'] = 16
+        coarse = xgb.train(param, dtrain, 5)
+        assert dtrain_bytes() > quantized_bytes
+        fresh = xgb.train(param, xgb.DMatrix({username: dpath + 'agaricus.txt.train.enc'}), 5)
+        assert coarse.get_dump() == fresh.get_dump()
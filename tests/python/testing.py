@@ -1,4 +1,6 @@
 # coding: utf-8
+import os
+
 from securexgboost.compat import SKLEARN_INSTALLED, PANDAS_INSTALLED
 from securexgboost.compat import CUDF_INSTALLED, DASK_INSTALLED
 
@@ -75,3 +77,12 @@ def no_json_schema():
         return {'condition': False, 'reason': reason}
     except ImportError:
         return {'condition': True, 'reason': reason}
+
+
+def tamper_last_byte(path):
+    """Flip a bit of the last byte of a file, so that it fails authentication."""
+    with open(path, 'r+b') as f:
+        f.seek(-1, os.SEEK_END)
+        last = f.read(1)
+        f.seek(-1, os.SEEK_END)
+        f.write(bytes([last[0] ^ 1]))
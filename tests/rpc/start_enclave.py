@@ -1,9 +1,17 @@
+import argparse
 import securexgboost as xgb
 import os
 
 HOME_DIR = os.path.dirname(os.path.realpath(__file__)) + "/../../"
 
+parser = argparse.ArgumentParser()
+parser.add_argument("--async", dest="use_async", action="store_true", help="serve on grpc.aio")
+args = parser.parse_args()
+
 xgb.init_server(enclave_image=HOME_DIR + "build/enclave/xgboost_enclave.signed", client_list=["user1"])
 
 # Start RPC server
-xgb.serve(all_users=["user1"], port=50051)
+if args.use_async:
+    xgb.serve_async(all_users=["user1"], port=50051)
+else:
+    xgb.serve(all_users=["user1"], port=50051)
@@ -1,4 +1,16 @@
+import argparse
 import securexgboost as xgb
 
+parser = argparse.ArgumentParser()
+parser.add_argument("--async", dest="use_async", action="store_true", help="serve on grpc.aio")
+parser.add_argument("--port", type=int, default=50052)
+parser.add_argument("--nodes-port", type=int, default=50051)
+parser.add_argument("--node-timeout", type=float, default=None)
+args = parser.parse_args()
+
 # Start orchestrator
-xgb.serve(all_users=["user1"], nodes=["127.0.0.1"], port=50052)
+if args.use_async:
+    xgb.serve_async(all_users=["user1"], nodes=["127.0.0.1"], nodes_port=args.nodes_port, port=args.port,
+                    node_timeout=args.node_timeout)
+else:
+    xgb.serve(all_users=["user1"], nodes=["127.0.0.1"], nodes_port=args.nodes_port, port=args.port)
@@ -7,7 +7,16 @@ import pytest
 import locale
 from sklearn.datasets import dump_svmlight_file
 import subprocess
+import threading
 import time
+from concurrent import futures
+from unittest import mock
+
+import grpc
+from numproto import ndarray_to_proto
+from securexgboost import remote_server
+from securexgboost.rpc import remote_pb2
+from securexgboost.rpc import remote_pb2_grpc
 
 username = "user1"
 HOME_DIR = os.path.dirname(os.path.realpath(__file__)) + "/../../"
@@ -22,12 +31,15 @@ temp_enc_name = HOME_DIR + "demo/data/temp_file.txt.enc"
 dpath = HOME_DIR + 'demo/data/'
 
 class TestRPC(unittest.TestCase):
+    # extra arguments of the server and orchestrator scripts
+    server_args = []
+
     def setUp(self):
         # Initialize server
-        subprocess.Popen(["python3", HOME_DIR + "tests/rpc/start_enclave.py"], stdout=subprocess.PIPE)
+        subprocess.Popen(["python3", HOME_DIR + "tests/rpc/start_enclave.py"] + self.server_args, stdout=subprocess.PIPE)
 
         # Start orchestrator
-        subprocess.Popen(["python3", HOME_DIR + "tests/rpc/start_orchestrator.py"], stdout=subprocess.PIPE)
+        subprocess.Popen(["python3", HOME_DIR + "tests/rpc/start_orchestrator.py"] + self.server_args, stdout=subprocess.PIPE)
 
         # Give some time for server and orchestrator to start
         time.sleep(5)
@@ -74,3 +86,205 @@ class TestRPC(unittest.TestCase):
         # Kill orchestrator
         subprocess.Popen(["pkill", "-f", "start_orchestrator.py"], stdout=subprocess.PIPE)
 
+
+class TestAsyncRPC(TestRPC):
+    server_args = ["--async"]
+
+
+class FakeNode(remote_pb2_grpc.RemoteServicer):
+    """
+    Node that answers XGDMatrixCreateFromEncryptedFile without an enclave,
+    after `delay` seconds
+    """
+    def __init__(self, delay=0):
+        self.delay = delay
+        self.requests = []
+
+    def rpc_XGDMatrixCreateFromEncryptedFile(self, request, context):
+        self.requests.append(request)
+        time.sleep(self.delay)
+        return remote_pb2.Name(name="dmatrix_0", status=remote_pb2.Status(status=0))
+
+    def rpc_XGBoosterPredictRows(self, request, context):
+        self.requests.append(request)
+        return remote_pb2.RowPredictions(num_preds=request.num_rows, status=remote_pb2.Status(status=0))
+
+
+def start_fake_node(node, port):
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=2))
+    remote_pb2_grpc.add_RemoteServicer_to_server(node, server)
+    server.add_insecure_port('127.0.0.1:' + str(port))
+    server.start()
+    return server
+
+
+def create_dmatrix_request(nonce_ctr):
+    return remote_pb2.DMatrixAttrsRequest(
+        params=remote_pb2.DMatrixAttrs(filenames=[dpath + 'agaricus.txt.train.enc'], usernames=[username]),
+        seq_num=remote_pb2.SequenceNumber(nonce_ctr=nonce_ctr), username=username)
+
+
+class TestNodeTimeout(unittest.TestCase):
+    nodes_port = 50061
+    port = 50062
+
+    def setUp(self):
+        self.node = FakeNode(delay=5)
+        self.node_server = start_fake_node(self.node, self.nodes_port)
+        subprocess.Popen(["python3", HOME_DIR + "tests/rpc/start_orchestrator.py", "--async", "--node-timeout", "0.5",
+                          "--port", str(self.port), "--nodes-port", str(self.nodes_port)], stdout=subprocess.PIPE)
+        time.sleep(5)
+
+    def test_node_timeout(self):
+        with grpc.insecure_channel("127.0.0.1:" + str(self.port)) as channel:
+            stub = remote_pb2_grpc.RemoteStub(channel)
+            start = time.time()
+            response = stub.rpc_XGDMatrixCreateFromEncryptedFile(create_dmatrix_request(1))
+            # the command fails once the node times out, not when it answers
+            self.assertLess(time.time() - start, 4)
+            self.assertEqual(response.status.status, -1)
+            self.assertIn("did not complete", response.status.exception)
+            self.assertIn("DEADLINE_EXCEEDED", response.status.exception)
+
+            # the failed command is cleared, so the next command runs
+            self.node.delay = 0
+            response = stub.rpc_XGDMatrixCreateFromEncryptedFile(create_dmatrix_request(2))
+            self.assertEqual(response.status.status, 0)
+            self.assertEqual(response.name, "dmatrix_0")
+            self.assertEqual(len(self.node.requests), 2)
+
+    def tearDown(self):
+        self.node_server.stop(0)
+        subprocess.Popen(["pkill", "-f", "start_orchestrator.py"], stdout=subprocess.PIPE)
+
+
+def predict_rows_request(request_id, num_rows, username=username, num_col=2):
+    enc_rows = np.zeros(num_rows * num_col * 4 + 12 + 16, dtype=np.uint8)
+    return remote_pb2.PredictRowsRequest(username=username, booster_handle="booster_0", request_id=request_id,
+                                         enc_rows=ndarray_to_proto(enc_rows), num_rows=num_rows, num_col=num_col)
+
+
+class TestPredictionBatcher(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+        patcher = mock.patch.object(remote_server.remote_api, "XGBoosterPredictRows", self.predict_rows)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def predict_rows(self, requests):
+        """
+        Stands in for the enclave: requests from "forger" fail authentication,
+        and a request from "crash" fails the whole call
+        """
+        self.calls.append([request.request_id for request in requests])
+        if any(request.username == "crash" for request in requests):
+            raise RuntimeError("enclave call failed")
+        return [None if request.username == "forger" else (request.request_id.encode(), request.num_rows)
+                for request in requests]
+
+    def run_concurrently(self, batcher, requests):
+        """Submit `requests` from one thread each, returning the result or exception of each"""
+        barrier = threading.Barrier(len(requests))
+        results = [None] * len(requests)
+
+        def run(i):
+            barrier.wait()
+            try:
+                results[i] = batcher.predict(requests[i])
+            except Exception as e:
+                results[i] = e
+
+        threads = [threading.Thread(target=run, args=(i,)) for i in range(len(requests))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_coalesce(self):
+        batcher = remote_server.PredictionBatcher(window=0.5, max_rows=1000)
+        requests = [predict_rows_request("request_{}".format(i), i + 1) for i in range(8)]
+        results = self.run_concurrently(batcher, requests)
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual(sorted(self.calls[0]), sorted(r.request_id for r in requests))
+        # each request receives its own predictions
+        for request, result in zip(requests, results):
+            self.assertEqual(result, (request.request_id.encode(), request.num_rows))
+
+    def test_max_rows(self):
+        batcher = remote_server.PredictionBatcher(window=0.5, max_rows=25)
+        requests = [predict_rows_request("request_{}".format(i), 10) for i in range(6)]
+        start = time.time()
+        results = self.run_concurrently(batcher, requests)
+        # full batches run without waiting for the window
+        self.assertLess(time.time() - start, 0.5)
+        self.assertEqual([len(call) for call in self.calls], [3, 3])
+        for request, result in zip(requests, results):
+            self.assertEqual(result, (request.request_id.encode(), 10))
+
+        # a request above max_rows runs alone
+        results = self.run_concurrently(batcher, [predict_rows_request("large", 100)])
+        self.assertEqual(self.calls[-1], ["large"])
+        self.assertEqual(results[0], (b"large", 100))
+
+    def test_per_request_failure(self):
+        batcher = remote_server.PredictionBatcher(window=0.5, max_rows=1000)
+        requests = [predict_rows_request("request_{}".format(i), 5) for i in range(4)]
+        requests.append(predict_rows_request("forged", 5, username="forger"))
+        malformed = predict_rows_request("malformed", 5)
+        malformed.num_rows = 6
+        requests.append(malformed)
+        results = self.run_concurrently(batcher, requests)
+
+        # the malformed request never reaches the enclave
+        self.assertEqual(len(self.calls), 1)
+        self.assertNotIn("malformed", self.calls[0])
+        self.assertIsInstance(results[-1], ValueError)
+        # only the forged request fails authentication
+        self.assertIsInstance(results[-2], ValueError)
+        for request, result in zip(requests[:4], results[:4]):
+            self.assertEqual(result, (request.request_id.encode(), 5))
+
+    def test_error_fan_out(self):
+        batcher = remote_server.PredictionBatcher(window=0.5, max_rows=1000)
+        requests = [predict_rows_request("request_{}".format(i), 5) for i in range(3)]
+        requests.append(predict_rows_request("crash", 5, username="crash"))
+        results = self.run_concurrently(batcher, requests)
+        self.assertEqual(len(self.calls), 1)
+        # a failed enclave call fails every request of the batch
+        for result in results:
+            self.assertIsInstance(result, RuntimeError)
+
+        # and the next batch runs
+        results = self.run_concurrently(batcher, [predict_rows_request("next", 5)])
+        self.assertEqual(results[0], (b"next", 5))
+
+
+class TestPredictRowsForwarding(unittest.TestCase):
+    nodes_port = 50071
+
+    def setUp(self):
+        self.nodes = [FakeNode(), FakeNode()]
+        self.node_servers = []
+        for ip, node in zip(["127.0.0.1", "127.0.0.2"], self.nodes):
+            server = grpc.server(futures.ThreadPoolExecutor(max_workers=2))
+            remote_pb2_grpc.add_RemoteServicer_to_server(node, server)
+            server.add_insecure_port(ip + ':' + str(self.nodes_port))
+            server.start()
+            self.node_servers.append(server)
+        remote_server._init_server([], ["127.0.0.2", "127.0.0.1"], self.nodes_port)
+
+    def test_round_robin(self):
+        servicer = remote_server.RemoteServicer(threading.Condition(), remote_server.Command())
+        for i in range(6):
+            response = servicer.rpc_XGBoosterPredictRows(predict_rows_request("request_{}".format(i), i + 1), None)
+            self.assertEqual(response.status.status, 0)
+            self.assertEqual(response.num_preds, i + 1)
+        # requests alternate between the nodes, in node order
+        self.assertEqual([r.request_id for r in self.nodes[0].requests], ["request_0", "request_2", "request_4"])
+        self.assertEqual([r.request_id for r in self.nodes[1].requests], ["request_1", "request_3", "request_5"])
+
+    def tearDown(self):
+        for server in self.node_servers:
+            server.stop(0)
+        remote_server.is_orchestrator = False